@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark podcast assembly: streaming assemble_wav vs. the old pydub loop.
+
+Generates synthetic PCM WAV segments (one per speaker turn) and times how long
+each approach takes to combine them with a 300ms pause between speakers. The
+pydub loop (``combined = combined + pause + segment``) recopies the whole
+accumulated buffer on every join, so its cost grows quadratically.
+
+Usage:
+    python scripts/bench_audio_assembly.py --segments 720 --seconds 5
+    python scripts/bench_audio_assembly.py --segments 200 --compare-pydub
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import wave
+
+from youtube_chat_cli_main.audio_assembly import assemble_wav
+
+
+def write_segments(directory: str, count: int, seconds: float, rate: int) -> list:
+    frame = (1000).to_bytes(2, "little", signed=True)
+    pcm = frame * int(rate * seconds)
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"seg_{i:04d}.wav")
+        with wave.open(path, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(rate)
+            w.writeframes(pcm)
+        paths.append(path)
+    return paths
+
+
+def pydub_loop(paths: list, output_file: str) -> None:
+    from pydub import AudioSegment
+
+    combined = None
+    for path in paths:
+        segment = AudioSegment.from_wav(path)
+        if combined is None:
+            combined = segment
+        else:
+            combined = combined + AudioSegment.silent(duration=300) + segment
+    combined.export(output_file, format="wav")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=720)
+    parser.add_argument("--seconds", type=float, default=5.0, help="Length of each segment")
+    parser.add_argument("--rate", type=int, default=24000)
+    parser.add_argument("--compare-pydub", action="store_true", help="Also time the old pydub loop")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_segments(tmp, args.segments, args.seconds, args.rate)
+        total_min = args.segments * (args.seconds + 0.3) / 60
+        print(f"{args.segments} segments x {args.seconds}s @ {args.rate} Hz (~{total_min:.1f} min of audio)")
+
+        started = time.perf_counter()
+        stats = assemble_wav(paths, os.path.join(tmp, "streamed.wav"), pause_ms=300)
+        print(f"assemble_wav: {time.perf_counter() - started:7.2f}s ({stats['duration_s'] / 60:.1f} min written)")
+
+        if args.compare_pydub:
+            started = time.perf_counter()
+            pydub_loop(paths, os.path.join(tmp, "pydub.wav"))
+            print(f"pydub loop:   {time.perf_counter() - started:7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
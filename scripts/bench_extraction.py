@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark document parsing throughput against the number of worker processes.
+
+Builds a mixed corpus (PDF, DOCX, HTML, JSON) in a temp directory and parses
+it with the extraction process pool at each requested size, reporting
+files/second and speedup over inline parsing on the calling thread
+(EXTRACTION_PROCESSES=0). Parsing is pure Python, so inline throughput does
+not improve with threads; the pool should scale until it runs out of cores.
+
+Usage:
+    python scripts/bench_extraction.py --files 200
+    python scripts/bench_extraction.py --files 400 --processes 0 1 2 4 8 --pages 20
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+WORDS = "retrieval augmented generation indexes documents into chunks embeds them and answers questions".split()
+
+
+def _sentence(i: int, words: int = 40) -> str:
+    return " ".join(WORDS[(i + j) % len(WORDS)] for j in range(words)) + "."
+
+
+def write_pdf(path: str, pages: int) -> None:
+    """Minimal multi-page PDF with one text stream per page."""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for page in range(pages):
+        lines = " ".join(f"({_sentence(page * 40 + line, 12)}) Tj T*" for line in range(40))
+        stream = f"BT /F1 9 Tf 11 TL 36 800 Td {lines} ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        content_ref = len(objects)
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_ref} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {pages} >>"
+
+    body, offsets = b"%PDF-1.4\n", []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(body))
+        body += f"{number} 0 obj\n{obj}\nendobj\n".encode("latin-1")
+    xref = len(body)
+    body += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    body += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    body += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    with open(path, "wb") as f:
+        f.write(body)
+
+
+def write_docx(path: str, paragraphs: int) -> None:
+    import docx
+
+    doc = docx.Document()
+    for i in range(paragraphs):
+        if i % 10 == 0:
+            doc.add_heading(f"Section {i // 10}", level=2)
+        doc.add_paragraph(_sentence(i))
+    doc.save(path)
+
+
+def write_html(path: str, paragraphs: int) -> None:
+    body = "\n".join(f"<h2>Section {i}</h2>\n<p>{_sentence(i)}</p>\n<script>track({i})</script>" for i in range(paragraphs))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"<html><head><style>p {{}}</style></head><body>\n{body}\n</body></html>")
+
+
+def write_json(path: str, records: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"records": [{"id": i, "text": _sentence(i, 12), "tags": ["a", "b"]} for i in range(records)]}, f)
+
+
+def build_corpus(directory: str, files: int, pages: int) -> list:
+    from youtube_chat_cli_main.services import content_processor as cp
+
+    kinds = [
+        ("pdf", lambda p: write_pdf(p, pages), cp.pdf_to_markdown),
+        ("docx", lambda p: write_docx(p, pages * 20), cp.docx_to_markdown),
+        ("html", lambda p: write_html(p, pages * 40), cp.html_to_text),
+        ("json", lambda p: write_json(p, pages * 100), cp.json_to_text),
+    ]
+    corpus = []
+    for i in range(files):
+        ext, write, parser = kinds[i % len(kinds)]
+        path = os.path.join(directory, f"doc{i}.{ext}")
+        write(path)
+        corpus.append((parser, path))
+    return corpus
+
+
+def bench(corpus: list, processes: int) -> float:
+    from youtube_chat_cli_main.services.extraction_executor import ExtractionExecutor
+
+    executor = ExtractionExecutor(processes, timeout=600)
+    try:
+        if processes:
+            # Warm the pool so worker start-up is not counted
+            list(ThreadPoolExecutor(processes).map(lambda _: executor.run(os.getpid), range(processes)))
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, processes)) as pool:
+            chars = sum(pool.map(lambda item: len(executor.run(item[0], item[1])), corpus))
+        elapsed = time.perf_counter() - started
+    finally:
+        executor.shutdown()
+    assert chars > 0
+    return len(corpus) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=200, help="documents in the corpus (mixed types)")
+    parser.add_argument("--pages", type=int, default=10, help="size of each document, in PDF pages or equivalent")
+    parser.add_argument("--processes", type=int, nargs="+",
+                        default=sorted({0, 1, 2, 4, os.cpu_count() or 1}), help="pool sizes to test (0 = inline)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        corpus = build_corpus(directory, args.files, args.pages)
+        print(f"{args.files} files, {args.pages} pages each, {os.cpu_count()} cores")
+        print(f"{'processes':>10} {'files/s':>10} {'speedup':>8}")
+        baseline = None
+        for processes in args.processes:
+            rate = bench(corpus, processes)
+            baseline = baseline or rate
+            print(f"{processes or 'inline':>10} {rate:>10.1f} {rate / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Benchmark the local (memmap + SQLite) vector store against ChromaDB.
+
+Indexes synthetic clustered embeddings (like real chunk embeddings, they sit
+around topics) and reports build time, single-query latency p50/p99 and peak
+RSS. Each backend runs in its own subprocess so RSS figures don't mix.
+
+Usage:
+    python scripts/bench_local_vector_store.py --chunks 100000 --dim 768
+    python scripts/bench_local_vector_store.py --backend local --dtype float16
+    python scripts/bench_local_vector_store.py --backend local --ivf-threshold 1000000000  # exact only
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+BATCH = 1000
+
+
+def make_embeddings(chunks: int, dim: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(max(1, chunks // 200), dim)).astype(np.float32)
+    noise = 0.5 * rng.normal(size=(chunks, dim)).astype(np.float32)
+    return centers[rng.integers(0, len(centers), chunks)] + noise
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def bench_local(args, directory: str, embeddings: np.ndarray, queries: np.ndarray):
+    from youtube_chat_cli_main.services.local_vector_store import LocalVectorStore
+
+    store = LocalVectorStore(SimpleNamespace(
+        local_vector_store_path=directory,
+        local_vector_collection_name="bench",
+        local_vector_dtype=args.dtype,
+        local_vector_ivf_threshold=args.ivf_threshold,
+        local_vector_ivf_nprobe=args.nprobe,
+    ))
+
+    started = time.perf_counter()
+    for start in range(0, len(embeddings), BATCH):
+        batch = embeddings[start:start + BATCH]
+        docs = [{"content": f"chunk {start + i}"} for i in range(len(batch))]
+        store.add_documents(docs, batch.tolist(), {"file_id": f"file{start // BATCH}"})
+    build = time.perf_counter() - started
+
+    search = lambda q: store.search(q.tolist(), top_k=args.top_k)
+    return build, search, store.get_collection_info()
+
+
+def bench_chroma(args, directory: str, embeddings: np.ndarray, queries: np.ndarray):
+    import chromadb
+    from chromadb.config import Settings
+
+    client = chromadb.PersistentClient(path=directory, settings=Settings(anonymized_telemetry=False))
+    collection = client.get_or_create_collection("bench", metadata={"hnsw:space": "cosine"})
+
+    started = time.perf_counter()
+    for start in range(0, len(embeddings), BATCH):
+        batch = embeddings[start:start + BATCH]
+        collection.add(
+            ids=[f"file{start // BATCH}_{i}" for i in range(len(batch))],
+            embeddings=batch.tolist(),
+            documents=[f"chunk {start + i}" for i in range(len(batch))],
+            metadatas=[{"file_id": f"file{start // BATCH}"} for _ in range(len(batch))],
+        )
+    build = time.perf_counter() - started
+
+    search = lambda q: collection.query(query_embeddings=[q.tolist()], n_results=args.top_k)
+    return build, search, {"points_count": collection.count()}
+
+
+def run_backend(args) -> dict:
+    embeddings = make_embeddings(args.chunks, args.dim)
+    queries = make_embeddings(args.queries, args.dim, seed=1)
+    bench = bench_local if args.backend == "local" else bench_chroma
+
+    with tempfile.TemporaryDirectory() as tmp:
+        build, search, info = bench(args, tmp, embeddings, queries)
+        search(queries[0])  # warm up
+        latencies = []
+        for query in queries:
+            started = time.perf_counter()
+            search(query)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "backend": args.backend,
+        "chunks": args.chunks,
+        "build_s": round(build, 2),
+        "p50_ms": round(float(np.percentile(latencies, 50)), 2),
+        "p99_ms": round(float(np.percentile(latencies, 99)), 2),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "info": info,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=("all", "local", "chroma"), default="all")
+    parser.add_argument("--chunks", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--dtype", choices=("float32", "float16"), default="float32")
+    parser.add_argument("--ivf-threshold", type=int, default=50_000)
+    parser.add_argument("--nprobe", type=int, default=8)
+    args = parser.parse_args()
+
+    if args.backend != "all":
+        print(json.dumps(run_backend(args)))
+        return
+
+    forwarded = [a for a in sys.argv[1:] if a not in ("--backend", "all")]
+    for backend in ("local", "chroma"):
+        proc = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--backend", backend, *forwarded],
+            capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            print(f"{backend:>6}: failed ({proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else proc.returncode})")
+            continue
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        print(
+            f"{backend:>6}: build {result['build_s']:.2f}s  "
+            f"p50 {result['p50_ms']:.2f}ms  p99 {result['p99_ms']:.2f}ms  "
+            f"peak RSS {result['peak_rss_mb']:.0f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
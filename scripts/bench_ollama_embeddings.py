@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark OllamaEmbeddingService.embed_documents against a local stub server.
+
+The stub emulates Ollama's /api/tags, /api/embeddings (one prompt per call) and
+/api/embed (multi-input) endpoints with a fixed per-request latency plus a small
+per-input cost, so the numbers reflect round-trip savings rather than model speed.
+
+Usage:
+    python scripts/bench_ollama_embeddings.py --chunks 2000 --latency-ms 15
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+from youtube_chat_cli_main.services.embedding_service import OllamaEmbeddingService
+
+DIM = 768
+
+
+def make_handler(latency_s: float, per_input_s: float):
+    class StubOllamaHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):  # silence default stderr logging
+            pass
+
+        def _reply(self, payload: dict) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            self._reply({"models": []})
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            req = json.loads(self.rfile.read(length) or b"{}")
+            if self.path == "/api/embed":
+                inputs = req.get("input") or []
+                time.sleep(latency_s + per_input_s * len(inputs))
+                self._reply({"embeddings": [[0.1] * DIM for _ in inputs]})
+            else:
+                time.sleep(latency_s + per_input_s)
+                self._reply({"embedding": [0.1] * DIM})
+
+    return StubOllamaHandler
+
+
+def run_case(base_url: str, texts, batch_size: int, concurrency: int) -> float:
+    cfg = SimpleNamespace(
+        ollama_base_url=base_url,
+        ollama_embedding_model="nomic-embed-text",
+        ollama_embed_batch_size=batch_size,
+        ollama_embed_concurrency=concurrency,
+        ollama_embed_retry_attempts=1,
+    )
+    svc = OllamaEmbeddingService(cfg)
+    t0 = time.perf_counter()
+    out = svc.embed_documents(texts)
+    elapsed = time.perf_counter() - t0
+    assert len(out) == len(texts)
+    return len(texts) / elapsed
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--chunks", type=int, default=1000)
+    ap.add_argument("--latency-ms", type=float, default=15.0, help="fixed stub latency per request")
+    ap.add_argument("--per-input-ms", type=float, default=0.5, help="stub latency per embedded input")
+    ap.add_argument("--batch-size", type=int, default=32)
+    ap.add_argument("--concurrency", type=int, default=4)
+    args = ap.parse_args()
+
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0),
+        make_handler(args.latency_ms / 1000.0, args.per_input_ms / 1000.0),
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    texts = [f"chunk {i} " + "lorem ipsum " * 50 for i in range(args.chunks)]
+    try:
+        before = run_case(base_url, texts, batch_size=1, concurrency=1)
+        after = run_case(base_url, texts, batch_size=args.batch_size, concurrency=args.concurrency)
+    finally:
+        server.shutdown()
+
+    print(f"chunks={args.chunks} latency={args.latency_ms}ms per_input={args.per_input_ms}ms")
+    print(f"before (per-text /api/embeddings): {before:10.1f} chunks/s")
+    print(f"after  (batch={args.batch_size}, concurrency={args.concurrency}): {after:10.1f} chunks/s")
+    print(f"speedup: {after / before:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
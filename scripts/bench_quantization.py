@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark quantized storage in the local vector store.
+
+Indexes the same synthetic clustered embeddings once per quantization mode
+(none, int8, binary) and reports the bytes scanned per vector in the first
+pass, recall@k against exact float32 search, and single-query latency
+p50/p99. Results of quantized modes are rescored with the full vectors over
+``top_k * oversampling`` candidates.
+
+Usage:
+    python scripts/bench_quantization.py --chunks 50000 --dim 768
+    python scripts/bench_quantization.py --oversampling 2 --modes int8 binary
+"""
+
+import argparse
+import tempfile
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+BATCH = 1000
+
+
+def make_embeddings(chunks: int, dim: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(max(1, chunks // 200), dim)).astype(np.float32)
+    noise = 0.5 * rng.normal(size=(chunks, dim)).astype(np.float32)
+    return centers[rng.integers(0, len(centers), chunks)] + noise
+
+
+def exact_top_k(embeddings: np.ndarray, queries: np.ndarray, k: int) -> list:
+    normed = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    scores = (queries / np.linalg.norm(queries, axis=1, keepdims=True)) @ normed.T
+    return [set(np.argpartition(-row, k)[:k].tolist()) for row in scores]
+
+
+def bench_mode(args, mode: str, embeddings: np.ndarray, queries: np.ndarray, truth: list) -> dict:
+    from youtube_chat_cli_main.services.local_vector_store import LocalVectorStore
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = LocalVectorStore(SimpleNamespace(
+            local_vector_store_path=tmp,
+            local_vector_collection_name="bench",
+            local_vector_dtype="float32",
+            local_vector_ivf_threshold=args.ivf_threshold,
+            local_vector_ivf_nprobe=8,
+            vector_quantization=mode,
+            vector_quantization_oversampling=args.oversampling,
+        ))
+        for start in range(0, len(embeddings), BATCH):
+            batch = embeddings[start:start + BATCH]
+            docs = [{"content": str(start + i)} for i in range(len(batch))]
+            store.add_documents(docs, batch.tolist(), {"file_id": "bench"}, ids=[str(start + i) for i in range(len(batch))])
+
+        store.search(queries[0].tolist(), top_k=args.top_k)  # warm up
+        latencies, hits = [], []
+        for query in queries:
+            started = time.perf_counter()
+            results = store.search(query.tolist(), top_k=args.top_k)
+            latencies.append((time.perf_counter() - started) * 1000)
+            hits.append({int(r["id"]) for r in results})
+        info = store.get_collection_info()
+        store.close()
+
+    recall = np.mean([len(found & expected) / args.top_k for found, expected in zip(hits, truth)])
+    return {
+        "mode": mode,
+        "scan_mb": info["scan_bytes_per_vector"] * len(embeddings) / 2**20,
+        "recall": float(recall),
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p99_ms": float(np.percentile(latencies, 99)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=50_000)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--oversampling", type=float, default=4.0)
+    parser.add_argument("--ivf-threshold", type=int, default=1_000_000_000, help="default: exact scan only")
+    parser.add_argument("--modes", nargs="+", choices=("none", "int8", "binary"), default=["none", "int8", "binary"])
+    args = parser.parse_args()
+
+    embeddings = make_embeddings(args.chunks, args.dim)
+    # Queries near stored chunks, as questions about ingested content are
+    picks = np.random.default_rng(1).integers(0, args.chunks, args.queries)
+    queries = embeddings[picks] + 0.3 * make_embeddings(args.queries, args.dim, seed=2)
+    truth = exact_top_k(embeddings, queries, args.top_k)
+
+    for mode in args.modes:
+        result = bench_mode(args, mode, embeddings, queries, truth)
+        print(
+            f"{mode:>6}: scan {result['scan_mb']:.1f}MB  recall@{args.top_k} {result['recall']:.3f}  "
+            f"p50 {result['p50_ms']:.2f}ms  p99 {result['p99_ms']:.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
 import os
 import sys
+from types import SimpleNamespace
+
 import pytest
 
 try:
@@ -48,3 +50,53 @@ def respx_mock():
     with _respx.mock as mock:
         yield mock
 
+
+
+def local_store_config(path, **overrides):
+    """Config for a ``LocalVectorStore`` under ``path`` (exact search, no quantization)."""
+    values = dict(
+        local_vector_store_path=str(path),
+        local_vector_collection_name="documents",
+        local_vector_dtype="float32",
+        local_vector_ivf_threshold=10_000,
+        local_vector_ivf_nprobe=8,
+        vector_quantization="none",
+        vector_quantization_oversampling=4.0,
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def add_chunks(store, vectors, file_id="f1", **metadata):
+    """Add one chunk per row of ``vectors`` to a backend store; returns the ids ``{file_id}_{i}``."""
+    docs = [{"content": f"chunk {i}", "metadata": {"chunk_index": i}} for i in range(len(vectors))]
+    return store.add_documents(docs, vectors.tolist(), {"file_id": file_id, **metadata})
+
+
+def brute_force(vectors, query, k):
+    """Row indexes of the ``k`` rows of ``vectors`` most cosine-similar to ``query``."""
+    import numpy as np
+
+    normed = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return list(np.argsort(-(normed @ (query / np.linalg.norm(query))))[:k])
+
+
+def make_vector_store(backend, embedding_service=None, db=None, **config):
+    """``VectorStore`` over ``backend`` that skips ``__init__`` (no Ollama, no global config)."""
+    from youtube_chat_cli_main.services import vector_store as vs_mod
+
+    store = vs_mod.VectorStore.__new__(vs_mod.VectorStore)
+    store.config = SimpleNamespace(**config)
+    store.db = db
+    store.embedding_service = embedding_service
+    store.backend = backend
+    return store
+
+
+def make_local_vector_store(tmp_path, embedding_service, **config):
+    """``make_vector_store`` over a ``LocalVectorStore`` and metadata database in ``tmp_path``."""
+    from youtube_chat_cli_main.core.database import Database
+    from youtube_chat_cli_main.services.local_vector_store import LocalVectorStore
+
+    backend = LocalVectorStore(local_store_config(tmp_path / "vectors"))
+    return make_vector_store(backend, embedding_service, Database(str(tmp_path / "meta.db")), **config)
@@ -0,0 +1,98 @@
+import io
+import wave
+
+import pytest
+
+from youtube_chat_cli_main import audio_assembly as aa
+
+RATE = 8000
+
+
+def _wav_bytes(samples, rate=RATE, channels=1, width=2):
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(width)
+        w.setframerate(rate)
+        w.writeframes(b"".join(int(s).to_bytes(width, "little", signed=True) for s in samples))
+    return buf.getvalue()
+
+
+def _read_samples(path):
+    with wave.open(str(path), "rb") as w:
+        data = w.readframes(w.getnframes())
+        width = w.getsampwidth()
+    return [int.from_bytes(data[i:i + width], "little", signed=True) for i in range(0, len(data), width)]
+
+
+def test_streams_files_and_buffers_with_pauses(tmp_path):
+    first = tmp_path / "seg_01.wav"
+    first.write_bytes(_wav_bytes([100] * 800))
+    second = _wav_bytes([200] * 400)  # in-memory segment
+
+    out = tmp_path / "podcast.wav"
+    stats = aa.assemble_wav([str(first), second], str(out), pause_ms=50, chunk_frames=128)
+
+    samples = _read_samples(out)
+    assert samples == [100] * 800 + [0] * 400 + [200] * 400
+    assert stats["segments"] == 2 and stats["skipped"] == 0
+    assert stats["frames"] == len(samples)
+    assert stats["duration_s"] == pytest.approx(1600 / RATE)
+
+
+def test_unreadable_segments_are_skipped(tmp_path):
+    out = tmp_path / "podcast.wav"
+    stats = aa.assemble_wav(
+        [str(tmp_path / "missing.wav"), _wav_bytes([7] * 10)], str(out), pause_ms=0
+    )
+    assert stats["skipped"] == 1
+    assert _read_samples(out) == [7] * 10
+
+    with pytest.raises(aa.AudioAssemblyError):
+        aa.assemble_wav([str(tmp_path / "missing.wav")], str(tmp_path / "none.wav"))
+
+
+def test_mismatched_segment_converted_to_output_format(tmp_path):
+    out = tmp_path / "podcast.wav"
+    aa.assemble_wav(
+        [_wav_bytes([10] * 800), _wav_bytes([10] * 400, rate=RATE // 2)], str(out), pause_ms=0
+    )
+    with wave.open(str(out), "rb") as w:
+        assert w.getframerate() == RATE
+        assert w.getnframes() == pytest.approx(1600, abs=4)
+
+
+def test_crossfade_overlaps_segments(tmp_path):
+    pytest.importorskip("numpy")
+    out = tmp_path / "podcast.wav"
+    stats = aa.assemble_wav(
+        [_wav_bytes([1000] * 800), _wav_bytes([-1000] * 800)],
+        str(out), pause_ms=300, crossfade_ms=25, chunk_frames=64,
+    )
+
+    samples = _read_samples(out)
+    fade = RATE * 25 // 1000
+    assert len(samples) == stats["frames"] == 1600 - fade
+    assert samples[:800 - fade] == [1000] * (800 - fade)
+    assert samples[800:] == [-1000] * (800 - fade)
+    window = samples[800 - fade:800]
+    assert window[0] == 1000 and window[-1] == -1000
+    assert window == sorted(window, reverse=True)
+
+
+def test_combine_audio_segments_mixes_files_and_buffers(tmp_path, monkeypatch):
+    from youtube_chat_cli_main.tts_service import TTSService
+
+    monkeypatch.setenv("PODCAST_PAUSE_MS", "0")
+    seg_file = tmp_path / "seg_01.wav"
+    seg_file.write_bytes(_wav_bytes([1] * 100))
+    segments = [
+        ("Host", "voice-a", "hi", str(seg_file)),
+        ("Expert", "voice-b", "hello", _wav_bytes([2] * 50)),
+    ]
+
+    out = tmp_path / "podcast.wav"
+    TTSService()._combine_audio_segments(segments, str(out))
+
+    assert _read_samples(out) == [1] * 100 + [2] * 50
+    assert not seg_file.exists()
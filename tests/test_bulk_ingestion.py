@@ -0,0 +1,95 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from youtube_chat_cli_main.core.database import Database
+from youtube_chat_cli_main.services import vector_store as vs_mod
+
+from .conftest import make_vector_store
+
+CONFIG = SimpleNamespace(vector_upsert_batch_size=3, vector_upsert_parallelism=2)
+
+
+def _docs(n):
+    return [{"content": f"chunk {i}", "metadata": {"chunk_index": i}} for i in range(n)]
+
+
+class _RecordingQdrant:
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.calls = []
+        self.active = self.peak = 0
+
+    def upsert(self, collection_name, points, wait):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+            self.calls.append(([p.id for p in points], wait))
+
+
+def test_qdrant_upserts_in_parallel_batches_with_final_barrier():
+    store = vs_mod.QdrantVectorStore.__new__(vs_mod.QdrantVectorStore)
+    store.config = CONFIG
+    store.collection_name = "documents"
+    store.client = _RecordingQdrant()
+
+    ids = store.add_documents(_docs(10), [[0.1, 0.2]] * 10, {"file_id": "f"})
+
+    assert ids == [f"f_{i}" for i in range(10)]
+    assert store.client.peak == 2
+    *early, last = store.client.calls
+    assert sorted(i for batch, _ in early for i in batch) == sorted(ids[:9])
+    assert all(not wait for _, wait in early)
+    assert last == (["f_9"], True)
+
+
+def test_chroma_batches_and_normalizes_metadata():
+    added = []
+    store = vs_mod.ChromaVectorStore.__new__(vs_mod.ChromaVectorStore)
+    store.config = CONFIG
+    store.collection = SimpleNamespace(upsert=lambda **kw: added.append(kw))
+
+    docs = _docs(4)
+    docs[1]["metadata"]["tags"] = ["Work"]
+    store.add_documents(docs, [[0.0]] * 4, {"file_id": "f", "tags": ["Inbox"], "size": None, "ts": object})
+
+    assert [len(call["ids"]) for call in added] == [3, 1]
+    metadatas = [m for call in added for m in call["metadatas"]]
+    assert metadatas[0]["tags"] == "Inbox" and metadatas[0]["tag_inbox"] == 1
+    assert "size" not in metadatas[0] and isinstance(metadatas[0]["ts"], str)
+    assert metadatas[1]["tags"] == "Work" and metadatas[1]["tag_work"] == 1
+    assert [m["chunk_index"] for m in metadatas] == [0, 1, 2, 3]
+
+
+def test_metadata_written_in_one_transaction(tmp_path, monkeypatch):
+    db = Database(str(tmp_path / "ingest.db"))
+    connections = []
+    original = db.get_connection
+
+    def counting_connection():
+        connections.append(1)
+        return original()
+
+    store = make_vector_store(
+        SimpleNamespace(add_documents=lambda documents, embeddings, metadata, ids: ids),
+        SimpleNamespace(embed_documents=lambda texts: [[0.0]] * len(texts)),
+        db, **vars(CONFIG),
+    )
+    monkeypatch.setattr(db, "get_connection", counting_connection)
+    monkeypatch.setattr(vs_mod, "invalidate_semantic_cache", lambda: None)
+
+    store.add_documents(_docs(50), {"file_id": "f"})
+
+    assert len(connections) == 2  # one read of the stored chunk hashes, one write
+    monkeypatch.setattr(db, "get_connection", original)
+    with db.get_connection() as conn:
+        count, text = conn.execute(
+            "SELECT COUNT(*), MAX(chunk_text) FROM vector_metadata WHERE source_file_id = 'f'"
+        ).fetchone()
+    assert count == 50 and text == "chunk 9"
+    if db.fts_enabled:
+        assert [r["id"] for r in db.lexical_search("42")] == ["f_42"]
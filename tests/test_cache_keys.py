@@ -0,0 +1,88 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from youtube_chat_cli_main.core import cache_keys
+from youtube_chat_cli_main.core import redis_cache
+from youtube_chat_cli_main.core.redis_cache import RedisCache
+from youtube_chat_cli_main.services import semantic_cache as sc
+from youtube_chat_cli_main.workflows import content_checks as cc
+
+
+@pytest.fixture()
+def cache(monkeypatch):
+    cache = RedisCache("redis://unused", None, 0, enabled=False)
+    monkeypatch.setattr(redis_cache, "_cache_singleton", cache)
+    monkeypatch.setattr(sc, "_semantic_cache", None)
+    return cache
+
+
+def test_keys_are_stable_across_processes(cache):
+    code = (
+        "from youtube_chat_cli_main.core.cache_keys import stable_digest, normalize_text;"
+        "print(stable_digest(normalize_text('What is  RAG?'), ['brave', 'legacy'], 10))"
+    )
+    digests = {
+        subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+        ).stdout.strip()
+        for seed in ("1", "2")
+    }
+    assert digests == {cache_keys.stable_digest("what is rag?", ["brave", "legacy"], 10)}
+
+
+def test_bumping_a_generation_orphans_its_keys_only(cache):
+    vector_key = cache_keys.cache_key("vector", "q", 5)
+    search_key = cache_keys.cache_key("search", "q", generation_name=cache_keys.SEARCH)
+    assert vector_key == cache_keys.cache_key("vector", "q", 5)
+
+    assert cache_keys.bump_generation(cache_keys.CORPUS) == 1
+    assert cache_keys.cache_key("vector", "q", 5) != vector_key
+    assert cache_keys.cache_key("search", "q", generation_name=cache_keys.SEARCH) == search_key
+
+
+def test_counters_survive_memory_eviction():
+    cache = RedisCache("redis://unused", None, 0, enabled=False)
+    cache._mem._max = 4
+    cache_keys.bump_generation(cache_keys.CORPUS, cache)
+    for i in range(20):
+        cache.set(f"k{i}", "v")
+    assert cache_keys.generation(cache_keys.CORPUS, cache) == 1
+
+
+def test_vector_search_cache_hits_and_corpus_invalidation(cache, monkeypatch):
+    from youtube_chat_cli_main.services import vector_store as vs_mod
+
+    searches = []
+
+    class _Store:
+        def search(self, query, top_k, filter_dict):
+            searches.append(query)
+            return [{"id": "a", "score": 0.9}]
+
+    monkeypatch.setattr(vs_mod, "get_vector_store", lambda: _Store())
+
+    assert cc._vector_search("Hello  World") == cc._vector_search("hello world") == [{"id": "a", "score": 0.9}]
+    assert len(searches) == 1
+
+    # Corpus changed: semantic cache invalidation also drops vector results
+    sc.invalidate_semantic_cache()
+    cc._vector_search("hello world")
+    assert len(searches) == 2
+
+    stats = cache_keys.cache_stats(["vector"])
+    assert stats["vector"] == {"hits": 1, "misses": 2, "hit_ratio": pytest.approx(1 / 3)}
+    assert stats["generations"][cache_keys.CORPUS] == 1
+
+
+def test_semantic_answers_follow_corpus_generation(cache):
+    answers = sc.SemanticAnswerCache(cache=cache)
+    answers.store([1.0, 0.0], {"answer": "a"})
+    assert answers.lookup([1.0, 0.0])["answer"] == "a"
+
+    # Another process bumps the generation; this index still has the entry
+    cache_keys.bump_generation(cache_keys.CORPUS, cache)
+    assert answers.lookup([1.0, 0.0]) is None
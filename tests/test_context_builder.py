@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+
+from langchain_core.documents import Document
+
+from youtube_chat_cli_main.services import rag_engine as re_mod
+from youtube_chat_cli_main.services.context_builder import build_context, estimate_tokens, select_passages
+
+TEXT = " ".join(f"word{i}" for i in range(400))
+
+
+def _chunks(file_id, size=600, overlap=150):
+    """Split TEXT like the ingestion splitter: fixed size, shared overlap."""
+    chunks, start, index = [], 0, 0
+    while start < len(TEXT):
+        chunks.append({
+            "content": TEXT[start:start + size],
+            "metadata": {"file_id": file_id, "chunk_index": index},
+            "score": 0.5,
+        })
+        start += size - overlap
+        index += 1
+    return chunks
+
+
+def test_adjacent_chunks_merge_without_overlap():
+    chunks = _chunks("f")
+    passages = select_passages(chunks[1:4], max_tokens=10_000)
+
+    assert len(passages) == 1
+    assert passages[0]["content"] == TEXT[450:450 * 3 + 600]
+    assert passages[0]["metadata"]["chunk_index"] == 1
+
+
+def test_near_duplicates_are_dropped():
+    chunk = _chunks("f")[0]
+    copy_elsewhere = {"content": chunk["content"], "metadata": {"file_id": "g", "chunk_index": 0}, "score": 0.4}
+    quoted = {"content": chunk["content"][100:400], "title": "Web", "url": "https://x", "score": 0.3}
+    other = {"content": "an unrelated passage about something else entirely", "score": 0.2}
+
+    passages = select_passages([chunk, copy_elsewhere, quoted, other], max_tokens=10_000)
+
+    assert [p["content"] for p in passages] == [chunk["content"], other["content"]]
+
+
+def test_budget_keeps_the_best_passages_in_input_order():
+    passages = [
+        {"content": "alpha " * 50, "score": 0.2},
+        {"content": "bravo " * 200, "score": 0.9},
+        {"content": "charlie " * 50, "score": 0.5},
+        {"content": "delta " * 50, "score": 0.1},
+    ]
+    budget = estimate_tokens(passages[1]["content"]) + estimate_tokens(passages[2]["content"]) + 10
+
+    context = build_context(passages, max_tokens=budget)
+
+    assert context.startswith("bravo") and "charlie" in context
+    assert "alpha" not in context and "delta" not in context
+    assert estimate_tokens(context) <= budget
+
+
+def test_oversized_best_passage_is_truncated_not_dropped():
+    context = build_context([{"content": "x" * 10_000, "score": 1.0}], max_tokens=100)
+    assert 0 < estimate_tokens(context) <= 100
+
+
+def test_formatter_and_documents_without_scores():
+    docs = [Document(page_content="first", metadata={"title": "A"}), Document(page_content="second", metadata={})]
+    context = build_context(docs, max_tokens=100, formatter=lambda i, p: f"[{i}] {p['content']}")
+    assert context == "[1] first\n\n[2] second"
+
+
+def test_rag_prompt_uses_budgeted_context():
+    engine = re_mod.AdaptiveRAGEngine.__new__(re_mod.AdaptiveRAGEngine)
+    engine.config = SimpleNamespace(rag_context_max_tokens=10_000, rag_context_dedup_threshold=0.8)
+    chunks = _chunks("f")
+    docs = [Document(page_content=c["content"], metadata=c["metadata"]) for c in chunks + chunks[:1]]
+
+    _, prompt = engine._generation_prompts("q?", docs)
+
+    assert TEXT in prompt
+    assert prompt.count(TEXT[:100]) == 1
+    assert len(prompt) < len(TEXT) + 200
@@ -0,0 +1,83 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from youtube_chat_cli_main.services import embedding_service as es
+
+
+class _Resp:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class _FakeSession:
+    def __init__(self, fail_first=0):
+        self.calls = []
+        self.fail_first = fail_first
+        self._lock = threading.Lock()
+
+    def mount(self, *a, **k):
+        pass
+
+    def get(self, url, timeout=None):
+        return _Resp({"models": []})
+
+    def post(self, url, json=None, timeout=None):
+        with self._lock:
+            self.calls.append((url, json))
+            if self.fail_first > 0:
+                self.fail_first -= 1
+                raise ConnectionError("transient")
+        if url.endswith("/api/embed"):
+            return _Resp({"embeddings": [[float(t.split()[-1])] for t in json["input"]]})
+        return _Resp({"embedding": [float(json["prompt"].split()[-1])]})
+
+
+def _make(monkeypatch, batch_size, concurrency=3, fail_first=0):
+    session = _FakeSession(fail_first=fail_first)
+    monkeypatch.setattr(es.requests, "Session", lambda: session)
+    monkeypatch.setattr(es.time, "sleep", lambda s: None)
+    cfg = SimpleNamespace(
+        ollama_base_url="http://ollama",
+        ollama_embedding_model="nomic-embed-text",
+        ollama_embed_batch_size=batch_size,
+        ollama_embed_concurrency=concurrency,
+        ollama_embed_retry_attempts=3,
+    )
+    return es.OllamaEmbeddingService(cfg), session
+
+
+def test_batched_embed_preserves_order(monkeypatch):
+    svc, session = _make(monkeypatch, batch_size=4)
+    texts = [f"chunk {i}" for i in range(10)]
+    out = svc.embed_documents(texts)
+    assert out == [[float(i)] for i in range(10)]
+    assert all(url.endswith("/api/embed") for url, _ in session.calls)
+    assert len(session.calls) == 3
+
+
+def test_batch_is_retried(monkeypatch):
+    svc, session = _make(monkeypatch, batch_size=8, concurrency=1, fail_first=1)
+    out = svc.embed_documents([f"t {i}" for i in range(5)])
+    assert len(out) == 5
+    assert len(session.calls) == 2
+
+
+def test_batch_size_one_uses_legacy_endpoint(monkeypatch):
+    svc, session = _make(monkeypatch, batch_size=1)
+    out = svc.embed_documents(["a 1", "b 2"])
+    assert out == [[1.0], [2.0]]
+    assert all(url.endswith("/api/embeddings") for url, _ in session.calls)
+
+
+def test_batch_exhausts_retries(monkeypatch):
+    svc, _ = _make(monkeypatch, batch_size=8, concurrency=1, fail_first=10)
+    with pytest.raises(es.EmbeddingError):
+        svc.embed_documents(["x 1"])
@@ -0,0 +1,76 @@
+import itertools
+
+from youtube_chat_cli_main.core import embedding_cache as ec
+from youtube_chat_cli_main.core.embedding_cache import EmbeddingCache, text_digest
+from youtube_chat_cli_main.services import embedding_service as es
+
+
+class _CountingBackend:
+    model = "nomic-embed-text"
+
+    def __init__(self, config=None):
+        self.calls = []
+
+    def embed_query(self, text):
+        self.calls.append([text])
+        return [float(len(text)), 0.5]
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(t)), 0.5] for t in texts]
+
+    def get_embedding_dimension(self):
+        return 2
+
+
+def _make(monkeypatch, cache):
+    monkeypatch.setenv("EMBEDDING_PROVIDER", "ollama")
+    monkeypatch.setattr(es, "OllamaEmbeddingService", _CountingBackend)
+    return es.EmbeddingService(cache=cache)
+
+
+def test_reingest_costs_no_embedding_calls(monkeypatch, tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "emb.db"))
+    svc = _make(monkeypatch, cache)
+    texts = ["alpha", "beta", "alpha", "gamma!"]
+
+    first = svc.embed_documents(texts)
+    assert svc.backend.calls == [["alpha", "beta", "gamma!"]]
+
+    second = svc.embed_documents(texts)
+    assert second == first
+    assert len(svc.backend.calls) == 1
+
+    assert svc.embed_query("beta") == [4.0, 0.5]
+    assert len(svc.backend.calls) == 1
+
+    stats = cache.stats()
+    assert stats["entries"] == 3
+    assert stats["hits"] == 5 and stats["misses"] == 4
+    assert 0.5 < stats["hit_ratio"] < 0.6
+
+
+def test_cache_persists_across_instances_and_is_model_scoped(tmp_path):
+    path = str(tmp_path / "emb.db")
+    c1 = EmbeddingCache(path)
+    c1.put_many("ollama", "m1", {text_digest("x"): [0.25, -1.0, 3.5]})
+    c1.close()
+
+    c2 = EmbeddingCache(path)
+    assert c2.get_many("ollama", "m1", [text_digest("x")]) == {text_digest("x"): [0.25, -1.0, 3.5]}
+    assert c2.get_many("ollama", "m2", [text_digest("x")]) == {}
+
+
+def test_lru_eviction_respects_cap(monkeypatch, tmp_path):
+    clock = itertools.count(1)
+    monkeypatch.setattr(ec.time, "time", lambda: float(next(clock)))
+    cache = EmbeddingCache(str(tmp_path / "emb.db"), max_entries=3)
+    for i in range(3):
+        cache.put_many("p", "m", {f"h{i}": [float(i)]})
+    # Touch h0 so h1 becomes the least recently used entry
+    cache.get_many("p", "m", ["h0"])
+    cache.put_many("p", "m", {"h3": [3.0]})
+    cache.trim()
+
+    remaining = cache.get_many("p", "m", ["h0", "h1", "h2", "h3"])
+    assert set(remaining) == {"h0", "h2", "h3"}
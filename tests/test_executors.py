@@ -0,0 +1,87 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from youtube_chat_cli_main.core import executors
+
+
+@pytest.fixture()
+def event_loop_sockets():
+    from pytest_socket import enable_socket
+
+    enable_socket()  # the event loop's self-pipe needs socketpair()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pools():
+    executors.shutdown_executors()
+    yield
+    executors.shutdown_executors()
+
+
+def test_pool_tracks_saturation():
+    pool = executors.WorkloadPool("llm", max_workers=2)
+    release = threading.Event()
+    futures = [pool.submit(release.wait) for _ in range(3)]
+    deadline = time.time() + 2
+    while pool.stats()["active"] < 2 and time.time() < deadline:
+        time.sleep(0.01)
+
+    stats = pool.stats()
+    assert stats["active"] == 2 and stats["queued"] == 1
+    assert stats["saturation"] == 1.0
+
+    release.set()
+    for f in futures:
+        f.result(timeout=2)
+    assert pool.stats()["completed"] == 3
+    pool.shutdown()
+
+
+def test_unknown_workload_rejected():
+    with pytest.raises(ValueError):
+        executors.get_executor("gpu")
+
+
+def test_iterate_in_pool_preserves_order(event_loop_sockets):
+    async def collect():
+        return [x async for x in executors.iterate_in_pool("llm", iter(range(5)))]
+
+    assert asyncio.run(collect()) == [0, 1, 2, 3, 4]
+
+
+def test_health_latency_flat_under_chat_load(monkeypatch, event_loop_sockets):
+    from youtube_chat_cli_main import api_server
+
+    class _SlowEngine:
+        def query(self, question):
+            time.sleep(0.3)
+            return {"answer": "ok", "question": question, "documents": []}
+
+    monkeypatch.setattr(api_server, "get_rag_engine", lambda: _SlowEngine())
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=api_server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            chats = [
+                asyncio.create_task(client.post("/api/v1/chat/query", json={"question": f"q{i}"}))
+                for i in range(20)
+            ]
+            await asyncio.sleep(0.05)
+            latencies = []
+            for _ in range(5):
+                t0 = time.perf_counter()
+                r = await client.get("/api/v1/health")
+                latencies.append(time.perf_counter() - t0)
+                assert r.status_code == 200
+            in_flight = r.json()["executors"]["llm"]["active"]
+            responses = await asyncio.gather(*chats)
+            return latencies, in_flight, responses
+
+    latencies, in_flight, responses = asyncio.run(scenario())
+    assert all(r.status_code == 200 for r in responses)
+    assert in_flight > 0
+    assert max(latencies) < 0.2
@@ -0,0 +1,65 @@
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from youtube_chat_cli_main.services import content_processor as cp
+from youtube_chat_cli_main.services import extraction_executor as ee
+
+
+@pytest.fixture(scope="module")
+def executor():
+    executor = ee.ExtractionExecutor(processes=2, timeout=20)
+    yield executor
+    executor.shutdown()
+
+
+def test_parsers_run_in_worker_processes(executor, tmp_path):
+    page = tmp_path / "page.html"
+    page.write_text("<html><script>x()</script><body>\n<h1>Title</h1>\n<p>Body  text</p></body></html>")
+    data = tmp_path / "data.json"
+    data.write_text('{"a": {"b": [1, 2]}}')
+
+    assert executor.run(cp.html_to_text, str(page)) == "Title\nBody\ntext"
+    assert executor.run(cp.json_to_text, str(data)) == "a.b.0: 1\na.b.1: 2"
+    assert executor.run(os.getpid) != os.getpid()
+
+    # Workers unpickle tasks by module name; stdlib callables resolve the same in
+    # every child, whatever shadows this test package on sys.path
+    with pytest.raises(ValueError, match="malformed"):
+        executor.run(int, "malformed.pdf")
+
+
+def test_crash_and_timeout_fail_only_that_file(executor, tmp_path):
+    data = tmp_path / "data.json"
+    data.write_text('{"ok": true}')
+
+    with pytest.raises(ee.ExtractionError, match="crashed"):
+        executor.run(os._exit, 1)
+    with pytest.raises(ee.ExtractionTimeout):
+        executor.run(time.sleep, 60, timeout=0.5)
+
+    # The pool was replaced and keeps working
+    assert executor.run(cp.json_to_text, str(data)) == "ok: True"
+    stats = executor.stats()
+    assert stats["crashes"] >= 1 and stats["timeouts"] == 1 and stats["restarts"] >= 2
+
+
+def test_process_files_streams_results_as_they_finish(tmp_path, monkeypatch):
+    monkeypatch.setattr(ee, "_extraction_executor", ee.ExtractionExecutor(processes=0))
+    processor = cp.ContentProcessor.__new__(cp.ContentProcessor)
+    processor.config = SimpleNamespace(
+        extraction_processes=2, chunk_size=1000, chunk_overlap=100, split_by_headings=True
+    )
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"doc{i}.json"
+        path.write_text(f'{{"doc": {i}}}')
+        paths.append(str(path))
+    paths.append(str(tmp_path / "missing.json"))
+
+    results = {path: (result, error) for path, result, error in processor.process_files(paths)}
+
+    assert results[paths[3]][0]["chunks"][0]["content"] == "doc: 3"
+    assert isinstance(results[paths[-1]][1], cp.ContentProcessingError)
@@ -0,0 +1,98 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from youtube_chat_cli_main.core.database import Database
+from youtube_chat_cli_main.services import vector_store as vs_mod
+
+from .conftest import make_vector_store
+
+
+@pytest.fixture()
+def db(tmp_path):
+    database = Database(str(tmp_path / "fts.db"))
+    if not database.fts_enabled:
+        pytest.skip("SQLite built without FTS5")
+    return database
+
+
+def test_lexical_index_follows_vector_metadata(db):
+    db.add_vector_metadata("a", "f1", 0, {"source": "gdrive"}, chunk_text="Startup fails with ERR-4711 on boot")
+    db.add_vector_metadata("b", "f1", 1, {"source": "web"}, chunk_text="Alice explains qdrant payload indexes")
+
+    assert [r["id"] for r in db.lexical_search("what does ERR-4711 mean?")] == ["a"]
+    assert [r["id"] for r in db.lexical_search("alice", filters={"source": "web"})] == ["b"]
+    assert db.lexical_search("alice", filters={"source": "gdrive"}) == []
+
+    db.add_vector_metadata("a", "f1", 0, {"source": "gdrive"}, chunk_text="rewritten chunk")
+    assert db.lexical_search("ERR-4711") == []
+    assert [r["id"] for r in db.lexical_search("rewritten")] == ["a"]
+
+    db.delete_vector_metadata("b")
+    assert db.lexical_search("alice") == []
+
+
+def test_match_query_is_quoted():
+    assert Database.fts_match_query('ERR-42 "AND" (x') == '"ERR" OR "42" OR "AND" OR "x"'
+    assert Database.fts_match_query("?!") is None
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    fused = vs_mod.reciprocal_rank_fusion(
+        [[{"id": "a"}, {"id": "b"}], [{"id": "c"}, {"id": "a"}]], k=60
+    )
+    assert [r["id"] for r in fused] == ["a", "c", "b"]
+    assert fused[0]["score"] == pytest.approx(1 / 61 + 1 / 62)
+
+
+def _store(db, dense_results):
+    return make_vector_store(
+        SimpleNamespace(search=lambda **kw: list(dense_results)),
+        SimpleNamespace(embed_query=lambda query: [0.0]),
+        db, vector_search_mode="vector", hybrid_rrf_k=60,
+    )
+
+
+def test_hybrid_search_surfaces_exact_terms(db):
+    db.add_vector_metadata("code", "f2", 0, {"file_id": "f2"}, chunk_text="Error ERR-4711 means the cache is full")
+    db.add_vector_metadata("x", "f1", 0, {"file_id": "f1"}, chunk_text="General caching overview")
+    dense = [
+        {"id": "x", "score": 0.82, "content": "General caching overview", "metadata": {}},
+        {"id": "low", "score": 0.40, "content": "unrelated", "metadata": {}},
+    ]
+    store = _store(db, dense)
+
+    vector_only = store.search("ERR-4711 cache", top_k=3, min_score=0.7)
+    assert [r["id"] for r in vector_only] == ["x"]
+
+    hybrid = store.search("ERR-4711 cache", top_k=3, min_score=0.7, mode="hybrid")
+    assert {r["id"] for r in hybrid} == {"x", "code"}
+    assert hybrid[0]["id"] == "x"  # found by both retrievers
+    code = next(r for r in hybrid if r["id"] == "code")
+    assert code["vector_score"] is None and code["lexical_score"] > 0
+    assert code["content"] == "Error ERR-4711 means the cache is full"
+
+
+def test_hybrid_runs_lexical_leg_concurrently(db, monkeypatch):
+    started = threading.Event()
+
+    def lexical_search(query, limit=10, filters=None):
+        started.set()
+        return []
+
+    def embed_query(query):
+        # Only returns once BM25 is already running alongside the embedding
+        assert started.wait(1.0), "lexical search did not start"
+        return [0.0]
+
+    monkeypatch.setattr(db, "lexical_search", lexical_search)
+    store = _store(db, [])
+    store.embedding_service = SimpleNamespace(embed_query=embed_query)
+
+    assert store.search("anything", mode="hybrid") == []
+
+
+def test_unknown_mode_rejected(db):
+    with pytest.raises(vs_mod.VectorStoreError):
+        _store(db, []).search("q", mode="fuzzy")
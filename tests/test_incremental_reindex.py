@@ -0,0 +1,81 @@
+from types import SimpleNamespace
+
+import pytest
+
+from youtube_chat_cli_main.core.database import Database
+from youtube_chat_cli_main.services import vector_store as vs_mod
+
+from .conftest import make_local_vector_store
+
+
+@pytest.fixture()
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(vs_mod, "invalidate_semantic_cache", lambda: None)
+    embedded = []
+
+    def embed_documents(texts):
+        embedded.extend(texts)
+        return [[float(len(t)), 1.0, float(sum(map(ord, t)) % 97)] for t in texts]
+
+    store = make_local_vector_store(tmp_path, SimpleNamespace(embed_documents=embed_documents))
+    store.embedded = embedded
+    return store
+
+
+def _chunks(texts):
+    return [{"content": t, "metadata": {"chunk_index": i}} for i, t in enumerate(texts)]
+
+
+def test_only_changed_chunks_are_embedded(store):
+    texts = [f"paragraph {i} of the document" for i in range(500)]
+    ids = store.add_documents(_chunks(texts), {"file_id": "doc", "file_name": "a.txt"})
+    assert len(store.embedded) == 500
+
+    store.embedded.clear()
+    texts[123] = "paragraph 123 of the documnet, typo fixed"
+    assert store.add_documents(_chunks(texts), {"file_id": "doc", "file_name": "a.txt"}) == ids
+    assert store.embedded == [texts[123]]
+    assert store.db.get_vector_metadata("doc_123")["chunk_text"] == texts[123]
+
+    store.embedded.clear()
+    store.add_documents(_chunks(texts), {"file_id": "doc", "file_name": "a.txt"})
+    assert store.embedded == []
+
+
+def test_vanished_chunks_are_removed(store):
+    store.add_documents(_chunks(["a", "b", "c", "d"]), {"file_id": "doc"})
+    store.add_documents(_chunks(["a", "b"]), {"file_id": "doc"})
+
+    assert set(store.db.get_chunk_hashes("doc")) == {"doc_0", "doc_1"}
+    assert store.backend.get_collection_info()["points_count"] == 2
+
+
+def test_legacy_rows_without_hash_are_reembedded(store):
+    store.db.add_vector_metadata("doc_0", "doc", 0, {"file_id": "doc"}, chunk_text="old")
+    assert store.db.get_chunk_hashes("doc") == {"doc_0": None}
+
+    store.add_documents(_chunks(["old"]), {"file_id": "doc"})
+    assert store.embedded == ["old"]
+    assert store.db.get_chunk_hashes("doc")["doc_0"] == vs_mod.chunk_hash(_chunks(["old"])[0])
+
+
+def test_chunk_hash_covers_chunk_metadata_only():
+    doc = {"content": "text", "metadata": {"page": 1}}
+    assert vs_mod.chunk_hash(doc) == vs_mod.chunk_hash({"content": "text", "metadata": {"page": 1}})
+    assert vs_mod.chunk_hash(doc) != vs_mod.chunk_hash({"content": "text", "metadata": {"page": 2}})
+    assert vs_mod.chunk_hash(doc) != vs_mod.chunk_hash({"content": "text!", "metadata": {"page": 1}})
+
+
+def test_existing_database_gains_content_hash_column(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "old.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE vector_metadata (id TEXT PRIMARY KEY, source_file_id TEXT, source_type TEXT, "
+                 "chunk_index INTEGER, chunk_text TEXT, embedding_model TEXT, vector_store TEXT, "
+                 "collection_name TEXT, metadata TEXT, created_at TIMESTAMP)")
+    conn.execute("INSERT INTO vector_metadata (id, source_file_id, chunk_text) VALUES ('f_0', 'f', 'x')")
+    conn.commit()
+    conn.close()
+
+    assert Database(str(path)).get_chunk_hashes("f") == {"f_0": None}
@@ -0,0 +1,116 @@
+import threading
+import time
+
+import pytest
+
+from youtube_chat_cli_main.services import vector_store as vs_mod
+from youtube_chat_cli_main.services.ingestion_pipeline import IngestionPipeline
+
+from .conftest import make_local_vector_store
+
+
+class _Embedder:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.lock = threading.Lock()
+        self.active = self.peak = 0
+
+    def embed_documents(self, texts):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.calls.append(len(texts))
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return [[float(len(t)), 1.0, float(sum(map(ord, t)) % 97)] for t in texts]
+
+
+@pytest.fixture()
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(vs_mod, "invalidate_semantic_cache", lambda: None)
+    return make_local_vector_store(
+        tmp_path, _Embedder(),
+        ingest_extract_workers=4, ingest_embed_concurrency=4, ingest_embed_batch_size=8,
+        ingest_queue_size=2, vector_upsert_batch_size=256,
+    )
+
+
+def _extract(name, chunks=3):
+    docs = [{"content": f"{name} chunk {i}", "metadata": {"chunk_index": i}} for i in range(chunks)]
+    return docs, {"file_id": name, "file_name": f"{name}.txt"}
+
+
+def test_files_are_indexed_like_add_documents(store):
+    done = {}
+    summary = IngestionPipeline(_extract, store, on_success=lambda f, ids: done.update({f: ids})).run(
+        f"f{i}" for i in range(20)
+    )
+
+    assert summary["succeeded"] == 20 and summary["failed"] == 0
+    assert done["f7"] == ["f7_0", "f7_1", "f7_2"]
+    assert store.backend.get_collection_info()["points_count"] == 60
+    assert store.db.get_vector_metadata("f7_2")["metadata"]["file_name"] == "f7.txt"
+    # Small files share embedding calls
+    assert sum(store.embedding_service.calls) == 60
+    assert max(store.embedding_service.calls) > 3
+    assert summary["stages"]["upsert"]["chunks"] == 60
+
+    # Unchanged files are not embedded again
+    store.embedding_service.calls.clear()
+    IngestionPipeline(_extract, store).run(f"f{i}" for i in range(20))
+    assert store.embedding_service.calls == []
+
+
+def test_failures_are_isolated(store):
+    def extract(name):
+        if name == "bad":
+            raise ValueError("corrupt file")
+        return _extract(name)
+
+    failed = []
+    summary = IngestionPipeline(extract, store, on_failure=lambda f, e: failed.append((f, str(e)))).run(
+        ["a", "bad", "b"]
+    )
+
+    assert (summary["succeeded"], summary["failed"]) == (2, 1)
+    assert failed == [("bad", "corrupt file")]
+    assert summary["stages"]["extract"]["failed"] == 1
+
+
+def test_bad_file_in_a_batched_upsert_does_not_fail_the_batch(store, monkeypatch):
+    write = store.write_documents
+
+    def write_documents(prepared, embeddings):
+        if any(p["file_id"] == "bad" for p in prepared):
+            raise RuntimeError("rejected")
+        return write(prepared, embeddings)
+
+    monkeypatch.setattr(store, "write_documents", write_documents)
+    failed = []
+    summary = IngestionPipeline(_extract, store, embed_batch_size=64, on_failure=lambda f, e: failed.append(f)).run(
+        ["a", "bad", "b", "c"]
+    )
+
+    assert (summary["succeeded"], summary["failed"]) == (3, 1)
+    assert failed == ["bad"]
+
+
+def test_embedding_runs_concurrently_with_bounded_queues(store):
+    store.embedding_service = _Embedder(delay=0.05)
+    produced = []
+
+    def source():
+        for i in range(40):
+            produced.append(i)
+            yield f"f{i}"
+
+    summary = IngestionPipeline(_extract, store, embed_batch_size=1).run(source())
+
+    assert summary["succeeded"] == 40
+    assert store.embedding_service.peak == 4
+    assert summary["elapsed"] < 40 * 0.05
+    # Backpressure: no queue ever held more than INGEST_QUEUE_SIZE files
+    assert all(stage["queue_peak"] <= 2 for stage in summary["stages"].values())
+    assert summary["stages"]["embed"]["utilization"] > 0.5
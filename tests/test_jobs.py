@@ -0,0 +1,175 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from youtube_chat_cli_main.core.database import Database
+from youtube_chat_cli_main.services import job_service as js
+
+
+def _wait(service, job_id, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = service.get(job_id)
+        if job and job["status"] in js.TERMINAL_STATUSES:
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+@pytest.fixture()
+def service(tmp_path):
+    svc = js.JobService(db=Database(str(tmp_path / "jobs.db")))
+    yield svc
+    svc.shutdown(wait=True)
+
+
+def test_job_runs_and_records_progress(service, monkeypatch):
+    def handler(params, progress):
+        progress(0.5, "halfway")
+        return {"echo": params["value"]}
+
+    monkeypatch.setitem(js._HANDLERS, "echo", handler)
+    job_id = service.submit("echo", {"value": 42})
+
+    job = _wait(service, job_id)
+    assert job["status"] == "completed"
+    assert job["progress"] == 1.0
+    assert job["result"] == {"echo": 42}
+    assert job["params"] == {"value": 42}
+    assert job["started_at"] and job["completed_at"]
+
+
+def test_failed_job_keeps_error(service, monkeypatch):
+    def handler(params, progress):
+        raise RuntimeError("tts exploded")
+
+    monkeypatch.setitem(js._HANDLERS, "boom", handler)
+    job = _wait(service, service.submit("boom"))
+    assert job["status"] == "failed"
+    assert job["error_message"] == "tts exploded"
+
+
+def test_unknown_job_type_rejected(service):
+    with pytest.raises(js.JobError):
+        service.submit("nope")
+
+
+def test_per_type_concurrency_limit(service, monkeypatch):
+    monkeypatch.setenv("JOB_CONCURRENCY_PODCAST", "2")
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def handler(params, progress):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.05)
+        with lock:
+            state["active"] -= 1
+        return {}
+
+    monkeypatch.setitem(js._HANDLERS, "podcast", handler)
+    ids = [service.submit("podcast") for _ in range(5)]
+    for job_id in ids:
+        assert _wait(service, job_id)["status"] == "completed"
+    assert state["peak"] == 2
+
+
+def test_unfinished_jobs_resume(service, monkeypatch):
+    monkeypatch.setitem(js._HANDLERS, "echo", lambda params, progress: {"ok": params["n"]})
+    service.db.create_job("left-over", "echo", {"n": 7})
+    service.db.update_job("left-over", status="running")
+
+    assert service.resume_unfinished() == 1
+    assert _wait(service, "left-over")["result"] == {"ok": 7}
+
+
+def test_batch_research_endpoint_returns_job(service, monkeypatch):
+    from pytest_socket import enable_socket
+
+    enable_socket()  # TestClient's event loop needs socketpair()
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from youtube_chat_cli_main.api import jobs as jobs_api
+    from youtube_chat_cli_main.api import nexus_agents
+
+    monkeypatch.setattr(nexus_agents, "get_job_service", lambda: service)
+    monkeypatch.setattr(jobs_api, "get_job_service", lambda: service)
+    monkeypatch.setattr(nexus_agents.deep_research, "run", lambda topic, max_turns=None: {"summary": topic.upper()})
+
+    app = FastAPI()
+    app.include_router(nexus_agents.router, prefix="/api/v1/nexus-agents")
+    app.include_router(jobs_api.router)
+    client = TestClient(app)
+
+    r = client.post("/api/v1/nexus-agents/batch-research", json={"topics": ["a", "b"]})
+    assert r.status_code == 202
+    job_id = r.json()["job_id"]
+
+    _wait(service, job_id)
+    events = client.get(f"/api/v1/jobs/{job_id}/events").text
+    assert "event: completed" in events
+
+    job = client.get(f"/api/v1/jobs/{job_id}").json()
+    assert job["result"]["items"] == [
+        {"topic": "a", "result": {"summary": "A"}},
+        {"topic": "b", "result": {"summary": "B"}},
+    ]
+
+
+def test_jobs_of_a_live_owner_are_not_resumed(service, monkeypatch):
+    monkeypatch.setitem(js._HANDLERS, "echo", lambda params, progress: {"ok": params["n"]})
+    service.db.create_job("elsewhere", "echo", {"n": 1}, owner="other-host:1:jobs")
+    service.db.update_job("elsewhere", status="running")
+
+    assert service.resume_unfinished() == 0
+    assert service.get("elsewhere")["owner"] == "other-host:1:jobs"
+
+    # The other process stops heartbeating; its job is taken over once
+    with service.db.get_connection() as conn:
+        conn.execute("UPDATE jobs SET heartbeat_at = ? WHERE id = 'elsewhere'", (time.time() - 3600,))
+    assert service.resume_unfinished() == 1
+    assert service.resume_unfinished() == 0
+    job = _wait(service, "elsewhere")
+    assert (job["owner"], job["result"]) == (service.owner, {"ok": 1})
+
+
+def test_concurrent_resumes_run_each_job_once(service, monkeypatch, tmp_path):
+    runs = []
+    monkeypatch.setitem(js._HANDLERS, "echo", lambda params, progress: runs.append(params["n"]) or {})
+    for n in range(10):
+        service.db.create_job(f"left-over-{n}", "echo", {"n": n})
+    others = [js.JobService(db=Database(str(tmp_path / "jobs.db"))) for _ in range(3)]
+    try:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            resumed = list(pool.map(lambda svc: svc.resume_unfinished(), [service] + others))
+        assert sum(resumed) == 10
+        for n in range(10):
+            assert _wait(service, f"left-over-{n}")["status"] == "completed"
+    finally:
+        for other in others:
+            other.shutdown(wait=True)
+    assert sorted(runs) == list(range(10))
+
+
+def test_taken_over_job_discards_the_stale_owners_result(service, monkeypatch):
+    started, release = threading.Event(), threading.Event()
+
+    def handler(params, progress):
+        started.set()
+        release.wait(5)
+        return {"by": "stale owner"}
+
+    monkeypatch.setitem(js._HANDLERS, "slow", handler)
+    job_id = service.submit("slow")
+    assert started.wait(5)
+    with service.db.get_connection() as conn:
+        conn.execute("UPDATE jobs SET owner = 'new-owner', heartbeat_at = ? WHERE id = ?", (time.time(), job_id))
+    release.set()
+    service.shutdown(wait=True)
+
+    job = service.get(job_id)
+    assert (job["status"], job["owner"], job["result"]) == ("running", "new-owner", None)
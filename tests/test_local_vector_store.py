@@ -0,0 +1,162 @@
+import numpy as np
+import pytest
+
+from youtube_chat_cli_main.services.local_vector_store import LocalVectorStore
+from youtube_chat_cli_main.services.vector_store import VectorStoreError
+
+from .conftest import add_chunks, brute_force, local_store_config
+
+DIM = 16
+
+
+def _vectors(n, seed=0):
+    return np.random.default_rng(seed).normal(size=(n, DIM)).astype(np.float32)
+
+
+def test_search_matches_brute_force(tmp_path):
+    store = LocalVectorStore(local_store_config(tmp_path))
+    vectors = _vectors(300)
+    ids = add_chunks(store, vectors)
+
+    query = _vectors(1, seed=1)[0]
+    results = store.search(query.tolist(), top_k=5)
+
+    assert [r["id"] for r in results] == [ids[i] for i in brute_force(vectors, query, 5)]
+    assert results[0]["content"].startswith("chunk ")
+    assert results[0]["metadata"]["file_id"] == "f1"
+    assert results == sorted(results, key=lambda r: -r["score"])
+
+
+def test_search_many_matches_single_queries(tmp_path, monkeypatch):
+    from youtube_chat_cli_main.services import local_vector_store as lvs
+
+    monkeypatch.setattr(lvs, "SEARCH_BLOCK_ROWS", 64)  # force several blocks
+    store = LocalVectorStore(local_store_config(tmp_path))
+    add_chunks(store, _vectors(500))
+    queries = _vectors(4, seed=2).tolist()
+
+    batched = store.search_many(queries, top_k=7)
+    assert [[r["id"] for r in hits] for hits in batched] == [
+        [r["id"] for r in store.search(q, top_k=7)] for q in queries
+    ]
+
+
+def test_upsert_delete_and_reopen(tmp_path):
+    store = LocalVectorStore(local_store_config(tmp_path))
+    vectors = _vectors(10)
+    add_chunks(store, vectors)
+    add_chunks(store, vectors[:2][::-1])  # same ids f1_0/f1_1, swapped vectors
+    assert store.get_collection_info()["points_count"] == 10
+
+    top = store.search(vectors[1].tolist(), top_k=1)[0]
+    assert top["id"] == "f1_0" and top["score"] == pytest.approx(1.0, abs=1e-5)
+
+    store.delete_documents(["f1_0", "f1_5"])
+    assert "f1_0" not in [r["id"] for r in store.search(vectors[1].tolist(), top_k=10)]
+    store.close()
+
+    reopened = LocalVectorStore(local_store_config(tmp_path))
+    assert reopened.get_collection_info()["points_count"] == 8
+    assert reopened.search(vectors[3].tolist(), top_k=1)[0]["id"] == "f1_3"
+
+
+def test_compaction_keeps_results(tmp_path):
+    store = LocalVectorStore(local_store_config(tmp_path))
+    vectors = _vectors(40)
+    add_chunks(store, vectors)
+    store.delete_documents([f"f1_{i}" for i in range(25)])
+
+    info = store.get_collection_info()
+    assert info["slots"] == info["points_count"] == 15
+    assert store.search(vectors[30].tolist(), top_k=1)[0]["id"] == "f1_30"
+    add_chunks(store, _vectors(3, seed=5), file_id="f2")
+    assert store.get_collection_info()["points_count"] == 18
+
+
+def test_where_filters(tmp_path):
+    store = LocalVectorStore(local_store_config(tmp_path))
+    add_chunks(store, _vectors(5), file_id="a", file_type="pdf", file_size=100, tags=["Work"])
+    add_chunks(store, _vectors(5, seed=3), file_id="b", file_type="txt", file_size=900)
+    query = _vectors(1, seed=4)[0].tolist()
+
+    def ids(where):
+        return {r["id"].split("_")[0] for r in store.search(query, top_k=10, filter_dict=where)}
+
+    assert ids({"file_type": "pdf"}) == {"a"}
+    assert ids({"tag_work": 1}) == {"a"}
+    assert ids({"$and": [{"file_size": {"$gte": 500}}, {"file_type": {"$in": ["txt", "md"]}}]}) == {"b"}
+    assert ids({"$or": [{"file_id": "a"}, {"file_size": {"$gt": 500}}]}) == {"a", "b"}
+    assert ids({"file_type": {"$nin": ["pdf", "txt"]}}) == set()
+
+    with pytest.raises(VectorStoreError):
+        store.search(query, filter_dict={"file_size": {"$regex": "x"}})
+
+
+def test_float16_storage(tmp_path):
+    store = LocalVectorStore(local_store_config(tmp_path, local_vector_dtype="float16"))
+    vectors = _vectors(50)
+    add_chunks(store, vectors)
+
+    assert (tmp_path / "documents.f16").exists()
+    assert store.search(vectors[7].tolist(), top_k=1)[0]["id"] == "f1_7"
+
+
+def test_ivf_index_takes_over_above_threshold(tmp_path):
+    # Clustered data, as real embeddings are
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(20, DIM))
+    vectors = (centers[rng.integers(0, 20, 2000)] + 0.3 * rng.normal(size=(2000, DIM))).astype(np.float32)
+
+    store = LocalVectorStore(local_store_config(tmp_path, local_vector_ivf_threshold=1000, local_vector_ivf_nprobe=4))
+    add_chunks(store, vectors)
+    assert store.get_collection_info()["ivf_lists"] is not None
+
+    queries = vectors[:50] + 0.05 * rng.normal(size=(50, DIM)).astype(np.float32)
+    recall = np.mean([
+        len({r["id"] for r in hits} & {f"f1_{i}" for i in brute_force(vectors, q, 10)}) / 10
+        for q, hits in zip(queries, store.search_many(queries.tolist(), top_k=10))
+    ])
+    assert recall > 0.8
+
+    # New points are assigned to lists incrementally and survive a reopen
+    add_chunks(store, vectors[:5] * -1, file_id="neg")
+    store.close()
+    reopened = LocalVectorStore(local_store_config(tmp_path, local_vector_ivf_threshold=1000, local_vector_ivf_nprobe=4))
+    assert reopened.search((vectors[2] * -1).tolist(), top_k=1)[0]["id"] == "neg_2"
+
+
+def test_overwritten_vectors_move_to_their_new_ivf_list(tmp_path):
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(20, DIM))
+    vectors = (centers[rng.integers(0, 20, 2000)] + 0.3 * rng.normal(size=(2000, DIM))).astype(np.float32)
+    config = local_store_config(tmp_path, local_vector_ivf_threshold=1000, local_vector_ivf_nprobe=1)
+    store = LocalVectorStore(config)
+    add_chunks(store, vectors)
+
+    # Re-indexing an edited file overwrites f1_0..f1_4 in place
+    add_chunks(store, vectors[:5] * -1)
+    assert store.search((vectors[2] * -1).tolist(), top_k=1)[0]["id"] == "f1_2"
+    store.close()
+    assert LocalVectorStore(config).search((vectors[3] * -1).tolist(), top_k=1)[0]["id"] == "f1_3"
+
+
+def test_search_racing_with_compaction_resolves_the_right_chunks(tmp_path):
+    store = LocalVectorStore(local_store_config(tmp_path))
+    vectors = _vectors(40)
+    add_chunks(store, vectors)
+    store.delete_documents([f"f1_{i}" for i in range(15)])
+
+    fetch, epochs = store._fetch_results, []
+
+    def compact_first(hits, epoch):
+        if not epochs:
+            # Crosses the dead fraction: compact() renumbers every slot
+            store.delete_documents([f"f1_{i}" for i in range(15, 25)])
+        epochs.append(epoch)
+        return fetch(hits, epoch)
+
+    store._fetch_results = compact_first
+    top = store.search(vectors[30].tolist(), top_k=1)[0]
+
+    assert len(epochs) == 2 and epochs[0] != epochs[1]
+    assert top["id"] == "f1_30" and top["score"] == pytest.approx(1.0, abs=1e-5)
@@ -0,0 +1,105 @@
+from types import SimpleNamespace
+
+import pytest
+
+from youtube_chat_cli_main.services import content_processor as cp
+from youtube_chat_cli_main.services import extraction_executor as ee
+from youtube_chat_cli_main.services.ingestion_pipeline import IngestionPipeline
+
+from .test_ingestion_pipeline import store  # noqa: F401 - fixture
+
+
+def _write_pdf(path, pages):
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for page in range(pages):
+        lines = " ".join(f"(Page {page + 1} line {line} of the quarterly report text.) Tj T*" for line in range(30))
+        stream = f"BT /F1 9 Tf 11 TL 36 800 Td {lines} ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {pages} >>"
+
+    body, offsets = b"%PDF-1.4\n", []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(body))
+        body += f"{number} 0 obj\n{obj}\nendobj\n".encode("latin-1")
+    xref = len(body)
+    body += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    body += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    body += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(body)
+    return str(path)
+
+
+@pytest.fixture()
+def processor(monkeypatch):
+    monkeypatch.setattr(ee, "_extraction_executor", ee.ExtractionExecutor(processes=0))
+    processor = cp.ContentProcessor.__new__(cp.ContentProcessor)
+    processor.config = SimpleNamespace(
+        chunk_size=400, chunk_overlap=50, split_by_headings=True, pdf_pages_per_task=3, extraction_processes=0
+    )
+    return processor
+
+
+def test_pages_stream_in_order_from_page_ranges(processor, tmp_path):
+    pdf = _write_pdf(tmp_path / "report.pdf", 10)
+
+    pages = list(processor.iter_pdf_pages(pdf))
+
+    assert [page.split("\n", 1)[0] for page in pages] == [f"## Page {i}" for i in range(1, 11)]
+    assert "Page 7 line 3" in pages[6]
+
+
+def test_streamed_chunks_match_whole_file_chunks(processor, tmp_path):
+    pdf = _write_pdf(tmp_path / "report.pdf", 7)
+
+    chunks, metadata = processor.stream_file(pdf)
+    streamed = list(chunks)
+
+    assert streamed == processor.process_file(pdf)["chunks"]
+    assert [c["metadata"]["chunk_index"] for c in streamed] == list(range(len(streamed)))
+    assert metadata["file_type"] == "application/pdf"
+
+
+def test_streamed_file_is_embedded_while_parsing_with_bounded_buffering(store):  # noqa: F811
+    total = 200
+    produced = []
+
+    def chunks():
+        for i in range(total):
+            # Chunks produced but not yet embedded stay bounded by the queues
+            assert len(produced) - sum(store.embedding_service.calls) <= 3 * 4
+            produced.append(i)
+            yield {"content": f"page chunk {i}", "metadata": {"chunk_index": i}}
+
+    store.db.add_vector_metadata("big_500", "big", 500, {"file_id": "big"}, chunk_text="old")
+    done = {}
+    summary = IngestionPipeline(
+        lambda item: (chunks(), {"file_id": item}), store,
+        extract_workers=1, embed_concurrency=1, embed_batch_size=4, queue_size=1, part_chunks=4,
+        on_success=lambda item, ids: done.update({item: ids}),
+    ).run(["big"])
+
+    assert summary["succeeded"] == 1
+    assert done["big"] == [f"big_{i}" for i in range(total)]
+    assert set(store.db.get_chunk_hashes("big")) == set(done["big"])
+
+
+def test_error_mid_stream_fails_the_file_once(store):  # noqa: F811
+    def chunks(item):
+        yield {"content": f"{item} first", "metadata": {"chunk_index": 0}}
+        if item == "broken":
+            raise cp.ContentProcessingError("truncated PDF")
+
+    failed, done = [], []
+    IngestionPipeline(
+        lambda item: (chunks(item), {"file_id": item}), store, part_chunks=1,
+        on_failure=lambda item, e: failed.append(str(e)), on_success=lambda item, ids: done.append(item),
+    ).run(["broken", "fine"])
+
+    assert failed == ["truncated PDF"]
+    assert done == ["fine"]
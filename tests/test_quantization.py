@@ -0,0 +1,152 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from youtube_chat_cli_main.services import vector_store as vs_mod
+from youtube_chat_cli_main.services.local_vector_store import LocalVectorStore
+from youtube_chat_cli_main.services.vector_store import VectorStoreError
+
+from .conftest import add_chunks, brute_force, local_store_config
+
+DIM = 64
+
+
+def _clustered(n, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(max(1, n // 50), DIM))
+    return (centers[rng.integers(0, len(centers), n)] + 0.5 * rng.normal(size=(n, DIM))).astype(np.float32)
+
+
+def _recall(store, vectors, queries, k=10):
+    results = store.search_many(queries.tolist(), top_k=k)
+    exact = [{f"f1_{i}" for i in brute_force(vectors, q, k)} for q in queries]
+    return np.mean([len({r["id"] for r in hits} & ids) / k for ids, hits in zip(exact, results)])
+
+
+@pytest.mark.parametrize("mode, min_recall", [("int8", 0.95), ("binary", 0.7)])
+def test_rescored_recall_and_exact_scores(tmp_path, mode, min_recall):
+    vectors = _clustered(2000)
+    queries = vectors[:30] + 0.1 * np.random.default_rng(1).normal(size=(30, DIM)).astype(np.float32)
+    store = LocalVectorStore(local_store_config(tmp_path, vector_quantization=mode))
+    add_chunks(store, vectors)
+
+    assert _recall(store, vectors, queries) >= min_recall
+    # Scores come from the rescoring pass, so they are exact cosine similarities
+    top = store.search(vectors[5].tolist(), top_k=1)[0]
+    assert top["id"] == "f1_5" and top["score"] == pytest.approx(1.0, abs=1e-5)
+
+    info = store.get_collection_info()
+    assert info["quantization"] == mode
+    assert info["scan_bytes_per_vector"] == (DIM + 4 if mode == "int8" else DIM // 8)
+
+
+def test_mode_is_fixed_per_collection(tmp_path):
+    store = LocalVectorStore(local_store_config(tmp_path, vector_quantization="int8"))
+    vectors = _clustered(100)
+    add_chunks(store, vectors)
+    store.close()
+
+    # A different global default does not change an existing collection
+    reopened = LocalVectorStore(local_store_config(tmp_path, vector_quantization="none"))
+    assert reopened.get_collection_info()["quantization"] == "int8"
+    assert reopened.search(vectors[3].tolist(), top_k=1)[0]["id"] == "f1_3"
+
+    reopened.create_collection("other", DIM, quantization="binary")
+    assert reopened.get_collection_info()["quantization"] == "binary"
+    assert (tmp_path / "documents.int8").exists()
+
+
+def test_set_quantization_reencodes_existing_vectors(tmp_path):
+    store = LocalVectorStore(local_store_config(tmp_path))
+    vectors = _clustered(300)
+    add_chunks(store, vectors)
+    before = [r["id"] for r in store.search(vectors[7].tolist(), top_k=5)]
+
+    store.set_quantization("binary")
+    assert store.search(vectors[7].tolist(), top_k=1)[0]["id"] == "f1_7"
+    assert len(set(before) & {r["id"] for r in store.search(vectors[7].tolist(), top_k=5)}) >= 4
+
+    store.set_quantization("none")
+    assert not (tmp_path / "documents.binary").exists()
+    with pytest.raises(VectorStoreError):
+        store.set_quantization("pq")
+
+
+def test_filters_compaction_and_ivf_with_codes(tmp_path):
+    vectors = _clustered(1500)
+    store = LocalVectorStore(local_store_config(tmp_path, vector_quantization="int8", local_vector_ivf_threshold=1000))
+    add_chunks(store, vectors[:1000])
+    add_chunks(store, vectors[1000:], file_id="g", file_type="pdf")
+    assert store.get_collection_info()["ivf_lists"] is not None
+
+    hits = store.search(vectors[1200].tolist(), top_k=3, filter_dict={"file_type": "pdf"})
+    assert hits[0]["id"] == "g_200" and all(h["id"].startswith("g_") for h in hits)
+
+    store.delete_documents([f"f1_{i}" for i in range(1000)])
+    assert store.get_collection_info()["slots"] == 500
+    assert store.search(vectors[1400].tolist(), top_k=1)[0]["id"] == "g_400"
+
+
+@pytest.mark.parametrize("mode", ["int8", "binary"])
+def test_quantized_search_racing_with_compaction_retries(tmp_path, mode):
+    vectors = _clustered(200)
+    store = LocalVectorStore(local_store_config(tmp_path, vector_quantization=mode))
+    add_chunks(store, vectors)
+    store.delete_documents([f"f1_{i}" for i in range(90)])
+
+    exact_top_k, calls = store._exact_top_k, []
+
+    def compact_first(*args):
+        if not calls:
+            # Crosses the dead fraction: compact() re-encodes into a new quantizer
+            store.delete_documents([f"f1_{i}" for i in range(90, 110)])
+        calls.append(1)
+        return exact_top_k(*args)
+
+    store._exact_top_k = compact_first
+    top = store.search(vectors[150].tolist(), top_k=1)[0]
+
+    assert len(calls) == 2
+    assert top["id"] == "f1_150" and top["score"] == pytest.approx(1.0, abs=1e-5)
+
+
+def test_qdrant_quantization_config_and_search_params():
+    from qdrant_client.models import BinaryQuantization, ScalarQuantization
+
+    assert isinstance(vs_mod.QdrantVectorStore._quantization_config("int8"), ScalarQuantization)
+    assert isinstance(vs_mod.QdrantVectorStore._quantization_config("binary"), BinaryQuantization)
+    assert vs_mod.QdrantVectorStore._quantization_config("none") is None
+
+    # Local-mode Qdrant does not report quantization configs; serve them like a server would
+    quantization = {"documents": None, "archive": vs_mod.QdrantVectorStore._quantization_config("binary")}
+    reads = []
+
+    def get_collection(name):
+        reads.append(name)
+        vectors = SimpleNamespace(quantization_config=None)
+        return SimpleNamespace(config=SimpleNamespace(
+            params=SimpleNamespace(vectors=vectors), quantization_config=quantization[name]
+        ))
+
+    store = vs_mod.QdrantVectorStore.__new__(vs_mod.QdrantVectorStore)
+    store.client = SimpleNamespace(get_collection=get_collection)
+    store.collection_name = "documents"
+    store._search_params_cache = {}
+    store.config = SimpleNamespace(vector_quantization="int8", vector_quantization_oversampling=3.0)
+
+    # Params follow each collection's own config, not VECTOR_QUANTIZATION
+    assert store._search_params() is None
+    params = store._search_params("archive")
+    assert params.quantization.rescore is True and params.quantization.oversampling == 3.0
+    store.config.vector_quantization = "none"
+    assert store._search_params("archive") is params
+    assert store._search_params() is None
+    assert reads == ["documents", "archive"]
+
+
+def test_vector_store_rejects_unknown_mode():
+    store = vs_mod.VectorStore.__new__(vs_mod.VectorStore)
+    store.backend = SimpleNamespace(create_collection=lambda *a, **kw: pytest.fail("backend called"))
+    with pytest.raises(VectorStoreError):
+        store.create_collection("documents", quantization="pq")
@@ -0,0 +1,124 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from youtube_chat_cli_main.core.database import Database
+from youtube_chat_cli_main.core.resilience import backoff_delay
+from youtube_chat_cli_main.services import content_processor as cp
+from youtube_chat_cli_main.services.embedding_service import EmbeddingError
+
+
+@pytest.fixture()
+def db(tmp_path):
+    return Database(str(tmp_path / "queue.db"))
+
+
+@pytest.fixture()
+def processor(db):
+    processor = cp.ContentProcessor.__new__(cp.ContentProcessor)
+    processor.db = db
+    processor.config = SimpleNamespace(
+        queue_dead_retry_threshold=3, queue_retry_base_seconds=10, queue_retry_max_seconds=100
+    )
+    return processor
+
+
+def _wrapped(cause):
+    # Processing errors wrap their cause the way process_file does
+    try:
+        raise cause
+    except Exception as e:
+        try:
+            raise cp.ContentProcessingError(f"Failed to process file: {e}")
+        except cp.ContentProcessingError as wrapped:
+            return wrapped
+
+
+def _claim(db, queue_id):
+    return db.claim_queue_items("w", limit=1, queue_id=queue_id)
+
+
+def test_errors_are_classified_through_the_exception_chain():
+    assert cp.classify_queue_error(_wrapped(EmbeddingError("Ollama is down"))) == "transient"
+    assert cp.classify_queue_error(_wrapped(TimeoutError())) == "transient"
+    assert cp.classify_queue_error(_wrapped(ValueError("bad xref table"))) == "permanent"
+    assert cp.classify_queue_error(FileNotFoundError("gone.pdf")) == "permanent"
+    assert cp.classify_queue_error(RuntimeError("unexpected")) == "transient"
+
+
+def test_backoff_doubles_with_jitter_up_to_the_cap():
+    for attempt, full in [(1, 10), (2, 20), (3, 40), (8, 100)]:
+        delays = [backoff_delay(attempt, 10, 100) for _ in range(50)]
+        assert all(full / 2 <= d <= full for d in delays)
+    assert len({backoff_delay(1, 10, 100) for _ in range(10)}) > 1
+
+
+def test_transient_failure_is_retried_after_backoff(db, processor):
+    queue_id = db.add_to_queue(file_id="a.pdf", file_name="a.pdf", source="local")
+    item, = _claim(db, queue_id)
+
+    processor.fail_queue_item(item, _wrapped(EmbeddingError("connection refused")))
+
+    item = db.get_queue_item(queue_id)
+    assert (item["status"], item["retry_count"], item["lease_owner"]) == ("pending", 1, None)
+    assert 5 <= item["next_attempt_at"] - time.time() <= 10
+    assert db.claim_queue_items("w", limit=10) == []
+    assert _claim(db, queue_id) == []
+    assert db.get_queue_statistics()["scheduled_retries"] == 1
+
+    with db.get_connection() as conn:
+        conn.execute("UPDATE processing_queue SET next_attempt_at = ? WHERE id = ?", (time.time() - 1, queue_id))
+    assert [i["id"] for i in db.claim_queue_items("w", limit=10)] == [queue_id]
+
+
+def test_items_are_dead_lettered_at_the_threshold_and_requeued(db, processor):
+    queue_id = db.add_to_queue(file_id="b.pdf", file_name="b.pdf", source="local", priority=2,
+                               metadata={"tags": ["q3"]})
+    for attempt in range(3):
+        with db.get_connection() as conn:
+            conn.execute("UPDATE processing_queue SET next_attempt_at = NULL WHERE id = ?", (queue_id,))
+        item, = _claim(db, queue_id)
+        processor.fail_queue_item(item, _wrapped(TimeoutError("embedding timed out")))
+
+    assert db.get_queue_item(queue_id) is None
+    dead = db.list_dead_letters()
+    assert dead["total"] == 1
+    assert dead["items"][0]["reason"].startswith("transient failure after 3 attempts")
+    assert db.get_queue_statistics()["dead_letters"] == 1
+
+    new_id, = db.requeue_dead_letters()
+    item = db.get_queue_item(new_id)
+    assert (item["status"], item["retry_count"], item["priority"]) == ("pending", 0, 2)
+    assert item["metadata"] == {"tags": ["q3"]}
+    assert db.list_dead_letters()["total"] == 0
+
+
+def test_failure_reported_after_losing_the_lease_is_ignored(db, processor):
+    queue_id = db.add_to_queue(file_id="e.pdf", file_name="e.pdf", source="local")
+    stale, = _claim(db, queue_id)
+    with db.get_connection() as conn:
+        conn.execute("UPDATE processing_queue SET lease_owner = 'other' WHERE id = ?", (queue_id,))
+
+    processor.fail_queue_item(stale, _wrapped(TimeoutError("embedding timed out")))
+    processor.fail_queue_item(stale, _wrapped(ValueError("not a PDF")))
+    assert processor.complete_queue_item(stale) is False
+
+    item = db.get_queue_item(queue_id)
+    assert (item["status"], item["lease_owner"], item["retry_count"]) == ("processing", "other", 0)
+    assert db.list_dead_letters()["total"] == 0
+
+
+def test_permanent_failure_is_dead_lettered_at_once(db, processor):
+    broken = db.add_to_queue(file_id="c.pdf", file_name="c.pdf", source="local")
+    other = db.add_to_queue(file_id="d.pdf", file_name="d.pdf", source="local")
+    for queue_id in (broken, other):
+        item, = _claim(db, queue_id)
+        processor.fail_queue_item(item, _wrapped(ValueError("not a PDF")))
+
+    dead = {row["original_id"]: row["id"] for row in db.list_dead_letters()["items"]}
+    assert set(dead) == {str(broken), str(other)}
+
+    assert len(db.requeue_dead_letters([dead[str(broken)]])) == 1
+    assert db.requeue_dead_letters([]) == []
+    assert [row["original_id"] for row in db.list_dead_letters()["items"]] == [str(other)]
@@ -0,0 +1,146 @@
+import queue
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from youtube_chat_cli_main.core import queue_signal as qs
+from youtube_chat_cli_main.core.database import Database
+from youtube_chat_cli_main.services.background_service import BackgroundService
+
+from .test_queue_workers import _Processor
+
+
+@pytest.fixture()
+def signal(monkeypatch):
+    signal = qs.QueueSignal()
+    monkeypatch.setattr(qs, "_queue_signal", signal)
+    return signal
+
+
+@pytest.fixture()
+def db(tmp_path, signal):
+    return Database(str(tmp_path / "queue.db"))
+
+
+class _Broker:
+    """In-memory stand-in for a Redis server's pub/sub."""
+
+    def __init__(self):
+        self.subscribers = []
+
+    def publish(self, channel, message):
+        for subscriber in self.subscribers:
+            subscriber.put({"type": "message", "channel": channel, "data": message.encode()})
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        inbox = queue.Queue()
+        broker = self
+
+        class _PubSub:
+            def subscribe(self, channel):
+                broker.subscribers.append(inbox)
+
+            def get_message(self, timeout=0.0):
+                try:
+                    return inbox.get(timeout=timeout)
+                except queue.Empty:
+                    return None
+
+            def close(self):
+                broker.subscribers.remove(inbox)
+
+        return _PubSub()
+
+
+def test_wait_returns_on_notify_and_times_out_otherwise(signal):
+    seen = signal.generation
+    assert signal.wait(seen, timeout=0.05) == seen
+
+    threading.Timer(0.05, signal.notify).start()
+    started = time.perf_counter()
+    assert signal.wait(seen, timeout=5) == seen + 1
+    assert time.perf_counter() - started < 2
+
+    # A notification that arrived while the caller was busy is not lost
+    signal.notify()
+    assert signal.wait(seen + 1, timeout=5) == seen + 2
+
+
+def test_enqueue_wakes_workers_once_per_call(db, signal):
+    seen = signal.generation
+    db.add_to_queue(file_id="a.txt", file_name="a.txt", source="local")
+    db.add_to_queue(file_id="b.txt", file_name="b.txt", source="local", notify=False)
+
+    assert signal.generation == seen + 1
+
+
+def test_wake_ups_cross_processes_through_redis():
+    broker = _Broker()
+    api, service = qs.QueueSignal(broker), qs.QueueSignal(broker)
+    api._origin, service._origin = "host:1", "host:2"
+    service.listen()
+    try:
+        while not broker.subscribers:
+            time.sleep(0.01)
+        seen = service.generation
+        api.notify()
+        assert service.wait(seen, timeout=5) == seen + 1
+        # The publisher does not get its own message back as a second wake-up
+        assert api.generation == 1
+    finally:
+        service.close()
+
+
+def _service(db, interval=60, workers=2, batch=8):
+    service = BackgroundService.__new__(BackgroundService)
+    service.db = db
+    service.config = SimpleNamespace(
+        background_service_interval=interval, queue_workers=workers, queue_claim_batch=batch, queue_lease_seconds=60
+    )
+    service.content_processor = _Processor(db)
+    service._queue_stop = threading.Event()
+    return service
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.02)
+
+
+def test_dispatcher_processes_enqueued_items_without_waiting_for_the_poll(db, signal):
+    service = _service(db)
+    dispatcher = threading.Thread(target=service._run_queue_dispatcher)
+    dispatcher.start()
+    try:
+        queue_id = db.add_to_queue(file_id="new.pdf", file_name="new.pdf", source="local")
+        _wait_for(lambda: db.get_queue_item(queue_id)["status"] == "completed")
+
+        # The drain after this wake-up finds the retry not yet due; the
+        # dispatcher then sleeps only until it falls due, not the full poll
+        retry_id = db.add_to_queue(file_id="retry.pdf", file_name="retry.pdf", source="local", notify=False)
+        db.retry_queue_item(retry_id, 0.3)
+        signal.notify(publish=False)
+        _wait_for(lambda: db.get_queue_item(retry_id)["status"] == "completed")
+    finally:
+        service._queue_stop.set()
+        signal.notify(publish=False)
+        dispatcher.join(timeout=5)
+    assert not dispatcher.is_alive()
+
+
+def test_claims_grow_from_one_item_to_the_batch_size(db):
+    for i in range(20):
+        db.add_to_queue(file_id=f"{i}.txt", file_name=f"{i}.txt", source="local", notify=False)
+    service = _service(db, workers=1, batch=8)
+    sizes = []
+    process = service.content_processor.process_queue_items
+    service.content_processor.process_queue_items = lambda items, worker_id=None: (
+        sizes.append(len(items)) or process(items, worker_id)
+    )
+
+    assert service._drain_queue()["claimed"] == 20
+    assert sizes == [1, 2, 4, 8, 5]
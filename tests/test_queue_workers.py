@@ -0,0 +1,227 @@
+import sqlite3
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from youtube_chat_cli_main.core.database import Database
+from youtube_chat_cli_main.services import content_processor as cp
+from youtube_chat_cli_main.services.background_service import BackgroundService
+
+
+@pytest.fixture()
+def db(tmp_path):
+    return Database(str(tmp_path / "queue.db"))
+
+
+def _enqueue(db, count):
+    return [db.add_to_queue(file_id=f"/docs/{i}.txt", file_name=f"{i}.txt", source="local") for i in range(count)]
+
+
+def test_concurrent_claims_never_overlap(db, tmp_path):
+    ids = _enqueue(db, 200)
+    # Separate Database objects stand in for separate processes
+    handles = [db] + [Database(str(tmp_path / "queue.db")) for _ in range(3)]
+    claimed = {}
+
+    def worker(n):
+        handle = handles[n % len(handles)]
+        mine = claimed.setdefault(n, [])
+        while True:
+            items = handle.claim_queue_items(f"w{n}", limit=3)
+            if not items:
+                return
+            mine.extend(item["id"] for item in items)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    everything = [queue_id for mine in claimed.values() for queue_id in mine]
+    assert sorted(everything) == ids
+    assert sum(1 for mine in claimed.values() if mine) > 1
+    assert db.get_queue_item(ids[0])["status"] == "processing"
+
+
+def test_claim_order_and_single_item_claim(db):
+    low, high = _enqueue(db, 2)
+    db.update_queue_status(high, "pending")
+    with db.get_connection() as conn:
+        conn.execute("UPDATE processing_queue SET priority = 5 WHERE id = ?", (high,))
+
+    assert db.claim_queue_items("a", limit=1, queue_id=low)[0]["id"] == low
+    assert db.claim_queue_items("b", limit=1, queue_id=low) == []
+    assert [item["id"] for item in db.claim_queue_items("b", limit=5)] == [high]
+
+
+def test_expired_leases_are_reclaimed_and_heartbeat_keeps_them(db):
+    crashed, alive = _enqueue(db, 2)
+    db.claim_queue_items("crashed", limit=1, lease_seconds=0.2, queue_id=crashed)
+    db.claim_queue_items("alive", limit=1, lease_seconds=0.2, queue_id=alive)
+
+    with db.queue_lease_heartbeat("alive", lease_seconds=0.2):
+        time.sleep(0.5)
+        assert db.reclaim_expired_queue_leases() == 1
+
+    assert db.get_queue_item(crashed)["status"] == "pending"
+    assert db.get_queue_item(alive)["lease_owner"] == "alive"
+    db.update_queue_status(alive, "completed")
+    assert db.get_queue_item(alive)["lease_owner"] is None
+
+
+def test_worker_that_lost_its_lease_cannot_finish_the_item(db, caplog):
+    queue_id, = _enqueue(db, 1)
+    db.claim_queue_items("slow", limit=1, lease_seconds=0.1)
+    time.sleep(0.2)
+    db.reclaim_expired_queue_leases()
+    db.claim_queue_items("fresh", limit=1)
+
+    assert db.update_queue_status(queue_id, "completed", lease_owner="slow") is False
+    assert db.retry_queue_item(queue_id, 60, lease_owner="slow") == 0
+    assert db.dead_letter_queue_item(queue_id, "broken", lease_owner="slow") is False
+    assert "slow no longer holds its lease" in caplog.text
+
+    item = db.get_queue_item(queue_id)
+    assert (item["status"], item["lease_owner"], item["retry_count"]) == ("processing", "fresh", 0)
+    assert db.update_queue_status(queue_id, "completed", lease_owner="fresh") is True
+
+
+def test_old_database_gains_lease_columns_and_stuck_rows_recover(tmp_path):
+    path = tmp_path / "old.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE processing_queue (id INTEGER PRIMARY KEY AUTOINCREMENT, file_id TEXT NOT NULL, "
+                 "file_name TEXT NOT NULL, file_type TEXT, source TEXT NOT NULL, status TEXT NOT NULL DEFAULT 'pending', "
+                 "priority INTEGER DEFAULT 0, retry_count INTEGER DEFAULT 0, error_message TEXT, metadata TEXT, "
+                 "created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, "
+                 "processed_at TIMESTAMP)")
+    conn.execute("INSERT INTO processing_queue (file_id, file_name, source, status) VALUES ('f', 'f', 'local', 'processing')")
+    conn.commit()
+    conn.close()
+
+    db = Database(str(path))
+    assert db.reclaim_expired_queue_leases() == 1
+    assert db.claim_queue_items("w", limit=1)[0]["file_id"] == "f"
+
+
+class _Processor:
+    def __init__(self, db):
+        self.db = db
+        self.seen = []
+        self.lock = threading.Lock()
+        self.active = self.peak = 0
+
+    def process_queue_items(self, items, worker_id=None):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.seen.extend(item["id"] for item in items)
+        time.sleep(0.05)
+        for item in items:
+            assert item["lease_owner"] == worker_id
+            assert self.db.update_queue_status(item["id"], "completed", lease_owner=worker_id)
+        with self.lock:
+            self.active -= 1
+        return {"succeeded": len(items), "failed": 0}
+
+
+def _service(db, workers=3, batch=2):
+    service = BackgroundService.__new__(BackgroundService)
+    service.db = db
+    service.config = SimpleNamespace(queue_workers=workers, queue_claim_batch=batch, queue_lease_seconds=60)
+    service.content_processor = _Processor(db)
+    service._queue_stop = threading.Event()
+    return service
+
+
+def test_service_initializes_through_its_constructor(db, monkeypatch):
+    from youtube_chat_cli_main.services import background_service as bs
+
+    monkeypatch.setattr(bs, "get_config", lambda: SimpleNamespace())
+    monkeypatch.setattr(bs, "get_database", lambda: db)
+    monkeypatch.setattr(bs, "get_gdrive_watcher", lambda: None)
+    monkeypatch.setattr(bs, "get_content_processor", lambda: _Processor(db))
+    monkeypatch.setattr(bs.signal, "signal", lambda *args: None)
+
+    service = bs.BackgroundService()
+
+    assert not service._queue_stop.is_set()
+    assert service._queue_thread is None and service.db is db
+
+
+def test_background_workers_drain_the_queue_concurrently(db):
+    ids = _enqueue(db, 30)
+    service = _service(db)
+
+    results = service._drain_queue()
+
+    assert results == {"claimed": 30, "succeeded": 30, "failed": 0}
+    assert sorted(service.content_processor.seen) == ids
+    assert service.content_processor.peak > 1
+    assert db.get_queue_stats() == {"completed": 30}
+
+
+def test_drain_respects_max_items(db):
+    _enqueue(db, 30)
+    service = _service(db, workers=4, batch=3)
+
+    assert service._drain_queue(max_items=10)["claimed"] == 10
+    assert db.get_queue_stats() == {"completed": 10, "pending": 20}
+
+
+def test_stop_waits_only_for_claimed_batches(db):
+    _enqueue(db, 40)
+    service = _service(db, workers=2, batch=2)
+    processor = service.content_processor
+    process = processor.process_queue_items
+
+    def stop_after_first_batch(items, worker_id=None):
+        service._queue_stop.set()
+        return process(items, worker_id)
+
+    processor.process_queue_items = stop_after_first_batch
+    results = service._drain_queue()
+
+    assert results["claimed"] <= 2
+    assert db.get_queue_stats()["pending"] >= 38
+
+
+def test_mcp_tool_claims_a_batch_and_processes_it_in_one_call(db, monkeypatch):
+    from youtube_chat_cli_main.mcp import server
+
+    processor = _Processor(db)
+    monkeypatch.setattr(server, "get_database", lambda: db)
+    monkeypatch.setattr(server, "get_content_processor", lambda: processor)
+    monkeypatch.setattr(server, "get_config", lambda: SimpleNamespace(queue_lease_seconds=60))
+    ids = _enqueue(db, 5)
+    db.claim_queue_items("background", limit=1, queue_id=ids[0])
+
+    result = server.MCPTools._process_queue_items({"limit": 10})
+
+    assert result == {"processed": 4, "succeeded": 4, "failed": 0}
+    assert sorted(processor.seen) == ids[1:]
+    assert db.get_queue_stats() == {"completed": 4, "processing": 1}
+
+
+def test_processing_an_empty_claim_does_not_start_the_pipeline(db, monkeypatch):
+    from youtube_chat_cli_main.services import ingestion_pipeline
+
+    monkeypatch.setattr(ingestion_pipeline, "ingest", lambda *a, **kw: pytest.fail("pipeline started"))
+    processor = cp.ContentProcessor.__new__(cp.ContentProcessor)
+    processor.db = db
+    processor.config = SimpleNamespace(queue_lease_seconds=60)
+
+    assert processor.process_queue_items([], worker_id="w") == {"succeeded": 0, "failed": 0}
+
+
+def test_process_queue_item_skips_items_claimed_elsewhere(db):
+    queue_id, = _enqueue(db, 1)
+    db.claim_queue_items("other-worker", limit=1)
+    processor = cp.ContentProcessor.__new__(cp.ContentProcessor)
+    processor.db = db
+    processor.config = SimpleNamespace(queue_lease_seconds=60)
+
+    assert processor.process_queue_item(queue_id) is False
+    assert db.get_queue_item(queue_id)["lease_owner"] == "other-worker"
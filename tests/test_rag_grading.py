@@ -0,0 +1,88 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from langchain_core.documents import Document
+
+from youtube_chat_cli_main.services.rag_engine import AdaptiveRAGEngine
+
+
+class _SlowGraderLLM:
+    def __init__(self, delay=0.05, structured=None):
+        self.delay = delay
+        self.structured = structured
+        self.active = 0
+        self.peak = 0
+        self.generate_calls = 0
+        self.structured_calls = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt, system_prompt=None, temperature=0.7, max_tokens=None):
+        with self._lock:
+            self.generate_calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            return "yes" if prompt.split("Document: ")[-1].startswith("relevant") else "no"
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def generate_structured(self, prompt, system_prompt=None, response_format=None):
+        self.structured_calls += 1
+        if isinstance(self.structured, Exception):
+            raise self.structured
+        return self.structured
+
+
+def _engine(llm, concurrency=5, batch=False):
+    engine = AdaptiveRAGEngine.__new__(AdaptiveRAGEngine)
+    engine.config = SimpleNamespace(rag_grading_concurrency=concurrency, rag_batch_grading=batch)
+    engine.llm = llm
+    return engine
+
+
+def _state(n):
+    docs = [Document(page_content=("relevant %d" % i) if i % 2 == 0 else ("noise %d" % i)) for i in range(n)]
+    return {"question": "q", "documents": docs}
+
+
+def test_grading_runs_concurrently_and_keeps_order():
+    llm = _SlowGraderLLM()
+    t0 = time.perf_counter()
+    out = _engine(llm)._grade_documents(_state(5))
+    elapsed = time.perf_counter() - t0
+
+    assert [d.page_content for d in out["documents"]] == ["relevant 0", "relevant 2", "relevant 4"]
+    assert out["web_search"] == "Yes"
+    assert llm.peak > 1
+    assert elapsed < 5 * llm.delay
+
+
+def test_concurrency_one_grades_serially():
+    llm = _SlowGraderLLM(delay=0.0)
+    _engine(llm, concurrency=1)._grade_documents(_state(4))
+    assert llm.peak == 1 and llm.generate_calls == 4
+
+
+def test_batch_grader_single_call():
+    scores = {"scores": [{"index": i, "relevant": "yes" if i % 2 == 0 else "no"} for i in range(4)]}
+    llm = _SlowGraderLLM(structured=scores)
+    out = _engine(llm, batch=True)._grade_documents(_state(4))
+    assert llm.structured_calls == 1 and llm.generate_calls == 0
+    assert [d.page_content for d in out["documents"]] == ["relevant 0", "relevant 2"]
+
+
+def test_batch_grader_falls_back_for_unscored_documents():
+    llm = _SlowGraderLLM(structured={"scores": [{"index": 0, "relevant": "yes"}, {"index": 9, "relevant": "no"}]})
+    out = _engine(llm, batch=True)._grade_documents(_state(3))
+    assert llm.generate_calls == 2
+    assert [d.page_content for d in out["documents"]] == ["relevant 0", "relevant 2"]
+
+
+def test_batch_grader_parse_failure_grades_individually():
+    llm = _SlowGraderLLM(structured=ValueError("bad json"))
+    out = _engine(llm, batch=True)._grade_documents(_state(3))
+    assert llm.generate_calls == 3
+    assert len(out["documents"]) == 2
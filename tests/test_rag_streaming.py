@@ -0,0 +1,68 @@
+import json
+from types import SimpleNamespace
+
+from youtube_chat_cli_main.services import rag_engine as re_mod
+
+
+class _StreamingLLM:
+    def __init__(self, grounded="yes", useful="yes"):
+        self.grounded = grounded
+        self.useful = useful
+
+    def generate(self, prompt, system_prompt=None, temperature=0.7, max_tokens=None):
+        if "grounded" in (system_prompt or ""):
+            return self.grounded
+        if "resolves" in (system_prompt or ""):
+            return self.useful
+        return "yes"  # relevance grading
+
+    def stream(self, prompt, system_prompt=None, temperature=0.7):
+        yield from ["RAG ", "combines ", "retrieval."]
+
+
+def _engine(monkeypatch, llm):
+    monkeypatch.setattr(re_mod, "get_semantic_cache", lambda: None)
+    engine = re_mod.AdaptiveRAGEngine.__new__(re_mod.AdaptiveRAGEngine)
+    engine.config = SimpleNamespace(
+        rag_top_k=3,
+        rag_min_relevance_score=0.0,
+        rag_search_mode="hybrid",
+        rag_max_transform_attempts=2,
+        rag_hallucination_check=True,
+        rag_answer_check=True,
+        rag_grading_concurrency=2,
+        rag_batch_grading=False,
+        rag_context_max_tokens=3000,
+        rag_context_dedup_threshold=0.8,
+    )
+    engine.llm = llm
+    engine.vector_store = SimpleNamespace(
+        search=lambda **kw: [{"content": "RAG retrieves then generates", "metadata": {"file_id": "f"}}]
+    )
+    return engine
+
+
+def test_stream_emits_context_tokens_then_verdict(monkeypatch):
+    events = list(_engine(monkeypatch, _StreamingLLM()).stream_query("what is rag?"))
+    kinds = [e["event"] for e in events]
+
+    assert kinds[0] == "context"
+    assert kinds[1:-1] == ["token"] * 3
+    assert kinds[-1] == "verdict"
+    assert events[0]["data"]["documents"][0]["metadata"] == {"file_id": "f"}
+    assert "".join(e["data"]["text"] for e in events if e["event"] == "token") == "RAG combines retrieval."
+    assert events[-1]["data"] == {"verdict": "useful", "grounded": True, "useful": True, "cached": False}
+
+
+def test_stream_verdict_reports_ungrounded_answer(monkeypatch):
+    events = list(_engine(monkeypatch, _StreamingLLM(grounded="no")).stream_query("q"))
+    assert events[-1]["data"]["verdict"] == "not supported"
+
+
+def test_sse_formatting():
+    from youtube_chat_cli_main.api_server import _sse_frame
+
+    frame = _sse_frame({"event": "token", "data": {"text": "hi"}}, session_id="s1")
+    assert frame.startswith("event: token\ndata: ")
+    assert frame.endswith("\n\n")
+    assert json.loads(frame.split("data: ", 1)[1]) == {"text": "hi", "session_id": "s1"}
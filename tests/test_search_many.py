@@ -0,0 +1,133 @@
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.documents import Document
+
+from youtube_chat_cli_main.core.database import Database
+from youtube_chat_cli_main.services import rag_engine as re_mod
+from youtube_chat_cli_main.services import vector_store as vs_mod
+
+from .conftest import make_vector_store
+
+
+def _hit(doc_id, score):
+    return {"id": doc_id, "score": score, "content": doc_id, "metadata": {}}
+
+
+class _Backend:
+    def __init__(self, per_query):
+        self.per_query = per_query
+        self.calls = []
+
+    def search_many(self, query_embeddings, top_k=5, filter_dict=None):
+        self.calls.append((len(query_embeddings), top_k, filter_dict))
+        return [list(self.per_query[int(e[0])]) for e in query_embeddings]
+
+
+def _store(backend, db=None):
+    embed_calls = []
+
+    def embed_documents(texts):
+        embed_calls.append(list(texts))
+        return [[float(i)] for i in range(len(texts))]
+
+    store = make_vector_store(
+        backend, SimpleNamespace(embed_documents=embed_documents), db, vector_search_mode="vector", hybrid_rrf_k=60
+    )
+    store.embed_calls = embed_calls
+    return store
+
+
+def test_one_embedding_call_and_one_backend_call():
+    backend = _Backend([[_hit("a", 0.9), _hit("b", 0.5)], [_hit("a", 0.7), _hit("c", 0.8)], [_hit("d", 0.2)]])
+    store = _store(backend)
+
+    results = store.search_many(["q1", "q2", "q3"], top_k=2, filter_dict={"source": "gdrive"}, min_score=0.3)
+
+    assert store.embed_calls == [["q1", "q2", "q3"]]
+    assert backend.calls == [(3, 2, {"source": "gdrive"})]
+    # "a" stays only under q1 (its best score); "d" is below min_score
+    assert [[r["id"] for r in hits] for hits in results] == [["a", "b"], ["c"], []]
+
+
+def test_dedupe_can_be_disabled():
+    backend = _Backend([[_hit("a", 0.9)], [_hit("a", 0.7)]])
+    results = _store(backend).search_many(["q1", "q2"], dedupe=False)
+    assert [[r["id"] for r in hits] for hits in results] == [["a"], ["a"]]
+
+
+def test_hybrid_fuses_lexical_results_per_query(tmp_path):
+    db = Database(str(tmp_path / "many.db"))
+    if not db.fts_enabled:
+        pytest.skip("SQLite built without FTS5")
+    db.add_vector_metadata("code", "f", 0, {}, chunk_text="ERR-4711 means the cache is full")
+    backend = _Backend([[_hit("x", 0.9)], [_hit("y", 0.9)]])
+
+    results = _store(backend, db).search_many(["ERR-4711", "unrelated words"], top_k=3, mode="hybrid")
+
+    assert {r["id"] for r in results[0]} == {"x", "code"}
+    assert [r["id"] for r in results[1]] == ["y"]
+    assert backend.calls[0][1] == 3 * vs_mod.HYBRID_CANDIDATE_FACTOR
+
+
+def test_chroma_sends_all_query_embeddings_at_once():
+    queries = []
+
+    def query(query_embeddings, n_results, where):
+        queries.append(query_embeddings)
+        return {
+            "ids": [["a"], ["b"]],
+            "distances": [[0.1], [0.4]],
+            "documents": [["doc a"], ["doc b"]],
+            "metadatas": [[{"k": 1}], [{"k": 2}]],
+        }
+
+    store = vs_mod.ChromaVectorStore.__new__(vs_mod.ChromaVectorStore)
+    store.collection = SimpleNamespace(query=query)
+
+    results = store.search_many([[1.0], [2.0]], top_k=1)
+
+    assert queries == [[[1.0], [2.0]]]
+    assert results[1] == [{"id": "b", "score": pytest.approx(0.6), "content": "doc b", "metadata": {"k": 2}}]
+
+
+def test_qdrant_batch_query():
+    from qdrant_client import QdrantClient
+    from qdrant_client.models import Distance, PointStruct, VectorParams
+
+    client = QdrantClient(":memory:")
+    client.create_collection("documents", vectors_config=VectorParams(size=2, distance=Distance.COSINE))
+    client.upsert("documents", points=[
+        PointStruct(id=1, vector=[1.0, 0.0], payload={"content": "east", "file_id": "f"}),
+        PointStruct(id=2, vector=[0.0, 1.0], payload={"content": "north", "file_id": "f"}),
+    ])
+    store = vs_mod.QdrantVectorStore.__new__(vs_mod.QdrantVectorStore)
+    store.client = client
+    store.collection_name = "documents"
+    store._search_params_cache = {}
+    store.config = SimpleNamespace(vector_quantization="none")
+
+    results = store.search_many([[1.0, 0.1], [0.1, 1.0]], top_k=1)
+
+    assert [[r["content"] for r in hits] for hits in results] == [["east"], ["north"]]
+    assert results[0][0]["metadata"] == {"file_id": "f"}
+
+
+def test_rag_retrieve_searches_all_phrasings_after_rewrite(monkeypatch):
+    monkeypatch.setattr(re_mod, "get_semantic_cache", lambda: None)
+    calls = []
+
+    def search_many(queries, **kw):
+        calls.append((queries, kw))
+        return [[_hit("new", 0.8), _hit("both", 0.7)], [_hit("both", 0.9)]]
+
+    engine = re_mod.AdaptiveRAGEngine.__new__(re_mod.AdaptiveRAGEngine)
+    engine.config = SimpleNamespace(rag_top_k=2, rag_min_relevance_score=0.5, rag_search_mode="hybrid", rag_multi_query=True)
+    engine.vector_store = SimpleNamespace(search_many=search_many)
+
+    out = engine._retrieve({"question": "rewritten", "previous_questions": ["original"]})
+
+    assert calls[0][0] == ["rewritten", "original"]
+    assert calls[0][1]["dedupe"] is False
+    assert [d.page_content for d in out["documents"]] == ["both", "new"]
+    assert isinstance(out["documents"][0], Document)
@@ -0,0 +1,86 @@
+from types import SimpleNamespace
+
+from langchain_core.documents import Document
+
+from youtube_chat_cli_main.core.redis_cache import RedisCache
+from youtube_chat_cli_main.services import rag_engine as re_mod
+from youtube_chat_cli_main.services import semantic_cache as sc
+
+
+_VECTORS = {
+    "what is rag?": [1.0, 0.0, 0.0],
+    "what is RAG ?": [0.99, 0.05, 0.0],
+    "how do podcasts work?": [0.0, 1.0, 0.0],
+}
+
+
+class _Graph:
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, state):
+        self.calls += 1
+        return {
+            "question": state["question"],
+            "generation": f"answer #{self.calls}",
+            "documents": [Document(page_content="ctx", metadata={"file_id": "f1"})],
+            "web_search": "No",
+            "transform_count": 0,
+        }
+
+
+def _engine(monkeypatch, cache):
+    monkeypatch.setattr(re_mod, "get_semantic_cache", lambda: cache)
+    engine = re_mod.AdaptiveRAGEngine.__new__(re_mod.AdaptiveRAGEngine)
+    engine.graph = _Graph()
+    engine.vector_store = SimpleNamespace(
+        embedding_service=SimpleNamespace(embed_query=lambda q: _VECTORS[q])
+    )
+    return engine
+
+
+def _cache(**kw):
+    return sc.SemanticAnswerCache(cache=RedisCache("redis://unused", None, 0, enabled=False), **kw)
+
+
+def test_similar_question_served_from_cache(monkeypatch):
+    cache = _cache(threshold=0.95)
+    engine = _engine(monkeypatch, cache)
+
+    first = engine.query("what is rag?")
+    second = engine.query("what is RAG ?")
+    assert engine.graph.calls == 1
+    assert second["answer"] == first["answer"]
+    assert isinstance(second["documents"][0], Document)
+    assert second["documents"][0].metadata == {"file_id": "f1"}
+
+    engine.query("how do podcasts work?")
+    assert engine.graph.calls == 2
+    assert cache.stats()["hits"] == 1
+
+
+def test_invalidation_forces_fresh_answer(monkeypatch):
+    cache = _cache()
+    engine = _engine(monkeypatch, cache)
+    engine.query("what is rag?")
+    cache.invalidate()
+    assert engine.query("what is rag?")["answer"] == "answer #2"
+
+
+def test_payload_removed_elsewhere_is_a_miss(monkeypatch):
+    cache = _cache()
+    engine = _engine(monkeypatch, cache)
+    engine.query("what is rag?")
+    # Another process clearing the shared prefix must invalidate this index too
+    cache.cache.clear_prefix(sc.CACHE_PREFIX)
+    assert engine.query("what is rag?")["answer"] == "answer #2"
+
+
+def test_lru_capacity():
+    cache = _cache(max_entries=2)
+    cache.store([1.0, 0.0], {"answer": "a"})
+    cache.store([0.0, 1.0], {"answer": "b"})
+    assert cache.lookup([1.0, 0.0])["answer"] == "a"
+    cache.store([0.7, 0.7], {"answer": "c"})
+    assert cache.lookup([0.0, 1.0]) is None
+    assert cache.lookup([1.0, 0.0])["answer"] == "a"
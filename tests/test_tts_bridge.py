@@ -0,0 +1,117 @@
+import importlib.util
+import io
+import sys
+import threading
+import types
+from pathlib import Path
+
+import pytest
+
+from youtube_chat_cli_main import tts_bridge_client as tbc
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture()
+def bridge_module():
+    spec = importlib.util.spec_from_file_location("tts_bridge_under_test", ROOT / "tts_bridge.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture()
+def client_factory():
+    tbc.shutdown_bridge_pools()
+    yield lambda **kw: tbc.TTSBridgeClient(python311_path=sys.executable, **kw)
+    tbc.shutdown_bridge_pools()
+
+
+def test_frames_round_trip(bridge_module):
+    buf = io.BytesIO()
+    bridge_module.write_frame(buf, {"op": "ping", "text": "héllo"})
+    bridge_module.write_frame(buf, {"op": "shutdown"})
+    buf.seek(0)
+
+    assert bridge_module.read_frame(buf) == {"op": "ping", "text": "héllo"}
+    assert bridge_module.read_frame(buf) == {"op": "shutdown"}
+    assert bridge_module.read_frame(buf) is None
+
+
+def test_daemon_reuses_loaded_model(bridge_module, monkeypatch, tmp_path):
+    loads = []
+
+    class FakeTTS:
+        def __init__(self, language, device):
+            loads.append(language)
+            self.hps = types.SimpleNamespace(data=types.SimpleNamespace(spk2id={"EN-US": 0}))
+
+        def tts_to_file(self, text, speaker_id, output_path, speed):
+            Path(output_path).write_bytes(b"RIFF")
+
+    melo = types.ModuleType("melo")
+    melo.api = types.SimpleNamespace(TTS=FakeTTS)
+    monkeypatch.setitem(sys.modules, "melo", melo)
+    monkeypatch.setitem(sys.modules, "melo.api", melo.api)
+
+    for i in range(3):
+        response = bridge_module.handle_request({
+            "id": i, "op": "generate", "engine": "melotts",
+            "text": "hi", "output": str(tmp_path / f"seg_{i}.wav"),
+        })
+        assert response["success"] and response["id"] == i
+
+    assert loads == ["EN"]
+
+
+def test_persistent_worker_is_reused(client_factory):
+    client = client_factory(workers=1)
+
+    with pytest.raises(RuntimeError, match="Unknown engine"):
+        client._request({"engine": "nope", "text": "x", "output": "x.wav"})
+    first = client.status()["workers"][0]
+    with pytest.raises(RuntimeError, match="Unknown engine"):
+        client._request({"engine": "nope", "text": "x", "output": "x.wav"})
+    second = client.status()["workers"][0]
+
+    assert first["alive"] and second["alive"]
+    assert first["pid"] == second["pid"]
+    assert second["requests"] == first["requests"] + 1
+
+
+def test_dead_worker_is_restarted(client_factory):
+    client = client_factory(workers=1)
+    with pytest.raises(RuntimeError, match="Unknown engine"):
+        client._request({"engine": "nope", "text": "x", "output": "x.wav"})
+    worker = client._pool.workers[0]
+    old_pid = worker.pid
+    worker.process.kill()
+    worker.process.wait()
+
+    with pytest.raises(RuntimeError, match="Unknown engine"):
+        client._request({"engine": "nope", "text": "x", "output": "x.wav"})
+    status = client.status()["workers"][0]
+    assert status["alive"] and status["pid"] != old_pid
+    assert status["restarts"] == 1
+
+
+def test_pool_runs_requests_on_separate_workers(client_factory):
+    client = client_factory(workers=2)
+    errors = []
+
+    def call():
+        try:
+            client._request({"engine": "nope", "text": "x", "output": "x.wav"})
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=60)
+
+    assert len(errors) == 4
+    workers = client.status()["workers"]
+    assert len(workers) == 2
+    assert sum(w["requests"] for w in workers) >= 4
@@ -0,0 +1,89 @@
+import os
+import threading
+import time
+
+import pytest
+
+from youtube_chat_cli_main import tts_service as ts
+
+SCRIPT = "\n".join(
+    f"**{'Host' if i % 2 == 0 else 'Expert'}:** Turn number {i}." for i in range(6)
+)
+
+
+@pytest.fixture()
+def service(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    svc = ts.TTSService()
+    svc.tts_bridge_available = True
+    svc.edge_tts_available = False
+    return svc
+
+
+def _tracking_writer(delay, fail_on=()):
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def write(text, output_file, **kwargs):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        try:
+            time.sleep(delay)
+            if any(marker in text for marker in fail_on):
+                raise ts.APIError("bridge crashed")
+            with open(output_file, "w") as f:
+                f.write(text)
+            return output_file
+        finally:
+            with lock:
+                state["active"] -= 1
+
+    return write, state
+
+
+def test_segments_synthesized_concurrently_in_script_order(service, monkeypatch):
+    monkeypatch.setenv("TTS_SEGMENT_CONCURRENCY_BRIDGE", "6")
+    write, state = _tracking_writer(0.2)
+    monkeypatch.setattr(service, "generate_audio_chatterbox_bridge", write)
+
+    started = time.perf_counter()
+    segments = service._generate_podcast_segments(SCRIPT)
+    elapsed = time.perf_counter() - started
+
+    assert [seg[2] for seg in segments] == [f"Turn number {i}." for i in range(6)]
+    assert [os.path.basename(seg[3]) for seg in segments] == [f"seg_{i:02d}.wav" for i in range(1, 7)]
+    assert state["peak"] > 1
+    assert elapsed < 0.2 * 6 * 0.75
+
+
+def test_bridge_concurrency_defaults_to_bridge_workers(service, monkeypatch):
+    monkeypatch.delenv("TTS_SEGMENT_CONCURRENCY_BRIDGE", raising=False)
+    monkeypatch.setenv("TTS_BRIDGE_WORKERS", "2")
+    write, state = _tracking_writer(0.05)
+    monkeypatch.setattr(service, "generate_audio_chatterbox_bridge", write)
+
+    assert len(service._generate_podcast_segments(SCRIPT)) == 6
+    assert state["peak"] == 2
+
+
+def test_failed_segments_retry_on_fallback_engine(service, monkeypatch):
+    monkeypatch.setenv("TTS_SEGMENT_CONCURRENCY_BRIDGE", "3")
+    bridge, _ = _tracking_writer(0.01, fail_on=("number 1.", "number 4."))
+    monkeypatch.setattr(service, "generate_audio_chatterbox_bridge", bridge)
+    fallback_calls = []
+
+    def fallback(text, output_file, voice=None, allow_bridge=True):
+        fallback_calls.append((text, allow_bridge))
+        if "number 4." in text:
+            raise ts.APIError("no fallback either")
+        with open(output_file, "w") as f:
+            f.write("fallback")
+        return output_file
+
+    monkeypatch.setattr(service, "generate_audio", fallback)
+
+    segments = service._generate_podcast_segments(SCRIPT)
+
+    assert sorted(fallback_calls) == [("Turn number 1.", False), ("Turn number 4.", False)]
+    assert [seg[2] for seg in segments] == [f"Turn number {i}." for i in (0, 1, 2, 3, 5)]
@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+
+import pytest
+
+from youtube_chat_cli_main.cli.rag_commands import _build_filter_dict
+from youtube_chat_cli_main.services import vector_filters as vf
+from youtube_chat_cli_main.services import vector_store as vs_mod
+from youtube_chat_cli_main.services.local_vector_store import LocalVectorStore
+
+from .conftest import local_store_config
+
+
+def test_parse_flattens_and_validates():
+    assert vf.parse_filter(None) is None
+    assert vf.parse_filter({"$and": [{"a": 1}]}) == ("a", "$eq", 1)
+    assert vf.parse_filter({"a": {"$gte": 1, "$lte": 5}}) == ("$and", [("a", "$gte", 1), ("a", "$lte", 5)])
+
+    for bad in ({"a": {"$regex": "x"}}, {"$not": {"a": 1}}, {"$or": []}, {"a": {"$in": []}}, {'a") OR 1=1 --': 1}):
+        with pytest.raises(vf.FilterError):
+            vf.parse_filter(bad)
+
+
+def test_chroma_where_uses_one_operator_per_clause():
+    assert vf.to_chroma_where({"$and": [{"source": "gdrive"}]}) == {"source": "gdrive"}
+    assert vf.to_chroma_where({"source": "gdrive", "file_size": {"$gte": 10, "$lt": 99}}) == {
+        "$and": [{"source": "gdrive"}, {"file_size": {"$gte": 10}}, {"file_size": {"$lt": 99}}]
+    }
+    assert vf.to_chroma_where({}) is None
+
+
+def test_sql_where_parameterizes_values():
+    sql, params = vf.to_sql_where({"$and": [{"a": 1}, {"b": {"$ne": "x'; --"}}, {"c": {"$in": [1, 2]}}]})
+    assert "x'" not in sql
+    assert params == [1, "x'; --", 1, 2]
+
+
+def test_local_filters_use_expression_indexes(tmp_path):
+    store = LocalVectorStore(local_store_config(tmp_path))
+    sql, params = vf.to_sql_where({"source": "gdrive"})
+    plan = " ".join(row[-1] for row in store._db.execute(f"EXPLAIN QUERY PLAN SELECT slot FROM points WHERE {sql}", params))
+    assert "points_source" in plan
+
+
+def _qdrant_store():
+    from qdrant_client import QdrantClient
+
+    store = vs_mod.QdrantVectorStore.__new__(vs_mod.QdrantVectorStore)
+    store.client = QdrantClient(":memory:")
+    store.collection_name = "documents"
+    store._search_params_cache = {}
+    store.config = SimpleNamespace(
+        vector_quantization="none", vector_upsert_batch_size=256, vector_upsert_parallelism=1
+    )
+    store.create_collection("documents", 2)
+    return store
+
+
+def test_qdrant_runs_cli_filters_natively():
+    store = _qdrant_store()
+    files = [
+        (1, {"tags": ["Work", "AI"], "ingested_at": 1_700_000_000, "file_type": "application/pdf", "file_size": 500}),
+        (2, {"tags": ["work"], "ingested_at": 1_600_000_000, "file_type": "application/pdf", "file_size": 500}),
+        (3, {"tags": ["ai"], "ingested_at": 1_700_000_000, "file_type": "text/plain", "file_size": 5_000}),
+    ]
+    for point_id, metadata in files:
+        store.add_documents([{"content": f"file {point_id}"}], [[1.0, 0.1 * point_id]], metadata, ids=[point_id])
+
+    def found(where):
+        return sorted(r["id"] for r in store.search_many([[1.0, 0.0]], top_k=10, filter_dict=where)[0])
+
+    assert found(_build_filter_dict("2023-01-01", "", "work", "", 0, 0, 0, 0)) == [1]
+    assert found(_build_filter_dict("", "", "ai", "", 0, 1000, 0, 0)) == [1]
+    assert found({"$or": [{"file_type": "text/plain"}, {"tag_work": 1}]}) == [1, 2, 3]
+    assert found({"file_type": {"$nin": ["text/plain"]}, "ingested_at": {"$ne": 1_600_000_000}}) == [1]
+    assert found({"file_size": 5_000.0}) == [3]
+    assert vs_mod.TAG_FIELD not in store.search_many([[1.0, 0.0]], top_k=1)[0][0]["metadata"]
+
+
+def test_qdrant_collection_gets_payload_indexes():
+    created = []
+    client = SimpleNamespace(
+        get_collections=lambda: SimpleNamespace(collections=[SimpleNamespace(name="documents")]),
+        create_payload_index=lambda collection_name, field_name, field_schema: created.append((field_name, field_schema.value)),
+    )
+    store = vs_mod.QdrantVectorStore.__new__(vs_mod.QdrantVectorStore)
+    store.client = client
+    store._search_params_cache = {}
+    store.config = SimpleNamespace(vector_quantization="none")
+
+    store.create_collection("documents", 2)
+
+    assert dict(created) == vf.INDEXED_FIELDS
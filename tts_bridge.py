@@ -9,16 +9,30 @@ Usage:
     python tts_bridge.py --engine melotts --text "Hello world" --output output.wav
     python tts_bridge.py --engine chatterbox --text "Hello world" --output output.wav
 
+Daemon mode:
+    python tts_bridge.py --serve                      # requests on stdin/stdout
+    python tts_bridge.py --serve --socket /tmp/tts.sock
+
+In daemon mode models are loaded once and kept warm. Every request and
+response is a frame: a 4-byte big-endian length followed by that many bytes
+of UTF-8 JSON. Requests carry an "op" ("generate", "ping" or "shutdown");
+"generate" requests use the same field names as the command-line options
+(engine, text, output, language, speed, voice_index, audio_prompt,
+exaggeration, cfg_weight, language_id).
+
 Author: Augment Agent
 Date: September 30, 2025
 """
 
+import os
 import sys
 import json
+import socket
+import struct
 import argparse
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, BinaryIO, Dict, Optional
 
 # Setup logging
 logging.basicConfig(
@@ -27,6 +41,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Frame header: 4-byte big-endian payload length
+FRAME_HEADER = struct.Struct(">I")
+
+# Loaded models, kept for the lifetime of the process (daemon mode)
+_MODELS: Dict[str, Any] = {}
+
+
+def _load_melotts(lang_code: str):
+    """Load (or reuse) the MeloTTS model for a language."""
+    key = f"melotts:{lang_code}"
+    if key not in _MODELS:
+        logger.info(f"Initializing MeloTTS for language: {lang_code}")
+        from melo.api import TTS
+        _MODELS[key] = TTS(language=lang_code, device='cpu')
+    return _MODELS[key]
+
+
+def _load_chatterbox(multilingual: bool):
+    """Load (or reuse) the English or multilingual Chatterbox model."""
+    key = "chatterbox:multilingual" if multilingual else "chatterbox:en"
+    if key not in _MODELS:
+        if multilingual:
+            logger.info("Initializing Chatterbox Multilingual TTS")
+            from chatterbox.mtl_tts import ChatterboxMultilingualTTS
+            _MODELS[key] = ChatterboxMultilingualTTS.from_pretrained(device="cpu")
+        else:
+            logger.info("Initializing Chatterbox English TTS")
+            from chatterbox.tts import ChatterboxTTS
+            _MODELS[key] = ChatterboxTTS.from_pretrained(device="cpu")
+    return _MODELS[key]
+
 
 def generate_melotts(
     text: str,
@@ -49,14 +94,11 @@ def generate_melotts(
         Path to generated audio file
     """
     try:
-        logger.info(f"Initializing MeloTTS for language: {language}")
-        from melo.api import TTS
-        
         # Extract language code (e.g., "EN" from "EN-US")
         lang_code = language.split("-")[0]
         
-        # Initialize TTS
-        tts = TTS(language=lang_code, device='cpu')
+        # Initialize TTS (cached across requests in daemon mode)
+        tts = _load_melotts(lang_code)
         speaker_ids = tts.hps.data.spk2id
         
         # Get speaker ID
@@ -114,15 +156,8 @@ def generate_chatterbox(
     try:
         import torchaudio as ta
         
-        # Determine which model to use
-        if language_id and language_id != 'en':
-            logger.info(f"Initializing Chatterbox Multilingual for language: {language_id}")
-            from chatterbox.mtl_tts import ChatterboxMultilingualTTS
-            model = ChatterboxMultilingualTTS.from_pretrained(device="cpu")
-        else:
-            logger.info("Initializing Chatterbox English TTS")
-            from chatterbox.tts import ChatterboxTTS
-            model = ChatterboxTTS.from_pretrained(device="cpu")
+        # Determine which model to use (cached across requests in daemon mode)
+        model = _load_chatterbox(bool(language_id and language_id != 'en'))
         
         logger.info(f"Generating audio (exaggeration={exaggeration}, cfg_weight={cfg_weight})")
         
@@ -154,27 +189,159 @@ def generate_chatterbox(
         raise
 
 
+def synthesize(request: Dict[str, Any]) -> str:
+    """
+    Dispatch a generation request to the requested engine.
+    
+    Args:
+        request: Request fields (same names as the command-line options)
+    
+    Returns:
+        Path to generated audio file
+    """
+    engine = request.get("engine")
+    if engine == 'melotts':
+        return generate_melotts(
+            text=request["text"],
+            output_file=request["output"],
+            language=request.get("language", "EN-US"),
+            speed=float(request.get("speed", 1.0)),
+            voice_index=int(request.get("voice_index", 0))
+        )
+    if engine == 'chatterbox':
+        return generate_chatterbox(
+            text=request["text"],
+            output_file=request["output"],
+            audio_prompt=request.get("audio_prompt"),
+            exaggeration=float(request.get("exaggeration", 0.5)),
+            cfg_weight=float(request.get("cfg_weight", 0.5)),
+            language_id=request.get("language_id")
+        )
+    raise ValueError(f"Unknown engine: {engine}")
+
+
+# ---------------------------------------------------------------------------
+# Daemon mode
+# ---------------------------------------------------------------------------
+
+def read_frame(stream: BinaryIO) -> Optional[Dict[str, Any]]:
+    """Read one length-prefixed JSON frame; returns None at end of stream."""
+    header = stream.read(FRAME_HEADER.size)
+    if len(header) < FRAME_HEADER.size:
+        return None
+    (length,) = FRAME_HEADER.unpack(header)
+    payload = stream.read(length)
+    if len(payload) < length:
+        return None
+    return json.loads(payload.decode("utf-8"))
+
+
+def write_frame(stream: BinaryIO, message: Dict[str, Any]) -> None:
+    """Write one length-prefixed JSON frame."""
+    payload = json.dumps(message).encode("utf-8")
+    stream.write(FRAME_HEADER.pack(len(payload)) + payload)
+    stream.flush()
+
+
+def handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Execute one daemon request and build its response."""
+    op = request.get("op", "generate")
+    response: Dict[str, Any] = {"id": request.get("id"), "op": op}
+    try:
+        if op == "ping":
+            response.update(success=True, pid=os.getpid(), models=sorted(_MODELS))
+        elif op == "shutdown":
+            response.update(success=True)
+        elif op == "generate":
+            response.update(success=True, output=synthesize(request), engine=request.get("engine"))
+        else:
+            raise ValueError(f"Unknown op: {op}")
+    except Exception as e:
+        logger.exception("TTS request failed")
+        response.update(success=False, error=str(e), engine=request.get("engine"))
+    return response
+
+
+def serve(reader: BinaryIO, writer: BinaryIO) -> bool:
+    """
+    Answer framed requests until end of stream or a shutdown request.
+    
+    Returns:
+        True if a shutdown was requested
+    """
+    while True:
+        request = read_frame(reader)
+        if request is None:
+            return False
+        write_frame(writer, handle_request(request))
+        if request.get("op") == "shutdown":
+            return True
+
+
+def serve_stdio() -> None:
+    """Serve requests over stdin/stdout."""
+    # Keep the protocol channel private: anything the TTS libraries print
+    # (to sys.stdout or straight to fd 1) is redirected to stderr.
+    protocol_out = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    sys.stdout.flush()
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+    logger.info(f"TTS bridge daemon ready on stdio (pid {os.getpid()})")
+    serve(sys.stdin.buffer, protocol_out)
+
+
+def serve_socket(path: str) -> None:
+    """Serve requests on a local Unix socket, one connection at a time."""
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("Unix sockets are not supported on this platform; use stdio mode")
+    if os.path.exists(path):
+        os.unlink(path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(8)
+    logger.info(f"TTS bridge daemon ready on {path} (pid {os.getpid()})")
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn, conn.makefile("rb") as reader, conn.makefile("wb") as writer:
+                if serve(reader, writer):
+                    return
+    finally:
+        server.close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+
 def main():
     """Main entry point for TTS bridge."""
     parser = argparse.ArgumentParser(
         description='TTS Bridge - Python 3.11 subprocess for MeloTTS and Chatterbox'
     )
     
-    # Required arguments
+    # Daemon mode
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Run as a long-lived daemon answering length-prefixed JSON requests'
+    )
+    parser.add_argument(
+        '--socket',
+        default=None,
+        help='Unix socket path for daemon mode (default: stdin/stdout)'
+    )
+    
+    # Required arguments (single-shot mode)
     parser.add_argument(
         '--engine',
-        required=True,
         choices=['melotts', 'chatterbox'],
         help='TTS engine to use'
     )
     parser.add_argument(
         '--text',
-        required=True,
         help='Text to synthesize'
     )
     parser.add_argument(
         '--output',
-        required=True,
         help='Output audio file path'
     )
     
@@ -224,27 +391,30 @@ def main():
     # Parse arguments
     args = parser.parse_args()
     
+    if args.serve:
+        if args.socket:
+            serve_socket(args.socket)
+        else:
+            serve_stdio()
+        sys.exit(0)
+    
+    if not (args.engine and args.text and args.output):
+        parser.error("--engine, --text and --output are required unless --serve is given")
+    
     try:
         # Generate audio based on engine
-        if args.engine == 'melotts':
-            result = generate_melotts(
-                text=args.text,
-                output_file=args.output,
-                language=args.language,
-                speed=args.speed,
-                voice_index=args.voice_index
-            )
-        elif args.engine == 'chatterbox':
-            result = generate_chatterbox(
-                text=args.text,
-                output_file=args.output,
-                audio_prompt=args.audio_prompt,
-                exaggeration=args.exaggeration,
-                cfg_weight=args.cfg_weight,
-                language_id=args.language_id
-            )
-        else:
-            raise ValueError(f"Unknown engine: {args.engine}")
+        result = synthesize({
+            "engine": args.engine,
+            "text": args.text,
+            "output": args.output,
+            "language": args.language,
+            "speed": args.speed,
+            "voice_index": args.voice_index,
+            "audio_prompt": args.audio_prompt,
+            "exaggeration": args.exaggeration,
+            "cfg_weight": args.cfg_weight,
+            "language_id": args.language_id,
+        })
         
         # Return success response
         response = {
@@ -55,6 +55,31 @@ async def readiness() -> Dict[str, Any]:
     except Exception:
         checks["circuit_breakers"] = {"status": "unknown"}
 
+    # Execution pool saturation (informational)
+    try:
+        from ..core.executors import executor_stats  # type: ignore
+
+        checks["executors"] = executor_stats()
+    except Exception:
+        checks["executors"] = {"status": "unknown"}
+
+    # Embedding cache hit ratio (best-effort, informational)
+    try:
+        from ..core.embedding_cache import get_embedding_cache  # type: ignore
+
+        cache = get_embedding_cache()
+        checks["embedding_cache"] = cache.stats() if cache is not None else {"status": "disabled"}
+    except Exception:
+        checks["embedding_cache"] = {"status": "unknown"}
+
+    # Shared result cache hit ratio across all workers (informational)
+    try:
+        from ..core.cache_keys import cache_stats  # type: ignore
+
+        checks["result_cache"] = cache_stats(("search", "vector", "rag:semantic"))
+    except Exception:
+        checks["result_cache"] = {"status": "unknown"}
+
     duration_ms = int((time.perf_counter() - started) * 1000)
     return {"status": "ok" if ok else "degraded", "duration_ms": duration_ms, "checks": checks}
 
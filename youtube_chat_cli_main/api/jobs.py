@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from ..core.executors import run_in_pool
+from ..services.job_service import TERMINAL_STATUSES, get_job_service
+
+router = APIRouter(prefix="/api/v1/jobs", tags=["jobs"])
+
+EVENT_POLL_INTERVAL_S = 0.5
+
+
+def _frame(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+async def _get_job_or_404(job_id: str) -> Dict[str, Any]:
+    job = await run_in_pool("io", get_job_service().get, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.get("")
+async def list_jobs(
+    job_type: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+) -> Dict[str, Any]:
+    jobs = await run_in_pool("io", get_job_service().list, job_type=job_type, status=status, limit=limit, offset=offset)
+    return {"jobs": jobs, "count": len(jobs), "limit": limit, "offset": offset}
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str) -> Dict[str, Any]:
+    return await _get_job_or_404(job_id)
+
+
+@router.get("/{job_id}/events")
+async def job_events(job_id: str):
+    """Server-Sent Events: 'progress' on every change, then 'completed' or 'failed'."""
+    await _get_job_or_404(job_id)
+
+    async def events():
+        last = None
+        while True:
+            job = await run_in_pool("io", get_job_service().get, job_id)
+            if not job:
+                return
+            snapshot = (job["status"], job["progress"], job["message"])
+            if snapshot != last:
+                last = snapshot
+                yield _frame("progress", {
+                    "job_id": job_id,
+                    "status": job["status"],
+                    "progress": job["progress"],
+                    "message": job["message"],
+                })
+            if job["status"] in TERMINAL_STATUSES:
+                yield _frame(job["status"], job)
+                return
+            await asyncio.sleep(EVENT_POLL_INTERVAL_S)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
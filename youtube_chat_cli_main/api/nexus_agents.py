@@ -9,6 +9,7 @@ from fastapi import APIRouter
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 
+from ..core.executors import run_in_pool
 from ..workflows import deep_research, content_checks
 
 router = APIRouter()
@@ -22,7 +23,7 @@ class DeepResearchRequest(BaseModel):
 
 @router.post("/deep-research")
 async def api_deep_research(req: DeepResearchRequest) -> Dict[str, Any]:
-    return deep_research.run(topic=req.topic, max_turns=req.max_turns, backends=req.backends)
+    return await run_in_pool("llm", deep_research.run, topic=req.topic, max_turns=req.max_turns, backends=req.backends)
 
 
 class ContentCheckRequest(BaseModel):
@@ -32,7 +33,7 @@ class ContentCheckRequest(BaseModel):
 
 @router.post("/content-check")
 async def api_content_check(req: ContentCheckRequest) -> Dict[str, Any]:
-    return content_checks.run(topic=req.topic, max_loops=req.max_loops)
+    return await run_in_pool("llm", content_checks.run, topic=req.topic, max_loops=req.max_loops)
 
 
 
@@ -41,6 +42,7 @@ from pydantic import BaseModel, Field
 import uuid as _uuid
 from ..core.database import get_database
 from ..services.background_service import get_background_service
+from ..services.job_service import get_job_service, register_job_handler
 
 class SessionsListResponse(BaseModel):
     sessions: list[dict]
@@ -51,7 +53,7 @@ class SessionsListResponse(BaseModel):
 @router.get("/sessions", response_model=SessionsListResponse)
 async def list_sessions(limit: int = Query(50, ge=1, le=500), offset: int = Query(0, ge=0), workflow_type: str | None = Query(None)):
     db = get_database()
-    res = db.list_sessions(limit=limit, offset=offset, workflow_type=workflow_type)
+    res = await run_in_pool("io", db.list_sessions, limit=limit, offset=offset, workflow_type=workflow_type)
     return SessionsListResponse(**res)
 
 class SessionDetailResponse(BaseModel):
@@ -65,10 +67,10 @@ async def get_session(session_id: str = Path(...)):
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid session_id format")
     db = get_database()
-    session = db.get_session(session_id)
+    session = await run_in_pool("io", db.get_session, session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
-    msgs = db.get_session_messages(session_id)
+    msgs = await run_in_pool("io", db.get_session_messages, session_id)
     return SessionDetailResponse(session=session, messages=msgs)
 
 class ArchiveStatusResponse(BaseModel):
@@ -82,7 +84,7 @@ class ArchiveStatusResponse(BaseModel):
 @router.get("/archive/status", response_model=ArchiveStatusResponse)
 async def archive_status():
     svc = get_background_service()
-    return ArchiveStatusResponse(**svc.get_indexing_status())
+    return ArchiveStatusResponse(**(await run_in_pool("io", svc.get_indexing_status)))
 
 class ReindexRequest(BaseModel):
     force: bool = Field(default=False)
@@ -95,7 +97,7 @@ class ReindexResponse(BaseModel):
 @router.post("/archive/reindex", response_model=ReindexResponse)
 async def archive_reindex(req: ReindexRequest):
     svc = get_background_service()
-    job_id = svc.start_reindex_job(force=req.force)
+    job_id = await run_in_pool("io", svc.start_reindex_job, force=req.force)
     return ReindexResponse(job_id=job_id, status="started", message="Reindex job started")
 
 
@@ -110,7 +112,7 @@ class QueueBreakdownResponse(BaseModel):
 @router.get("/archive/queue", response_model=QueueBreakdownResponse)
 async def archive_queue_breakdown():
     db = get_database()
-    data = db.get_queue_breakdown()
+    data = await run_in_pool("io", db.get_queue_breakdown)
     return QueueBreakdownResponse(**data)
 
 
@@ -129,7 +131,7 @@ class WorkflowTraceResponse(BaseModel):
 @router.get("/workflows/{workflow_id}/trace", response_model=WorkflowTraceResponse)
 async def get_workflow_trace(workflow_id: str = Path(...)):
     db = get_database()
-    items = db.get_workflow_traces(workflow_id)
+    items = await run_in_pool("io", db.get_workflow_traces, workflow_id)
     return WorkflowTraceResponse(workflow_id=workflow_id, traces=[WorkflowTraceItem(**i) for i in items])
 
 # --- Batch processing endpoint ---
@@ -137,23 +139,38 @@ class BatchResearchRequest(BaseModel):
     topics: List[str]
     max_turns: Optional[int] = None
 
-class BatchResearchItem(BaseModel):
-    topic: str
-    result: Dict[str, Any]
-
-class BatchResearchResponse(BaseModel):
-    items: List[BatchResearchItem]
-
-@router.post("/batch-research", response_model=BatchResearchResponse)
-async def batch_research(req: BatchResearchRequest):
-    out: List[BatchResearchItem] = []
-    for t in req.topics[:50]:  # cap to 50 per request
+class BatchResearchJobResponse(BaseModel):
+    job_id: str
+    status: str
+    topics: int
+    status_url: str
+    events_url: str
+
+def _run_batch_research(params: Dict[str, Any], progress) -> Dict[str, Any]:
+    topics = params.get("topics") or []
+    items: List[Dict[str, Any]] = []
+    for i, t in enumerate(topics):
+        progress(i / max(1, len(topics)), f"Researching {i + 1}/{len(topics)}: {t}")
         try:
-            res = deep_research.run(topic=t, max_turns=req.max_turns)
+            res = deep_research.run(topic=t, max_turns=params.get("max_turns"))
         except Exception as e:
             res = {"error": str(e)}
-        out.append(BatchResearchItem(topic=t, result=res))
-    return BatchResearchResponse(items=out)
+        items.append({"topic": t, "result": res})
+    return {"items": items}
+
+register_job_handler("batch_research", _run_batch_research)
+
+@router.post("/batch-research", response_model=BatchResearchJobResponse, status_code=202)
+async def batch_research(req: BatchResearchRequest):
+    params = {"topics": req.topics[:50], "max_turns": req.max_turns}  # cap to 50 per request
+    job_id = await run_in_pool("io", get_job_service().submit, "batch_research", params)
+    return BatchResearchJobResponse(
+        job_id=job_id,
+        status="queued",
+        topics=len(params["topics"]),
+        status_url=f"/api/v1/jobs/{job_id}",
+        events_url=f"/api/v1/jobs/{job_id}/events",
+    )
 
 # --- Circuit breaker health ---
 class CircuitBreakerHealth(BaseModel):
@@ -13,6 +13,8 @@ Date: October 1, 2025
 
 import os
 import sys
+import json
+import time
 import logging
 import asyncio
 from pathlib import Path
@@ -31,13 +33,15 @@ sys.path.insert(0, str(Path(__file__).parent))
 # Import existing services (no modifications needed)
 # Use relative imports to match the package structure
 from .core.config import get_config
-from .core.database import get_database
+from .core.database import get_database, queue_worker_id
 from .services.rag_engine import get_rag_engine
 from .services.content_processor import get_content_processor
 from .services.gdrive_service import get_gdrive_watcher
 from .services.background_service import get_background_service
 from .services.vector_store import get_vector_store
 from .services.llm_service import get_llm_service
+from .services.job_service import get_job_service, register_job_handler
+from .core.executors import run_in_pool, iterate_in_pool, executor_stats, shutdown_executors
 
 # Structured logging
 from .core.logging_config import configure_logging, get_logger
@@ -68,6 +72,10 @@ class FileProcessRequest(BaseModel):
     file_path: str = Field(..., description="Path to file to process")
     priority: int = Field(0, description="Processing priority")
 
+class DeadLetterRequeueRequest(BaseModel):
+    """Request model for requeueing dead-lettered queue items."""
+    ids: Optional[List[int]] = Field(None, description="Dead letter IDs to requeue (default: all)")
+
 class ConfigUpdateRequest(BaseModel):
     """Request model for configuration updates."""
     config: Dict[str, str] = Field(..., description="Configuration key-value pairs")
@@ -104,6 +112,9 @@ async def lifespan(app: FastAPI):
         app.state.config = config
         app.state.db = db
 
+        # Pick up jobs interrupted by a previous shutdown
+        get_job_service().resume_unfinished()
+
         logger.info("API Server started successfully")
     except Exception as e:
         logger.error(f"Failed to initialize services: {e}")
@@ -122,6 +133,8 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Error during shutdown: {e}")
 
+    get_job_service().shutdown()
+    shutdown_executors()
     logger.info("API Server shutdown complete")
 
 # ============================================================================
@@ -159,6 +172,13 @@ try:
 except Exception as e:
     logger.warning(f"Failed to include nexus agents router: {e}")
 
+# Jobs router
+try:
+    from .api.jobs import router as jobs_router
+    app.include_router(jobs_router)
+except Exception as e:
+    logger.warning(f"Failed to include jobs router: {e}")
+
 # Health router
 try:
     from .api.health import router as health_router
@@ -288,7 +308,8 @@ async def health_check():
     """Health check endpoint."""
     return {
         "status": "healthy",
-        "timestamp": asyncio.get_event_loop().time()
+        "timestamp": asyncio.get_event_loop().time(),
+        "executors": executor_stats()
     }
 
 @app.get("/api/v1/system/status", response_model=SystemStatusResponse)
@@ -320,7 +341,7 @@ async def get_system_status():
 
         # Check vector store
         try:
-            vector_store = get_vector_store()
+            vector_store = await run_in_pool("io", get_vector_store)
             services_status["vector_store"]["status"] = "healthy"
         except Exception as e:
             services_status["vector_store"]["status"] = "error"
@@ -328,7 +349,7 @@ async def get_system_status():
 
         # Check LLM service
         try:
-            llm = get_llm_service()
+            llm = await run_in_pool("io", get_llm_service)
             services_status["llm"]["status"] = "healthy"
         except Exception as e:
             services_status["llm"]["status"] = "error"
@@ -376,7 +397,7 @@ async def verify_connections():
 
         # Test vector store
         try:
-            vector_store = get_vector_store()
+            vector_store = await run_in_pool("io", get_vector_store)
             results["vector_store"]["status"] = "ok"
             results["vector_store"]["type"] = config.vector_store_type
         except Exception as e:
@@ -385,7 +406,7 @@ async def verify_connections():
 
         # Test LLM
         try:
-            llm = get_llm_service()
+            llm = await run_in_pool("io", get_llm_service)
             results["llm"]["status"] = "ok"
         except Exception as e:
             results["llm"]["status"] = "error"
@@ -407,6 +428,18 @@ async def verify_connections():
 # Chat & RAG Endpoints
 # ============================================================================
 
+def _sse_frame(event: Dict[str, Any], session_id: Optional[str] = None) -> str:
+    """Format one RAG stream event as a Server-Sent Events frame."""
+    data = dict(event.get("data") or {})
+    if session_id is not None:
+        data["session_id"] = session_id
+    return f"event: {event['event']}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+async def _sse_events(events, session_id: Optional[str] = None):
+    """Stream RAG events as SSE frames, pulling each event from the LLM pool."""
+    async for event in iterate_in_pool("llm", events):
+        yield _sse_frame(event, session_id)
+
 @app.post("/api/v1/chat/query", response_model=ChatQueryResponse)
 async def chat_query(request: ChatQueryRequest):
     """
@@ -419,10 +452,17 @@ async def chat_query(request: ChatQueryRequest):
         logger.info(f"Chat query: {request.question[:100]}...")
 
         # Get RAG engine
-        rag_engine = get_rag_engine()
+        rag_engine = await run_in_pool("llm", get_rag_engine)
+
+        if request.stream:
+            return StreamingResponse(
+                _sse_events(rag_engine.stream_query(request.question), request.session_id),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            )
 
         # Query the RAG engine
-        result = rag_engine.query(request.question)
+        result = await run_in_pool("llm", rag_engine.query, request.question)
 
         # Add session_id if provided
         result["session_id"] = request.session_id
@@ -485,15 +525,16 @@ async def upload_file(file: UploadFile = File(...)):
 
         # Save uploaded file
         file_path = uploads_dir / file.filename
-        with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
+        content = await file.read()
+        await run_in_pool("file", file_path.write_bytes, content)
 
         logger.info(f"File saved: {file_path} ({len(content)} bytes)")
 
         # Add to processing queue
         db = get_database()
-        queue_id = db.add_to_queue(
+        queue_id = await run_in_pool(
+            "io",
+            db.add_to_queue,
             file_id=str(file_path),
             file_name=file.filename,
             source='upload',
@@ -520,18 +561,21 @@ async def process_file(request: FileProcessRequest):
 
         # Get services
         db = get_database()
-        processor = get_content_processor()
+        processor = await run_in_pool("file", get_content_processor)
 
         # Add to queue
-        queue_id = db.add_to_queue(
+        queue_id = await run_in_pool(
+            "io",
+            db.add_to_queue,
             file_id=request.file_path,
             file_name=Path(request.file_path).name,
             source='local',
-            priority=request.priority
+            priority=request.priority,
+            notify=False  # processed right below; a woken worker would take it
         )
 
         # Process immediately
-        success = processor.process_queue_item(queue_id)
+        success = await run_in_pool("file", processor.process_queue_item, queue_id)
 
         return {
             "success": success,
@@ -550,10 +594,10 @@ async def get_processing_queue(limit: int = 50, status: Optional[str] = None):
         db = get_database()
 
         if status == "pending":
-            items = db.get_pending_queue_items(limit=limit)
+            items = await run_in_pool("io", db.get_pending_queue_items, limit=limit)
         else:
             # Get all items (we'll need to add this method to database)
-            items = db.get_pending_queue_items(limit=limit)
+            items = await run_in_pool("io", db.get_pending_queue_items, limit=limit)
 
         return {
             "items": items,
@@ -571,33 +615,51 @@ async def process_queue(limit: int = 10):
         logger.info(f"Processing queue (limit: {limit})")
 
         db = get_database()
-        processor = get_content_processor()
+        processor = await run_in_pool("file", get_content_processor)
 
-        # Get pending items
-        items = db.get_pending_queue_items(limit=limit)
+        # Claim pending items so background queue workers skip them
+        worker_id = queue_worker_id("api")
+        items = await run_in_pool(
+            "io", db.claim_queue_items, worker_id, limit, get_config().queue_lease_seconds
+        )
 
-        results = {
-            "processed": 0,
-            "failed": 0,
+        summary = await run_in_pool("file", processor.process_queue_items, items, worker_id=worker_id)
+
+        return {
+            "processed": summary["succeeded"],
+            "failed": summary["failed"],
             "total": len(items)
         }
 
-        # Process each item
-        for item in items:
-            try:
-                success = processor.process_queue_item(item['id'])
-                if success:
-                    results["processed"] += 1
-                else:
-                    results["failed"] += 1
-            except Exception as e:
-                logger.error(f"Error processing queue item {item['id']}: {e}")
-                results["failed"] += 1
+    except Exception as e:
+        logger.error(f"Error processing queue: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-        return results
+@app.get("/api/v1/files/queue/dead-letters")
+async def get_dead_letters(limit: int = 50, offset: int = 0):
+    """List queue items given up on after permanent or repeated failures."""
+    try:
+        db = get_database()
+        return await run_in_pool("io", db.list_dead_letters, limit=limit, offset=offset)
 
     except Exception as e:
-        logger.error(f"Error processing queue: {e}")
+        logger.error(f"Error listing dead letters: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/v1/files/queue/dead-letters/requeue")
+async def requeue_dead_letters(request: DeadLetterRequeueRequest):
+    """Put dead-lettered items back on the processing queue with their retries reset."""
+    try:
+        db = get_database()
+        queue_ids = await run_in_pool("io", db.requeue_dead_letters, request.ids)
+
+        return {
+            "requeued": len(queue_ids),
+            "queue_ids": queue_ids
+        }
+
+    except Exception as e:
+        logger.error(f"Error requeueing dead letters: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 # ============================================================================
@@ -619,10 +681,10 @@ async def sync_google_drive():
             )
 
         # Get Google Drive watcher
-        gdrive_watcher = get_gdrive_watcher()
+        gdrive_watcher = await run_in_pool("io", get_gdrive_watcher)
 
         # Trigger sync
-        new_files_count = gdrive_watcher.watch()
+        new_files_count = await run_in_pool("io", gdrive_watcher.watch)
 
         return {
             "success": True,
@@ -675,7 +737,7 @@ async def list_gdrive_files(folder_id: Optional[str] = None, page_size: int = 10
         List of files with metadata
     """
     try:
-        gdrive_service = get_gdrive_watcher()
+        gdrive_service = await run_in_pool("io", get_gdrive_watcher)
         config = get_config()
 
         # Use provided folder_id or fall back to configured folder
@@ -687,7 +749,9 @@ async def list_gdrive_files(folder_id: Optional[str] = None, page_size: int = 10
                 detail="No folder_id provided and no default folder configured"
             )
 
-        files = gdrive_service.list_files(
+        files = await run_in_pool(
+            "io",
+            gdrive_service.list_files,
             folder_id=target_folder,
             page_size=page_size
         )
@@ -703,6 +767,60 @@ async def list_gdrive_files(folder_id: Optional[str] = None, page_size: int = 10
         logger.error(f"Error listing Google Drive files: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def _download_gdrive_file(file_id: str) -> Dict[str, Any]:
+    """Download a Google Drive file to a temp location and queue it (blocking)."""
+    gdrive_service = get_gdrive_watcher()
+    db = get_database()
+
+    # Get file metadata
+    file_metadata = gdrive_service.service.files().get(
+        fileId=file_id,
+        fields='id, name, mimeType, size, modifiedTime'
+    ).execute()
+
+    # Download file content
+    import io
+    from googleapiclient.http import MediaIoBaseDownload
+
+    request = gdrive_service.service.files().get_media(fileId=file_id)
+    file_content = io.BytesIO()
+    downloader = MediaIoBaseDownload(file_content, request)
+
+    done = False
+    while not done:
+        status, done = downloader.next_chunk()
+
+    # Save to temporary location
+    import tempfile
+    temp_dir = Path(tempfile.gettempdir()) / "jaegis_gdrive"
+    temp_dir.mkdir(exist_ok=True)
+
+    file_path = temp_dir / file_metadata['name']
+    file_content.seek(0)
+    with open(file_path, 'wb') as f:
+        f.write(file_content.read())
+
+    # Add to processing queue
+    queue_id = db.add_to_queue(
+        file_id=file_id,
+        file_name=file_metadata['name'],
+        file_path=str(file_path),
+        source='google_drive',
+        priority=5
+    )
+
+    logger.info(f"Downloaded Google Drive file: {file_metadata['name']} (Queue ID: {queue_id})")
+
+    return {
+        "success": True,
+        "file_id": file_id,
+        "file_name": file_metadata['name'],
+        "file_path": str(file_path),
+        "file_size": int(file_metadata.get('size', 0)),
+        "queue_id": queue_id,
+        "message": f"File '{file_metadata['name']}' downloaded and added to processing queue"
+    }
+
 @app.post("/api/v1/gdrive/download")
 async def download_gdrive_file(file_id: str = Body(..., embed=True)):
     """
@@ -715,57 +833,7 @@ async def download_gdrive_file(file_id: str = Body(..., embed=True)):
         File information and queue ID
     """
     try:
-        gdrive_service = get_gdrive_watcher()
-        db = get_database()
-
-        # Get file metadata
-        file_metadata = gdrive_service.service.files().get(
-            fileId=file_id,
-            fields='id, name, mimeType, size, modifiedTime'
-        ).execute()
-
-        # Download file content
-        import io
-        from googleapiclient.http import MediaIoBaseDownload
-
-        request = gdrive_service.service.files().get_media(fileId=file_id)
-        file_content = io.BytesIO()
-        downloader = MediaIoBaseDownload(file_content, request)
-
-        done = False
-        while not done:
-            status, done = downloader.next_chunk()
-
-        # Save to temporary location
-        import tempfile
-        temp_dir = Path(tempfile.gettempdir()) / "jaegis_gdrive"
-        temp_dir.mkdir(exist_ok=True)
-
-        file_path = temp_dir / file_metadata['name']
-        file_content.seek(0)
-        with open(file_path, 'wb') as f:
-            f.write(file_content.read())
-
-        # Add to processing queue
-        queue_id = db.add_to_queue(
-            file_id=file_id,
-            file_name=file_metadata['name'],
-            file_path=str(file_path),
-            source='google_drive',
-            priority=5
-        )
-
-        logger.info(f"Downloaded Google Drive file: {file_metadata['name']} (Queue ID: {queue_id})")
-
-        return {
-            "success": True,
-            "file_id": file_id,
-            "file_name": file_metadata['name'],
-            "file_path": str(file_path),
-            "file_size": int(file_metadata.get('size', 0)),
-            "queue_id": queue_id,
-            "message": f"File '{file_metadata['name']}' downloaded and added to processing queue"
-        }
+        return await run_in_pool("io", _download_gdrive_file, file_id)
 
     except Exception as e:
         logger.error(f"Error downloading Google Drive file: {e}")
@@ -789,7 +857,7 @@ async def start_background_service():
                 "message": "Background service is already running"
             }
 
-        bg_service.start()
+        await run_in_pool("io", bg_service.start)
 
         return {
             "success": True,
@@ -814,7 +882,7 @@ async def stop_background_service():
                 "message": "Background service is not running"
             }
 
-        bg_service.stop()
+        await run_in_pool("io", bg_service.stop)
 
         return {
             "success": True,
@@ -971,59 +1039,83 @@ class PodcastGenerateRequest(BaseModel):
     tts_engine: str = Field("auto", description="TTS engine to use")
     output_name: Optional[str] = Field(None, description="Output filename")
 
-@app.post("/api/v1/podcast/generate")
+def _run_podcast_job(params: Dict[str, Any], progress) -> Dict[str, Any]:
+    """Generate a podcast (content → script → audio); runs on the podcast job pool."""
+    # Import TTS and LLM services
+    from .tts_service import get_tts_service
+    from .llm_service import get_llm_service
+
+    tts = get_tts_service()
+    llm = get_llm_service()
+
+    # Generate content
+    progress(0.05, "Gathering content")
+    if params.get("query"):
+        # Use RAG to generate content
+        result = get_rag_engine().query(params["query"])
+        content = result['answer']
+    else:
+        # Process source URL
+        from .source_processor import get_source_processor
+        processor = get_source_processor()
+        content = processor.process_content(params["source_url"])
+
+    # Generate podcast script
+    progress(0.35, "Writing podcast script")
+    podcast_script = llm.generate_podcast_script(content)
+
+    # Generate audio
+    progress(0.6, "Synthesizing audio")
+    output_name = params.get("output_name") or f"podcast_{int(time.time())}.wav"
+    output_path = Path("podcasts") / output_name
+    output_path.parent.mkdir(exist_ok=True)
+
+    audio_file = tts.generate_podcast_audio(podcast_script, str(output_path))
+
+    return {
+        "audio_file": str(audio_file),
+        "script_length": len(podcast_script),
+        "file_size": os.path.getsize(audio_file) if os.path.exists(audio_file) else 0
+    }
+
+register_job_handler("podcast", _run_podcast_job)
+
+@app.post("/api/v1/podcast/generate", status_code=202)
 async def generate_podcast(request: PodcastGenerateRequest):
     """
-    Generate a podcast from RAG query or source URL.
+    Start podcast generation from a RAG query or source URL.
 
-    This is a long-running operation. Consider using WebSocket for progress updates.
+    Returns a job id immediately; poll /api/v1/jobs/{job_id} or follow
+    /api/v1/jobs/{job_id}/events for progress and the resulting audio file.
     """
-    try:
-        logger.info(f"Generating podcast: query={request.query}, source={request.source_url}")
-
-        # Import TTS and LLM services
-        from .tts_service import get_tts_service
-        from .llm_service import get_llm_service
-
-        tts = get_tts_service()
-        llm = get_llm_service()
-
-        # Generate content
-        if request.query:
-            # Use RAG to generate content
-            rag_engine = get_rag_engine()
-            result = rag_engine.query(request.query)
-            content = result['answer']
-        elif request.source_url:
-            # Process source URL
-            from .source_processor import get_source_processor
-            processor = get_source_processor()
-            content = processor.process_content(request.source_url)
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail="Either query or source_url must be provided"
-            )
-
-        # Generate podcast script
-        podcast_script = llm.generate_podcast_script(content)
+    if not request.query and not request.source_url:
+        raise HTTPException(
+            status_code=400,
+            detail="Either query or source_url must be provided"
+        )
 
-        # Generate audio
-        output_name = request.output_name or f"podcast_{asyncio.get_event_loop().time()}.wav"
-        output_path = Path("podcasts") / output_name
-        output_path.parent.mkdir(exist_ok=True)
+    try:
+        logger.info(f"Queueing podcast: query={request.query}, source={request.source_url}")
 
-        audio_file = tts.generate_podcast_audio(podcast_script, str(output_path))
+        params = {
+            "query": request.query,
+            "source_url": request.source_url,
+            "style": request.style,
+            "tts_engine": request.tts_engine,
+            "output_name": request.output_name
+        }
+        job_id = await run_in_pool("io", get_job_service().submit, "podcast", params)
 
         return {
             "success": True,
-            "audio_file": str(audio_file),
-            "script_length": len(podcast_script),
-            "file_size": os.path.getsize(audio_file) if os.path.exists(audio_file) else 0
+            "job_id": job_id,
+            "status": "queued",
+            "status_url": f"/api/v1/jobs/{job_id}",
+            "events_url": f"/api/v1/jobs/{job_id}/events"
         }
 
     except Exception as e:
-        logger.error(f"Error generating podcast: {e}")
+        logger.error(f"Error queueing podcast: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/v1/podcast/list")
@@ -1089,12 +1181,14 @@ async def search_documents(request: SearchRequest):
     try:
         logger.info(f"Searching: {request.query}")
 
-        vector_store = get_vector_store()
+        vector_store = await run_in_pool("vector", get_vector_store)
 
         # Search vector store
-        results = vector_store.search(
+        results = await run_in_pool(
+            "vector",
+            vector_store.search,
             query=request.query,
-            limit=request.limit
+            top_k=request.limit
         )
 
         return {
@@ -1204,7 +1298,7 @@ async def convert_natural_language_to_command(request: NLCommandRequest):
 
         # If no pattern match, try using LLM for more complex queries
         try:
-            llm_service = get_llm_service()
+            llm_service = await run_in_pool("llm", get_llm_service)
 
             prompt = f"""Convert the following natural language request into a JAEGIS CLI command.
 
@@ -1228,7 +1322,7 @@ User request: "{request.input}"
 Respond with ONLY the command, nothing else. If you cannot determine a command, respond with "unknown".
 """
 
-            response = llm_service.generate(prompt, max_tokens=50)
+            response = await run_in_pool("llm", llm_service.generate, prompt, max_tokens=50)
             command = response.strip()
 
             if command and command != "unknown" and not command.startswith("I "):
@@ -0,0 +1,249 @@
+"""
+Audio assembly - streams podcast segments into a single WAV file.
+
+Segments are copied into the output ``wave`` writer chunk by chunk, so the
+combined podcast is never held in memory and each sample is copied once:
+assembly time is linear in podcast length and memory is bounded by one
+segment. Silence between segments is written directly; optional crossfades
+only buffer the overlapping frames.
+
+A segment is either a file path or an in-memory buffer (``bytes``). PCM WAV
+is read with the standard library; anything else (MP3 from Edge TTS, float
+WAV from Chatterbox) is decoded one segment at a time with pydub. Segments
+whose format differs from the first segment are converted to match it.
+"""
+
+import io
+import logging
+import wave
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+AudioSource = Union[str, bytes, bytearray, memoryview]
+
+# Frames copied per read; bounds memory independently of segment length
+CHUNK_FRAMES = 64 * 1024
+
+
+class AudioAssemblyError(Exception):
+    """Raised when no segment could be assembled."""
+    pass
+
+
+class PCMFormat(NamedTuple):
+    """Raw PCM layout shared by every frame written to the output."""
+
+    channels: int
+    sample_width: int
+    frame_rate: int
+
+    @property
+    def frame_size(self) -> int:
+        return self.channels * self.sample_width
+
+    def frames_for(self, ms: int) -> int:
+        return int(self.frame_rate * ms / 1000)
+
+    def silence(self, frames: int) -> bytes:
+        # 8-bit WAV is unsigned, so its zero level is 0x80
+        fill = b"\x80" if self.sample_width == 1 else b"\x00"
+        return fill * (frames * self.frame_size)
+
+
+def _is_buffer(source: AudioSource) -> bool:
+    return isinstance(source, (bytes, bytearray, memoryview))
+
+
+def _describe(source: AudioSource) -> str:
+    return f"<{len(source)} byte buffer>" if _is_buffer(source) else str(source)
+
+
+def _decode_with_pydub(source: AudioSource) -> Tuple[PCMFormat, bytes]:
+    """Decode a non-PCM segment (MP3, float WAV, ...) into PCM."""
+    from pydub import AudioSegment
+
+    audio = AudioSegment.from_file(io.BytesIO(bytes(source)) if _is_buffer(source) else source)
+    return PCMFormat(audio.channels, audio.sample_width, audio.frame_rate), audio.raw_data
+
+
+def _convert(pcm: bytes, source_fmt: PCMFormat, target: PCMFormat) -> bytes:
+    """Resample / remix one segment to the output format."""
+    from pydub import AudioSegment
+
+    audio = AudioSegment(
+        data=pcm,
+        sample_width=source_fmt.sample_width,
+        frame_rate=source_fmt.frame_rate,
+        channels=source_fmt.channels,
+    )
+    audio = audio.set_frame_rate(target.frame_rate).set_channels(target.channels).set_sample_width(target.sample_width)
+    return audio.raw_data
+
+
+def _chunked(data: bytes, chunk_bytes: int) -> Iterator[bytes]:
+    view = memoryview(data)
+    for start in range(0, len(view), chunk_bytes):
+        yield bytes(view[start:start + chunk_bytes])
+
+
+def open_segment(source: AudioSource, chunk_frames: int = CHUNK_FRAMES) -> Tuple[PCMFormat, Iterator[bytes]]:
+    """
+    Open a segment for streaming.
+
+    Args:
+        source: WAV/MP3 file path or in-memory audio buffer
+        chunk_frames: Frames per yielded chunk
+
+    Returns:
+        Tuple of (PCM format, iterator over PCM chunks)
+    """
+    try:
+        reader = wave.open(io.BytesIO(bytes(source)) if _is_buffer(source) else str(source), "rb")
+    except (wave.Error, EOFError):
+        fmt, pcm = _decode_with_pydub(source)
+        return fmt, _chunked(pcm, chunk_frames * fmt.frame_size)
+
+    fmt = PCMFormat(reader.getnchannels(), reader.getsampwidth(), reader.getframerate())
+
+    def chunks() -> Iterator[bytes]:
+        with reader:
+            while True:
+                data = reader.readframes(chunk_frames)
+                if not data:
+                    return
+                yield data
+
+    return fmt, chunks()
+
+
+def _crossfade(tail: bytes, head: bytes, fmt: PCMFormat) -> Optional[bytes]:
+    """Mix the end of one segment into the start of the next (linear ramps)."""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    dtypes = {1: np.uint8, 2: np.int16, 4: np.int32}
+    if fmt.sample_width not in dtypes:
+        return None
+
+    frames = min(len(tail), len(head)) // fmt.frame_size
+    if frames == 0:
+        return None
+    dtype = dtypes[fmt.sample_width]
+    out = np.frombuffer(tail[-frames * fmt.frame_size:], dtype=dtype).astype(np.float64).reshape(frames, fmt.channels)
+    into = np.frombuffer(head[:frames * fmt.frame_size], dtype=dtype).astype(np.float64).reshape(frames, fmt.channels)
+    if fmt.sample_width == 1:
+        out -= 128
+        into -= 128
+    ramp = np.linspace(1.0, 0.0, frames)[:, None]
+    mixed = out * ramp + into * (1.0 - ramp)
+    if fmt.sample_width == 1:
+        mixed += 128
+    info = np.iinfo(dtype)
+    mixed = np.clip(np.rint(mixed), info.min, info.max).astype(dtype)
+    # tail frames not covered by the overlap stay in front of the mix
+    return tail[:-frames * fmt.frame_size] + mixed.tobytes() + head[frames * fmt.frame_size:]
+
+
+def assemble_wav(
+    sources: Iterable[AudioSource],
+    output_file: str,
+    pause_ms: int = 300,
+    crossfade_ms: int = 0,
+    chunk_frames: int = CHUNK_FRAMES,
+) -> Dict[str, Any]:
+    """
+    Stream segments into one WAV file.
+
+    Args:
+        sources: Segment file paths or in-memory buffers, in playback order
+        output_file: Output WAV path
+        pause_ms: Silence inserted between segments
+        crossfade_ms: Overlap adjacent segments by this much instead of
+            pausing (needs numpy; 0 disables)
+        chunk_frames: Frames copied per read
+
+    Returns:
+        Dict with segments, skipped, frames, duration_s and format
+
+    Raises:
+        AudioAssemblyError: If no segment could be read
+    """
+    target: Optional[PCMFormat] = None
+    writer: Optional[wave.Wave_write] = None
+    tail = b""  # held-back frames of the previous segment (crossfade only)
+    written = skipped = frames = 0
+
+    try:
+        for source in sources:
+            try:
+                fmt, chunks = open_segment(source, chunk_frames)
+                if target is not None and fmt != target:
+                    pcm = _convert(b"".join(chunks), fmt, target)
+                    chunks = _chunked(pcm, chunk_frames * target.frame_size)
+            except Exception as e:
+                logger.warning(f"Failed to load segment {_describe(source)}: {e}")
+                skipped += 1
+                continue
+
+            if writer is None:
+                target = fmt
+                writer = wave.open(output_file, "wb")
+                writer.setnchannels(fmt.channels)
+                writer.setsampwidth(fmt.sample_width)
+                writer.setframerate(fmt.frame_rate)
+
+            fade_bytes = target.frames_for(crossfade_ms) * target.frame_size if crossfade_ms > 0 else 0
+            if written and not fade_bytes and pause_ms > 0:
+                silence = target.silence(target.frames_for(pause_ms))
+                writer.writeframes(silence)
+                frames += len(silence) // target.frame_size
+
+            # The previous segment's held-back end is mixed into this one's start
+            carry, tail, head = tail, b"", b""
+            for chunk in chunks:
+                if carry:
+                    head += chunk
+                    if len(head) < fade_bytes:
+                        continue
+                    chunk = _crossfade(carry, head, target) or (carry + head)
+                    carry = head = b""
+                if fade_bytes:
+                    # Hold back the last crossfade window for the next segment
+                    chunk = tail + chunk
+                    cut = max(0, len(chunk) - fade_bytes)
+                    writer.writeframes(chunk[:cut])
+                    frames += cut // target.frame_size
+                    tail = chunk[cut:]
+                else:
+                    writer.writeframes(chunk)
+                    frames += len(chunk) // target.frame_size
+
+            if carry:
+                # Segment shorter than the crossfade window
+                mixed = _crossfade(carry, head, target) or (carry + head)
+                cut = max(0, len(mixed) - fade_bytes)
+                writer.writeframes(mixed[:cut])
+                frames += cut // target.frame_size
+                tail = mixed[cut:]
+            written += 1
+
+        if writer is None:
+            raise AudioAssemblyError("No audio segments could be read")
+        if tail:
+            writer.writeframes(tail)
+            frames += len(tail) // target.frame_size
+    finally:
+        if writer is not None:
+            writer.close()
+
+    duration = frames / target.frame_rate if target and target.frame_rate else 0.0
+    logger.info(f"Assembled {written} segments into {output_file} ({duration:.1f}s)")
+    return {
+        "segments": written,
+        "skipped": skipped,
+        "frames": frames,
+        "duration_s": duration,
+        "format": target._asdict() if target else None,
+    }
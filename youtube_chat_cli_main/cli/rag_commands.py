@@ -12,17 +12,21 @@ Enhanced CLI commands for Adaptive RAG functionality including:
 
 import click
 import logging
+import threading
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict, Tuple
 from colorama import Fore, Style
 
 from ..core.config import get_config
-from ..core.database import get_database
+from ..core.database import get_database, queue_worker_id
+from ..core.queue_signal import get_queue_signal
 from ..services.rag_engine import get_rag_engine
 from ..services.content_processor import get_content_processor
 from ..services.gdrive_service import get_gdrive_watcher
 from ..services.background_service import get_background_service
 from ..services.vector_store import get_vector_store
+from ..services.context_builder import CHARS_PER_TOKEN, build_context
+from ..services.ingestion_pipeline import ingest
 from ..services.llm_service import get_llm_service  # Multi-backend LLM service (Ollama/OpenRouter)
 from ..tts_service import get_tts_service
 
@@ -35,6 +39,38 @@ def rag():
     pass
 
 
+def _stream_answer(rag_engine, question: str) -> None:
+    """Print a streamed RAG answer followed by its verdict."""
+    click.echo()
+    started = False
+    for event in rag_engine.stream_query(question):
+        kind, data = event["event"], event["data"]
+        if kind == "token":
+            if not started:
+                click.echo(Fore.GREEN + "Assistant: " + Style.RESET_ALL, nl=False)
+                started = True
+            click.echo(data["text"], nl=False)
+        elif kind == "context":
+            if data.get('web_search_used'):
+                click.echo(Fore.YELLOW + "ℹ️  Used web search")
+            if data.get('transform_count', 0) > 0:
+                click.echo(Fore.YELLOW + f"ℹ️  Query transformed {data['transform_count']} times")
+            if data.get('documents'):
+                click.echo(Fore.YELLOW + f"ℹ️  Retrieved {len(data['documents'])} documents")
+        elif kind == "verdict":
+            click.echo()
+            if data.get("cached"):
+                click.echo(Fore.YELLOW + "ℹ️  Answer served from cache")
+            elif data.get("verdict") == "not supported":
+                click.echo(Fore.RED + "⚠️  Answer may not be grounded in the retrieved documents")
+            elif data.get("verdict") == "not useful":
+                click.echo(Fore.RED + "⚠️  Answer may not fully address the question")
+        elif kind == "error":
+            click.echo()
+            click.echo(Fore.RED + f"❌ Error: {data.get('message')}")
+    click.echo()
+
+
 @rag.command()
 @click.option('--stream', is_flag=True, help='Stream the response')
 def chat(stream: bool):
@@ -81,6 +117,10 @@ def chat(stream: bool):
             # Query RAG engine
             click.echo(Fore.YELLOW + "🤔 Thinking...")
 
+            if stream:
+                _stream_answer(rag_engine, question)
+                continue
+
             result = rag_engine.query(question)
 
             # Display answer
@@ -130,7 +170,8 @@ def process_file(file_path: str, priority: int):
             file_id=file_path,
             file_name=Path(file_path).name,
             source='local',
-            priority=priority
+            priority=priority,
+            notify=False  # processed right below; a woken worker would take it
         )
 
         click.echo(Fore.YELLOW + f"Added to queue (ID: {queue_id})")
@@ -179,14 +220,17 @@ def process_folder(folder_path: str, priority: int, recursive: bool):
 
         click.echo(Fore.YELLOW + f"Found {len(files)} files to process")
 
-        # Add to queue
+        # Add to queue, waking the queue workers once
         for file in files:
             db.add_to_queue(
                 file_id=str(file),
                 file_name=file.name,
                 source='local',
-                priority=priority
+                priority=priority,
+                notify=False
             )
+        if files:
+            get_queue_signal().notify()
 
         click.echo(Fore.GREEN + f"✅ Added {len(files)} files to processing queue")
 
@@ -195,6 +239,16 @@ def process_folder(folder_path: str, priority: int, recursive: bool):
 
 
 
+def _echo_stage_stats(summary: Dict[str, Any]) -> None:
+    """Print per-stage throughput of an ingestion pipeline run."""
+    click.echo(Fore.CYAN + f"\nPipeline ({summary['elapsed']:.1f}s):")
+    for name, stage in summary['stages'].items():
+        click.echo(
+            f"  {name:<8} {stage['items']:>6} items  {stage['chunks_per_second']:>8.1f} chunks/s  "
+            f"{stage['utilization']:>4.0%} busy  queue peak {stage['queue_peak']}"
+        )
+
+
 @rag.command(name='import-batch')
 @click.option('--directory', '-d', type=click.Path(exists=True, file_okay=False), required=True, help='Directory to import from')
 @click.option('--recursive', '-r', is_flag=True, help='Recurse into subdirectories')
@@ -246,46 +300,61 @@ def import_batch(directory: str, recursive: bool, formats: str, tags: str, queue
 
     try:
         processor = get_content_processor()
-        vector_store = get_vector_store()
         db = get_database()
 
         success_count = 0
         fail_count = 0
 
-        with click.progressbar(files, label='Importing', show_pos=True) as bar:
-            for f in bar:
-                try:
-                    if queue:
+        if queue:
+            with click.progressbar(files, label='Enqueueing', show_pos=True) as bar:
+                for f in bar:
+                    try:
                         db.add_to_queue(
                             file_id=str(f),
                             file_name=f.name,
                             source='local',
-                            priority=0
+                            priority=0,
+                            notify=False
                         )
                         success_count += 1
-                    else:
-                        result = processor.process_file(str(f))
-                        # Attach tags and additional metadata
-                        import time
-                        try:
-                            mtime = f.stat().st_mtime
-                        except Exception:
-                            mtime = None
-                        metadata = {
-                            'file_id': str(f),
-                            'file_name': f.name,
-                            'source': 'local',
-                            'tags': tag_list,
-                            'ingested_at': int(time.time()),
-                            'file_mtime': int(mtime) if mtime else None,
-                            'file_type': result.get('file_type') or '',
-                            **result['metadata']
-                        }
-                        vector_store.add_documents(result['chunks'], metadata=metadata)
-                        success_count += 1
-                except Exception as e:
-                    logger.exception(f"Failed to import {f}: {e}")
-                    fail_count += 1
+                    except Exception as e:
+                        logger.exception(f"Failed to enqueue {f}: {e}")
+                        fail_count += 1
+            if success_count:
+                get_queue_signal().notify()
+        else:
+            import time
+
+            def extract(f):
+                # Large PDFs are chunked page by page while they are parsed
+                chunks, file_metadata = processor.stream_file(str(f))
+                # Attach tags and additional metadata
+                try:
+                    mtime = f.stat().st_mtime
+                except Exception:
+                    mtime = None
+                return chunks, {
+                    'file_id': str(f),
+                    'file_name': f.name,
+                    'source': 'local',
+                    'tags': tag_list,
+                    'ingested_at': int(time.time()),
+                    'file_mtime': int(mtime) if mtime else None,
+                    **file_metadata
+                }
+
+            # Files are extracted, embedded and upserted concurrently; the bar
+            # advances as each one is indexed or fails
+            with click.progressbar(length=len(files), label='Importing', show_pos=True) as bar:
+                bar_lock = threading.Lock()
+
+                def advance(*_args):
+                    with bar_lock:
+                        bar.update(1)
+
+                summary = ingest(files, extract, on_success=advance, on_failure=advance)
+            success_count, fail_count = summary['succeeded'], summary['failed']
+            _echo_stage_stats(summary)
 
         click.echo(Fore.GREEN + f"\n✅ Import complete: {success_count} succeeded, {fail_count} failed")
         if queue:
@@ -331,7 +400,7 @@ def search(query: Optional[str], top_k: int):
 
 
 @rag.command(name='filter-content')
-@click.option('--query', '-q', type=str, default='', help='Keyword/semantic query (optional)')
+@click.option('--query', '-q', type=str, multiple=True, help='Keyword/semantic query (optional, repeatable; results are merged)')
 @click.option('--top-k', type=int, default=50, help='Max results to return')
 @click.option('--date-start', type=str, default='', help='Start date (YYYY-MM-DD), filters ingested_at >= start')
 @click.option('--date-end', type=str, default='', help='End date (YYYY-MM-DD), filters ingested_at <= end')
@@ -342,7 +411,7 @@ def search(query: Optional[str], top_k: int):
 @click.option('--min-duration', type=float, default=0.0, help='Minimum duration in seconds (audio/video)')
 @click.option('--max-duration', type=float, default=0.0, help='Maximum duration in seconds (audio/video)')
 @click.option('--output', '-o', type=click.Path(dir_okay=False), default='', help='Optional path to write JSON results')
-def filter_content(query: str, top_k: int, date_start: str, date_end: str, tags: str,
+def filter_content(query: Tuple[str, ...], top_k: int, date_start: str, date_end: str, tags: str,
                    file_type: str, min_size: int, max_size: int,
                    min_duration: float, max_duration: float, output: str):
     """
@@ -401,12 +470,16 @@ def filter_content(query: str, top_k: int, date_start: str, date_end: str, tags:
     filter_dict = {'$and': conditions} if conditions else None
 
     # Require a query for now to leverage the vector index
-    if not query:
-        query = 'content'
+    queries = [q for q in query if q.strip()] or ['content']
 
     try:
         vs = get_vector_store()
-        results = vs.search(query=query, top_k=top_k, filter_dict=filter_dict)
+        if len(queries) == 1:
+            results = vs.search(query=queries[0], top_k=top_k, filter_dict=filter_dict)
+        else:
+            # One batched embedding + backend call; each hit kept once
+            per_query = vs.search_many(queries, top_k=top_k, filter_dict=filter_dict)
+            results = sorted((r for hits in per_query for r in hits), key=lambda r: r['score'], reverse=True)[:top_k]
 
         # Pretty print
         for i, r in enumerate(results, 1):
@@ -468,25 +541,14 @@ def _build_filter_dict(date_start: str, date_end: str, tags: str, file_type: str
 
 
 def _aggregate_results_text(results, max_chars: int = 8000) -> str:
-    parts = []
-    seen_files = set()
-    total = 0
-    for r in results:
-        meta = r.get('metadata') or {}
-        fname = meta.get('file_name') or ''
-        if fname and fname not in seen_files:
-            seen_files.add(fname)
-        chunk = r.get('content') or ''
-        if not chunk:
-            continue
-        if total + len(chunk) > max_chars:
-            chunk = chunk[: max(0, max_chars - total)]
-        if chunk:
-            parts.append(f"\n\n# Source: {fname}\n\n{chunk}")
-            total += len(chunk)
-        if total >= max_chars:
-            break
-    return ("\n".join(parts)).strip()
+    # Overlapping and duplicate chunks are merged/dropped before the budget applies
+    return build_context(
+        results,
+        max_tokens=max(1, max_chars // CHARS_PER_TOKEN),
+        dedup_threshold=get_config().rag_context_dedup_threshold,
+        formatter=lambda _i, p: f"# Source: {p['metadata'].get('file_name') or ''}\n\n{p['content']}",
+        separator="\n\n\n"
+    )
 
 
 @rag.command(name='generate-podcast-from-imports')
@@ -626,6 +688,11 @@ def queue_status():
 
         if stats['failed_high_retry'] > 0:
             click.echo(Fore.RED + f"⚠️  {stats['failed_high_retry']} items failed multiple times")
+        if stats['scheduled_retries'] > 0:
+            click.echo(Fore.YELLOW + f"⏳ {stats['scheduled_retries']} items waiting for a retry")
+        if stats['dead_letters'] > 0:
+            click.echo(Fore.RED + f"💀 {stats['dead_letters']} items in the dead letter queue "
+                       f"(requeue with 'rag queue-requeue-dead')")
 
     except Exception as e:
         click.echo(Fore.RED + f"❌ Error: {e}")
@@ -643,8 +710,9 @@ def queue_process(limit: int):
         db = get_database()
         processor = get_content_processor()
 
-        # Get pending items
-        items = db.get_pending_queue_items(limit=limit)
+        # Claim pending items so running queue workers skip them
+        worker_id = queue_worker_id("cli")
+        items = db.claim_queue_items(worker_id, limit, get_config().queue_lease_seconds)
 
         if not items:
             click.echo(Fore.YELLOW + "No pending items in queue")
@@ -652,20 +720,20 @@ def queue_process(limit: int):
 
         click.echo(Fore.YELLOW + f"Processing {len(items)} items...")
 
-        success_count = 0
-        fail_count = 0
-
-        for item in items:
-            click.echo(Fore.WHITE + f"Processing: {item['file_name']}...")
-
-            success = processor.process_queue_item(item['id'])
-
-            if success:
-                click.echo(Fore.GREEN + "  ✅ Success")
-                success_count += 1
+        def report(item, error=None):
+            if error is None:
+                click.echo(Fore.GREEN + f"  ✅ {item['file_name']}")
             else:
-                click.echo(Fore.RED + "  ❌ Failed")
-                fail_count += 1
+                click.echo(Fore.RED + f"  ❌ {item['file_name']}: {error}")
+
+        summary = processor.process_queue_items(
+            items,
+            worker_id=worker_id,
+            on_success=lambda item, _ids: report(item),
+            on_failure=report
+        )
+        success_count, fail_count = summary['succeeded'], summary['failed']
+        _echo_stage_stats(summary)
 
         click.echo()
         click.echo(Fore.GREEN + f"✅ Processed: {success_count} succeeded, {fail_count} failed")
@@ -674,6 +742,25 @@ def queue_process(limit: int):
         click.echo(Fore.RED + f"❌ Error: {e}")
 
 
+@rag.command()
+@click.option('--id', 'ids', type=int, multiple=True, help='Dead letter ID to requeue (repeatable; default: all)')
+def queue_requeue_dead(ids: tuple):
+    """
+    Put dead-lettered queue items back on the processing queue.
+    """
+    try:
+        db = get_database()
+        queue_ids = db.requeue_dead_letters(list(ids) if ids else None)
+
+        if queue_ids:
+            click.echo(Fore.GREEN + f"✅ Requeued {len(queue_ids)} items")
+        else:
+            click.echo(Fore.YELLOW + "No dead-lettered items to requeue")
+
+    except Exception as e:
+        click.echo(Fore.RED + f"❌ Error: {e}")
+
+
 @rag.group()
 def background():
     """Background service management."""
@@ -0,0 +1,111 @@
+"""
+Stable cache keys with generation-based invalidation.
+
+Keys look like ``<namespace>:<generation name><n>:<digest>``:
+- the digest is a sha256 of the normalized key parts, so every process (API
+  workers, CLI runs) derives the same key for the same input, unlike the
+  per-process randomized ``hash()``
+- the generation counter is stored in the shared cache itself; bumping it
+  (one INCR) orphans every key built with the old value, which then simply
+  expires by TTL - no keyspace SCAN
+
+Generations:
+- ``corpus``: bumped whenever the indexed documents change (vector search
+  results, RAG answers)
+- ``search``: bumped to drop cached web search results
+
+Lookups made through ``get_json`` are counted per namespace in the shared
+cache, so ``cache_stats()`` reports the hit ratio across all workers.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+CORPUS = "corpus"
+SEARCH = "search"
+
+_GENERATION_PREFIX = "gen:"
+_STATS_PREFIX = "cache_stats:"
+_NAMESPACES = set()
+
+
+def normalize_text(text: str) -> str:
+    """Case- and whitespace-insensitive form of free text (queries)."""
+    return " ".join(str(text).split()).casefold()
+
+
+def stable_digest(*parts: Any) -> str:
+    """Process-independent digest of JSON-serializable key parts."""
+    canonical = json.dumps(parts, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+
+def _cache(cache=None):
+    if cache is not None:
+        return cache
+    from .redis_cache import get_cache
+    return get_cache()
+
+
+def generation(name: str, cache=None) -> int:
+    """Current value of a generation counter (0 until first bumped)."""
+    try:
+        return int(_cache(cache).get(f"{_GENERATION_PREFIX}{name}") or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def bump_generation(name: str, cache=None) -> int:
+    """Invalidate every key built on generation ``name``. Returns the new value."""
+    value = _cache(cache).incr(f"{_GENERATION_PREFIX}{name}")
+    logger.info(f"Cache generation {name} -> {value}")
+    return value
+
+
+def cache_key(namespace: str, *parts: Any, generation_name: str = CORPUS, cache=None) -> str:
+    """
+    Build a stable key for ``parts`` in ``namespace``.
+
+    Args:
+        namespace: Key prefix, e.g. "vector" or "search"
+        *parts: Inputs the cached value depends on (normalize free text first)
+        generation_name: Generation counter the value depends on
+        cache: RedisCache instance (defaults to the global cache)
+    """
+    _NAMESPACES.add(namespace)
+    gen = generation(generation_name, cache)
+    return f"{namespace}:{generation_name[0]}{gen}:{stable_digest(*parts)}"
+
+
+def get_json(key: str, cache=None) -> Optional[Any]:
+    """``cache.get_json`` that also counts a hit or miss for the key's namespace."""
+    cache = _cache(cache)
+    value = cache.get_json(key)
+    namespace = key.rsplit(":", 2)[0]
+    try:
+        cache.incr(f"{_STATS_PREFIX}{namespace}:{'hits' if value is not None else 'misses'}")
+    except Exception:
+        pass
+    return value
+
+
+def cache_stats(namespaces: Optional[Iterable[str]] = None, cache=None) -> Dict[str, Dict[str, Any]]:
+    """Hits, misses and hit ratio per namespace, summed over all processes."""
+    cache = _cache(cache)
+    stats = {}
+    for namespace in sorted(namespaces or _NAMESPACES):
+        hits = int(cache.get(f"{_STATS_PREFIX}{namespace}:hits") or 0)
+        misses = int(cache.get(f"{_STATS_PREFIX}{namespace}:misses") or 0)
+        lookups = hits + misses
+        stats[namespace] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": (hits / lookups) if lookups else 0.0,
+        }
+    stats["generations"] = {name: generation(name, cache) for name in (CORPUS, SEARCH)}
+    return stats
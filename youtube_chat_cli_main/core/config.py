@@ -132,7 +132,7 @@ class Config:
 
     @property
     def vector_store_type(self) -> str:
-        """Vector store type: 'qdrant' or 'chroma'."""
+        """Vector store type: 'qdrant', 'chroma' or 'local'."""
         return os.getenv('VECTOR_STORE_TYPE', 'qdrant').lower()
 
     @property
@@ -160,13 +160,153 @@ class Config:
         """Chroma collection name."""
         return os.getenv('CHROMA_COLLECTION_NAME', 'documents')
 
+    @property
+    def vector_upsert_batch_size(self) -> int:
+        """Points sent per vector store write when ingesting documents."""
+        try:
+            return max(1, int(os.getenv('VECTOR_UPSERT_BATCH_SIZE', '256')))
+        except Exception:
+            return 256
+
+    @property
+    def vector_upsert_parallelism(self) -> int:
+        """Upsert batches in flight at once (Qdrant)."""
+        try:
+            return max(1, int(os.getenv('VECTOR_UPSERT_PARALLELISM', '4')))
+        except Exception:
+            return 4
+
+    @property
+    def extraction_processes(self) -> int:
+        """Worker processes for CPU-bound document parsing (0 = parse on the calling thread)."""
+        try:
+            return max(0, int(os.getenv('EXTRACTION_PROCESSES', str(os.cpu_count() or 1))))
+        except Exception:
+            return os.cpu_count() or 1
+
+    @property
+    def extraction_timeout(self) -> Optional[float]:
+        """Seconds one file may take to parse before its worker is killed (0 = no limit)."""
+        try:
+            timeout = float(os.getenv('EXTRACTION_TIMEOUT', '300'))
+        except Exception:
+            timeout = 300.0
+        return timeout if timeout > 0 else None
+
+    @property
+    def pdf_pages_per_task(self) -> int:
+        """PDF pages parsed per extraction task; ranges of a large PDF are parsed in parallel."""
+        try:
+            return max(1, int(os.getenv('PDF_PAGES_PER_TASK', '16')))
+        except Exception:
+            return 16
+
+    @property
+    def ingest_extract_workers(self) -> int:
+        """Files extracted and chunked at once by the ingestion pipeline."""
+        try:
+            return max(1, int(os.getenv('INGEST_EXTRACT_WORKERS', str(min(8, os.cpu_count() or 1)))))
+        except Exception:
+            return 4
+
+    @property
+    def ingest_embed_concurrency(self) -> int:
+        """Embedding batches in flight at once in the ingestion pipeline."""
+        try:
+            return max(1, int(os.getenv('INGEST_EMBED_CONCURRENCY', '4')))
+        except Exception:
+            return 4
+
+    @property
+    def ingest_embed_batch_size(self) -> int:
+        """Chunks (from one or more files) per embedding call in the ingestion pipeline."""
+        try:
+            return max(1, int(os.getenv('INGEST_EMBED_BATCH_SIZE', '64')))
+        except Exception:
+            return 64
+
+    @property
+    def ingest_part_chunks(self) -> int:
+        """Chunks of a streamed file (large PDFs) sent down the ingestion pipeline at a time."""
+        try:
+            return max(1, int(os.getenv('INGEST_PART_CHUNKS', '128')))
+        except Exception:
+            return 128
+
+    @property
+    def ingest_queue_size(self) -> int:
+        """Files buffered between ingestion stages before upstream stages block."""
+        try:
+            return max(1, int(os.getenv('INGEST_QUEUE_SIZE', '16')))
+        except Exception:
+            return 16
+
+    @property
+    def vector_quantization(self) -> str:
+        """Quantization for new collections: 'none', 'int8' (4x smaller) or 'binary' (32x smaller)."""
+        mode = os.getenv('VECTOR_QUANTIZATION', 'none').lower()
+        return mode if mode in ('none', 'int8', 'binary') else 'none'
+
+    @property
+    def vector_quantization_oversampling(self) -> float:
+        """Candidates per requested result scored on quantized vectors before full-precision rescoring."""
+        try:
+            return max(1.0, float(os.getenv('VECTOR_QUANTIZATION_OVERSAMPLING', '4.0')))
+        except Exception:
+            return 4.0
+
+    @property
+    def local_vector_store_path(self) -> str:
+        """Directory for the local (memory-mapped NumPy) vector store."""
+        return os.getenv('LOCAL_VECTOR_STORE_PATH', './local_vector_db')
+
+    @property
+    def local_vector_collection_name(self) -> str:
+        """Local vector store collection name."""
+        return os.getenv('LOCAL_VECTOR_COLLECTION_NAME', 'documents')
+
+    @property
+    def local_vector_dtype(self) -> str:
+        """Stored embedding precision for the local store: 'float32' or 'float16'."""
+        dtype = os.getenv('LOCAL_VECTOR_DTYPE', 'float32').lower()
+        return dtype if dtype in ('float32', 'float16') else 'float32'
+
+    @property
+    def local_vector_ivf_threshold(self) -> int:
+        """Point count above which the local store builds an IVF coarse index."""
+        try:
+            return max(1, int(os.getenv('LOCAL_VECTOR_IVF_THRESHOLD', '50000')))
+        except Exception:
+            return 50000
+
+    @property
+    def local_vector_ivf_nprobe(self) -> int:
+        """IVF lists scanned per query (higher = better recall, slower)."""
+        try:
+            return max(1, int(os.getenv('LOCAL_VECTOR_IVF_NPROBE', '8')))
+        except Exception:
+            return 8
+
+    @property
+    def vector_search_mode(self) -> str:
+        """Default VectorStore.search mode: 'vector', 'lexical' or 'hybrid'."""
+        return os.getenv('VECTOR_SEARCH_MODE', 'vector').lower()
+
+    @property
+    def hybrid_rrf_k(self) -> int:
+        """Reciprocal rank fusion constant k for hybrid search (higher flattens rank weights)."""
+        try:
+            return max(1, int(os.getenv('HYBRID_RRF_K', '60')))
+        except Exception:
+            return 60
+
     @property
     def has_vector_store_config(self) -> bool:
         """Check if vector store is configured."""
         if self.vector_store_type == 'qdrant':
             return bool(self.qdrant_url and self.qdrant_api_key)
-        elif self.vector_store_type == 'chroma':
-            return True  # Chroma works locally without credentials
+        elif self.vector_store_type in ('chroma', 'local'):
+            return True  # Chroma and the local store need no credentials
         return False
 
     # -------------------------------------------------------------------------
@@ -188,6 +328,49 @@ class Config:
         """Ollama embedding model name."""
         return os.getenv('OLLAMA_EMBEDDING_MODEL', 'nomic-embed-text')
 
+    @property
+    def ollama_embed_batch_size(self) -> int:
+        """Number of texts sent per Ollama /api/embed request (1 = legacy per-text /api/embeddings)."""
+        try:
+            return max(1, int(os.getenv('OLLAMA_EMBED_BATCH_SIZE', '32')))
+        except Exception:
+            return 32
+
+    @property
+    def ollama_embed_concurrency(self) -> int:
+        """Maximum number of in-flight Ollama embedding requests."""
+        try:
+            return max(1, int(os.getenv('OLLAMA_EMBED_CONCURRENCY', '4')))
+        except Exception:
+            return 4
+
+    @property
+    def ollama_embed_retry_attempts(self) -> int:
+        """Attempts per embedding batch before the whole call fails."""
+        try:
+            return max(1, int(os.getenv('OLLAMA_EMBED_RETRY_ATTEMPTS', '3')))
+        except Exception:
+            return 3
+
+    @property
+    def embedding_cache_enabled(self) -> bool:
+        """Reuse previously computed embeddings keyed by provider, model and text hash."""
+        return os.getenv('EMBEDDING_CACHE_ENABLED', 'true').lower() == 'true'
+
+    @property
+    def embedding_cache_path(self) -> str:
+        """SQLite file for the embedding cache (defaults to next to the main database)."""
+        default = os.path.join(os.path.dirname(self.database_path) or '.', 'jaegis_embedding_cache.db')
+        return os.getenv('EMBEDDING_CACHE_PATH', default)
+
+    @property
+    def embedding_cache_max_entries(self) -> int:
+        """Maximum cached vectors before least-recently-used entries are evicted."""
+        try:
+            return max(1, int(os.getenv('EMBEDDING_CACHE_MAX_ENTRIES', '200000')))
+        except Exception:
+            return 200000
+
     @property
     def ollama_model(self) -> str:
         """Preferred Ollama chat model, falling back to generic LLM model."""
@@ -513,9 +696,89 @@ class Config:
 
     @property
     def background_service_interval(self) -> int:
-        """Background service check interval in seconds."""
+        """Safety-net poll interval (seconds) of the queue dispatcher; enqueues wake it immediately."""
         return int(os.getenv('BACKGROUND_SERVICE_INTERVAL', '300'))
 
+    @property
+    def queue_workers(self) -> int:
+        """Concurrent queue workers in the background service."""
+        try:
+            return max(1, int(os.getenv('QUEUE_WORKERS', '2')))
+        except Exception:
+            return 2
+
+    @property
+    def queue_claim_batch(self) -> int:
+        """Most queue items a worker claims (and runs through the ingestion pipeline) at once."""
+        try:
+            return max(1, int(os.getenv('QUEUE_CLAIM_BATCH', '8')))
+        except Exception:
+            return 8
+
+    @property
+    def queue_lease_seconds(self) -> int:
+        """Visibility timeout of a claimed queue item; renewed by the worker's heartbeat."""
+        try:
+            return max(10, int(os.getenv('QUEUE_LEASE_SECONDS', '600')))
+        except Exception:
+            return 600
+
+    @property
+    def queue_retry_base_seconds(self) -> int:
+        """Delay before the first retry of a transiently failed queue item; doubles per attempt."""
+        try:
+            return max(1, int(os.getenv('QUEUE_RETRY_BASE_SECONDS', '30')))
+        except Exception:
+            return 30
+
+    @property
+    def queue_retry_max_seconds(self) -> int:
+        """Upper bound of the queue retry backoff."""
+        try:
+            return max(1, int(os.getenv('QUEUE_RETRY_MAX_SECONDS', '3600')))
+        except Exception:
+            return 3600
+
+    # -------------------------------------------------------------------------
+    # Background Jobs Configuration
+    # -------------------------------------------------------------------------
+
+    @property
+    def job_concurrency(self) -> Dict[str, int]:
+        """Concurrent jobs allowed per job type (JOB_CONCURRENCY_<TYPE>)."""
+        defaults = {'podcast': 1, 'batch_research': 2}
+        limits = {}
+        for job_type, default in defaults.items():
+            try:
+                limits[job_type] = max(1, int(os.getenv(f'JOB_CONCURRENCY_{job_type.upper()}', str(default))))
+            except Exception:
+                limits[job_type] = default
+        return limits
+
+    @property
+    def job_stale_seconds(self) -> int:
+        """Heartbeat age after which another process may take over an unfinished job."""
+        try:
+            return max(10, int(os.getenv('JOB_STALE_SECONDS', '120')))
+        except Exception:
+            return 120
+
+    # -------------------------------------------------------------------------
+    # Execution Pools Configuration
+    # -------------------------------------------------------------------------
+
+    @property
+    def executor_pool_sizes(self) -> Dict[str, int]:
+        """Thread pool size per workload class (EXECUTOR_<WORKLOAD>_WORKERS)."""
+        defaults = {'llm': 8, 'vector': 8, 'file': 4, 'tts': 2, 'io': 8}
+        sizes = {}
+        for workload, default in defaults.items():
+            try:
+                sizes[workload] = max(1, int(os.getenv(f'EXECUTOR_{workload.upper()}_WORKERS', str(default))))
+            except Exception:
+                sizes[workload] = default
+        return sizes
+
     # -------------------------------------------------------------------------
     # Text Splitting Configuration
     # -------------------------------------------------------------------------
@@ -549,6 +812,32 @@ class Config:
         """Minimum relevance score for retrieved documents."""
         return float(os.getenv('RAG_MIN_RELEVANCE_SCORE', '0.7'))
 
+    @property
+    def rag_search_mode(self) -> str:
+        """Retrieval mode for RAG: 'vector', 'lexical' or 'hybrid' (BM25 + vector)."""
+        return os.getenv('RAG_SEARCH_MODE', 'hybrid').lower()
+
+    @property
+    def rag_multi_query(self) -> bool:
+        """After a query rewrite, retrieve with the original and rewritten questions together."""
+        return os.getenv('RAG_MULTI_QUERY', 'true').lower() == 'true'
+
+    @property
+    def rag_context_max_tokens(self) -> int:
+        """Token budget for retrieved context in generation prompts."""
+        try:
+            return max(1, int(os.getenv('RAG_CONTEXT_MAX_TOKENS', '3000')))
+        except Exception:
+            return 3000
+
+    @property
+    def rag_context_dedup_threshold(self) -> float:
+        """Share of a passage's word trigrams found in a kept passage above which it is dropped as a duplicate."""
+        try:
+            return min(1.0, max(0.0, float(os.getenv('RAG_CONTEXT_DEDUP_THRESHOLD', '0.8'))))
+        except Exception:
+            return 0.8
+
     @property
     def rag_max_transform_attempts(self) -> int:
         """Maximum query transformation attempts."""
@@ -564,6 +853,48 @@ class Config:
         """Whether to enable answer relevance checking."""
         return os.getenv('RAG_ANSWER_CHECK', 'true').lower() == 'true'
 
+    @property
+    def rag_grading_concurrency(self) -> int:
+        """Maximum documents graded in parallel during relevance grading."""
+        try:
+            return max(1, int(os.getenv('RAG_GRADING_CONCURRENCY', '5')))
+        except Exception:
+            return 5
+
+    @property
+    def rag_batch_grading(self) -> bool:
+        """Grade all retrieved documents in a single structured LLM call."""
+        return os.getenv('RAG_BATCH_GRADING', 'false').lower() == 'true'
+
+    @property
+    def rag_semantic_cache_enabled(self) -> bool:
+        """Reuse answers for questions semantically close to earlier ones."""
+        return os.getenv('RAG_SEMANTIC_CACHE_ENABLED', 'true').lower() == 'true'
+
+    @property
+    def rag_semantic_cache_threshold(self) -> float:
+        """Minimum cosine similarity between questions for a cached answer to be reused."""
+        try:
+            return min(1.0, max(0.0, float(os.getenv('RAG_SEMANTIC_CACHE_THRESHOLD', '0.95'))))
+        except Exception:
+            return 0.95
+
+    @property
+    def rag_semantic_cache_ttl_seconds(self) -> int:
+        """Lifetime of cached RAG answers."""
+        try:
+            return max(1, int(os.getenv('RAG_SEMANTIC_CACHE_TTL_SECONDS', '3600')))
+        except Exception:
+            return 3600
+
+    @property
+    def rag_semantic_cache_max_entries(self) -> int:
+        """Maximum questions kept in the semantic cache index (LRU)."""
+        try:
+            return max(1, int(os.getenv('RAG_SEMANTIC_CACHE_MAX_ENTRIES', '256')))
+        except Exception:
+            return 256
+
     # -------------------------------------------------------------------------
     # PostgreSQL Configuration (Optional)
     # -------------------------------------------------------------------------
@@ -9,14 +9,18 @@ import sqlite3
 import json
 import logging
 import os
+import re
+import socket
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Iterable, Tuple
 from contextlib import contextmanager
 import queue
 import threading
 
 from .config import get_config
+from .queue_signal import get_queue_signal
 
 logger = logging.getLogger(__name__)
 
@@ -149,6 +153,19 @@ class Database:
                 ON processing_queue(status, priority DESC, created_at)
             """)
 
+            # Worker leases (claim_queue_items); older databases lack the columns
+            self._add_missing_columns(cursor, 'processing_queue', {
+                'lease_owner': 'TEXT',
+                'lease_expires_at': 'REAL',
+            })
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_queue_lease
+                ON processing_queue(status, lease_expires_at)
+            """)
+
+            # Retry scheduling (retry_queue_item); NULL means due now
+            self._add_missing_columns(cursor, 'processing_queue', {'next_attempt_at': 'REAL'})
+
             # Google Drive files table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS gdrive_files (
@@ -233,6 +250,12 @@ class Database:
                 ON vector_metadata(source_file_id, chunk_index)
             """)
 
+            # Databases created before chunk hashing lack the column
+            self._add_missing_columns(cursor, 'vector_metadata', {'content_hash': 'TEXT'})
+
+            # Lexical (BM25) index over chunk text, kept in sync by triggers
+            self.fts_enabled = self._init_fts_schema(cursor)
+
             # Indexing jobs table for archive indexing status
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS indexing_jobs (
@@ -281,8 +304,87 @@ class Database:
                 ON chat_sessions(workflow_id, created_at)
             """)
 
+            # Long-running background jobs (podcast generation, batch research, ...)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    job_type TEXT NOT NULL,
+                    status TEXT DEFAULT 'queued',
+                    params TEXT,
+                    progress REAL DEFAULT 0,
+                    message TEXT,
+                    result TEXT,
+                    error_message TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    started_at TIMESTAMP,
+                    completed_at TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_jobs_status
+                ON jobs(status, job_type, created_at)
+            """)
+
+            # Job ownership (claim_stale_jobs); NULL owner means a pre-ownership row
+            self._add_missing_columns(cursor, 'jobs', {
+                'owner': 'TEXT',
+                'heartbeat_at': 'REAL',
+            })
+
             logger.info("Database schema initialized successfully")
 
+    @staticmethod
+    def _add_missing_columns(cursor: sqlite3.Cursor, table: str, columns: Dict[str, str]) -> None:
+        """Add columns introduced after ``table`` was first created."""
+        existing = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+        for name, decl in columns.items():
+            if name not in existing:
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {name} {decl}")
+                logger.info(f"Added column {table}.{name}")
+
+    def _init_fts_schema(self, cursor: sqlite3.Cursor) -> bool:
+        """
+        Create the FTS5 index over vector_metadata.chunk_text.
+
+        Returns:
+            False if this SQLite build lacks FTS5 (lexical search disabled)
+        """
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS vector_fts USING fts5(
+                    chunk_text,
+                    content='vector_metadata',
+                    content_rowid='rowid',
+                    tokenize='porter unicode61'
+                )
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS vector_fts_insert AFTER INSERT ON vector_metadata
+                WHEN new.chunk_text IS NOT NULL BEGIN
+                    INSERT INTO vector_fts(rowid, chunk_text) VALUES (new.rowid, new.chunk_text);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS vector_fts_delete AFTER DELETE ON vector_metadata
+                WHEN old.chunk_text IS NOT NULL BEGIN
+                    INSERT INTO vector_fts(vector_fts, rowid, chunk_text) VALUES ('delete', old.rowid, old.chunk_text);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS vector_fts_update AFTER UPDATE OF chunk_text ON vector_metadata BEGIN
+                    INSERT INTO vector_fts(vector_fts, rowid, chunk_text)
+                        SELECT 'delete', old.rowid, old.chunk_text WHERE old.chunk_text IS NOT NULL;
+                    INSERT INTO vector_fts(rowid, chunk_text)
+                        SELECT new.rowid, new.chunk_text WHERE new.chunk_text IS NOT NULL;
+                END
+            """)
+            return True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 unavailable, lexical search disabled: {e}")
+            return False
+
     # -------------------------------------------------------------------------
     # -------------------------------------------------------------------------
     # Sessions & Archive Queries
@@ -381,6 +483,199 @@ class Database:
             row = cursor.fetchone()
             return dict(row) if row else None
 
+    # -------------------------------------------------------------------------
+    # Background Jobs
+    # -------------------------------------------------------------------------
+
+    def create_job(
+        self,
+        job_id: str,
+        job_type: str,
+        params: Optional[Dict[str, Any]] = None,
+        owner: Optional[str] = None
+    ) -> None:
+        """
+        Create a queued job row.
+
+        Args:
+            job_id: Unique job identifier
+            job_type: Registered job type (e.g. 'podcast', 'batch_research')
+            params: JSON-serializable job parameters
+            owner: Job service that runs the job (keeps it alive with heartbeats)
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO jobs (id, job_type, status, params, owner, heartbeat_at)
+                VALUES (?, ?, 'queued', ?, ?, ?)
+            """, (job_id, job_type, json.dumps(params or {}, ensure_ascii=False),
+                  owner, time.time() if owner else None))
+
+    def update_job(
+        self,
+        job_id: str,
+        status: Optional[str] = None,
+        progress: Optional[float] = None,
+        message: Optional[str] = None,
+        result: Optional[Dict[str, Any]] = None,
+        error_message: Optional[str] = None,
+        owner: Optional[str] = None
+    ) -> bool:
+        """
+        Update job status, progress and outcome.
+
+        Args:
+            job_id: Job identifier
+            status: New status ('queued', 'running', 'completed', 'failed')
+            progress: Progress fraction between 0 and 1
+            message: Human-readable progress message
+            result: Job result (stored as JSON)
+            error_message: Failure reason
+            owner: Only update while the job is still owned by this job service
+
+        Returns:
+            False if the job is unknown or was taken over by another owner
+        """
+        sets = ["updated_at = CURRENT_TIMESTAMP"]
+        params: List[Any] = []
+        if status is not None:
+            sets.append("status = ?")
+            params.append(status)
+            if status == 'running':
+                sets.append("started_at = COALESCE(started_at, CURRENT_TIMESTAMP)")
+            elif status in ('completed', 'failed'):
+                sets.append("completed_at = CURRENT_TIMESTAMP")
+        if progress is not None:
+            sets.append("progress = ?")
+            params.append(max(0.0, min(1.0, float(progress))))
+        if message is not None:
+            sets.append("message = ?")
+            params.append(message)
+        if result is not None:
+            sets.append("result = ?")
+            params.append(json.dumps(result, ensure_ascii=False, default=str))
+        if error_message is not None:
+            sets.append("error_message = ?")
+            params.append(error_message)
+
+        where = "id = ?"
+        params.append(job_id)
+        if owner is not None:
+            where += " AND owner = ?"
+            params.append(owner)
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"UPDATE jobs SET {', '.join(sets)} WHERE {where}", params)
+            return cursor.rowcount > 0
+
+    @staticmethod
+    def _job_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        for key in ('params', 'result'):
+            if job.get(key):
+                try:
+                    job[key] = json.loads(job[key])
+                except Exception:
+                    pass
+        return job
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job by ID with params/result decoded, or None if not found."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
+            row = cursor.fetchone()
+            return self._job_from_row(row) if row else None
+
+    def list_jobs(
+        self,
+        job_type: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """List jobs, newest first, optionally filtered by type and status."""
+        where, params = [], []
+        if job_type:
+            where.append("job_type = ?")
+            params.append(job_type)
+        if status:
+            where.append("status = ?")
+            params.append(status)
+        clause = f"WHERE {' AND '.join(where)}" if where else ""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT * FROM jobs {clause}
+                ORDER BY created_at DESC
+                LIMIT ? OFFSET ?
+            """, (*params, limit, offset))
+            return [self._job_from_row(r) for r in cursor.fetchall()]
+
+    def get_unfinished_jobs(self) -> List[Dict[str, Any]]:
+        """Jobs left queued or running (e.g. by a restart), oldest first."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT * FROM jobs
+                WHERE status IN ('queued', 'running')
+                ORDER BY created_at ASC
+            """)
+            return [self._job_from_row(r) for r in cursor.fetchall()]
+
+    def claim_stale_jobs(self, owner: str, stale_seconds: float, job_types: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Atomically take over unfinished jobs whose owner stopped heartbeating.
+
+        Jobs of a live job service (heartbeat within ``stale_seconds``) are
+        left alone, so a second process starting up does not run them twice.
+        Jobs without an owner (created before ownership existed) are claimed.
+
+        Args:
+            owner: Job service taking the jobs over
+            stale_seconds: Heartbeat age after which an owner is considered dead
+            job_types: Job types ``owner`` can run; other jobs are left alone
+
+        Returns:
+            The claimed jobs, reset to 'queued', oldest first
+        """
+        job_types = list(job_types)
+        if not job_types:
+            return []
+        now = time.time()
+        placeholders = ", ".join("?" for _ in job_types)
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                UPDATE jobs
+                SET owner = ?, heartbeat_at = ?, status = 'queued',
+                    message = 'Resumed after restart', updated_at = CURRENT_TIMESTAMP
+                WHERE status IN ('queued', 'running')
+                  AND job_type IN ({placeholders})
+                  AND (owner IS NULL OR COALESCE(heartbeat_at, 0) < ?)
+                RETURNING *
+            """, (owner, now, *job_types, now - stale_seconds))
+            jobs = [self._job_from_row(r) for r in cursor.fetchall()]
+        return sorted(jobs, key=lambda job: job.get('created_at') or '')
+
+    def renew_job_heartbeats(self, owner: str) -> int:
+        """
+        Mark ``owner``'s unfinished jobs as alive (heartbeat).
+
+        Returns:
+            Number of jobs renewed
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                UPDATE jobs
+                SET heartbeat_at = ?
+                WHERE status IN ('queued', 'running') AND owner = ?
+            """, (time.time(), owner))
+            return cursor.rowcount
+
+    # -------------------------------------------------------------------------
     # Processing Queue Operations
     # -------------------------------------------------------------------------
 
@@ -391,7 +686,8 @@ class Database:
         source: str,
         file_type: Optional[str] = None,
         priority: int = 0,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        notify: bool = True
     ) -> int:
         """
         Add a file to the processing queue.
@@ -403,6 +699,8 @@ class Database:
             file_type: MIME type or file extension
             priority: Processing priority (higher = processed first)
             metadata: Additional metadata as dictionary
+            notify: Wake queue workers; bulk enqueuers pass False and call
+                ``get_queue_signal().notify()`` once at the end
 
         Returns:
             Queue item ID
@@ -424,7 +722,10 @@ class Database:
 
             queue_id = cursor.lastrowid
             logger.info(f"Added file to queue: {file_name} (ID: {queue_id})")
-            return queue_id
+
+        if notify:
+            get_queue_signal().notify()
+        return queue_id
 
     def get_next_queue_item(self) -> Optional[Dict[str, Any]]:
         """
@@ -451,8 +752,9 @@ class Database:
         self,
         queue_id: int,
         status: str,
-        error_message: Optional[str] = None
-    ) -> None:
+        error_message: Optional[str] = None,
+        lease_owner: Optional[str] = None
+    ) -> bool:
         """
         Update the status of a queue item.
 
@@ -460,32 +762,59 @@ class Database:
             queue_id: Queue item ID
             status: New status ('pending', 'processing', 'completed', 'failed')
             error_message: Error message if status is 'failed'
+            lease_owner: Only update while this worker still holds the lease
+
+        Returns:
+            False if the item is gone or its lease passed to another worker
         """
+        owned, params = self._lease_clause(lease_owner)
         with self.get_connection() as conn:
             cursor = conn.cursor()
 
             if status == 'completed':
-                cursor.execute("""
+                cursor.execute(f"""
                     UPDATE processing_queue
                     SET status = ?, processed_at = CURRENT_TIMESTAMP,
+                        lease_owner = NULL, lease_expires_at = NULL,
                         updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """, (status, queue_id))
+                    WHERE id = ?{owned}
+                """, (status, queue_id, *params))
             elif status == 'failed':
-                cursor.execute("""
+                cursor.execute(f"""
                     UPDATE processing_queue
                     SET status = ?, error_message = ?, retry_count = retry_count + 1,
+                        lease_owner = NULL, lease_expires_at = NULL,
                         updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """, (status, error_message, queue_id))
+                    WHERE id = ?{owned}
+                """, (status, error_message, queue_id, *params))
             else:
-                cursor.execute("""
+                cursor.execute(f"""
                     UPDATE processing_queue
-                    SET status = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """, (status, queue_id))
-
-            logger.debug(f"Updated queue item {queue_id} status to {status}")
+                    SET status = ?, lease_owner = NULL, lease_expires_at = NULL,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?{owned}
+                """, (status, queue_id, *params))
+            updated = cursor.rowcount > 0
+
+        if not updated:
+            self._log_lost_lease(queue_id, f"set to {status}", lease_owner)
+            return False
+        logger.debug(f"Updated queue item {queue_id} status to {status}")
+        return True
+
+    @staticmethod
+    def _lease_clause(lease_owner: Optional[str]) -> Tuple[str, Tuple[Any, ...]]:
+        """SQL condition (and parameters) restricting a queue write to ``lease_owner``."""
+        if lease_owner is None:
+            return "", ()
+        return " AND lease_owner = ?", (lease_owner,)
+
+    @staticmethod
+    def _log_lost_lease(queue_id: int, action: str, lease_owner: Optional[str]) -> None:
+        if lease_owner is None:
+            logger.warning(f"Queue item {queue_id} not {action}: no such item")
+        else:
+            logger.warning(f"Queue item {queue_id} not {action}: {lease_owner} no longer holds its lease")
 
     def get_queue_stats(self) -> Dict[str, int]:
         """
@@ -562,6 +891,134 @@ class Database:
 
             return items
 
+    def claim_queue_items(
+        self,
+        worker_id: str,
+        limit: int = 1,
+        lease_seconds: float = 600,
+        queue_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Atomically claim pending queue items for one worker.
+
+        Claimed items move to 'processing' with a lease held by ``worker_id``
+        until ``lease_seconds`` from now. The select and the update are one
+        statement, so concurrent workers (threads or processes) never claim
+        the same item. A worker renews its leases with ``renew_queue_leases``
+        while it works; leases of a crashed worker run out and
+        ``reclaim_expired_queue_leases`` puts the items back. Items waiting
+        for a scheduled retry (``next_attempt_at`` in the future) are skipped.
+
+        Args:
+            worker_id: Unique worker name (host, pid and thread)
+            limit: Maximum number of items to claim
+            lease_seconds: Visibility timeout
+            queue_id: Claim this item only (if it is pending)
+
+        Returns:
+            Claimed queue items in processing order
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                UPDATE processing_queue
+                SET status = 'processing', lease_owner = ?, lease_expires_at = ?,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id IN (
+                    SELECT id FROM processing_queue
+                    WHERE status = 'pending' AND COALESCE(next_attempt_at, 0) <= ?
+                      {'AND id = ?' if queue_id is not None else ''}
+                    ORDER BY priority DESC, created_at ASC, id ASC
+                    LIMIT ?
+                )
+                RETURNING *
+            """, (
+                worker_id,
+                time.time() + lease_seconds,
+                time.time(),
+                *((queue_id,) if queue_id is not None else ()),
+                limit
+            ))
+
+            items = []
+            for row in cursor.fetchall():
+                item = dict(row)
+                if item.get('metadata'):
+                    item['metadata'] = json.loads(item['metadata'])
+                items.append(item)
+
+        # RETURNING rows come in no particular order
+        items.sort(key=lambda item: (-(item['priority'] or 0), item['created_at'], item['id']))
+        if items:
+            logger.debug(f"Worker {worker_id} claimed {len(items)} queue items")
+        return items
+
+    def renew_queue_leases(self, worker_id: str, lease_seconds: float = 600) -> int:
+        """
+        Extend every lease ``worker_id`` holds (heartbeat).
+
+        Returns:
+            Number of leases renewed
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                UPDATE processing_queue
+                SET lease_expires_at = ?
+                WHERE status = 'processing' AND lease_owner = ?
+            """, (time.time() + lease_seconds, worker_id))
+            return cursor.rowcount
+
+    def reclaim_expired_queue_leases(self) -> int:
+        """
+        Return items whose lease ran out (crashed or stuck worker) to 'pending'.
+
+        Items left 'processing' without a lease (claimed before leases
+        existed) are reclaimed too.
+
+        Returns:
+            Number of items reclaimed
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                UPDATE processing_queue
+                SET status = 'pending', lease_owner = NULL, lease_expires_at = NULL,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE status = 'processing' AND COALESCE(lease_expires_at, 0) < ?
+            """, (time.time(),))
+            reclaimed = cursor.rowcount
+
+        if reclaimed:
+            logger.warning(f"Reclaimed {reclaimed} queue items with expired leases")
+        return reclaimed
+
+    @contextmanager
+    def queue_lease_heartbeat(self, worker_id: str, lease_seconds: float = 600):
+        """
+        Renew ``worker_id``'s leases every third of ``lease_seconds`` while the block runs.
+
+        Example:
+            with db.queue_lease_heartbeat(worker_id, 600):
+                process(db.claim_queue_items(worker_id, 8, 600))
+        """
+        stop = threading.Event()
+
+        def beat():
+            while not stop.wait(lease_seconds / 3):
+                try:
+                    self.renew_queue_leases(worker_id, lease_seconds)
+                except Exception as e:
+                    logger.warning(f"Lease heartbeat for {worker_id} failed: {e}")
+
+        thread = threading.Thread(target=beat, name=f"lease-{worker_id}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
     def increment_queue_retry(self, queue_id: int) -> None:
         """
         Increment the retry count for a queue item.
@@ -581,6 +1038,141 @@ class Database:
 
             logger.debug(f"Incremented retry count for queue item {queue_id}")
 
+    def retry_queue_item(
+        self,
+        queue_id: int,
+        delay: float,
+        error_message: Optional[str] = None,
+        lease_owner: Optional[str] = None
+    ) -> int:
+        """
+        Put a failed queue item back to 'pending', due again in ``delay`` seconds.
+
+        Args:
+            queue_id: Queue item ID
+            delay: Seconds until the item may be claimed again
+            error_message: Error of the failed attempt
+            lease_owner: Only retry while this worker still holds the lease
+
+        Returns:
+            The item's retry count after this failure (0 if not updated)
+        """
+        owned, params = self._lease_clause(lease_owner)
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                UPDATE processing_queue
+                SET status = 'pending', error_message = ?, retry_count = retry_count + 1,
+                    next_attempt_at = ?, lease_owner = NULL, lease_expires_at = NULL,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?{owned}
+                RETURNING retry_count
+            """, (error_message, time.time() + delay, queue_id, *params))
+            row = cursor.fetchone()
+
+        if row is None:
+            self._log_lost_lease(queue_id, "scheduled for retry", lease_owner)
+            return 0
+        logger.debug(f"Queue item {queue_id} retries in {delay:.0f}s")
+        return row['retry_count']
+
+    def dead_letter_queue_item(self, queue_id: int, reason: str, lease_owner: Optional[str] = None) -> bool:
+        """
+        Move a queue item to ``dead_letter_queue``.
+
+        The whole row is kept as the dead letter's payload so
+        ``requeue_dead_letters`` can put it back.
+
+        Args:
+            queue_id: Queue item ID
+            reason: Why the item was given up on
+            lease_owner: Only move the item while this worker still holds the lease
+
+        Returns:
+            True if the item was moved
+        """
+        owned, params = self._lease_clause(lease_owner)
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"DELETE FROM processing_queue WHERE id = ?{owned} RETURNING *", (queue_id, *params))
+            row = cursor.fetchone()
+            if row is None:
+                self._log_lost_lease(queue_id, "dead-lettered", lease_owner)
+                return False
+
+            payload = dict(row)
+            if payload.get('metadata'):
+                payload['metadata'] = json.loads(payload['metadata'])
+            cursor.execute("""
+                INSERT INTO dead_letter_queue (source_table, original_id, reason, payload)
+                VALUES ('processing_queue', ?, ?, ?)
+            """, (str(queue_id), reason, json.dumps(payload, ensure_ascii=False)))
+
+        logger.warning(f"Moved queue item {queue_id} ({payload['file_name']}) to the dead letter queue: {reason}")
+        return True
+
+    def requeue_dead_letters(self, dead_letter_ids: Optional[List[int]] = None) -> List[int]:
+        """
+        Put dead-lettered queue items back on the processing queue.
+
+        Items keep their file, source, priority and metadata and start over
+        with no retries.
+
+        Args:
+            dead_letter_ids: Dead letters to requeue (default: all queue items)
+
+        Returns:
+            New queue item IDs
+        """
+        where = "source_table = 'processing_queue'"
+        params: List[Any] = []
+        if dead_letter_ids is not None:
+            if not dead_letter_ids:
+                return []
+            where += f" AND id IN ({','.join('?' * len(dead_letter_ids))})"
+            params.extend(dead_letter_ids)
+
+        queue_ids = []
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"DELETE FROM dead_letter_queue WHERE {where} RETURNING payload", params)
+            for row in cursor.fetchall():
+                item = json.loads(row['payload'] or '{}')
+                cursor.execute("""
+                    INSERT INTO processing_queue
+                    (file_id, file_name, file_type, source, priority, metadata)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, (
+                    item['file_id'],
+                    item['file_name'],
+                    item.get('file_type'),
+                    item['source'],
+                    item.get('priority') or 0,
+                    json.dumps(item['metadata']) if item.get('metadata') else None
+                ))
+                queue_ids.append(cursor.lastrowid)
+
+        if queue_ids:
+            logger.info(f"✅ Requeued {len(queue_ids)} dead-lettered items")
+            get_queue_signal().notify()
+        return queue_ids
+
+    def next_queue_retry_at(self) -> Optional[float]:
+        """
+        Time (epoch seconds) the earliest scheduled retry becomes due.
+
+        Returns:
+            Timestamp, or None if no retry is scheduled
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT MIN(next_attempt_at) FROM processing_queue
+                WHERE status = 'pending' AND next_attempt_at IS NOT NULL
+            """)
+            row = cursor.fetchone()
+            return row[0] if row else None
+
     def get_queue_statistics(self) -> Dict[str, Any]:
         """
         Get comprehensive queue statistics.
@@ -604,6 +1196,32 @@ class Database:
 
             # Get total count
             cursor.execute("SELECT COUNT(*) as total FROM processing_queue")
+            total = cursor.fetchone()['total']
+
+            # Items that failed repeatedly and are waiting for a retry
+            cursor.execute("""
+                SELECT COUNT(*) FROM processing_queue
+                WHERE retry_count >= 3 AND status IN ('pending', 'failed')
+            """)
+            failed_high_retry = cursor.fetchone()[0]
+
+            cursor.execute("""
+                SELECT COUNT(*) FROM processing_queue
+                WHERE status = 'pending' AND next_attempt_at > ?
+            """, (time.time(),))
+            scheduled_retries = cursor.fetchone()[0]
+
+            cursor.execute("SELECT COUNT(*) FROM dead_letter_queue WHERE source_table = 'processing_queue'")
+            dead_letters = cursor.fetchone()[0]
+
+            return {
+                'total': total,
+                'by_status': status_counts,
+                'failed_high_retry': failed_high_retry,
+                'scheduled_retries': scheduled_retries,
+                'dead_letters': dead_letters
+            }
+
     # -------------------------------------------------------------------------
     # Observability: Workflow traces & Dead letter queue
     # -------------------------------------------------------------------------
@@ -1054,7 +1672,8 @@ class Database:
         vector_id: str,
         file_id: Optional[str] = None,
         chunk_index: int = 0,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        chunk_text: Optional[str] = None
     ) -> None:
         """
         Add metadata for a vector embedding.
@@ -1064,22 +1683,70 @@ class Database:
             file_id: Source file ID
             chunk_index: Chunk index within the file
             metadata: Additional metadata
+            chunk_text: Chunk text (indexed for lexical search)
         """
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            # Upsert keeps the rowid stable so the FTS triggers see an UPDATE
             cursor.execute("""
-                INSERT OR REPLACE INTO vector_metadata
-                (id, source_file_id, chunk_index, metadata)
-                VALUES (?, ?, ?, ?)
+                INSERT INTO vector_metadata
+                (id, source_file_id, chunk_index, chunk_text, metadata)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    source_file_id = excluded.source_file_id,
+                    chunk_index = excluded.chunk_index,
+                    chunk_text = excluded.chunk_text,
+                    metadata = excluded.metadata
             """, (
                 vector_id,
                 file_id,
                 chunk_index,
+                chunk_text,
                 json.dumps(metadata) if metadata else None
             ))
 
             logger.debug(f"Added vector metadata: {vector_id}")
 
+    def add_vector_metadata_many(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Upsert metadata for many vectors in a single transaction.
+
+        Args:
+            records: Dicts with the add_vector_metadata arguments (vector_id,
+                file_id, chunk_index, metadata, chunk_text) and optionally
+                content_hash
+
+        Returns:
+            Number of rows written
+        """
+        rows = [
+            (
+                record['vector_id'],
+                record.get('file_id'),
+                record.get('chunk_index', 0),
+                record.get('chunk_text'),
+                record.get('content_hash'),
+                json.dumps(record['metadata']) if record.get('metadata') else None
+            )
+            for record in records
+        ]
+        if not rows:
+            return 0
+        with self.get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO vector_metadata
+                (id, source_file_id, chunk_index, chunk_text, content_hash, metadata)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    source_file_id = excluded.source_file_id,
+                    chunk_index = excluded.chunk_index,
+                    chunk_text = excluded.chunk_text,
+                    content_hash = excluded.content_hash,
+                    metadata = excluded.metadata
+            """, rows)
+        logger.debug(f"Added {len(rows)} vector metadata rows")
+        return len(rows)
+
     def delete_vector_metadata(self, vector_id: str) -> None:
         """
         Delete vector metadata.
@@ -1096,6 +1763,45 @@ class Database:
 
             logger.debug(f"Deleted vector metadata: {vector_id}")
 
+    def delete_vector_metadata_many(self, vector_ids: Iterable[str]) -> int:
+        """
+        Delete metadata for many vectors in a single transaction.
+
+        Args:
+            vector_ids: Vector IDs to delete
+
+        Returns:
+            Number of rows deleted
+        """
+        rows = [(vector_id,) for vector_id in vector_ids]
+        if not rows:
+            return 0
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("DELETE FROM vector_metadata WHERE id = ?", rows)
+            deleted = cursor.rowcount
+        logger.debug(f"Deleted {deleted} vector metadata rows")
+        return deleted
+
+    def get_chunk_hashes(self, file_id: str) -> Dict[str, Optional[str]]:
+        """
+        Get the content hash of every indexed chunk of a file.
+
+        Args:
+            file_id: Source file ID
+
+        Returns:
+            Mapping of vector ID to content hash (None for chunks indexed
+            before hashing was introduced)
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT id, content_hash FROM vector_metadata
+                WHERE source_file_id = ?
+            """, (file_id,))
+            return {row['id']: row['content_hash'] for row in cursor.fetchall()}
+
     def get_vector_metadata(self, vector_id: str) -> Optional[Dict[str, Any]]:
         """
         Get metadata for a vector.
@@ -1122,6 +1828,79 @@ class Database:
             return None
 
 
+    # -------------------------------------------------------------------------
+    # Lexical Search (FTS5 / BM25)
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def fts_match_query(text: str) -> Optional[str]:
+        """
+        Turn free text into a safe FTS5 MATCH expression.
+
+        Every word is quoted (so operators, hyphens and codes like ``ERR-42``
+        cannot break the syntax) and terms are OR-ed; BM25 ranks documents
+        matching more and rarer terms first.
+        """
+        terms = []
+        for term in re.findall(r"\w+", text or "", re.UNICODE):
+            quoted = '"' + term.replace('"', '""') + '"'
+            if quoted not in terms:
+                terms.append(quoted)
+        return " OR ".join(terms) if terms else None
+
+    def lexical_search(
+        self,
+        query: str,
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        BM25 search over indexed chunk text.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results
+            filters: Optional equality filters on metadata keys
+
+        Returns:
+            List of dicts with id, score (higher is better), content and metadata
+        """
+        match = self.fts_match_query(query)
+        if not getattr(self, 'fts_enabled', False) or not match:
+            return []
+
+        sql = """
+            SELECT m.id, m.chunk_text, m.metadata, bm25(vector_fts) AS rank
+            FROM vector_fts
+            JOIN vector_metadata m ON m.rowid = vector_fts.rowid
+            WHERE vector_fts MATCH ?
+        """
+        params: List[Any] = [match]
+        for key, value in (filters or {}).items():
+            sql += " AND json_extract(m.metadata, ?) = ?"
+            params.extend([f'$."{key}"', value])
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            results = []
+            for row in cursor.fetchall():
+                results.append({
+                    'id': row['id'],
+                    'score': -row['rank'],
+                    'content': row['chunk_text'],
+                    'metadata': json.loads(row['metadata']) if row['metadata'] else {}
+                })
+            return results
+
+
+def queue_worker_id(name: str = "worker") -> str:
+    """Lease owner name for ``claim_queue_items``, unique across hosts and processes."""
+    return f"{socket.gethostname()}:{os.getpid()}:{name}"
+
+
 # Global database instance
 _database: Optional[Database] = None
 
@@ -0,0 +1,190 @@
+"""
+Persistent, content-addressed embedding cache.
+
+Vectors are keyed by (provider, model, sha256(text)) and stored as float32
+blobs in a small SQLite file that lives next to the main database. Entries
+carry a last-used timestamp so the table can be trimmed LRU-style once it
+grows past ``EMBEDDING_CACHE_MAX_ENTRIES``.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# SQLite caps host parameters per statement (999 on older builds)
+_SQL_CHUNK = 500
+
+
+def text_digest(text: str) -> str:
+    """Return the sha256 hex digest used as the content address of ``text``."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _pack(vector: Sequence[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _unpack(blob: bytes) -> List[float]:
+    arr = array("f")
+    arr.frombytes(blob)
+    return arr.tolist()
+
+
+class EmbeddingCache:
+    """SQLite-backed embedding cache with LRU trimming and hit/miss counters."""
+
+    def __init__(self, path: str, max_entries: int = 200_000):
+        self.path = path
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._writes_since_trim = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (provider, model, text_hash)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_used ON embedding_cache(last_used)"
+        )
+        self._conn.commit()
+        logger.info(f"✅ Embedding cache ready at {path} (max {self.max_entries} entries)")
+
+    def get_many(self, provider: str, model: str, digests: Sequence[str]) -> Dict[str, List[float]]:
+        """Look up cached vectors for ``digests``; returns only the hits."""
+        found: Dict[str, List[float]] = {}
+        unique = list(dict.fromkeys(digests))
+        now = time.time()
+        with self._lock:
+            for start in range(0, len(unique), _SQL_CHUNK):
+                part = unique[start:start + _SQL_CHUNK]
+                marks = ",".join("?" * len(part))
+                rows = self._conn.execute(
+                    f"SELECT text_hash, vector FROM embedding_cache "
+                    f"WHERE provider = ? AND model = ? AND text_hash IN ({marks})",
+                    (provider, model, *part),
+                ).fetchall()
+                for text_hash, blob in rows:
+                    found[text_hash] = _unpack(blob)
+            if found:
+                self._conn.executemany(
+                    "UPDATE embedding_cache SET last_used = ? WHERE provider = ? AND model = ? AND text_hash = ?",
+                    [(now, provider, model, h) for h in found],
+                )
+                self._conn.commit()
+            hits = sum(1 for d in digests if d in found)
+            self._hits += hits
+            self._misses += len(digests) - hits
+        return found
+
+    def put_many(self, provider: str, model: str, items: Dict[str, Sequence[float]]) -> None:
+        """Store vectors keyed by text digest, trimming the table when over capacity."""
+        if not items:
+            return
+        now = time.time()
+        rows = [(provider, model, h, len(v), _pack(v), now) for h, v in items.items()]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache "
+                "(provider, model, text_hash, dim, vector, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+            self._writes_since_trim += len(rows)
+            # Counting rows is cheap but not free; only check after a meaningful number of writes
+            if self._writes_since_trim >= max(1, min(1000, self.max_entries // 10)):
+                self._writes_since_trim = 0
+                self._trim_locked()
+
+    def _trim_locked(self) -> int:
+        total = self._conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+        excess = total - self.max_entries
+        if excess <= 0:
+            return 0
+        self._conn.execute(
+            "DELETE FROM embedding_cache WHERE (provider, model, text_hash) IN "
+            "(SELECT provider, model, text_hash FROM embedding_cache ORDER BY last_used LIMIT ?)",
+            (excess,),
+        )
+        self._conn.commit()
+        logger.debug(f"Embedding cache evicted {excess} least-recently-used entries")
+        return excess
+
+    def trim(self) -> int:
+        """Evict least-recently-used entries above ``max_entries``. Returns number evicted."""
+        with self._lock:
+            self._writes_since_trim = 0
+            return self._trim_locked()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM embedding_cache")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit/miss counters, hit ratio and current entry count."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": (self._hits / lookups) if lookups else 0.0,
+                "entries": entries,
+                "max_entries": self.max_entries,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+
+
+_embedding_cache: Optional[EmbeddingCache] = None
+_embedding_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Return the global embedding cache, or None when disabled or unavailable."""
+    global _embedding_cache
+    if _embedding_cache is None:
+        from .config import get_config
+        cfg = get_config()
+        if not getattr(cfg, "embedding_cache_enabled", True):
+            return None
+        with _embedding_cache_lock:
+            if _embedding_cache is None:
+                try:
+                    _embedding_cache = EmbeddingCache(
+                        path=cfg.embedding_cache_path,
+                        max_entries=cfg.embedding_cache_max_entries,
+                    )
+                except Exception as e:
+                    logger.warning(f"Embedding cache unavailable, continuing without it: {e}")
+                    return None
+    return _embedding_cache
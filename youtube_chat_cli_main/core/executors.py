@@ -0,0 +1,141 @@
+"""
+Per-workload thread pools for running blocking service calls off the event loop.
+
+Async handlers (API server, MCP server, nexus-agents router) dispatch blocking
+work here instead of calling it inline, so a slow LLM call cannot stall
+unrelated requests such as health checks. Each workload class gets its own
+sized pool so, for example, a burst of TTS jobs cannot starve chat queries.
+
+Workloads:
+    llm     - RAG queries, LLM generation, research workflows
+    vector  - embedding and vector store search
+    file    - content extraction and queue processing
+    tts     - audio synthesis
+    io      - other blocking I/O (database, Google Drive, connection checks)
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterator
+
+logger = logging.getLogger(__name__)
+
+WORKLOADS = ("llm", "vector", "file", "tts", "io")
+
+_DEFAULT_WORKERS = {"llm": 8, "vector": 8, "file": 4, "tts": 2, "io": 8}
+
+_SENTINEL = object()
+
+
+class WorkloadPool:
+    """ThreadPoolExecutor wrapper that tracks queued/active/completed work."""
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max(1, int(max_workers))
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"pool-{name}")
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.active = 0
+        self.completed = 0
+        self.failed = 0
+        self.peak_active = 0
+        self.peak_queued = 0
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        with self._lock:
+            self.queued += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+        return self._executor.submit(self._run, fn, args, kwargs)
+
+    def _run(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        with self._lock:
+            self.queued -= 1
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+        ok = False
+        try:
+            result = fn(*args, **kwargs)
+            ok = True
+            return result
+        finally:
+            with self._lock:
+                self.active -= 1
+                if ok:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``fn`` in this pool and await its result."""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "active": self.active,
+                "queued": self.queued,
+                "completed": self.completed,
+                "failed": self.failed,
+                "peak_active": self.peak_active,
+                "peak_queued": self.peak_queued,
+                "saturation": self.active / self.max_workers,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+_pools: Dict[str, WorkloadPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_executor(workload: str) -> WorkloadPool:
+    """Return the pool for ``workload`` (one of WORKLOADS), creating it on first use."""
+    if workload not in WORKLOADS:
+        raise ValueError(f"Unknown workload: {workload}")
+    pool = _pools.get(workload)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(workload)
+            if pool is None:
+                from .config import get_config
+                sizes = getattr(get_config(), "executor_pool_sizes", _DEFAULT_WORKERS)
+                pool = WorkloadPool(workload, sizes.get(workload, _DEFAULT_WORKERS[workload]))
+                _pools[workload] = pool
+                logger.info(f"Started '{workload}' pool with {pool.max_workers} workers")
+    return pool
+
+
+async def run_in_pool(workload: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run blocking ``fn(*args, **kwargs)`` in the ``workload`` pool and await the result."""
+    return await get_executor(workload).run(fn, *args, **kwargs)
+
+
+async def iterate_in_pool(workload: str, iterator: Iterator[Any]) -> AsyncIterator[Any]:
+    """Drive a blocking iterator from the ``workload`` pool, yielding items asynchronously."""
+    pool = get_executor(workload)
+    step = functools.partial(next, iterator, _SENTINEL)
+    while True:
+        item = await pool.run(step)
+        if item is _SENTINEL:
+            return
+        yield item
+
+
+def executor_stats() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of every started pool (saturation = active / max_workers)."""
+    return {name: pool.stats() for name, pool in list(_pools.items())}
+
+
+def shutdown_executors(wait: bool = False) -> None:
+    """Shut down all pools; they are recreated lazily on next use."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.shutdown(wait=wait)
+        _pools.clear()
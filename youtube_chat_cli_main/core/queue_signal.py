@@ -0,0 +1,139 @@
+"""
+Queue wake-up signal: tells queue workers that items were enqueued.
+
+Enqueueing bumps an in-process generation counter that waiting workers
+block on, so work starts as soon as it arrives instead of on the next poll.
+With REDIS_ENABLED the wake-up is also published on a Redis channel, so a
+background service in another process (CLI, API server, MCP server
+enqueueing) wakes up too. Redis is optional; without it, workers in other
+processes fall back to their polling interval.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+from typing import Any, Optional
+
+try:
+    import redis  # type: ignore
+except Exception:  # pragma: no cover
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+QUEUE_WAKEUP_CHANNEL = "nexus:queue:wakeup"
+
+
+class QueueSignal:
+    """Generation counter with cross-process notification over Redis pub/sub.
+
+    Example:
+        signal = get_queue_signal()
+        seen = signal.generation
+        drain()
+        seen = signal.wait(seen, timeout=300)  # returns early on enqueue
+    """
+
+    def __init__(self, client: Any = None, channel: str = QUEUE_WAKEUP_CHANNEL):
+        self._client = client
+        self._channel = channel
+        # Wake-ups this process publishes come back over the channel; skip them
+        self._origin = f"{socket.gethostname()}:{os.getpid()}"
+        self._cond = threading.Condition()
+        self._generation = 0
+        self._listener: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def generation(self) -> int:
+        with self._cond:
+            return self._generation
+
+    def notify(self, publish: bool = True) -> None:
+        """Wake every waiting worker in this process, and in others via Redis."""
+        with self._cond:
+            self._generation += 1
+            self._cond.notify_all()
+        if publish and self._client is not None:
+            try:
+                self._client.publish(self._channel, self._origin)
+            except Exception as e:
+                logger.debug(f"Queue wake-up publish failed: {e}")
+
+    def wait(self, seen: int, timeout: Optional[float] = None) -> int:
+        """
+        Block until a notification newer than generation ``seen`` or the timeout.
+
+        Returns:
+            The current generation (pass it to the next wait)
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._generation != seen, timeout)
+            return self._generation
+
+    def listen(self) -> None:
+        """Start relaying wake-ups published by other processes (no-op without Redis)."""
+        if self._client is None or (self._listener and self._listener.is_alive()):
+            return
+        self._stop.clear()
+        self._listener = threading.Thread(target=self._relay, name="queue-signal", daemon=True)
+        self._listener.start()
+
+    def close(self) -> None:
+        """Stop the Redis listener."""
+        self._stop.set()
+        if self._listener:
+            self._listener.join()
+            self._listener = None
+
+    def _relay(self) -> None:
+        while not self._stop.is_set():
+            try:
+                pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self._channel)
+                try:
+                    while not self._stop.is_set():
+                        message = pubsub.get_message(timeout=1.0)
+                        if not message:
+                            continue
+                        origin = message.get('data')
+                        if isinstance(origin, (bytes, bytearray)):
+                            origin = origin.decode('utf-8', 'replace')
+                        if origin != self._origin:
+                            self.notify(publish=False)
+                finally:
+                    pubsub.close()
+            except Exception as e:
+                logger.warning(f"Queue wake-up listener lost Redis, reconnecting: {e}")
+                self._stop.wait(5.0)
+
+
+_queue_signal: Optional[QueueSignal] = None
+_queue_signal_lock = threading.Lock()
+
+
+def get_queue_signal() -> QueueSignal:
+    """
+    Get the global queue signal, publishing through Redis when it is enabled.
+
+    Returns:
+        QueueSignal instance
+    """
+    global _queue_signal
+    with _queue_signal_lock:
+        if _queue_signal is None:
+            from .config import get_config
+            cfg = get_config()
+            client = None
+            if getattr(cfg, 'redis_enabled', False) and redis is not None:
+                client = redis.Redis.from_url(
+                    url=getattr(cfg, 'redis_url', 'redis://localhost:6379'),
+                    password=getattr(cfg, 'redis_password', None),
+                    db=int(getattr(cfg, 'redis_db', 0)),
+                    socket_timeout=5,
+                    socket_connect_timeout=2,
+                )
+            _queue_signal = QueueSignal(client)
+        return _queue_signal
@@ -17,11 +17,16 @@ except Exception:  # pragma: no cover
 class _InMemoryTTLCache:
     def __init__(self, max_items: int = 2048):
         self._data: dict[str, tuple[float, Any]] = {}
+        # Counters are never evicted: a generation falling back to an old
+        # value would make stale entries valid again
+        self._counters: dict[str, int] = {}
         self._lock = threading.Lock()
         self._max = max_items
 
     def get(self, key: str) -> Optional[str]:
         with self._lock:
+            if key in self._counters:
+                return str(self._counters[key])
             item = self._data.get(key)
             if not item:
                 return None
@@ -39,11 +44,18 @@ class _InMemoryTTLCache:
             exp = time.time() + max(1, int(ttl_s)) if ttl_s else 0
             self._data[key] = (exp, value)
 
+    def incr(self, key: str, amount: int = 1) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+            return self._counters[key]
+
     def clear_prefix(self, prefix: str) -> int:
         with self._lock:
             ks = [k for k in self._data if k.startswith(prefix)]
             for k in ks:
                 self._data.pop(k, None)
+            for k in [k for k in self._counters if k.startswith(prefix)]:
+                self._counters.pop(k, None)
             return len(ks)
 
 
@@ -84,6 +96,15 @@ class RedisCache:
                 pass
         self._mem.set(key, value, ttl)
 
+    def incr(self, key: str, amount: int = 1) -> int:
+        """Atomically increment a counter (no TTL) and return its new value."""
+        if self._r:
+            try:
+                return int(self._r.incrby(key, amount))
+            except Exception:
+                pass
+        return self._mem.incr(key, amount)
+
     def get_json(self, key: str) -> Optional[Any]:
         raw = self.get(key)
         if not raw:
@@ -101,7 +122,11 @@ class RedisCache:
             pass
 
     def clear_prefix(self, prefix: str) -> int:
-        """Delete all keys starting with prefix. Returns number removed (approximate for Redis)."""
+        """Delete all keys starting with prefix. Returns number removed (approximate for Redis).
+
+        Scans the whole keyspace; to invalidate cached results, bump a
+        generation in cache_keys instead.
+        """
         n = 0
         if self._r:
             try:
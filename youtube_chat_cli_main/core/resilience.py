@@ -3,6 +3,7 @@ Resilience helpers: retry with backoff and a simple circuit breaker.
 """
 from __future__ import annotations
 
+import random
 import time
 import threading
 from typing import Callable, Type, Any, Iterable
@@ -42,6 +43,16 @@ def retry_with_backoff(
     return decorator
 
 
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Jittered exponential backoff for the ``attempt``-th retry (1-based).
+
+    The delay doubles per attempt up to ``cap`` and is drawn from its upper
+    half, so retries of many items failing together spread out.
+    """
+    delay = min(cap, base * 2.0 ** max(0, attempt - 1))
+    return random.uniform(delay / 2, delay)
+
+
 class CircuitBreaker:
     """Very small in-process circuit breaker.
 
@@ -22,7 +22,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 
 from ..core.config import get_config
-from ..core.database import get_database
+from ..core.database import get_database, queue_worker_id
+from ..core.queue_signal import get_queue_signal
+from ..core.executors import run_in_pool, executor_stats
 from ..services.rag_engine import get_rag_engine
 from ..services.content_processor import get_content_processor
 from ..services.gdrive_service import get_gdrive_service, get_gdrive_watcher
@@ -356,7 +358,8 @@ class MCPTools:
             file_id=file_path,
             file_name=Path(file_path).name,
             source='local',
-            priority=priority
+            priority=priority,
+            notify=False  # processed right below; a woken worker would take it
         )
 
         # Process immediately
@@ -388,14 +391,17 @@ class MCPTools:
         supported_extensions = {'.pdf', '.docx', '.txt', '.md', '.html', '.png', '.jpg', '.jpeg'}
         files = [f for f in files if f.is_file() and f.suffix.lower() in supported_extensions]
 
-        # Add to queue
+        # Add to queue, waking the queue workers once
         for file in files:
             db.add_to_queue(
                 file_id=str(file),
                 file_name=file.name,
                 source='local',
-                priority=priority
+                priority=priority,
+                notify=False
             )
+        if files:
+            get_queue_signal().notify()
 
         return {
             "files_added": len(files),
@@ -416,22 +422,16 @@ class MCPTools:
         processor = get_content_processor()
         limit = args.get("limit", 10)
 
-        items = db.get_pending_queue_items(limit=limit)
-
-        success_count = 0
-        fail_count = 0
+        # Claim pending items so background queue workers skip them
+        worker_id = queue_worker_id("mcp")
+        items = db.claim_queue_items(worker_id, limit, get_config().queue_lease_seconds)
 
-        for item in items:
-            success = processor.process_queue_item(item['id'])
-            if success:
-                success_count += 1
-            else:
-                fail_count += 1
+        summary = processor.process_queue_items(items, worker_id=worker_id)
 
         return {
             "processed": len(items),
-            "succeeded": success_count,
-            "failed": fail_count
+            "succeeded": summary["succeeded"],
+            "failed": summary["failed"]
         }
 
     @staticmethod
@@ -627,6 +627,17 @@ class MCPTools:
 # FastAPI Endpoints
 # ============================================================================
 
+# Execution pool per tool; unlisted tools run in the general "io" pool
+TOOL_WORKLOADS = {
+    "rag_query": "llm",
+    "vector_search": "vector",
+    "vector_store_info": "vector",
+    "vector_store_delete": "vector",
+    "process_file": "file",
+    "process_folder": "file",
+    "process_queue_items": "file",
+}
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -657,7 +668,12 @@ async def call_tool(tool_call: MCPToolCall):
         Tool execution result
     """
     try:
-        result = MCPTools.execute_tool(tool_call.name, tool_call.arguments)
+        result = await run_in_pool(
+            TOOL_WORKLOADS.get(tool_call.name, "io"),
+            MCPTools.execute_tool,
+            tool_call.name,
+            tool_call.arguments
+        )
 
         return MCPToolResponse(
             content=[{
@@ -682,7 +698,7 @@ async def call_tool(tool_call: MCPToolCall):
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return {"status": "healthy", "executors": executor_stats()}
 
 
 if __name__ == "__main__":
@@ -7,21 +7,25 @@ This module provides automated background processing including:
 - Scheduled document ingestion
 - Automatic retry logic
 
-Uses APScheduler for reliable background task execution.
+Uses APScheduler for the Google Drive watcher. The queue is drained by a
+dispatcher thread that wakes up when items are enqueued (see queue_signal).
 """
 
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 import signal
 import sys
+import threading
+import time
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED
 
 from ..core.config import get_config
-from ..core.database import get_database
+from ..core.database import get_database, queue_worker_id
+from ..core.queue_signal import get_queue_signal
 from .gdrive_service import get_gdrive_watcher
 from .content_processor import get_content_processor
 
@@ -45,6 +49,8 @@ class BackgroundService:
         self.db = get_database()
         self.scheduler = BackgroundScheduler()
         self.is_running = False
+        self._queue_stop = threading.Event()
+        self._queue_thread: Optional[threading.Thread] = None
 
         # Get service instances
         self.gdrive_watcher = get_gdrive_watcher()
@@ -62,7 +68,6 @@ class BackgroundService:
 
         # Register signal handlers for graceful shutdown (only in main thread)
         try:
-            import threading
             if threading.current_thread() is threading.main_thread():
                 signal.signal(signal.SIGINT, self._signal_handler)
                 signal.signal(signal.SIGTERM, self._signal_handler)
@@ -75,9 +80,9 @@ class BackgroundService:
         """
         Start the background service.
 
-        This starts all scheduled jobs:
-        - Google Drive monitoring
-        - Queue processing
+        This starts:
+        - Google Drive monitoring (scheduled job)
+        - The queue dispatcher, draining the queue as items are enqueued
         """
         if self.is_running:
             logger.warning("Background service is already running")
@@ -103,19 +108,16 @@ class BackgroundService:
         else:
             logger.warning("Google Drive folder ID not configured, skipping watcher")
 
-        # Add queue processing job
-        self.scheduler.add_job(
-            func=self._process_queue,
-            trigger=IntervalTrigger(
-                seconds=self.config.background_service_interval
-            ),
-            id='queue_processor',
-            name='Queue Processor',
-            replace_existing=True
+        # Start the queue dispatcher; enqueues in other processes reach it through Redis
+        get_queue_signal().listen()
+        self._queue_stop.clear()
+        self._queue_thread = threading.Thread(
+            target=self._run_queue_dispatcher, name="queue-dispatcher", daemon=True
         )
+        self._queue_thread.start()
         logger.info(
-            f"✅ Queue processor scheduled "
-            f"(interval: {self.config.background_service_interval}s)"
+            f"✅ Queue dispatcher started "
+            f"(fallback poll: {self.config.background_service_interval}s)"
         )
 
         # Start the scheduler
@@ -135,6 +137,15 @@ class BackgroundService:
 
         # Shutdown scheduler
         self.scheduler.shutdown(wait=True)
+
+        # Stop the dispatcher once its current drain finishes
+        self._queue_stop.set()
+        get_queue_signal().notify(publish=False)
+        if self._queue_thread:
+            self._queue_thread.join()
+            self._queue_thread = None
+        # run_once() drains with the same workers after a stop
+        self._queue_stop.clear()
         self.is_running = False
 
         logger.info("✅ Background service stopped")
@@ -155,50 +166,125 @@ class BackgroundService:
         except Exception as e:
             logger.error(f"Google Drive watcher failed: {e}")
 
+    def _run_queue_dispatcher(self) -> None:
+        """
+        Drain the queue, then sleep until items are enqueued.
+
+        Enqueueing wakes the dispatcher through the queue signal, so new
+        items start processing right away. The wait also ends when the
+        earliest scheduled retry falls due. BACKGROUND_SERVICE_INTERVAL is
+        only a safety-net poll, for items enqueued by another process without
+        Redis and for expired leases.
+        """
+        queue_signal = get_queue_signal()
+        seen = queue_signal.generation
+
+        while not self._queue_stop.is_set():
+            self._process_queue()
+
+            timeout = float(self.config.background_service_interval)
+            try:
+                due = self.db.next_queue_retry_at()
+                if due is not None:
+                    timeout = min(timeout, max(0.0, due - time.time()) + 0.05)
+            except Exception as e:
+                logger.error(f"Queue dispatcher failed to read retry schedule: {e}")
+
+            seen = queue_signal.wait(seen, timeout)
+
     def _process_queue(self) -> None:
         """
         Process items from the queue.
 
-        This job runs periodically to process pending items.
+        Drains the queue with QUEUE_WORKERS concurrent workers; called by the
+        dispatcher on every wake-up.
         """
         try:
             logger.debug("Running queue processor...")
 
-            # Get pending items from queue
-            pending_items = self.db.get_pending_queue_items(limit=10)
+            results = self._drain_queue()
 
-            if not pending_items:
+            if not results['claimed']:
                 logger.debug("No pending items in queue")
                 return
 
-            logger.info(f"Processing {len(pending_items)} queue items...")
+            logger.info(
+                f"Queue processing complete: "
+                f"{results['succeeded']} succeeded, {results['failed']} failed"
+            )
 
-            success_count = 0
-            fail_count = 0
+        except Exception as e:
+            logger.error(f"Queue processor failed: {e}")
 
-            for item in pending_items:
-                queue_id = item['id']
+    def _drain_queue(self, max_items: Optional[int] = None) -> Dict[str, int]:
+        """
+        Run QUEUE_WORKERS workers until no pending item is left.
 
-                try:
-                    # Process the item
-                    success = self.content_processor.process_queue_item(queue_id)
+        Each worker claims items under its own lease and runs them through
+        the ingestion pipeline, so workers in other threads or processes (API,
+        CLI, a second service) never get the same item. Items of crashed
+        workers come back once their lease expires.
 
-                    if success:
-                        success_count += 1
-                    else:
-                        fail_count += 1
+        Claims start at one item and double up to QUEUE_CLAIM_BATCH while the
+        backlog keeps filling them: a single upload starts at once, and the
+        other workers aren't left idle behind one worker's batch, while a
+        large backlog is claimed in full batches.
 
-                except Exception as e:
-                    logger.error(f"Failed to process queue item {queue_id}: {e}")
-                    fail_count += 1
+        Workers stop claiming once ``stop()`` is called, so shutdown waits
+        only for the batches already claimed.
 
-            logger.info(
-                f"Queue processing complete: "
-                f"{success_count} succeeded, {fail_count} failed"
-            )
+        Args:
+            max_items: Stop claiming after this many items
 
-        except Exception as e:
-            logger.error(f"Queue processor failed: {e}")
+        Returns:
+            Dictionary with 'claimed', 'succeeded' and 'failed' counts
+        """
+        self.db.reclaim_expired_queue_leases()
+
+        workers = getattr(self.config, 'queue_workers', 1)
+        batch = getattr(self.config, 'queue_claim_batch', 8)
+        lease_seconds = getattr(self.config, 'queue_lease_seconds', 600)
+        totals = {'claimed': 0, 'succeeded': 0, 'failed': 0}
+        lock = threading.Lock()
+
+        def work(worker_id: str) -> None:
+            size = 1
+            # Stopping lets claimed batches finish but claims nothing new
+            while not self._queue_stop.is_set():
+                with lock:
+                    # Reserve the claim up front so max_items holds across workers
+                    budget = size if max_items is None else min(size, max_items - totals['claimed'])
+                    if budget <= 0:
+                        return
+                    totals['claimed'] += budget
+                items = self.db.claim_queue_items(worker_id, budget, lease_seconds)
+                with lock:
+                    totals['claimed'] -= budget - len(items)
+                if not items:
+                    return
+                if len(items) == budget:
+                    size = min(batch, size * 2)
+
+                summary = self.content_processor.process_queue_items(items, worker_id=worker_id)
+                with lock:
+                    totals['succeeded'] += summary['succeeded']
+                    totals['failed'] += summary['failed']
+
+        def run(worker_id: str) -> None:
+            try:
+                work(worker_id)
+            except Exception as e:
+                logger.error(f"Queue worker {worker_id} failed: {e}")
+
+        threads = [
+            threading.Thread(target=run, args=(queue_worker_id(f"queue-{n}"),), name=f"queue-worker-{n}", daemon=True)
+            for n in range(workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return totals
 
     def _job_executed_listener(self, event) -> None:
         """
@@ -255,6 +341,7 @@ class BackgroundService:
         return {
             'is_running': self.is_running,
             'jobs': jobs,
+            'queue_dispatcher': bool(self._queue_thread and self._queue_thread.is_alive()),
             'queue_statistics': queue_stats
         }
 
@@ -283,15 +370,7 @@ class BackgroundService:
 
         # Run queue processor
         try:
-            pending_items = self.db.get_pending_queue_items(limit=10)
-
-            for item in pending_items:
-                try:
-                    success = self.content_processor.process_queue_item(item['id'])
-                    if success:
-                        results['queue_processor'] += 1
-                except Exception as e:
-                    logger.error(f"Failed to process item {item['id']}: {e}")
+            results['queue_processor'] = self._drain_queue(max_items=10)['succeeded']
 
             logger.info(f"Queue processor: {results['queue_processor']} items processed")
 
@@ -312,10 +391,9 @@ class BackgroundService:
 
         # Invalidate caches related to search/vector before reindex starts
         try:
-            from ..core.redis_cache import get_cache
-            c = get_cache()
-            c.clear_prefix("vector:")
-            c.clear_prefix("search:")
+            from ..core.cache_keys import CORPUS, SEARCH, bump_generation
+            bump_generation(CORPUS)
+            bump_generation(SEARCH)
         except Exception:
             pass
 
@@ -343,12 +421,15 @@ class BackgroundService:
                                     file_name=f.get('name','unknown'),
                                     source='gdrive',
                                     file_type=f.get('mime_type'),
-                                    metadata={'reindex_job_id': job_id}
+                                    metadata={'reindex_job_id': job_id},
+                                    notify=False
                                 )
                                 processed += 1
                             except Exception as fe:
                                 self.db.update_indexing_job(job_id, files_failed=1, failed_files=[f.get('id','')])
                         self.db.update_indexing_job(job_id, files_processed=processed, status='in_progress')
+                    if processed:
+                        get_queue_signal().notify()
                 except Exception as e:
                     logger.error("Indexer enqueue failed: %s", e)
                 # Kick a single run of processors
@@ -8,11 +8,14 @@ This module handles multi-format document processing including:
 - Document chunking for vector storage
 """
 
+import itertools
 import os
 import logging
+import shutil
 import tempfile
+from collections import deque
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Callable, List, Dict, Any, Iterable, Iterator, Optional, Tuple
 import re
 
 # Document processing
@@ -32,7 +35,8 @@ from langchain.text_splitter import (
 )
 
 from ..core.config import get_config
-from ..core.database import get_database
+from ..core.database import get_database, queue_worker_id
+from ..core.resilience import backoff_delay
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +46,156 @@ class ContentProcessingError(Exception):
     pass
 
 
+def _transient_errors() -> Tuple[type, ...]:
+    # Failures of a dependency that is down or overloaded (Ollama, the vector
+    # store, Drive, the network) or of a parse that ran out of time
+    import sqlite3
+    import requests
+    from .embedding_service import EmbeddingError
+    from .extraction_executor import ExtractionTimeout
+    from .vector_store import VectorStoreError
+
+    errors: Tuple[type, ...] = (
+        ConnectionError, TimeoutError, requests.RequestException, sqlite3.OperationalError,
+        EmbeddingError, ExtractionTimeout, VectorStoreError,
+    )
+    try:
+        from .gdrive_service import GoogleDriveError
+        errors += (GoogleDriveError,)
+    except ImportError:
+        pass
+    return errors
+
+
+def classify_queue_error(error: BaseException) -> str:
+    """
+    Retry class of a queue item failure.
+
+    Processing errors wrap their cause, so the whole exception chain is
+    inspected. Any transient cause makes the failure 'transient' (retried
+    with backoff); otherwise a parse, format or missing-file error is
+    'permanent' (dead-lettered at once). Unknown errors count as transient.
+
+    Args:
+        error: Exception raised while processing the item
+
+    Returns:
+        'transient' or 'permanent'
+    """
+    from .extraction_executor import ExtractionError
+
+    chain = []
+    while error is not None and error not in chain:
+        chain.append(error)
+        error = error.__cause__ or error.__context__
+
+    transient = _transient_errors()
+    if any(isinstance(e, transient) for e in chain):
+        return 'transient'
+
+    permanent = (
+        ContentProcessingError, ExtractionError, ValueError, UnicodeError,
+        FileNotFoundError, IsADirectoryError, PermissionError, NotImplementedError,
+    )
+    if any(isinstance(e, permanent) for e in chain):
+        return 'permanent'
+    return 'transient'
+
+
+def pdf_page_count(file_path: str) -> int:
+    """Number of pages in a PDF (reads the page tree, not the pages)."""
+    return len(PdfReader(file_path).pages)
+
+
+def pdf_pages_to_markdown(file_path: str, start: int = 0, stop: Optional[int] = None) -> List[str]:
+    """Markdown of PDF pages ``start`` to ``stop`` (0-based, exclusive), one string per page."""
+    reader = PdfReader(file_path)
+    pages = []
+
+    for page_num in range(start, len(reader.pages) if stop is None else min(stop, len(reader.pages))):
+        text = reader.pages[page_num].extract_text()
+
+        # If page has little text, use OCR
+        if len(text.strip()) < 50:
+            logger.info(f"Page {page_num + 1} has little text, using OCR...")
+            # OCR would go here - for now, use extracted text
+        pages.append(f"## Page {page_num + 1}\n\n{text}")
+
+    return pages
+
+
+def pdf_to_markdown(file_path: str) -> str:
+    """Text of every PDF page under a ``## Page n`` heading."""
+    return "\n\n".join(pdf_pages_to_markdown(file_path))
+
+
+def docx_to_markdown(file_path: str) -> str:
+    """DOCX paragraphs, with Heading styles turned into markdown headings."""
+    doc = docx.Document(file_path)
+
+    content_parts = []
+
+    for para in doc.paragraphs:
+        text = para.text.strip()
+        if not text:
+            continue
+
+        # Detect headings based on style
+        if para.style.name.startswith('Heading'):
+            level = para.style.name.replace('Heading ', '')
+            if level.isdigit():
+                content_parts.append(f"{'#' * int(level)} {text}")
+            else:
+                content_parts.append(f"## {text}")
+        else:
+            content_parts.append(text)
+
+    return "\n\n".join(content_parts)
+
+
+def html_to_text(file_path: str) -> str:
+    """Visible text of an HTML file, one phrase per line."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        html_content = f.read()
+
+    soup = BeautifulSoup(html_content, 'html.parser')
+
+    # Remove script and style elements
+    for script in soup(["script", "style"]):
+        script.decompose()
+
+    # Get text
+    text = soup.get_text()
+
+    # Clean up whitespace
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return '\n'.join(chunk for chunk in chunks if chunk)
+
+
+def json_to_text(file_path: str) -> str:
+    """JSON flattened to ``dotted.key: value`` lines."""
+    import json
+    with open(file_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    def flatten(obj, prefix=""):
+        lines = []
+        if isinstance(obj, dict):
+            for k, v in obj.items():
+                lines.extend(flatten(v, f"{prefix}{k}."))
+        elif isinstance(obj, list):
+            for i, v in enumerate(obj):
+                lines.extend(flatten(v, f"{prefix}{i}."))
+        else:
+            # Primitive
+            key = prefix[:-1] if prefix.endswith(".") else prefix
+            lines.append(f"{key}: {obj}")
+        return lines
+
+    return "\n".join(flatten(data))
+
+
 class ContentProcessor:
     """
     Multi-format content processor with OCR and intelligent chunking.
@@ -112,6 +266,85 @@ class ContentProcessor:
             logger.error(f"Failed to process file {file_path}: {e}")
             raise ContentProcessingError(f"Failed to process file: {e}")
     
+    def process_files(
+        self,
+        file_paths: Iterable[str],
+        workers: Optional[int] = None
+    ) -> Iterator[Tuple[str, Optional[Dict[str, Any]], Optional[Exception]]]:
+        """
+        Process files concurrently, yielding each as soon as it is chunked.
+
+        Parsing runs in the extraction process pool, so up to ``workers``
+        files (default EXTRACTION_PROCESSES) are parsed at once; at most
+        twice that many are in flight, so a long listing is not read ahead.
+
+        Yields:
+            Tuples of (file_path, result, error) in completion order; exactly
+            one of result (as returned by ``process_file``) and error is set
+        """
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        workers = max(1, workers or getattr(self.config, 'extraction_processes', 0) or 1)
+        paths = iter(file_paths)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="extract") as pool:
+            pending = {}
+            for path in itertools.islice(paths, workers * 2):
+                pending[pool.submit(self.process_file, str(path))] = path
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    error = future.exception()
+                    yield path, (None if error else future.result()), error
+                    for following in itertools.islice(paths, 1):
+                        pending[pool.submit(self.process_file, str(following))] = following
+
+    def stream_file(
+        self,
+        file_path: str,
+        file_type: Optional[str] = None
+    ) -> Tuple[Iterator[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Like ``process_file``, but chunks are produced while the file is parsed.
+
+        PDFs are split page by page as pages arrive from ``iter_pdf_pages``,
+        so the first chunks can be embedded while later pages are parsed and
+        the whole document is never held in memory. Chunks match those of
+        ``process_file`` when splitting by headings (every page is its own
+        ``## Page n`` section). Other files are processed whole.
+
+        Returns:
+            Tuple of (chunk iterator, file metadata); parse errors are raised
+            as ContentProcessingError while iterating
+        """
+        if not file_type:
+            file_type = self._detect_file_type(file_path)
+
+        if file_type != 'application/pdf' or not self.config.split_by_headings:
+            result = self.process_file(file_path, file_type)
+            return iter(result['chunks']), result['metadata']
+
+        metadata = {
+            'file_name': Path(file_path).name,
+            'file_type': file_type,
+            'file_size': os.path.getsize(file_path)
+        }
+        return self._iter_pdf_chunks(file_path), metadata
+
+    def _iter_pdf_chunks(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        logger.info(f"Streaming file: {file_path}")
+        count = 0
+        try:
+            for page in self.iter_pdf_pages(file_path):
+                for chunk in self._split_by_markdown_headings(self._clean_text(page)):
+                    chunk['metadata']['chunk_index'] = count
+                    count += 1
+                    yield chunk
+        except Exception as e:
+            logger.error(f"Failed to process file {file_path}: {e}")
+            raise ContentProcessingError(f"Failed to process file: {e}")
+        logger.info(f"✅ Streamed file: {count} chunks")
+
     def _detect_file_type(self, file_path: str) -> str:
         """
         Detect file type from extension or MIME type.
@@ -230,6 +463,11 @@ class ContentProcessor:
 
         return content, metadata
 
+    def _run_extractor(self, extractor, file_path: str) -> str:
+        """Run a CPU-bound parser in the extraction process pool (inline if disabled)."""
+        from .extraction_executor import get_extraction_executor
+        return get_extraction_executor().run(extractor, file_path)
+
     def _extract_pdf(self, file_path: str) -> str:
         """
         Extract text from PDF with OCR fallback.
@@ -241,32 +479,43 @@ class ContentProcessor:
             Extracted markdown content
         """
         try:
-            # Try text extraction first
-            reader = PdfReader(file_path)
-            text_content = []
-            
-            for page_num, page in enumerate(reader.pages, 1):
-                text = page.extract_text()
-                
-                # If page has little text, use OCR
-                if len(text.strip()) < 50:
-                    logger.info(f"Page {page_num} has little text, using OCR...")
-                    # OCR would go here - for now, use extracted text
-                    text_content.append(f"## Page {page_num}\n\n{text}")
-                else:
-                    text_content.append(f"## Page {page_num}\n\n{text}")
-            
-            content = "\n\n".join(text_content)
-            
-            # Clean up the text
-            content = self._clean_text(content)
-            
-            return content
-            
+            return self._clean_text("\n\n".join(self.iter_pdf_pages(file_path)))
         except Exception as e:
             logger.error(f"PDF extraction failed: {e}")
             raise ContentProcessingError(f"PDF extraction failed: {e}")
     
+    def iter_pdf_pages(self, file_path: str) -> Iterator[str]:
+        """
+        Yield the markdown of each PDF page, in order, as it is parsed.
+
+        Ranges of PDF_PAGES_PER_TASK pages are parsed in parallel in the
+        extraction pool; only a few ranges are in flight at once, so memory
+        does not grow with the page count.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from .extraction_executor import get_extraction_executor
+
+        executor = get_extraction_executor()
+        pages = executor.run(pdf_page_count, file_path)
+        per_task = max(1, getattr(self.config, 'pdf_pages_per_task', 16))
+        window = max(1, executor.processes) + 1
+        ranges = iter(range(0, pages, per_task))
+
+        with ThreadPoolExecutor(max_workers=window, thread_name_prefix="pdf-pages") as pool:
+            in_flight = deque(
+                pool.submit(executor.run, pdf_pages_to_markdown, file_path, start, start + per_task)
+                for start in itertools.islice(ranges, window)
+            )
+            try:
+                while in_flight:
+                    batch = in_flight.popleft().result()
+                    for start in itertools.islice(ranges, 1):
+                        in_flight.append(pool.submit(executor.run, pdf_pages_to_markdown, file_path, start, start + per_task))
+                    yield from batch
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
     def _extract_docx(self, file_path: str) -> str:
         """
         Extract text from DOCX file.
@@ -278,28 +527,7 @@ class ContentProcessor:
             Extracted markdown content
         """
         try:
-            doc = docx.Document(file_path)
-            
-            content_parts = []
-            
-            for para in doc.paragraphs:
-                text = para.text.strip()
-                if not text:
-                    continue
-                
-                # Detect headings based on style
-                if para.style.name.startswith('Heading'):
-                    level = para.style.name.replace('Heading ', '')
-                    if level.isdigit():
-                        content_parts.append(f"{'#' * int(level)} {text}")
-                    else:
-                        content_parts.append(f"## {text}")
-                else:
-                    content_parts.append(text)
-            
-            content = "\n\n".join(content_parts)
-            return self._clean_text(content)
-            
+            return self._clean_text(self._run_extractor(docx_to_markdown, file_path))
         except Exception as e:
             logger.error(f"DOCX extraction failed: {e}")
             raise ContentProcessingError(f"DOCX extraction failed: {e}")
@@ -333,25 +561,7 @@ class ContentProcessor:
             Extracted markdown content
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            # Get text
-            text = soup.get_text()
-            
-            # Clean up whitespace
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = '\n'.join(chunk for chunk in chunks if chunk)
-            
-            return self._clean_text(text)
-            
+            return self._clean_text(self._run_extractor(html_to_text, file_path))
         except Exception as e:
             logger.error(f"HTML extraction failed: {e}")
             raise ContentProcessingError(f"HTML extraction failed: {e}")
@@ -423,24 +633,7 @@ class ContentProcessor:
         Flatten JSON content to a readable text representation.
         """
         try:
-            import json
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            def flatten(obj, prefix=""):
-                lines = []
-                if isinstance(obj, dict):
-                    for k, v in obj.items():
-                        lines.extend(flatten(v, f"{prefix}{k}."))
-                elif isinstance(obj, list):
-                    for i, v in enumerate(obj):
-                        lines.extend(flatten(v, f"{prefix}{i}."))
-                else:
-                    # Primitive
-                    key = prefix[:-1] if prefix.endswith(".") else prefix
-                    lines.append(f"{key}: {obj}")
-                return lines
-            text = "\n".join(flatten(data))
-            return self._clean_text(text)
+            return self._clean_text(self._run_extractor(json_to_text, file_path))
         except Exception as e:
             logger.error(f"JSON extraction failed: {e}")
             raise ContentProcessingError(f"JSON extraction failed: {e}")
@@ -594,68 +787,165 @@ class ContentProcessor:
         Returns:
             True if processing succeeded, False otherwise
         """
+        # Claim the item so no queue worker picks it up at the same time
+        worker_id = queue_worker_id(f"item-{queue_id}")
+        lease_seconds = getattr(self.config, 'queue_lease_seconds', 600)
+        claimed = self.db.claim_queue_items(worker_id, 1, lease_seconds, queue_id=queue_id)
+        if not claimed:
+            logger.error(f"Queue item {queue_id} not found, not pending or waiting for a retry")
+            return False
+        item = claimed[0]
+
         try:
-            # Get queue item
-            item = self.db.get_queue_item(queue_id)
-            if not item:
-                logger.error(f"Queue item {queue_id} not found")
-                return False
+            with self.db.queue_lease_heartbeat(worker_id, lease_seconds):
+                documents, metadata = self.extract_queue_item(item)
 
-            # Update status to processing
-            self.db.update_queue_status(queue_id, 'processing')
+                # Store chunks in vector store
+                from .vector_store import get_vector_store
+                get_vector_store().add_documents(documents=list(documents), metadata=metadata)
 
-            # Download file if from Google Drive
-            if item['source'] == 'google_drive':
-                from .gdrive_service import get_gdrive_service
-                gdrive = get_gdrive_service()
+            return self.complete_queue_item(item, worker_id)
 
-                # Create temp directory
-                temp_dir = tempfile.mkdtemp()
-                file_path = os.path.join(temp_dir, item['file_name'])
+        except Exception as e:
+            self.fail_queue_item(item, e, worker_id)
+            return False
 
-                # Download file
-                gdrive.download_file(item['file_id'], file_path)
-            else:
-                file_path = item['file_id']  # Assume it's a local path
-
-            # Process file
-            result = self.process_file(file_path, item.get('file_type'))
-
-            # Store chunks in vector store
-            from .vector_store import get_vector_store
-            vector_store = get_vector_store()
-
-            vector_store.add_documents(
-                documents=result['chunks'],
-                metadata={
-                    'file_id': item['file_id'],
-                    'file_name': item['file_name'],
-                    'source': item['source'],
-                    **result['metadata']
-                }
-            )
+    def process_queue_items(
+        self,
+        items: List[Dict[str, Any]],
+        worker_id: Optional[str] = None,
+        on_success: Optional[Callable[[Dict[str, Any], List[str]], None]] = None,
+        on_failure: Optional[Callable[[Dict[str, Any], Exception], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Process claimed queue items through the staged ingestion pipeline.
 
-            # Update status to completed
-            self.db.update_queue_status(queue_id, 'completed')
+        Extraction, embedding and upserts of different items overlap, and
+        small files are embedded and written together.
 
-            # Update Google Drive file status if applicable
-            if item['source'] == 'google_drive':
-                self.db.update_gdrive_file_status(item['file_id'], 'processed')
+        Args:
+            items: Queue items claimed with ``Database.claim_queue_items``
+            worker_id: Lease owner; its leases are renewed until all items are done
+            on_success / on_failure: Called after an item's status is updated
 
-            logger.info(f"✅ Successfully processed queue item {queue_id}")
-            return True
+        Returns:
+            Pipeline summary with 'succeeded', 'failed' and per-stage metrics
+        """
+        if not items:
+            # Nothing claimed: don't start the pipeline (and its vector store)
+            return {'succeeded': 0, 'failed': 0}
+        from .ingestion_pipeline import ingest
 
-        except Exception as e:
-            logger.error(f"Failed to process queue item {queue_id}: {e}")
+        def succeeded(item, doc_ids):
+            self.complete_queue_item(item, worker_id)
+            if on_success:
+                on_success(item, doc_ids)
+
+        def failed(item, error):
+            self.fail_queue_item(item, error, worker_id)
+            if on_failure:
+                on_failure(item, error)
 
-            # Update status to failed
-            self.db.update_queue_status(queue_id, 'failed', error_message=str(e))
+        if worker_id is None:
+            return ingest(items, self.extract_queue_item, on_success=succeeded, on_failure=failed)
+        with self.db.queue_lease_heartbeat(worker_id, getattr(self.config, 'queue_lease_seconds', 600)):
+            return ingest(items, self.extract_queue_item, on_success=succeeded, on_failure=failed)
 
-            # Increment retry count
-            self.db.increment_queue_retry(queue_id)
+    def extract_queue_item(self, item: Dict[str, Any]) -> Tuple[Iterator[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Download (Google Drive) and chunk a claimed queue item.
+
+        Returns:
+            Tuple of (chunk iterator, metadata for the vector store), see
+            ``stream_file``
+        """
+        temp_dir = None
+        if item['source'] == 'google_drive':
+            from .gdrive_service import get_gdrive_service
+            gdrive = get_gdrive_service()
+
+            temp_dir = tempfile.mkdtemp()
+            file_path = os.path.join(temp_dir, item['file_name'])
+            gdrive.download_file(item['file_id'], file_path)
+        else:
+            file_path = item['file_id']  # Assume it's a local path
+
+        try:
+            chunks, metadata = self.stream_file(file_path, item.get('file_type'))
+        except Exception:
+            if temp_dir:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+        if temp_dir:
+            chunks = self._remove_when_done(chunks, temp_dir)
+
+        return chunks, {
+            'file_id': item['file_id'],
+            'file_name': item['file_name'],
+            'source': item['source'],
+            **metadata
+        }
+
+    @staticmethod
+    def _remove_when_done(chunks: Iterator[Dict[str, Any]], temp_dir: str) -> Iterator[Dict[str, Any]]:
+        # Downloads are removed once read; many of them would fill the disk
+        try:
+            yield from chunks
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
 
+    def complete_queue_item(self, item: Dict[str, Any], worker_id: Optional[str] = None) -> bool:
+        """
+        Mark a queue item (and its Google Drive file) as done.
+
+        Args:
+            item: Claimed queue item
+            worker_id: Lease owner (default: the item's ``lease_owner``); the
+                update is skipped if the lease has since passed to another worker
+
+        Returns:
+            True if the item was marked completed
+        """
+        if not self.db.update_queue_status(item['id'], 'completed', lease_owner=worker_id or item.get('lease_owner')):
             return False
 
+        if item['source'] == 'google_drive':
+            self.db.update_gdrive_file_status(item['file_id'], 'processed')
+
+        logger.info(f"✅ Successfully processed queue item {item['id']}")
+        return True
+
+    def fail_queue_item(self, item: Dict[str, Any], error: Exception, worker_id: Optional[str] = None) -> None:
+        """
+        Schedule a failed queue item for retry, or dead-letter it.
+
+        Transient failures are retried with jittered exponential backoff so
+        workers don't hammer a dependency that is down. Permanent failures,
+        and items that reach QUEUE_DEAD_RETRY attempts, move to the dead
+        letter queue. Nothing changes if ``worker_id`` (default: the item's
+        ``lease_owner``) lost the lease to another worker.
+        """
+        retry_class = classify_queue_error(error)
+        attempts = (item.get('retry_count') or 0) + 1
+        lease_owner = worker_id or item.get('lease_owner')
+
+        if retry_class == 'permanent' or attempts >= getattr(self.config, 'queue_dead_retry_threshold', 5):
+            logger.error(f"Failed to process queue item {item['id']} ({retry_class}, attempt {attempts}): {error}")
+            reason = f"{retry_class} failure after {attempts} attempts: {error}"
+            if not self.db.dead_letter_queue_item(item['id'], reason, lease_owner=lease_owner):
+                return
+            if item['source'] == 'google_drive':
+                self.db.update_gdrive_file_status(item['file_id'], 'failed')
+            return
+
+        delay = backoff_delay(
+            attempts,
+            getattr(self.config, 'queue_retry_base_seconds', 30),
+            getattr(self.config, 'queue_retry_max_seconds', 3600)
+        )
+        logger.warning(f"Queue item {item['id']} failed (attempt {attempts}), retrying in {delay:.0f}s: {error}")
+        self.db.retry_queue_item(item['id'], delay, error_message=str(error), lease_owner=lease_owner)
+
 
 # Global service instance
 _content_processor: Optional[ContentProcessor] = None
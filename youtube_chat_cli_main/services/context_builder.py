@@ -0,0 +1,228 @@
+"""
+JAEGIS NexusSync - Prompt Context Builder
+
+Assembles retrieved passages into LLM prompt context under a token budget:
+- Adjacent chunks of the same file are joined into one span, without the
+  text they share through CHUNK_OVERLAP
+- Near-duplicate passages (the same chunk found twice, a web snippet quoted
+  in an ingested file, ...) are kept once
+- Passages are packed best-first until the budget is spent
+
+Passages are vector store results (``{'content', 'metadata', 'score'}``),
+LangChain Documents, or web search results (``{'content', 'title', 'url'}``).
+Without scores, input order is taken as the ranking.
+"""
+
+import logging
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Rough characters per token for English text; no tokenizer dependency
+CHARS_PER_TOKEN = 4
+
+# Shortest shared text treated as chunk overlap rather than coincidence
+MIN_OVERLAP_CHARS = 20
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of a text."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _passage(item: Any, position: int) -> Dict[str, Any]:
+    if hasattr(item, 'page_content'):
+        content, metadata, score = item.page_content, dict(item.metadata or {}), None
+    else:
+        content = item.get('content') or ''
+        metadata = dict(item.get('metadata') or {})
+        for key in ('title', 'url'):
+            if item.get(key) and key not in metadata:
+                metadata[key] = item[key]
+        score = item.get('score')
+    return {
+        'content': content.strip(),
+        'metadata': metadata,
+        'score': score,
+        'position': position,
+        'item': item,
+    }
+
+
+def _chunk_key(passage: Dict[str, Any]) -> Optional[Tuple[str, int]]:
+    metadata = passage['metadata']
+    source = metadata.get('file_id') or metadata.get('file_name') or metadata.get('url')
+    index = metadata.get('chunk_index')
+    if source is None or not isinstance(index, int):
+        return None
+    return str(source), index
+
+
+def _overlap(previous: str, following: str) -> int:
+    """Length of the longest suffix of ``previous`` that starts ``following``."""
+    limit = min(len(previous), len(following))
+    if limit < MIN_OVERLAP_CHARS:
+        return 0
+    probe = following[:MIN_OVERLAP_CHARS]
+    start = len(previous) - limit
+    while True:
+        pos = previous.find(probe, start)
+        if pos < 0:
+            return 0
+        if following.startswith(previous[pos:]):
+            return len(previous) - pos
+        start = pos + 1
+
+
+def _shingles(text: str, size: int = 3) -> Set[Tuple[str, ...]]:
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < size:
+        return {tuple(words)} if words else set()
+    return {tuple(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def _is_near_duplicate(shingles: Set[Tuple[str, ...]], kept: Iterable[Set[Tuple[str, ...]]], threshold: float) -> bool:
+    # Containment rather than Jaccard, so a passage quoted inside a longer
+    # one counts as a duplicate too
+    for other in kept:
+        smaller = min(len(shingles), len(other))
+        if smaller and len(shingles & other) / smaller >= threshold:
+            return True
+    return False
+
+
+def select_passages(
+    passages: Iterable[Any],
+    max_tokens: int,
+    dedup_threshold: float = 0.8,
+    separator_tokens: int = 1
+) -> List[Dict[str, Any]]:
+    """
+    Pick and merge passages for a prompt.
+
+    Args:
+        passages: Ranked results, Documents or web results
+        max_tokens: Token budget for the passage texts
+        dedup_threshold: Shingle containment above which a passage is a duplicate
+        separator_tokens: Budget charged per passage for separators/headers
+
+    Returns:
+        Passages (dicts with 'content', 'metadata', 'score', 'item') in
+        input order; a run of adjacent chunks is one passage whose 'content'
+        is the merged span and whose 'metadata' is its first chunk's
+    """
+    candidates = [_passage(item, i) for i, item in enumerate(passages)]
+    candidates = [p for p in candidates if p['content']]
+    ranked = sorted(
+        candidates,
+        key=lambda p: (-(p['score'] if p['score'] is not None else float('-inf')), p['position'])
+    )
+
+    selected: Dict[int, Dict[str, Any]] = {}
+    selected_keys: Dict[Tuple[str, int], int] = {}
+    kept_shingles: List[Set[Tuple[str, ...]]] = []
+    used = 0
+    for passage in ranked:
+        shingles = _shingles(passage['content'])
+        if _is_near_duplicate(shingles, kept_shingles, dedup_threshold):
+            continue
+
+        key = _chunk_key(passage)
+        text = passage['content']
+        shared = 0
+        if key is not None:
+            # Text shared with already selected neighbours costs nothing
+            previous = selected_keys.get((key[0], key[1] - 1))
+            following = selected_keys.get((key[0], key[1] + 1))
+            if previous is not None:
+                shared += _overlap(selected[previous]['content'], text)
+            if following is not None:
+                shared += _overlap(text, selected[following]['content'])
+        cost = estimate_tokens(text) - shared // CHARS_PER_TOKEN + separator_tokens
+
+        if used + cost > max_tokens:
+            if selected:
+                continue
+            # Never return an empty context because the best passage is too long
+            passage = {**passage, 'content': text[:max(0, max_tokens - separator_tokens) * CHARS_PER_TOKEN]}
+            cost = max_tokens
+
+        selected[passage['position']] = passage
+        kept_shingles.append(shingles)
+        if key is not None:
+            selected_keys[key] = passage['position']
+        used += cost
+
+    return _merge_runs(selected, selected_keys)
+
+
+def _merge_runs(
+    selected: Dict[int, Dict[str, Any]],
+    selected_keys: Dict[Tuple[str, int], int]
+) -> List[Dict[str, Any]]:
+    merged: List[Dict[str, Any]] = []
+    absorbed: Set[int] = set()
+    for position in sorted(selected):
+        if position in absorbed:
+            continue
+        passage = selected[position]
+        key = _chunk_key(passage)
+        if key is None:
+            merged.append(passage)
+            continue
+
+        # Extend to the whole run of selected neighbours
+        start = key[1]
+        while (key[0], start - 1) in selected_keys:
+            start -= 1
+        run = []
+        index = start
+        while (key[0], index) in selected_keys:
+            run.append(selected[selected_keys[(key[0], index)]])
+            index += 1
+
+        text = run[0]['content']
+        for chunk in run[1:]:
+            shared = _overlap(text, chunk['content'])
+            text += chunk['content'][shared:] if shared else "\n" + chunk['content']
+        absorbed.update(chunk['position'] for chunk in run)
+        merged.append({**run[0], 'content': text, 'score': passage['score']})
+    return merged
+
+
+def build_context(
+    passages: Iterable[Any],
+    max_tokens: int,
+    dedup_threshold: float = 0.8,
+    formatter: Optional[Callable[[int, Dict[str, Any]], str]] = None,
+    separator: str = "\n\n"
+) -> str:
+    """
+    Build prompt context from ranked passages under a token budget.
+
+    Args:
+        passages: Ranked results, Documents or web results
+        max_tokens: Token budget for the whole context
+        dedup_threshold: Shingle containment above which a passage is a duplicate
+        formatter: Optional ``(number, passage) -> text``, e.g. to add a source
+            header; defaults to the passage content
+        separator: Text between passages
+
+    Returns:
+        Context string
+    """
+    items = list(passages)
+    overhead = estimate_tokens(separator)
+    if formatter is not None and items:
+        probe = _passage(items[0], 0)
+        overhead += max(0, estimate_tokens(formatter(1, {**probe, 'content': ''})))
+    chosen = select_passages(items, max_tokens, dedup_threshold, separator_tokens=overhead)
+    render = formatter or (lambda _number, passage: passage['content'])
+    context = separator.join(render(i, passage) for i, passage in enumerate(chosen, 1))
+    logger.debug(
+        f"Context: {len(chosen)} of {len(items)} passages, ~{estimate_tokens(context)} of {max_tokens} tokens"
+    )
+    return context
@@ -9,11 +9,14 @@ Default: Ollama with nomic-embed-text model (completely free).
 """
 
 import logging
+import time
 from typing import List, Optional
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 # Ollama
 import requests
+from requests.adapters import HTTPAdapter
 
 # OpenAI (optional)
 try:
@@ -23,6 +26,7 @@ except ImportError:
     OPENAI_AVAILABLE = False
 
 from ..core.config import get_config
+from ..core.embedding_cache import get_embedding_cache, text_digest
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +61,11 @@ class OllamaEmbeddingService(BaseEmbeddingService):
     
     Uses local Ollama instance running in Docker.
     Model: nomic-embed-text (768 dimensions, 274MB)
+
+    Documents are embedded in batches through the multi-input ``/api/embed``
+    endpoint, with up to ``OLLAMA_EMBED_CONCURRENCY`` batches in flight over a
+    pooled keep-alive session. Set ``OLLAMA_EMBED_BATCH_SIZE=1`` to fall back
+    to one ``/api/embeddings`` call per text (older Ollama releases).
     """
     
     def __init__(self, config):
@@ -64,10 +73,19 @@ class OllamaEmbeddingService(BaseEmbeddingService):
         self.config = config
         self.base_url = config.ollama_base_url
         self.model = config.ollama_embedding_model
+        self.batch_size = int(getattr(config, 'ollama_embed_batch_size', 32))
+        self.concurrency = int(getattr(config, 'ollama_embed_concurrency', 4))
+        self.retry_attempts = int(getattr(config, 'ollama_embed_retry_attempts', 3))
+
+        # Persistent session sized for the number of in-flight batches
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, self.concurrency))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         
         # Verify Ollama is accessible
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=5)
             response.raise_for_status()
             logger.info(f"✅ Connected to Ollama at {self.base_url}")
         except Exception as e:
@@ -79,7 +97,7 @@ class OllamaEmbeddingService(BaseEmbeddingService):
     def embed_query(self, text: str) -> List[float]:
         """Generate embedding for a single query using Ollama."""
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/embeddings",
                 json={
                     "model": self.model,
@@ -100,18 +118,69 @@ class OllamaEmbeddingService(BaseEmbeddingService):
         except Exception as e:
             logger.error(f"Ollama embedding failed: {e}")
             raise EmbeddingError(f"Failed to generate embedding: {e}")
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed one batch through /api/embed, retrying with backoff."""
+        delay = 0.5
+        for attempt in range(1, self.retry_attempts + 1):
+            try:
+                response = self.session.post(
+                    f"{self.base_url}/api/embed",
+                    json={
+                        "model": self.model,
+                        "input": texts
+                    },
+                    timeout=300
+                )
+                response.raise_for_status()
+
+                embeddings = response.json().get('embeddings') or []
+                if len(embeddings) != len(texts):
+                    raise EmbeddingError(
+                        f"Ollama returned {len(embeddings)} embeddings for {len(texts)} inputs"
+                    )
+                return embeddings
+
+            except Exception as e:
+                if attempt >= self.retry_attempts:
+                    logger.error(f"Ollama batch embedding failed after {attempt} attempts: {e}")
+                    raise EmbeddingError(f"Failed to generate embeddings: {e}")
+                logger.warning(f"Ollama batch embedding attempt {attempt} failed, retrying: {e}")
+                time.sleep(delay)
+                delay = min(8.0, delay * 2)
     
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings for multiple documents using Ollama."""
-        embeddings = []
-        
-        for i, text in enumerate(texts):
-            if i % 10 == 0:
-                logger.debug(f"Generating embedding {i+1}/{len(texts)}...")
-            
-            embedding = self.embed_query(text)
-            embeddings.append(embedding)
-        
+        if not texts:
+            return []
+
+        if self.batch_size <= 1:
+            embeddings = []
+            for i, text in enumerate(texts):
+                if i % 10 == 0:
+                    logger.debug(f"Generating embedding {i+1}/{len(texts)}...")
+                embeddings.append(self.embed_query(text))
+            logger.info(f"✅ Generated {len(embeddings)} embeddings using Ollama")
+            return embeddings
+
+        batches = [
+            texts[i:i + self.batch_size]
+            for i in range(0, len(texts), self.batch_size)
+        ]
+        logger.debug(
+            f"Embedding {len(texts)} texts in {len(batches)} batches "
+            f"(batch_size={self.batch_size}, concurrency={self.concurrency})"
+        )
+
+        # executor.map preserves input order; max_workers bounds in-flight requests
+        workers = min(self.concurrency, len(batches))
+        if workers == 1:
+            results = [self._embed_batch(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                results = list(ex.map(self._embed_batch, batches))
+
+        embeddings = [emb for batch in results for emb in batch]
         logger.info(f"✅ Generated {len(embeddings)} embeddings using Ollama")
         return embeddings
     
@@ -192,9 +261,11 @@ class EmbeddingService:
     Unified embedding service with automatic backend selection.
     
     Automatically selects the appropriate embedding backend based on configuration.
+    Vectors are looked up in the persistent embedding cache first (keyed by
+    provider, model and sha256 of the text) so only unseen texts reach the backend.
     """
     
-    def __init__(self):
+    def __init__(self, cache=None):
         """Initialize embedding service with configured backend."""
         self.config = get_config()
         
@@ -209,6 +280,10 @@ class EmbeddingService:
             raise EmbeddingError(
                 f"Unsupported embedding provider: {self.config.embedding_provider}"
             )
+
+        self.provider = self.config.embedding_provider
+        self.model = getattr(self.backend, 'model', '')
+        self.cache = cache if cache is not None else get_embedding_cache()
     
     def embed_query(self, text: str) -> List[float]:
         """
@@ -220,7 +295,17 @@ class EmbeddingService:
         Returns:
             Embedding vector
         """
-        return self.backend.embed_query(text)
+        if self.cache is None:
+            return self.backend.embed_query(text)
+
+        digest = text_digest(text)
+        cached = self._cache_get([digest])
+        if digest in cached:
+            return cached[digest]
+
+        embedding = self.backend.embed_query(text)
+        self._cache_put({digest: embedding})
+        return embedding
     
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """
@@ -232,7 +317,39 @@ class EmbeddingService:
         Returns:
             List of embedding vectors
         """
-        return self.backend.embed_documents(texts)
+        if self.cache is None or not texts:
+            return self.backend.embed_documents(texts)
+
+        digests = [text_digest(t) for t in texts]
+        cached = self._cache_get(digests)
+
+        # Embed each distinct missing text once, preserving first-seen order
+        missing: dict = {}
+        for digest, text in zip(digests, texts):
+            if digest not in cached and digest not in missing:
+                missing[digest] = text
+
+        if missing:
+            fresh = self.backend.embed_documents(list(missing.values()))
+            computed = dict(zip(missing.keys(), fresh))
+            self._cache_put(computed)
+            cached.update(computed)
+            logger.debug(f"Embedding cache: {len(texts) - len(missing)} hits, {len(missing)} misses")
+
+        return [cached[d] for d in digests]
+
+    def _cache_get(self, digests: List[str]) -> dict:
+        try:
+            return self.cache.get_many(self.provider, self.model, digests)
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed: {e}")
+            return {}
+
+    def _cache_put(self, items: dict) -> None:
+        try:
+            self.cache.put_many(self.provider, self.model, items)
+        except Exception as e:
+            logger.warning(f"Embedding cache write failed: {e}")
     
     def get_embedding_dimension(self) -> int:
         """
@@ -0,0 +1,176 @@
+"""
+JAEGIS NexusSync - Extraction Process Pool
+
+Runs CPU-bound document parsers (PyPDF2, python-docx, BeautifulSoup, JSON
+flattening) in a reusable pool of worker processes, so they scale with cores
+instead of serializing behind the GIL, and never run on the API event loop.
+
+- Per-file timeout (EXTRACTION_TIMEOUT): a parser stuck on a pathological
+  file is killed and the pool restarted
+- Crash isolation: a worker dying mid-parse (segfault, OOM kill) fails only
+  that file; other files caught in the restart are retried once
+- Workers are started with ``spawn``, so forking a threaded process (API
+  server, ingestion pipeline) can never inherit a held lock
+
+EXTRACTION_PROCESSES=0 runs parsers inline on the calling thread.
+"""
+
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionError(Exception):
+    """Raised when an extraction worker crashes or the pool cannot run."""
+    pass
+
+
+class ExtractionTimeout(ExtractionError):
+    """Raised when a file takes longer than the extraction timeout."""
+    pass
+
+
+class ExtractionExecutor:
+    """
+    Process pool with per-task timeouts and crash isolation.
+
+    Args:
+        processes: Worker processes (0 runs tasks inline)
+        timeout: Seconds a single task may run; None for no limit
+    """
+
+    def __init__(self, processes: int, timeout: Optional[float] = None):
+        self.processes = max(0, int(processes))
+        self.timeout = timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._generation = 0
+        self._lock = threading.Lock()
+        # Submissions wait here, so a task's timeout starts when it starts running
+        self._slots = threading.BoundedSemaphore(max(1, self.processes))
+        self._stats = {'completed': 0, 'failed': 0, 'timeouts': 0, 'crashes': 0, 'restarts': 0, 'busy_seconds': 0.0}
+
+    def run(self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None) -> Any:
+        """
+        Run ``fn(*args)`` in a worker process and return its result.
+
+        ``fn`` and its arguments must be picklable (module-level functions).
+        Exceptions raised by ``fn`` are re-raised here.
+
+        Raises:
+            ExtractionTimeout: The task ran longer than ``timeout``
+            ExtractionError: The worker process died while running the task
+        """
+        timeout = self.timeout if timeout is None else timeout
+        if self.processes == 0:
+            return self._record(fn, args)
+
+        for attempt in (1, 2):
+            with self._slots:
+                executor, generation = self._pool()
+                started = time.perf_counter()
+                try:
+                    future = executor.submit(fn, *args)
+                    result = future.result(timeout=timeout)
+                except FutureTimeout:
+                    self._count('timeouts', time.perf_counter() - started)
+                    self._restart(generation)
+                    raise ExtractionTimeout(f"Extraction timed out after {timeout}s")
+                except BrokenProcessPool:
+                    self._count('crashes', time.perf_counter() - started)
+                    self._restart(generation)
+                    if attempt == 2:
+                        raise ExtractionError("Extraction worker crashed")
+                    # The worker may have died on another file: retry once on a fresh pool
+                    logger.warning("Extraction worker died, retrying on a fresh pool")
+                    continue
+                except Exception:
+                    self._count('failed', time.perf_counter() - started)
+                    raise
+                self._count('completed', time.perf_counter() - started)
+                return result
+
+    def _record(self, fn: Callable[..., Any], args: tuple) -> Any:
+        started = time.perf_counter()
+        try:
+            result = fn(*args)
+        except Exception:
+            self._count('failed', time.perf_counter() - started)
+            raise
+        self._count('completed', time.perf_counter() - started)
+        return result
+
+    def _count(self, outcome: str, seconds: float) -> None:
+        with self._lock:
+            self._stats[outcome] += 1
+            self._stats['busy_seconds'] += seconds
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+                logger.info(f"Started extraction pool with {self.processes} processes")
+            return self._executor, self._generation
+
+    def _restart(self, generation: int) -> None:
+        """Kill the pool a task failed on (once, however many tasks notice)."""
+        with self._lock:
+            if generation != self._generation or self._executor is None:
+                return
+            executor, self._executor = self._executor, None
+            self._generation += 1
+            self._stats['restarts'] += 1
+        # Shutdown alone would wait for a stuck parser; kill the workers
+        for process in list((getattr(executor, '_processes', None) or {}).values()):
+            try:
+                process.kill()
+            except Exception:
+                pass
+        executor.shutdown(wait=False, cancel_futures=True)
+        logger.warning("Extraction pool restarted")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'processes': self.processes, 'timeout': self.timeout, **self._stats}
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._generation += 1
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# Global executor instance
+_extraction_executor: Optional[ExtractionExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_extraction_executor() -> ExtractionExecutor:
+    """
+    Get the global extraction executor (sized by EXTRACTION_PROCESSES).
+
+    Returns:
+        ExtractionExecutor instance
+    """
+    global _extraction_executor
+
+    if _extraction_executor is None:
+        with _executor_lock:
+            if _extraction_executor is None:
+                from ..core.config import get_config
+                config = get_config()
+                _extraction_executor = ExtractionExecutor(
+                    getattr(config, 'extraction_processes', 0),
+                    getattr(config, 'extraction_timeout', None)
+                )
+
+    return _extraction_executor
@@ -21,6 +21,7 @@ import io
 
 from ..core.config import get_config
 from ..core.database import get_database
+from ..core.queue_signal import get_queue_signal
 
 logger = logging.getLogger(__name__)
 
@@ -391,7 +392,8 @@ class GoogleDriveService:
                         'modified_time': file.get('modifiedTime'),
                         'size': file.get('size'),
                         'web_view_link': file.get('webViewLink')
-                    }
+                    },
+                    notify=False
                 )
 
                 logger.info(f"Added to queue: {file['name']} (Queue ID: {queue_id})")
@@ -400,6 +402,10 @@ class GoogleDriveService:
             except Exception as e:
                 logger.error(f"Failed to add file to queue: {file['name']}: {e}")
 
+        # One wake-up for the whole change set
+        if count:
+            get_queue_signal().notify()
+
         return count
 
 
@@ -0,0 +1,412 @@
+"""
+JAEGIS NexusSync - Staged Ingestion Pipeline
+
+Ingests many files with every stage busy at once instead of one file at a time:
+
+    source -> extract (+ chunk, diff) -> embed -> upsert
+
+- extract: INGEST_EXTRACT_WORKERS files are extracted, chunked and diffed
+  against the index (``VectorStore.prepare_documents``) in parallel
+- embed: INGEST_EMBED_CONCURRENCY embedding calls in flight; chunks of small
+  files are packed into calls of up to INGEST_EMBED_BATCH_SIZE texts
+- upsert: finished files are written together (``VectorStore.write_documents``),
+  up to VECTOR_UPSERT_BATCH_SIZE chunks per write
+
+Stages are connected by queues of INGEST_QUEUE_SIZE files, so a fast stage
+blocks instead of buffering the whole import in memory (backpressure). A file
+whose chunks come as an iterator (large PDFs, see
+``ContentProcessor.stream_file``) travels in parts of INGEST_PART_CHUNKS
+chunks, so its first pages are embedded while later ones are still parsed and
+memory stays bounded by the queues, not by the document. A file that fails in
+any stage is reported through ``on_failure`` and does not stop the others.
+"""
+
+import itertools
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# End-of-stream marker, one per downstream worker
+_DONE = object()
+
+ExtractFn = Callable[[Any], Tuple[Union[List[Dict[str, Any]], Iterable[Dict[str, Any]]], Dict[str, Any]]]
+
+
+class IngestionError(Exception):
+    """Raised when the ingestion pipeline cannot run."""
+    pass
+
+
+class _StageQueue(queue.Queue):
+    """Bounded queue that remembers its high-water mark."""
+
+    def __init__(self, maxsize: int):
+        super().__init__(maxsize)
+        self.peak = 0
+
+    def _put(self, item):
+        super()._put(item)
+        self.peak = max(self.peak, len(self.queue))
+
+
+class _File:
+    """Progress of one item through the pipeline (possibly in several parts)."""
+
+    def __init__(self, item: Any):
+        self.item = item
+        self.parts: Dict[int, List[str]] = {}
+        self.sent = 0
+        self.pending = 0
+        self.extracted = False
+        self.failed = False
+        self.lock = threading.Lock()
+
+    def add_part(self) -> int:
+        with self.lock:
+            self.sent += 1
+            self.pending += 1
+            return self.sent - 1
+
+    def part_written(self, part: int, doc_ids: List[str]) -> bool:
+        """Record a written part; True once the whole file is in."""
+        with self.lock:
+            self.parts[part] = doc_ids
+            self.pending -= 1
+            return self.extracted and not self.pending and not self.failed
+
+    def extraction_done(self) -> bool:
+        """Record that every part was sent; True if all were already written."""
+        with self.lock:
+            self.extracted = True
+            return not self.pending and not self.failed
+
+    def fail(self) -> bool:
+        """Mark the file failed; True only for the first failure."""
+        with self.lock:
+            first, self.failed = not self.failed, True
+            return first
+
+    def doc_ids(self) -> List[str]:
+        return [doc_id for part in sorted(self.parts) for doc_id in self.parts[part]]
+
+
+class StageStats:
+    """Throughput counters of one pipeline stage."""
+
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+        self.items = 0
+        self.failed = 0
+        self.calls = 0
+        self.chunks = 0
+        self.busy_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, items: int = 1, chunks: int = 0, failed: int = 0) -> None:
+        with self._lock:
+            self.calls += 1
+            self.items += items
+            self.chunks += chunks
+            self.failed += failed
+            self.busy_seconds += seconds
+
+    def to_dict(self, elapsed: float, input_queue: Optional[_StageQueue] = None) -> Dict[str, Any]:
+        elapsed = max(elapsed, 1e-9)
+        return {
+            'workers': self.workers,
+            'items': self.items,
+            'failed': self.failed,
+            'calls': self.calls,
+            'chunks': self.chunks,
+            'busy_seconds': round(self.busy_seconds, 3),
+            'items_per_second': round(self.items / elapsed, 2),
+            'chunks_per_second': round(self.chunks / elapsed, 2),
+            # 1.0 = every worker busy for the whole run
+            'utilization': round(min(1.0, self.busy_seconds / (elapsed * self.workers)), 3),
+            'queue_peak': input_queue.peak if input_queue is not None else 0,
+        }
+
+
+class IngestionPipeline:
+    """
+    Extract, embed and upsert a stream of files with bounded queues between stages.
+
+    Args:
+        extract: ``item -> (chunks, metadata)``; chunks are dicts with a
+            'content' key (a list, or an iterator to stream the file in
+            parts), metadata is attached to every chunk (and its 'file_id'
+            keys incremental re-indexing)
+        vector_store: VectorStore (defaults to the global instance)
+        on_success: Called as ``on_success(item, doc_ids)`` once a file is indexed
+        on_failure: Called as ``on_failure(item, error)`` when a file fails
+        extract_workers / embed_concurrency / embed_batch_size / queue_size / part_chunks:
+            Override the INGEST_* settings
+    """
+
+    def __init__(
+        self,
+        extract: ExtractFn,
+        vector_store=None,
+        on_success: Optional[Callable[[Any, List[str]], None]] = None,
+        on_failure: Optional[Callable[[Any, Exception], None]] = None,
+        extract_workers: Optional[int] = None,
+        embed_concurrency: Optional[int] = None,
+        embed_batch_size: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        part_chunks: Optional[int] = None
+    ):
+        if vector_store is None:
+            from .vector_store import get_vector_store
+            vector_store = get_vector_store()
+        config = getattr(vector_store, 'config', None)
+
+        self.extract = extract
+        self.vector_store = vector_store
+        self.on_success = on_success
+        self.on_failure = on_failure
+        self.extract_workers = max(1, extract_workers or getattr(config, 'ingest_extract_workers', 4))
+        self.embed_concurrency = max(1, embed_concurrency or getattr(config, 'ingest_embed_concurrency', 4))
+        self.embed_batch_size = max(1, embed_batch_size or getattr(config, 'ingest_embed_batch_size', 64))
+        self.upsert_batch_size = max(1, getattr(config, 'vector_upsert_batch_size', 256))
+        self.queue_size = max(1, queue_size or getattr(config, 'ingest_queue_size', 16))
+        self.part_chunks = max(1, part_chunks or getattr(config, 'ingest_part_chunks', 128))
+
+    def run(self, items: Iterable[Any]) -> Dict[str, Any]:
+        """
+        Ingest ``items`` and block until every one succeeded or failed.
+
+        Returns:
+            Dictionary with 'succeeded', 'failed', 'elapsed' and per-stage
+            'stages' metrics (items, chunks, throughput, utilization, queue peak)
+        """
+        extract_q = _StageQueue(self.queue_size)
+        embed_q = _StageQueue(self.queue_size)
+        upsert_q = _StageQueue(self.queue_size)
+        stats = {
+            'extract': StageStats('extract', self.extract_workers),
+            'embed': StageStats('embed', self.embed_concurrency),
+            'upsert': StageStats('upsert', 1),
+        }
+        outcome = {'succeeded': 0, 'failed': 0}
+        outcome_lock = threading.Lock()
+
+        def succeed(file: _File) -> None:
+            with outcome_lock:
+                outcome['succeeded'] += 1
+            if self.on_success:
+                try:
+                    self.on_success(file.item, file.doc_ids())
+                except Exception as e:
+                    logger.error(f"Ingestion success callback failed: {e}")
+
+        def fail(file: _File, error: Exception) -> None:
+            if not file.fail():
+                return
+            logger.error(f"Failed to ingest {file.item!r}: {error}")
+            with outcome_lock:
+                outcome['failed'] += 1
+            if self.on_failure:
+                try:
+                    self.on_failure(file.item, error)
+                except Exception as e:
+                    logger.error(f"Ingestion failure callback failed: {e}")
+
+        def feed() -> None:
+            try:
+                for item in items:
+                    extract_q.put(item)
+            except Exception as e:
+                logger.error(f"Ingestion source failed: {e}")
+            finally:
+                for _ in range(self.extract_workers):
+                    extract_q.put(_DONE)
+
+        remaining_extractors = [self.extract_workers]
+        remaining_lock = threading.Lock()
+
+        def extract_file(file: _File) -> None:
+            started = time.perf_counter()
+            busy = 0.0
+            chunks = 0
+            try:
+                documents, metadata = self.extract(file.item)
+                if isinstance(documents, list):
+                    parts = iter([documents])
+                else:
+                    # Streamed file: parts go downstream while later ones are parsed
+                    source = iter(documents)
+                    parts = iter(lambda: list(itertools.islice(source, self.part_chunks)), [])
+                    parts = itertools.chain(parts, [[]])
+                for part in parts:
+                    final = not part or isinstance(documents, list)
+                    prepared = self.vector_store.prepare_documents(part, metadata, offset=chunks, final=final)
+                    chunks += len(part)
+                    busy += time.perf_counter() - started
+                    embed_q.put((file, file.add_part(), prepared))
+                    started = time.perf_counter()
+                    if final:
+                        break
+            except Exception as e:
+                stats['extract'].record(busy + time.perf_counter() - started, failed=1)
+                fail(file, e)
+                return
+            stats['extract'].record(busy + time.perf_counter() - started, chunks=chunks)
+            if file.extraction_done():
+                succeed(file)
+
+        def extract_worker() -> None:
+            while True:
+                item = extract_q.get()
+                if item is _DONE:
+                    break
+                extract_file(_File(item))
+            with remaining_lock:
+                remaining_extractors[0] -= 1
+                last = remaining_extractors[0] == 0
+            if last:
+                for _ in range(self.embed_concurrency):
+                    embed_q.put(_DONE)
+
+        def embed_worker() -> None:
+            from .vector_store import pending_texts
+
+            done = False
+            while not done:
+                job = embed_q.get()
+                if job is _DONE:
+                    break
+                # Pack whatever else is already waiting into the same call
+                batch = [job]
+                size = len(job[2]['changed'])
+                while size < self.embed_batch_size:
+                    try:
+                        job = embed_q.get_nowait()
+                    except queue.Empty:
+                        break
+                    if job is _DONE:
+                        done = True
+                        break
+                    batch.append(job)
+                    size += len(job[2]['changed'])
+                batch = [job for job in batch if not job[0].failed]
+
+                started = time.perf_counter()
+                try:
+                    texts = [text for _, _, prepared in batch for text in pending_texts(prepared)]
+                    vectors = self.vector_store.embedding_service.embed_documents(texts) if texts else []
+                except Exception as e:
+                    stats['embed'].record(time.perf_counter() - started, items=0, failed=len(batch))
+                    for file, _, _ in batch:
+                        fail(file, e)
+                    continue
+                stats['embed'].record(time.perf_counter() - started, items=len(batch), chunks=len(texts))
+
+                offset = 0
+                embedded = []
+                for file, part, prepared in batch:
+                    count = len(prepared['changed'])
+                    embedded.append((file, part, prepared, vectors[offset:offset + count]))
+                    offset += count
+                if embedded:
+                    upsert_q.put(embedded)
+            upsert_q.put(_DONE)
+
+        threads = [threading.Thread(target=feed, name="ingest-feed", daemon=True)]
+        threads += [
+            threading.Thread(target=extract_worker, name=f"ingest-extract-{i}", daemon=True)
+            for i in range(self.extract_workers)
+        ]
+        threads += [
+            threading.Thread(target=embed_worker, name=f"ingest-embed-{i}", daemon=True)
+            for i in range(self.embed_concurrency)
+        ]
+
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+
+        # Upserts run on the calling thread: backend and metadata writes are serialized anyway
+        remaining_embedders = self.embed_concurrency
+        while remaining_embedders:
+            embedded = upsert_q.get()
+            if embedded is _DONE:
+                remaining_embedders -= 1
+                continue
+            # Drain finished parts up to one write batch
+            while sum(len(p['changed']) for _, _, p, _ in embedded) < self.upsert_batch_size:
+                try:
+                    more = upsert_q.get_nowait()
+                except queue.Empty:
+                    break
+                if more is _DONE:
+                    remaining_embedders -= 1
+                    continue
+                embedded.extend(more)
+            self._upsert([entry for entry in embedded if not entry[0].failed], stats['upsert'], succeed, fail)
+
+        for thread in threads:
+            thread.join()
+
+        elapsed = time.perf_counter() - started
+        summary = {
+            **outcome,
+            'elapsed': round(elapsed, 3),
+            'stages': {
+                'extract': stats['extract'].to_dict(elapsed, extract_q),
+                'embed': stats['embed'].to_dict(elapsed, embed_q),
+                'upsert': stats['upsert'].to_dict(elapsed, upsert_q),
+            },
+        }
+        logger.info(
+            f"✅ Ingested {outcome['succeeded']} files ({outcome['failed']} failed) in {elapsed:.1f}s - "
+            + ", ".join(
+                f"{name}: {s['chunks_per_second']} chunks/s, {s['utilization']:.0%} busy"
+                for name, s in summary['stages'].items()
+            )
+        )
+        return summary
+
+    def _upsert(
+        self,
+        embedded: List[Tuple[_File, int, Dict[str, Any], List[List[float]]]],
+        stats: StageStats,
+        succeed: Callable[[_File], None],
+        fail: Callable[[_File, Exception], None]
+    ) -> None:
+        if not embedded:
+            return
+        started = time.perf_counter()
+        chunks = sum(len(p['changed']) for _, _, p, _ in embedded)
+        try:
+            self.vector_store.write_documents([p for _, _, p, _ in embedded], [v for _, _, _, v in embedded])
+        except Exception as e:
+            if len(embedded) == 1:
+                stats.record(time.perf_counter() - started, items=0, failed=1)
+                fail(embedded[0][0], e)
+                return
+            # Find the file that broke the batch; the others still go in
+            logger.warning(f"Batched upsert of {len(embedded)} parts failed ({e}), retrying one by one")
+            stats.record(time.perf_counter() - started, items=0)
+            for entry in embedded:
+                self._upsert([entry], stats, succeed, fail)
+            return
+        stats.record(time.perf_counter() - started, items=len(embedded), chunks=chunks)
+        for file, part, prepared, _ in embedded:
+            if file.part_written(part, prepared['doc_ids']):
+                succeed(file)
+
+
+def ingest(
+    items: Iterable[Any],
+    extract: ExtractFn,
+    on_success: Optional[Callable[[Any, List[str]], None]] = None,
+    on_failure: Optional[Callable[[Any, Exception], None]] = None,
+    **options: Any
+) -> Dict[str, Any]:
+    """Run ``items`` through an ``IngestionPipeline`` on the global vector store."""
+    return IngestionPipeline(extract, on_success=on_success, on_failure=on_failure, **options).run(items)
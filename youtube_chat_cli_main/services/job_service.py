@@ -0,0 +1,195 @@
+"""
+JAEGIS NexusSync - Background Job Service
+
+Runs long operations (podcast generation, batch research, ...) outside the
+HTTP request that started them. Jobs are durable rows in the SQLite ``jobs``
+table; each job type runs on its own bounded worker pool so, for example, a
+queue of podcast renders cannot starve research jobs.
+
+Handlers are plain functions ``handler(params, progress) -> dict`` registered
+with ``register_job_handler``. ``progress(fraction, message)`` persists
+progress so clients can poll ``GET /api/v1/jobs/{id}`` or follow the SSE
+stream at ``GET /api/v1/jobs/{id}/events``.
+
+Every job is owned by the service that runs it, which heartbeats its jobs
+while it is alive. Unfinished jobs are only taken over (``resume_unfinished``)
+once their owner's heartbeat is older than JOB_STALE_SECONDS, so several
+processes sharing the database never run the same job twice.
+"""
+
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from ..core.config import get_config
+from ..core.database import get_database, queue_worker_id
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+ProgressCallback = Callable[[float, Optional[str]], None]
+JobHandler = Callable[[Dict[str, Any], ProgressCallback], Optional[Dict[str, Any]]]
+
+_HANDLERS: Dict[str, JobHandler] = {}
+
+
+class JobError(Exception):
+    """Raised when a job cannot be submitted or found."""
+    pass
+
+
+def register_job_handler(job_type: str, handler: JobHandler) -> None:
+    """Register the function that executes jobs of ``job_type``."""
+    _HANDLERS[job_type] = handler
+
+
+class JobService:
+    """
+    Durable job runner with per-type concurrency limits.
+
+    Args:
+        db: Database instance (defaults to the global database)
+    """
+
+    def __init__(self, db=None):
+        self.db = db or get_database()
+        self.config = get_config()
+        self.owner = queue_worker_id(f"jobs-{uuid.uuid4().hex[:8]}")
+        self._pools: Dict[str, ThreadPoolExecutor] = {}
+        self._lock = threading.Lock()
+        self._heartbeat: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def _pool_for(self, job_type: str) -> ThreadPoolExecutor:
+        self._start_heartbeat()
+        with self._lock:
+            pool = self._pools.get(job_type)
+            if pool is None:
+                workers = self.config.job_concurrency.get(job_type, 1)
+                pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"job-{job_type}")
+                self._pools[job_type] = pool
+                logger.info(f"Job pool '{job_type}' started with concurrency {workers}")
+            return pool
+
+    def _start_heartbeat(self) -> None:
+        with self._lock:
+            if self._heartbeat is None:
+                self._stop.clear()
+                self._heartbeat = threading.Thread(target=self._beat, name="job-heartbeat", daemon=True)
+                self._heartbeat.start()
+
+    def _beat(self) -> None:
+        # Keep our jobs alive and pick up jobs of services that stopped heartbeating
+        while not self._stop.wait(self.config.job_stale_seconds / 3):
+            try:
+                self.db.renew_job_heartbeats(self.owner)
+                self.resume_unfinished()
+            except Exception as e:
+                logger.warning(f"Job heartbeat for {self.owner} failed: {e}")
+
+    def submit(self, job_type: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Persist and schedule a job.
+
+        Args:
+            job_type: Registered job type
+            params: JSON-serializable job parameters
+
+        Returns:
+            Job ID
+        """
+        if job_type not in _HANDLERS:
+            raise JobError(f"Unknown job type: {job_type}")
+
+        job_id = str(uuid.uuid4())
+        self.db.create_job(job_id, job_type, params or {}, owner=self.owner)
+        self._pool_for(job_type).submit(self._run, job_id, job_type, params or {})
+        logger.info(f"Queued {job_type} job {job_id}")
+        return job_id
+
+    def _run(self, job_id: str, job_type: str, params: Dict[str, Any]) -> None:
+        handler = _HANDLERS[job_type]
+        if not self.db.update_job(job_id, status='running', progress=0.0, message='Started', owner=self.owner):
+            logger.warning(f"Job {job_id} was taken over by another process; not running it")
+            return
+
+        def progress(fraction: float, message: Optional[str] = None) -> None:
+            try:
+                self.db.update_job(job_id, progress=fraction, message=message, owner=self.owner)
+            except Exception as e:
+                logger.warning(f"Failed to record progress for job {job_id}: {e}")
+
+        try:
+            result = handler(params, progress)
+            outcome = dict(status='completed', progress=1.0, message='Completed', result=result or {})
+        except Exception as e:
+            logger.error(f"Job {job_id} ({job_type}) failed: {e}")
+            outcome = dict(status='failed', message='Failed', error_message=str(e))
+        if not self.db.update_job(job_id, owner=self.owner, **outcome):
+            logger.warning(f"Job {job_id} was taken over by another process; discarding its {outcome['status']} result")
+        elif outcome['status'] == 'completed':
+            logger.info(f"✅ Job {job_id} ({job_type}) completed")
+
+    def resume_unfinished(self) -> int:
+        """
+        Take over and re-schedule jobs left queued or running by a dead process.
+
+        Only jobs whose owner stopped heartbeating are claimed; the claim is
+        atomic, so concurrent services resume each job once.
+
+        Returns:
+            Number of jobs re-scheduled
+        """
+        self._start_heartbeat()
+        resumed = 0
+        for job in self.db.claim_stale_jobs(self.owner, self.config.job_stale_seconds, list(_HANDLERS)):
+            job_type = job['job_type']
+            params = job.get('params') if isinstance(job.get('params'), dict) else {}
+            self._pool_for(job_type).submit(self._run, job['id'], job_type, params)
+            resumed += 1
+        if resumed:
+            logger.info(f"Resumed {resumed} unfinished jobs")
+        return resumed
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get job state, or None if unknown."""
+        return self.db.get_job(job_id)
+
+    def list(self, job_type: Optional[str] = None, status: Optional[str] = None, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        """List jobs, newest first."""
+        return self.db.list_jobs(job_type=job_type, status=status, limit=limit, offset=offset)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting work; running jobs finish (or resume on next start)."""
+        self._stop.set()
+        with self._lock:
+            heartbeat, self._heartbeat = self._heartbeat, None
+        if heartbeat is not None:
+            heartbeat.join()
+        with self._lock:
+            for pool in self._pools.values():
+                pool.shutdown(wait=wait)
+            self._pools.clear()
+
+
+# Global service instance
+_job_service: Optional[JobService] = None
+
+
+def get_job_service() -> JobService:
+    """
+    Get the global job service instance.
+
+    Returns:
+        JobService instance
+    """
+    global _job_service
+
+    if _job_service is None:
+        _job_service = JobService()
+        logger.info("Job service instance created")
+
+    return _job_service
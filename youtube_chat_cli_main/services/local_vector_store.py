@@ -0,0 +1,762 @@
+"""
+JAEGIS NexusSync - Local Vector Store
+
+Single-node vector store for CLI and small deployments: no server and no
+ChromaDB. Embeddings are L2-normalized and kept in a memory-mapped array file
+(float32, or float16 to halve disk and page-cache use); ids, chunk text and
+payloads live in a SQLite side table.
+
+Search is a blocked matrix multiply over the mapped vectors with
+``argpartition`` top-k, batched across queries. Above a size threshold an IVF
+coarse index (spherical k-means centroids + inverted lists) restricts each
+query to the vectors of its ``nprobe`` nearest lists.
+
+Collections can be quantized (int8 or binary, fixed per collection when it is
+created). The first pass then scans only the compact codes; the full-precision
+vectors are read for the ``top_k * oversampling`` candidates only, to rescore
+them, so they can stay on disk.
+
+Files per collection under ``LOCAL_VECTOR_STORE_PATH``:
+    <name>.f32 / <name>.f16   vectors, one row per slot
+    <name>.int8 (+ .scale)    int8 codes and per-vector scales (if quantized)
+    <name>.binary             sign bits, dim / 8 bytes per vector (if quantized)
+    <name>.sqlite             points(slot, id, content, payload) and settings
+    <name>.ivf.npz            IVF centroids and list assignments (if built)
+"""
+
+import contextlib
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .vector_filters import INDEXED_FIELDS, TAG_FIELD, json_field, to_sql_where
+from .vector_store import QUANTIZATION_MODES, BaseVectorStore, VectorStoreError, point_ids
+
+logger = logging.getLogger(__name__)
+
+# Rows multiplied per block during exact search; bounds temporary memory
+SEARCH_BLOCK_ROWS = 65536
+
+# Compact the vector file once more than this fraction of slots are deleted
+COMPACT_DEAD_FRACTION = 0.5
+
+# Lock-free search attempts before searching under the lock (compaction races)
+SEARCH_ATTEMPTS = 3
+
+# Set bits per byte value, for Hamming distances between packed sign bits
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.uint8)
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class _IVFIndex:
+    """Coarse quantizer: centroids plus the list each slot belongs to."""
+
+    def __init__(self, centroids: np.ndarray, assignments: np.ndarray, trained_on: int):
+        self.centroids = centroids
+        self.assignments = assignments
+        self.trained_on = trained_on
+        self._order: Optional[np.ndarray] = None
+        self._offsets: Optional[np.ndarray] = None
+
+    @property
+    def n_lists(self) -> int:
+        return len(self.centroids)
+
+    @classmethod
+    def train(cls, vectors: np.ndarray, live: np.ndarray, iterations: int = 10) -> "_IVFIndex":
+        live_slots = np.flatnonzero(live)
+        n_lists = int(min(4096, max(16, math.sqrt(len(live_slots)))))
+        rng = np.random.default_rng(0)
+        sample_size = min(len(live_slots), n_lists * 64)
+        sample = np.asarray(vectors[np.sort(rng.choice(live_slots, sample_size, replace=False))], dtype=np.float32)
+
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+        for _ in range(iterations):
+            nearest = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, nearest, sample)
+            filled = np.bincount(nearest, minlength=n_lists) > 0
+            centroids[filled] = _normalize(sums[filled])
+
+        index = cls(centroids, np.zeros(0, dtype=np.int32), trained_on=len(live_slots))
+        index.assign(vectors, 0, len(vectors))
+        return index
+
+    def assign(self, vectors: np.ndarray, start: int, end: int) -> None:
+        """Assign slots [start, end) to their nearest centroid."""
+        if end > len(self.assignments):
+            grown = np.zeros(end, dtype=np.int32)
+            grown[:len(self.assignments)] = self.assignments
+            self.assignments = grown
+        for block in range(start, end, SEARCH_BLOCK_ROWS):
+            stop = min(end, block + SEARCH_BLOCK_ROWS)
+            rows = np.asarray(vectors[block:stop], dtype=np.float32)
+            self.assignments[block:stop] = np.argmax(rows @ self.centroids.T, axis=1)
+        self._order = self._offsets = None
+
+    def reassign(self, vectors: np.ndarray, slots: Sequence[int]) -> None:
+        """Re-assign overwritten slots, whose vectors changed, to their nearest centroid."""
+        slots = np.sort(np.asarray(slots, dtype=np.int64))
+        if len(slots) == 0:
+            return
+        rows = np.asarray(vectors[slots], dtype=np.float32)
+        self.assignments[slots] = np.argmax(rows @ self.centroids.T, axis=1)
+        self._order = self._offsets = None
+
+    def probe(self, queries: np.ndarray, nprobe: int, count: int) -> List[np.ndarray]:
+        """Candidate slots for each query: members of its nprobe nearest lists."""
+        if self._order is None or len(self._order) != count:
+            assignments = self.assignments[:count]
+            self._order = np.argsort(assignments, kind='stable')
+            self._offsets = np.searchsorted(assignments[self._order], np.arange(self.n_lists + 1))
+        nprobe = min(nprobe, self.n_lists)
+        nearest = np.argpartition(-(queries @ self.centroids.T), nprobe - 1, axis=1)[:, :nprobe]
+        return [
+            np.concatenate([self._order[self._offsets[c]:self._offsets[c + 1]] for c in lists])
+            for lists in nearest
+        ]
+
+
+class _Quantizer:
+    """
+    Compressed copy of the vectors for the approximate first pass.
+
+    int8 scales each vector by its largest component into [-127, 127] (dim
+    bytes + a float32 scale, ~4x smaller than float32); binary keeps one
+    sign bit per dimension (dim / 8 bytes, 32x smaller) and scores by
+    Hamming distance.
+    """
+
+    def __init__(self, mode: str, prefix: Path, dim: int):
+        self.mode = mode
+        self.dim = dim
+        self.width = dim if mode == 'int8' else (dim + 7) // 8
+        self.code_dtype = np.dtype(np.int8 if mode == 'int8' else np.uint8)
+        self.code_path = Path(f"{prefix}.{mode}")
+        self.scale_path = Path(f"{prefix}.{mode}.scale")
+        self.codes: Optional[np.ndarray] = None
+        self.scales: Optional[np.ndarray] = None
+
+    @property
+    def bytes_per_vector(self) -> int:
+        return self.width * self.code_dtype.itemsize + (4 if self.mode == 'int8' else 0)
+
+    @staticmethod
+    def _map_file(path: Path, dtype: np.dtype, shape: Tuple[int, ...]) -> np.ndarray:
+        size = int(np.prod(shape)) * dtype.itemsize
+        if not path.exists() or path.stat().st_size < size:
+            with open(path, 'ab') as f:
+                f.truncate(size)
+        return np.memmap(path, dtype=dtype, mode='r+', shape=shape)
+
+    def map(self, capacity: int) -> None:
+        self.codes = self._map_file(self.code_path, self.code_dtype, (capacity, self.width))
+        if self.mode == 'int8':
+            self.scales = self._map_file(self.scale_path, np.dtype(np.float32), (capacity,))
+
+    def store(self, slots, vectors: np.ndarray) -> None:
+        """Encode normalized float32 vectors into the given slots."""
+        if self.mode == 'int8':
+            scale = np.abs(vectors).max(axis=1)
+            scale[scale == 0] = 1.0
+            self.codes[slots] = np.rint(vectors / scale[:, None] * 127)
+            self.scales[slots] = scale / 127
+        else:
+            self.codes[slots] = np.packbits(vectors > 0, axis=1)
+
+    def encode_range(self, vectors: np.ndarray, start: int, end: int) -> None:
+        for block in range(start, end, SEARCH_BLOCK_ROWS):
+            stop = min(end, block + SEARCH_BLOCK_ROWS)
+            self.store(slice(block, stop), np.asarray(vectors[block:stop], dtype=np.float32))
+        self.flush()
+
+    def scorer(self) -> Callable[[Any, np.ndarray], np.ndarray]:
+        """
+        Approximate cosine similarity ``score(rows, queries)`` on the current codes.
+
+        The function keeps its own references to the code arrays, so a
+        search that outlives a ``remove()`` or re-encode (compaction, mode
+        change) still reads a consistent, if outdated, set of codes.
+        """
+        codes, scales, mode, dim = self.codes, self.scales, self.mode, self.dim
+
+        def scores(rows, queries: np.ndarray) -> np.ndarray:
+            row_codes = codes[rows]
+            if mode == 'int8':
+                return (queries @ row_codes.astype(np.float32).T) * scales[rows]
+            result = np.empty((len(queries), len(row_codes)), dtype=np.float32)
+            for i, query_bits in enumerate(np.packbits(queries > 0, axis=1)):
+                distance = _POPCOUNT[np.bitwise_xor(row_codes, query_bits)].sum(axis=1, dtype=np.int32)
+                result[i] = 1.0 - 2.0 * distance / dim
+            return result
+
+        return scores
+
+    def flush(self) -> None:
+        for array in (self.codes, self.scales):
+            if array is not None:
+                array.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self.codes = self.scales = None
+
+    def remove(self) -> None:
+        self.close()
+        for path in (self.code_path, self.scale_path):
+            if path.exists():
+                path.unlink()
+
+
+class LocalVectorStore(BaseVectorStore):
+    """
+    Memory-mapped NumPy vector store with SQLite payloads.
+
+    Deleted points leave holes that are skipped at search time; the vector
+    file is compacted once more than half of its slots are dead.
+    """
+
+    def __init__(self, config):
+        """Open (or create) the configured local collection."""
+        self.config = config
+        self.root = Path(config.local_vector_store_path)
+        self.dtype = np.dtype(np.float16 if config.local_vector_dtype == 'float16' else np.float32)
+        self.ivf_threshold = config.local_vector_ivf_threshold
+        self.ivf_nprobe = config.local_vector_ivf_nprobe
+        self.default_quantization = getattr(config, 'vector_quantization', 'none')
+        self.oversampling = max(1.0, float(getattr(config, 'vector_quantization_oversampling', 4.0)))
+        self._quantizer: Optional[_Quantizer] = None
+        self._lock = threading.RLock()
+        self._db: Optional[sqlite3.Connection] = None
+
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._open(config.local_vector_collection_name)
+            logger.info(f"✅ Local vector store at {self.root} ({self.collection_name}, {self._live_count} points)")
+        except VectorStoreError:
+            raise
+        except Exception as e:
+            raise VectorStoreError(f"Failed to open local vector store: {e}")
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _open(self, collection_name: str) -> None:
+        if self._db is not None:
+            self.close()
+        self.collection_name = collection_name
+        self._db = sqlite3.connect(str(self.root / f"{collection_name}.sqlite"), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS points (
+                slot INTEGER PRIMARY KEY,
+                id TEXT NOT NULL UNIQUE,
+                content TEXT,
+                payload TEXT
+            )
+        """)
+        self._db.execute("CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT)")
+        # Expression indexes for the hot filter fields (tags stay tag_<name> keys here)
+        for field in INDEXED_FIELDS:
+            if field != TAG_FIELD:
+                self._db.execute(f"CREATE INDEX IF NOT EXISTS points_{field} ON points({json_field(field)})")
+        self._db.commit()
+
+        settings = dict(self._db.execute("SELECT key, value FROM settings").fetchall())
+        if settings.get('dtype') and settings['dtype'] != self.dtype.name:
+            logger.warning(f"Collection {collection_name} stores {settings['dtype']}; ignoring LOCAL_VECTOR_DTYPE")
+            self.dtype = np.dtype(settings['dtype'])
+        self.dim: Optional[int] = int(settings['dim']) if settings.get('dim') else None
+        self._count = int(settings.get('count', 0))
+        self.quantization = settings.get('quantization') or self.default_quantization
+        self._quantizer = None
+
+        self._slot_of: Dict[str, int] = {}
+        for slot, point_id in self._db.execute("SELECT slot, id FROM points"):
+            self._slot_of[point_id] = slot
+        self._vectors: Optional[np.ndarray] = None
+        self._live = np.zeros(0, dtype=bool)
+        if self.dim:
+            self._map()
+            self._live = np.zeros(len(self._vectors), dtype=bool)
+            self._live[list(self._slot_of.values())] = True
+            if 'quantization' not in settings:
+                # Collection from before quantization: adopt the configured mode
+                self._set_quantization(self.quantization)
+        self._ivf = self._load_ivf()
+        # Slot numbers are only meaningful within one layout (see search_many)
+        self._epoch = getattr(self, '_epoch', 0) + 1
+
+    @property
+    def _vector_path(self) -> Path:
+        suffix = 'f16' if self.dtype == np.float16 else 'f32'
+        return self.root / f"{self.collection_name}.{suffix}"
+
+    @property
+    def _ivf_path(self) -> Path:
+        return self.root / f"{self.collection_name}.ivf.npz"
+
+    @property
+    def _live_count(self) -> int:
+        return len(self._slot_of)
+
+    def _map(self) -> None:
+        row_bytes = self.dim * self.dtype.itemsize
+        path = self._vector_path
+        if not path.exists() or path.stat().st_size < row_bytes:
+            with open(path, 'ab') as f:
+                f.truncate(row_bytes * 1024)
+        capacity = path.stat().st_size // row_bytes
+        self._vectors = np.memmap(path, dtype=self.dtype, mode='r+', shape=(capacity, self.dim))
+        if self.quantization != 'none':
+            if self._quantizer is None:
+                self._quantizer = _Quantizer(self.quantization, self.root / self.collection_name, self.dim)
+            self._quantizer.map(capacity)
+
+    def _ensure_capacity(self, needed: int) -> None:
+        capacity = len(self._vectors)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        self._vectors.flush()
+        if self._quantizer is not None:
+            self._quantizer.flush()
+        with open(self._vector_path, 'r+b') as f:
+            f.truncate(new_capacity * self.dim * self.dtype.itemsize)
+        self._map()
+        live = np.zeros(new_capacity, dtype=bool)
+        live[:len(self._live)] = self._live
+        self._live = live
+
+    def _set_settings(self, **values: Any) -> None:
+        self._db.executemany(
+            "INSERT INTO settings (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            [(k, str(v)) for k, v in values.items()]
+        )
+
+    def _set_quantization(self, mode: str) -> None:
+        if self._quantizer is not None:
+            self._quantizer.remove()
+            self._quantizer = None
+        self.quantization = mode
+        self._set_settings(quantization=mode)
+        self._db.commit()
+        if self.dim:
+            self._map()
+            if self._quantizer is not None:
+                self._quantizer.encode_range(self._vectors, 0, self._count)
+
+    def _load_ivf(self) -> Optional[_IVFIndex]:
+        if not self.dim or not self._ivf_path.exists():
+            return None
+        try:
+            data = np.load(self._ivf_path)
+            index = _IVFIndex(data['centroids'], data['assignments'], int(data['trained_on']))
+            if index.centroids.shape[1] != self.dim:
+                return None
+            if len(index.assignments) < self._count:
+                index.assign(self._vectors, len(index.assignments), self._count)
+            return index
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable IVF index {self._ivf_path}: {e}")
+            return None
+
+    def _maybe_build_ivf(self) -> None:
+        live = self._live_count
+        if live < self.ivf_threshold:
+            return
+        if self._ivf is not None and live < 2 * self._ivf.trained_on:
+            return
+        logger.info(f"Building IVF index over {live} vectors")
+        self._ivf = _IVFIndex.train(self._vectors[:self._count], self._live[:self._count])
+        self._save_ivf()
+        logger.info(f"✅ IVF index built ({self._ivf.n_lists} lists)")
+
+    def _save_ivf(self) -> None:
+        np.savez(
+            self._ivf_path,
+            centroids=self._ivf.centroids,
+            assignments=self._ivf.assignments[:self._count],
+            trained_on=self._ivf.trained_on,
+        )
+
+    # ------------------------------------------------------------------
+    # BaseVectorStore
+    # ------------------------------------------------------------------
+
+    def create_collection(self, collection_name: str, vector_size: int, quantization: Optional[str] = None) -> None:
+        """Open or create a local collection."""
+        if quantization is not None and quantization not in QUANTIZATION_MODES:
+            raise VectorStoreError(f"Unsupported quantization: {quantization}")
+        with self._lock:
+            if collection_name != self.collection_name:
+                self._open(collection_name)
+            if self.dim is None:
+                self.dim = vector_size
+                self.quantization = quantization or self.quantization
+                self._set_settings(dim=vector_size, dtype=self.dtype.name, count=self._count,
+                                   quantization=self.quantization)
+                self._db.commit()
+                self._map()
+                self._live = np.zeros(len(self._vectors), dtype=bool)
+            elif self.dim != vector_size:
+                raise VectorStoreError(f"Collection {collection_name} has dimension {self.dim}, not {vector_size}")
+            elif quantization is not None and quantization != self.quantization:
+                self.set_quantization(quantization)
+        logger.info(f"✅ Local collection ready: {collection_name} (quantization: {self.quantization})")
+
+    def set_quantization(self, mode: str) -> None:
+        """Change the collection's quantization, re-encoding every vector."""
+        if mode not in QUANTIZATION_MODES:
+            raise VectorStoreError(f"Unsupported quantization: {mode}")
+        with self._lock:
+            self._set_quantization(mode)
+        logger.info(f"✅ Quantization of {self.collection_name} set to {mode}")
+
+    @staticmethod
+    def _payload(metadata: Optional[Dict[str, Any]], doc: Dict[str, Any]) -> Dict[str, Any]:
+        payload = {**(metadata or {}), **doc.get('metadata', {})}
+        # Same tag expansion as ChromaDB so tag_<name>=1 filters work everywhere
+        tags = payload.get('tags')
+        if isinstance(tags, list):
+            for tag in tags:
+                if isinstance(tag, str) and tag.strip():
+                    payload[f"tag_{tag.strip().lower()}"] = 1
+        return payload
+
+    def add_documents(
+        self,
+        documents: List[Dict[str, Any]],
+        embeddings: List[List[float]],
+        metadata: Optional[Dict[str, Any]] = None,
+        ids: Optional[List[str]] = None
+    ) -> List[str]:
+        """Add (or overwrite) documents in the local store."""
+        if not documents:
+            return []
+        try:
+            vectors = _normalize(np.asarray(embeddings, dtype=np.float32))
+            doc_ids = ids or point_ids(metadata, len(documents))
+
+            with self._lock:
+                if self.dim is None:
+                    self.create_collection(self.collection_name, vectors.shape[1])
+                if vectors.shape[1] != self.dim:
+                    raise VectorStoreError(f"Embedding dimension {vectors.shape[1]} does not match collection ({self.dim})")
+
+                slots, overwritten = [], []
+                next_slot = self._count
+                for doc_id in doc_ids:
+                    slot = self._slot_of.get(doc_id)
+                    if slot is None:
+                        slot = next_slot
+                        next_slot += 1
+                        self._slot_of[doc_id] = slot
+                    else:
+                        overwritten.append(slot)
+                    slots.append(slot)
+
+                # Vectors hit the file before the rows that point at them
+                self._ensure_capacity(next_slot)
+                self._vectors[slots] = vectors.astype(self.dtype)
+                self._vectors.flush()
+                if self._quantizer is not None:
+                    self._quantizer.store(slots, vectors)
+                    self._quantizer.flush()
+
+                self._db.executemany("""
+                    INSERT INTO points (slot, id, content, payload) VALUES (?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET content = excluded.content, payload = excluded.payload
+                """, [
+                    (slot, doc_id, doc['content'], json.dumps(self._payload(metadata, doc), default=str))
+                    for slot, doc_id, doc in zip(slots, doc_ids, documents)
+                ])
+                previous_count, self._count = self._count, next_slot
+                self._set_settings(count=self._count)
+                self._db.commit()
+                self._live[slots] = True
+
+                if self._ivf is not None:
+                    if self._count > previous_count:
+                        self._ivf.assign(self._vectors, previous_count, self._count)
+                    if overwritten:
+                        # Re-indexed chunks keep their slot but may move to another list;
+                        # appended slots are re-assigned on load, these are not
+                        self._ivf.reassign(self._vectors, overwritten)
+                        self._save_ivf()
+                self._maybe_build_ivf()
+
+            logger.info(f"✅ Added {len(doc_ids)} documents to local vector store")
+            return doc_ids
+
+        except VectorStoreError:
+            raise
+        except Exception as e:
+            raise VectorStoreError(f"Failed to add documents: {e}")
+
+    def search(
+        self,
+        query_embedding: List[float],
+        top_k: int = 5,
+        filter_dict: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Search the local store for similar documents."""
+        return self.search_many([query_embedding], top_k=top_k, filter_dict=filter_dict)[0]
+
+    def search_many(
+        self,
+        query_embeddings: Sequence[List[float]],
+        top_k: int = 5,
+        filter_dict: Optional[Dict[str, Any]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search several queries with one matrix multiply per block.
+
+        Quantized collections rank candidates on the codes, then rescore the
+        best ``top_k * oversampling`` per query with the stored vectors.
+
+        Scoring runs without the lock on a snapshot of the layout. If
+        ``compact()`` renumbers the slots meanwhile, the search is repeated;
+        the last attempt holds the lock throughout.
+
+        Args:
+            query_embeddings: Query vectors
+            top_k: Results per query
+            filter_dict: Optional where filter (see vector_filters)
+
+        Returns:
+            One result list per query
+        """
+        try:
+            for attempt in range(SEARCH_ATTEMPTS):
+                locked = attempt == SEARCH_ATTEMPTS - 1
+                with self._lock if locked else contextlib.nullcontext():
+                    results = self._search_snapshot(query_embeddings, top_k, filter_dict)
+                if results is not None:
+                    return results
+                logger.debug("Local vector store was compacted during search, retrying")
+            raise VectorStoreError("Search raced with compaction")
+
+        except VectorStoreError:
+            raise
+        except Exception as e:
+            raise VectorStoreError(f"Search failed: {e}")
+
+    def _search_snapshot(
+        self,
+        query_embeddings: Sequence[List[float]],
+        top_k: int,
+        filter_dict: Optional[Dict[str, Any]]
+    ) -> Optional[List[List[Dict[str, Any]]]]:
+        # None when the slot layout changed before the hits were resolved
+        with self._lock:
+            if self.dim is None or self._live_count == 0 or top_k <= 0:
+                return [[] for _ in query_embeddings]
+            vectors, count, ivf = self._vectors, self._count, self._ivf
+            # Bound under the lock: compact() and set_quantization() drop the quantizer's arrays
+            approximate = self._quantizer.scorer() if self._quantizer is not None else None
+            live = self._live[:count].copy()
+            epoch = self._epoch
+
+        queries = _normalize(np.asarray(query_embeddings, dtype=np.float32).reshape(-1, self.dim))
+        if approximate is not None:
+            score = approximate
+            k = max(top_k, int(math.ceil(top_k * self.oversampling)))
+        else:
+            score = lambda rows, qs: qs @ np.asarray(vectors[rows], dtype=np.float32).T
+            k = top_k
+
+        if filter_dict:
+            sql, params = to_sql_where(filter_dict)
+            with self._lock:
+                rows = self._db.execute(f"SELECT slot FROM points WHERE {sql}", params).fetchall()
+            slots = np.array([r[0] for r in rows if r[0] < count], dtype=np.int64)
+            hits = [self._score_slots(score, slots[live[slots]], q, k) for q in queries]
+        elif ivf is not None:
+            candidates = ivf.probe(queries, self.ivf_nprobe, count)
+            hits = [
+                self._score_slots(score, slots[live[slots]], q, k)
+                for q, slots in zip(queries, candidates)
+            ]
+        else:
+            hits = self._exact_top_k(score, live, queries, k)
+
+        if approximate is not None:
+            hits = [
+                self._score_slots(lambda rows, qs: qs @ np.asarray(vectors[rows], dtype=np.float32).T,
+                                  np.array([slot for slot, _ in query_hits], dtype=np.int64), q, top_k)
+                for q, query_hits in zip(queries, hits)
+            ]
+
+        return self._fetch_results(hits, epoch)
+
+    @staticmethod
+    def _top_k(scores: np.ndarray, slots: np.ndarray, top_k: int) -> List[Tuple[int, float]]:
+        if len(scores) > top_k:
+            keep = np.argpartition(-scores, top_k - 1)[:top_k]
+            scores, slots = scores[keep], slots[keep]
+        order = np.argsort(-scores)
+        return [(int(slots[i]), float(scores[i])) for i in order if np.isfinite(scores[i])]
+
+    def _score_slots(self, score, slots: np.ndarray, query: np.ndarray, top_k: int) -> List[Tuple[int, float]]:
+        if len(slots) == 0:
+            return []
+        slots = np.sort(slots)  # sequential reads from the mapped file
+        return self._top_k(score(slots, query[None, :])[0], slots, top_k)
+
+    def _exact_top_k(self, score, live: np.ndarray, queries: np.ndarray, top_k: int) -> List[List[Tuple[int, float]]]:
+        n_queries = len(queries)
+        best_scores = np.full((n_queries, 0), -np.inf, dtype=np.float32)
+        best_slots = np.zeros((n_queries, 0), dtype=np.int64)
+        for start in range(0, len(live), SEARCH_BLOCK_ROWS):
+            stop = min(len(live), start + SEARCH_BLOCK_ROWS)
+            scores = score(slice(start, stop), queries)
+            scores[:, ~live[start:stop]] = -np.inf
+
+            scores = np.concatenate([best_scores, scores], axis=1)
+            slots = np.concatenate([best_slots, np.broadcast_to(np.arange(start, stop), (n_queries, stop - start))], axis=1)
+            if scores.shape[1] > top_k:
+                keep = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+                scores = np.take_along_axis(scores, keep, axis=1)
+                slots = np.take_along_axis(slots, keep, axis=1)
+            best_scores, best_slots = scores, slots
+
+        return [self._top_k(best_scores[i], best_slots[i], top_k) for i in range(n_queries)]
+
+    def _fetch_results(
+        self, hits: List[List[Tuple[int, float]]], epoch: int
+    ) -> Optional[List[List[Dict[str, Any]]]]:
+        wanted = sorted({slot for query_hits in hits for slot, _ in query_hits})
+        rows: Dict[int, Tuple[str, str, Optional[str]]] = {}
+        with self._lock:
+            if epoch != self._epoch:
+                return None
+            for start in range(0, len(wanted), 500):
+                chunk = wanted[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                for slot, point_id, content, payload in self._db.execute(
+                    f"SELECT slot, id, content, payload FROM points WHERE slot IN ({placeholders})", chunk
+                ):
+                    rows[slot] = (point_id, content, payload)
+
+        results = []
+        for query_hits in hits:
+            formatted = []
+            for slot, score in query_hits:
+                if slot not in rows:
+                    continue  # deleted while searching
+                point_id, content, payload = rows[slot]
+                formatted.append({
+                    'id': point_id,
+                    'score': score,
+                    'content': content or '',
+                    'metadata': json.loads(payload) if payload else {}
+                })
+            results.append(formatted)
+        return results
+
+    def delete_documents(self, document_ids: List[str]) -> None:
+        """Delete documents from the local store."""
+        try:
+            with self._lock:
+                slots = [self._slot_of.pop(doc_id) for doc_id in document_ids if doc_id in self._slot_of]
+                if not slots:
+                    return
+                self._db.executemany("DELETE FROM points WHERE slot = ?", [(slot,) for slot in slots])
+                self._db.commit()
+                self._live[slots] = False
+                if self._count and 1 - self._live_count / self._count > COMPACT_DEAD_FRACTION:
+                    self.compact()
+            logger.info(f"Deleted {len(slots)} documents from local vector store")
+        except VectorStoreError:
+            raise
+        except Exception as e:
+            raise VectorStoreError(f"Failed to delete documents: {e}")
+
+    def compact(self) -> None:
+        """Rewrite the vector file without deleted slots."""
+        with self._lock:
+            live_slots = np.flatnonzero(self._live[:self._count])
+            if len(live_slots) == self._count:
+                return
+
+            tmp_path = self._vector_path.with_suffix('.compact')
+            capacity = max(1024, len(live_slots))
+            with open(tmp_path, 'wb') as f:
+                f.truncate(capacity * self.dim * self.dtype.itemsize)
+            compacted = np.memmap(tmp_path, dtype=self.dtype, mode='r+', shape=(capacity, self.dim))
+            for start in range(0, len(live_slots), SEARCH_BLOCK_ROWS):
+                chunk = live_slots[start:start + SEARCH_BLOCK_ROWS]
+                compacted[start:start + len(chunk)] = self._vectors[chunk]
+            compacted.flush()
+            del compacted
+
+            # Slots only move down, so ascending updates never collide
+            moves = [(new, int(old)) for new, old in enumerate(live_slots) if new != old]
+            self._db.executemany("UPDATE points SET slot = ? WHERE slot = ?", moves)
+            self._epoch += 1
+            self._count = len(live_slots)
+            self._set_settings(count=self._count)
+            self._vectors.flush()
+            self._vectors = None
+            os.replace(tmp_path, self._vector_path)
+            self._db.commit()
+
+            if self._quantizer is not None:
+                self._quantizer.remove()
+                self._quantizer = None
+            self._map()
+            if self._quantizer is not None:
+                self._quantizer.encode_range(self._vectors, 0, self._count)
+            self._live = np.zeros(len(self._vectors), dtype=bool)
+            self._live[:self._count] = True
+            self._slot_of = {point_id: slot for slot, point_id in self._db.execute("SELECT slot, id FROM points")}
+            if self._ivf is not None:
+                self._ivf = _IVFIndex(self._ivf.centroids, self._ivf.assignments[live_slots], self._ivf.trained_on)
+                self._save_ivf()
+            logger.info(f"Compacted local vector store to {self._count} slots")
+
+    def get_collection_info(self) -> Dict[str, Any]:
+        """Get local collection information."""
+        with self._lock:
+            return {
+                'name': self.collection_name,
+                'points_count': self._live_count,
+                'vectors_count': self._live_count,
+                'dimension': self.dim,
+                'dtype': self.dtype.name,
+                'slots': self._count,
+                'ivf_lists': self._ivf.n_lists if self._ivf is not None else None,
+                'ivf_nprobe': self.ivf_nprobe if self._ivf is not None else None,
+                'quantization': self.quantization,
+                'scan_bytes_per_vector': (
+                    self._quantizer.bytes_per_vector if self._quantizer is not None
+                    else (self.dim or 0) * self.dtype.itemsize
+                ),
+            }
+
+    def close(self) -> None:
+        """Flush vectors and close the SQLite connection."""
+        with self._lock:
+            if self._vectors is not None:
+                self._vectors.flush()
+                self._vectors = None
+            if self._quantizer is not None:
+                self._quantizer.close()
+                self._quantizer = None
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -16,7 +16,8 @@ Based on the LangGraph Adaptive RAG tutorial with enhancements.
 """
 
 import logging
-from typing import List, Dict, Any, Optional, TypedDict, Annotated
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Annotated, Iterator
 from typing_extensions import TypedDict
 import operator
 
@@ -24,9 +25,11 @@ from langgraph.graph import StateGraph, END
 from langchain_core.documents import Document
 
 from ..core.config import get_config
+from .context_builder import build_context
 from .llm_service import get_llm_service
-from .vector_store import get_vector_store
+from .vector_store import get_vector_store, reciprocal_rank_fusion
 from .search_aggregator import WebSearchAggregatorService
+from .semantic_cache import get_semantic_cache
 
 logger = logging.getLogger(__name__)
 
@@ -41,12 +44,14 @@ class GraphState(TypedDict):
         web_search: Whether to perform web search
         documents: Retrieved documents
         transform_count: Number of query transformations
+        previous_questions: Questions replaced by earlier transformations
     """
     question: str
     generation: str
     web_search: str
     documents: List[Document]
     transform_count: int
+    previous_questions: List[str]
 
 
 class AdaptiveRAGEngine:
@@ -138,12 +143,25 @@ class AdaptiveRAGEngine:
         logger.info("---RETRIEVE---")
         question = state["question"]
         
-        # Retrieve documents
-        results = self.vector_store.search(
-            query=question,
-            top_k=self.config.rag_top_k,
-            min_score=self.config.rag_min_relevance_score
-        )
+        # Retrieve documents; after a rewrite every phrasing of the question
+        # is searched in one batch and the rankings fused
+        previous = state.get("previous_questions") or []
+        if previous and self.config.rag_multi_query:
+            per_query = self.vector_store.search_many(
+                [question, *previous],
+                top_k=self.config.rag_top_k,
+                min_score=self.config.rag_min_relevance_score,
+                mode=self.config.rag_search_mode,
+                dedupe=False
+            )
+            results = reciprocal_rank_fusion(per_query)[:self.config.rag_top_k]
+        else:
+            results = self.vector_store.search(
+                query=question,
+                top_k=self.config.rag_top_k,
+                min_score=self.config.rag_min_relevance_score,
+                mode=self.config.rag_search_mode
+            )
         
         # Convert to LangChain Document format
         documents = []
@@ -172,13 +190,13 @@ class AdaptiveRAGEngine:
         question = state["question"]
         documents = state["documents"]
         
+        scores = self._score_documents(question, [doc.page_content for doc in documents])
+        
         # Grade each document
         filtered_docs = []
         web_search = "No"
         
-        for doc in documents:
-            score = self._grade_document_relevance(question, doc.page_content)
-            
+        for doc, score in zip(documents, scores):
             if score == "yes":
                 logger.info("---GRADE: DOCUMENT RELEVANT---")
                 filtered_docs.append(doc)
@@ -192,6 +210,86 @@ class AdaptiveRAGEngine:
             "web_search": web_search
         }
     
+    def _score_documents(self, question: str, contents: List[str]) -> List[str]:
+        """
+        Score documents for relevance, in input order.
+        
+        Uses a single batched structured call when RAG_BATCH_GRADING is enabled;
+        any document the batch grader does not score is graded individually.
+        Individual grading fans out over up to RAG_GRADING_CONCURRENCY threads.
+        
+        Args:
+            question: User question
+            contents: Document contents
+        
+        Returns:
+            List of "yes"/"no" scores aligned with contents
+        """
+        scores: List[Optional[str]] = [None] * len(contents)
+        if len(contents) > 1 and getattr(self.config, 'rag_batch_grading', False):
+            scores = self._grade_documents_batch(question, contents)
+        
+        pending = [i for i, score in enumerate(scores) if score is None]
+        if not pending:
+            return scores
+        
+        workers = min(int(getattr(self.config, 'rag_grading_concurrency', 1)), len(pending))
+        if workers <= 1:
+            graded = [self._grade_document_relevance(question, contents[i]) for i in pending]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rag-grade") as pool:
+                graded = list(pool.map(lambda i: self._grade_document_relevance(question, contents[i]), pending))
+        
+        for i, score in zip(pending, graded):
+            scores[i] = score
+        return scores
+    
+    def _grade_documents_batch(self, question: str, contents: List[str]) -> List[Optional[str]]:
+        """
+        Grade all documents in one structured LLM call.
+        
+        Args:
+            question: User question
+            contents: Document contents
+        
+        Returns:
+            List of "yes"/"no" scores, with None for documents the response
+            did not cover (callers grade those individually)
+        """
+        system_prompt = """You are a grader assessing relevance of retrieved documents to a user question.
+
+If a document contains keyword(s) or semantic meaning related to the question, grade it as relevant.
+Give each document a binary score 'yes' or 'no'."""
+        
+        numbered = "\n\n".join(f"Document {i}:\n{content}" for i, content in enumerate(contents))
+        prompt = f"""Question: {question}
+
+{numbered}
+
+Grade every document above by its number."""
+        
+        scores: List[Optional[str]] = [None] * len(contents)
+        try:
+            result = self.llm.generate_structured(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                response_format={"scores": [{"index": 0, "relevant": "yes"}]}
+            )
+            for item in (result or {}).get("scores") or []:
+                if not isinstance(item, dict):
+                    continue
+                index = item.get("index")
+                verdict = str(item.get("relevant", "")).lower().strip()
+                if isinstance(index, int) and 0 <= index < len(contents) and verdict in ("yes", "no"):
+                    scores[index] = verdict
+        except Exception as e:
+            logger.warning(f"Batched document grading failed, grading individually: {e}")
+        
+        missing = sum(1 for score in scores if score is None)
+        if missing:
+            logger.info(f"Batched grader left {missing}/{len(contents)} documents unscored")
+        return scores
+    
     def _grade_document_relevance(self, question: str, document: str) -> str:
         """
         Grade if a document is relevant to the question.
@@ -269,7 +367,8 @@ Formulate an improved question that will retrieve better results from a vectorst
             return {
                 "documents": documents,
                 "question": better_question,
-                "transform_count": transform_count
+                "transform_count": transform_count,
+                "previous_questions": [*(state.get("previous_questions") or []), question]
             }
             
         except Exception as e:
@@ -372,21 +471,7 @@ Formulate an improved question that will retrieve better results from a vectorst
         question = state["question"]
         documents = state["documents"]
 
-        # Format documents as context
-        context = "\n\n".join([doc.page_content for doc in documents])
-
-        system_prompt = """You are an assistant for question-answering tasks.
-
-Use the following pieces of retrieved context to answer the question.
-If you don't know the answer, just say that you don't know.
-Use three sentences maximum and keep the answer concise."""
-
-        prompt = f"""Question: {question}
-
-Context:
-{context}
-
-Answer:"""
+        system_prompt, prompt = self._generation_prompts(question, documents)
 
         try:
             generation = self.llm.generate(
@@ -411,6 +496,42 @@ Answer:"""
                 "generation": f"Error generating answer: {e}"
             }
 
+    def _generation_prompts(self, question: str, documents: List[Document]) -> tuple:
+        """
+        Build the (system prompt, prompt) pair used for answer generation.
+
+        Args:
+            question: User question
+            documents: Context documents
+
+        Returns:
+            Tuple of system prompt and user prompt
+        """
+        context = self._context(documents)
+
+        system_prompt = """You are an assistant for question-answering tasks.
+
+Use the following pieces of retrieved context to answer the question.
+If you don't know the answer, just say that you don't know.
+Use three sentences maximum and keep the answer concise."""
+
+        prompt = f"""Question: {question}
+
+Context:
+{context}
+
+Answer:"""
+
+        return system_prompt, prompt
+
+    def _context(self, documents: List[Document]) -> str:
+        """Deduplicated document context within RAG_CONTEXT_MAX_TOKENS."""
+        return build_context(
+            documents,
+            max_tokens=self.config.rag_context_max_tokens,
+            dedup_threshold=self.config.rag_context_dedup_threshold
+        )
+
     def _grade_generation(self, state: GraphState) -> str:
         """
         Grade the generated answer for hallucinations and usefulness.
@@ -459,7 +580,8 @@ Answer:"""
         Returns:
             True if grounded, False if hallucinated
         """
-        context = "\n\n".join([doc.page_content for doc in documents])
+        # Same context the answer was generated from
+        context = self._context(documents)
 
         system_prompt = """You are a grader assessing whether an LLM generation is grounded in / supported by a set of retrieved facts.
 
@@ -533,6 +655,13 @@ Does the answer address the question? Answer only 'yes' or 'no'."""
         """
         logger.info(f"RAG query: {question}")
 
+        # Serve near-duplicate questions from the semantic cache
+        semantic_cache, question_embedding = self._semantic_cache_for(question)
+        if semantic_cache is not None:
+            cached = semantic_cache.lookup(question_embedding)
+            if cached is not None:
+                return self._result_from_cache(cached)
+
         # Initialize state
         initial_state = {
             "question": question,
@@ -546,7 +675,7 @@ Does the answer address the question? Answer only 'yes' or 'no'."""
         try:
             final_state = self.graph.invoke(initial_state)
 
-            return {
+            result = {
                 "answer": final_state.get("generation", "No answer generated"),
                 "question": final_state.get("question"),
                 "documents": final_state.get("documents", []),
@@ -554,6 +683,14 @@ Does the answer address the question? Answer only 'yes' or 'no'."""
                 "transform_count": final_state.get("transform_count", 0)
             }
 
+            if semantic_cache is not None:
+                try:
+                    semantic_cache.store(question_embedding, self._result_to_cache(result))
+                except Exception as e:
+                    logger.warning(f"Failed to cache RAG answer: {e}")
+
+            return result
+
         except Exception as e:
             logger.error(f"RAG query failed: {e}")
             return {
@@ -565,6 +702,159 @@ Does the answer address the question? Answer only 'yes' or 'no'."""
             }
 
 
+    def stream_query(self, question: str) -> Iterator[Dict[str, Any]]:
+        """
+        Query the RAG engine, streaming the answer while it is generated.
+
+        Retrieval, grading, query transformation and web search run first,
+        following the same routing as the graph. Generation tokens are then
+        streamed, and the hallucination/answer checks run on the full text
+        afterwards instead of triggering a re-generation.
+
+        Args:
+            question: User question
+
+        Yields:
+            Event dicts ``{"event": name, "data": payload}`` where name is
+            "context", "token", "verdict" (always last on success) or "error"
+        """
+        logger.info(f"RAG stream query: {question}")
+
+        semantic_cache, question_embedding = self._semantic_cache_for(question)
+        if semantic_cache is not None:
+            cached = semantic_cache.lookup(question_embedding)
+            if cached is not None:
+                yield {"event": "context", "data": self._context_event(self._result_from_cache(cached))}
+                yield {"event": "token", "data": {"text": cached.get("answer", "")}}
+                yield {"event": "verdict", "data": {"verdict": "useful", "grounded": None, "useful": None, "cached": True}}
+                return
+
+        state = {
+            "question": question,
+            "generation": "",
+            "web_search": "No",
+            "documents": [],
+            "transform_count": 0
+        }
+
+        try:
+            state = self._prepare_generation(state)
+        except Exception as e:
+            logger.error(f"RAG stream query failed: {e}")
+            yield {"event": "error", "data": {"message": f"Error processing query: {e}"}}
+            return
+
+        yield {"event": "context", "data": self._context_event(state)}
+
+        system_prompt, prompt = self._generation_prompts(state["question"], state["documents"])
+        parts: List[str] = []
+        try:
+            for token in self.llm.stream(prompt=prompt, system_prompt=system_prompt, temperature=0.7):
+                if token:
+                    parts.append(token)
+                    yield {"event": "token", "data": {"text": token}}
+        except Exception as e:
+            logger.error(f"Answer streaming failed: {e}")
+            yield {"event": "error", "data": {"message": f"Error generating answer: {e}"}}
+            return
+
+        generation = "".join(parts)
+        verdict = self._verdict(state["question"], state["documents"], generation)
+        yield {"event": "verdict", "data": verdict}
+
+        if semantic_cache is not None and verdict["verdict"] == "useful":
+            result = {
+                "answer": generation,
+                "question": state["question"],
+                "documents": state["documents"],
+                "web_search_used": state.get("web_search") == "Yes",
+                "transform_count": state.get("transform_count", 0)
+            }
+            try:
+                semantic_cache.store(question_embedding, self._result_to_cache(result))
+            except Exception as e:
+                logger.warning(f"Failed to cache RAG answer: {e}")
+
+    def _prepare_generation(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Run retrieve/grade/transform/web-search routing until the graph would generate."""
+        state = dict(state)
+        while True:
+            state.update(self._retrieve(state))
+            state.update(self._grade_documents(state))
+            decision = self._decide_to_generate(state)
+            if decision == "transform_query":
+                state.update(self._transform_query(state))
+                continue
+            if decision == "web_search":
+                state.update(self._web_search(state))
+            return state
+
+    def _verdict(self, question: str, documents: List[Document], generation: str) -> Dict[str, Any]:
+        """Run the enabled generation checks concurrently and summarize them."""
+        checks = {}
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="rag-verdict") as pool:
+            if self.config.rag_hallucination_check:
+                checks["grounded"] = pool.submit(self._check_hallucination, documents, generation)
+            if self.config.rag_answer_check:
+                checks["useful"] = pool.submit(self._check_answer_quality, question, generation)
+            grounded = checks["grounded"].result() if "grounded" in checks else None
+            useful = checks["useful"].result() if "useful" in checks else None
+
+        if grounded is False:
+            verdict = "not supported"
+        elif useful is False:
+            verdict = "not useful"
+        else:
+            verdict = "useful"
+        return {"verdict": verdict, "grounded": grounded, "useful": useful, "cached": False}
+
+    @staticmethod
+    def _context_event(state: Dict[str, Any]) -> Dict[str, Any]:
+        documents = state.get("documents", [])
+        return {
+            "question": state.get("question"),
+            "documents": [
+                {"page_content": doc.page_content, "metadata": doc.metadata}
+                for doc in documents
+            ],
+            "web_search_used": state.get("web_search_used", state.get("web_search") == "Yes"),
+            "transform_count": state.get("transform_count", 0)
+        }
+
+    def _semantic_cache_for(self, question: str):
+        """Return (semantic cache, question embedding), or (None, None) when unavailable."""
+        try:
+            cache = get_semantic_cache()
+            if cache is None:
+                return None, None
+            return cache, self.vector_store.embedding_service.embed_query(question)
+        except Exception as e:
+            logger.warning(f"Semantic cache unavailable: {e}")
+            return None, None
+
+    @staticmethod
+    def _result_to_cache(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a query result into a JSON-serializable payload."""
+        return {
+            **result,
+            "documents": [
+                {"page_content": doc.page_content, "metadata": doc.metadata}
+                for doc in result.get("documents", [])
+            ],
+        }
+
+    @staticmethod
+    def _result_from_cache(payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Rebuild a query result from a cached payload."""
+        return {
+            **payload,
+            "documents": [
+                Document(page_content=doc["page_content"], metadata=doc.get("metadata") or {})
+                for doc in payload.get("documents", [])
+            ],
+        }
+
+
 # Global service instance
 _rag_engine: Optional[AdaptiveRAGEngine] = None
 
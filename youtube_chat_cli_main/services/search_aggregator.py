@@ -17,6 +17,8 @@ import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlsplit
 
+from ..core import cache_keys
+from .context_builder import CHARS_PER_TOKEN, build_context
 from .web_search_service import get_web_search_service
 from .brave_search_service import BraveSearchService, BraveSearchError
 
@@ -71,11 +73,12 @@ class WebSearchAggregatorService:
 
     def search(self, query: str, max_results: int = 10, backends: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Search using configured backends in parallel; merge, dedupe, and cache results."""
-        cache_key = f"search:{','.join(backends or self.backends)}:{hash(query)}:{max_results}"
+        cache_key = cache_keys.cache_key(
+            "search", cache_keys.normalize_text(query), list(backends or self.backends), max_results,
+            generation_name=cache_keys.SEARCH
+        )
         try:
-            from ..core.redis_cache import get_cache
-            cache = get_cache()
-            cached = cache.get_json(cache_key)
+            cached = cache_keys.get_json(cache_key)
             if isinstance(cached, list) and cached:
                 return cached[:max_results]
         except Exception:
@@ -151,8 +154,18 @@ class WebSearchAggregatorService:
         return final
 
     def format_results_for_context(self, results: List[Dict[str, Any]], max_length: int = 2000) -> str:
-        # Reuse legacy formatter for now
-        return self._legacy.format_results_for_context(results, max_length=max_length)
+        """
+        Format results as LLM context of at most ~max_length characters.
+
+        Backends often return the same page or snippet; near-duplicates are
+        kept once, so the budget goes to distinct sources.
+        """
+        return build_context(
+            results,
+            max_tokens=max(1, max_length // CHARS_PER_TOKEN),
+            formatter=lambda i, p: f"[{i}] {p['metadata'].get('title', '')}\nURL: {p['metadata'].get('url', '')}\n{p['content']}",
+            separator="\n\n"
+        )
 
 
 
@@ -0,0 +1,158 @@
+"""
+JAEGIS NexusSync - Semantic Answer Cache
+
+Caches AdaptiveRAGEngine answers by question meaning rather than exact text.
+Question embeddings are kept in a small in-process LRU index; answer payloads
+live in the shared RedisCache (with its in-memory fallback) under the
+``rag:semantic:`` prefix with a TTL. Payload keys carry the corpus generation
+(see core.cache_keys); bumping it whenever the vector store corpus changes
+invalidates every cached answer, including those indexed by other processes,
+because an index hit without a payload is a miss.
+"""
+
+import logging
+import math
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core import cache_keys
+from ..core.config import get_config
+from ..core.redis_cache import get_cache
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "rag:semantic:"
+
+
+def _normalize(vector: List[float]) -> List[float]:
+    norm = math.sqrt(sum(v * v for v in vector))
+    if norm == 0:
+        return list(vector)
+    return [v / norm for v in vector]
+
+
+def _dot(a: List[float], b: List[float]) -> float:
+    return sum(x * y for x, y in zip(a, b))
+
+
+class SemanticAnswerCache:
+    """
+    Nearest-question answer cache.
+
+    Args:
+        threshold: Minimum cosine similarity for a cached answer to be reused
+        ttl_seconds: Lifetime of cached answers
+        max_entries: LRU capacity of the question index
+        cache: RedisCache instance (defaults to the global cache)
+    """
+
+    def __init__(self, threshold: float = 0.95, ttl_seconds: int = 3600, max_entries: int = 256, cache=None):
+        self.threshold = float(threshold)
+        self.ttl_seconds = max(1, int(ttl_seconds))
+        self.max_entries = max(1, int(max_entries))
+        self.cache = cache if cache is not None else get_cache()
+        self._index: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _payload_key(self, entry_id: str) -> str:
+        generation = cache_keys.generation(cache_keys.CORPUS, self.cache)
+        return f"{CACHE_PREFIX}c{generation}:{entry_id}"
+
+    def _best_match(self, embedding: List[float]) -> Tuple[Optional[str], float]:
+        best_id, best_score = None, -1.0
+        for entry_id, vector in self._index.items():
+            score = _dot(embedding, vector)
+            if score > best_score:
+                best_id, best_score = entry_id, score
+        return best_id, best_score
+
+    def lookup(self, embedding: List[float]) -> Optional[Dict[str, Any]]:
+        """Return the cached payload for the most similar question above threshold."""
+        query = _normalize(embedding)
+        with self._lock:
+            entry_id, score = self._best_match(query)
+            if entry_id is None or score < self.threshold:
+                self.misses += 1
+                return None
+
+            payload = cache_keys.get_json(self._payload_key(entry_id), self.cache)
+            if payload is None:
+                # Expired or invalidated (possibly by another process)
+                self._index.pop(entry_id, None)
+                self.misses += 1
+                return None
+
+            self._index.move_to_end(entry_id)
+            self.hits += 1
+        logger.info(f"Semantic cache hit (similarity {score:.3f})")
+        return payload
+
+    def store(self, embedding: List[float], payload: Dict[str, Any]) -> None:
+        """Cache ``payload`` for the question with ``embedding``."""
+        entry_id = uuid.uuid4().hex
+        self.cache.set_json(self._payload_key(entry_id), payload, ttl_s=self.ttl_seconds)
+        with self._lock:
+            self._index[entry_id] = _normalize(embedding)
+            while len(self._index) > self.max_entries:
+                self._index.popitem(last=False)
+
+    def invalidate(self) -> int:
+        """Drop every cached answer (bumps the corpus generation). Returns the new generation."""
+        with self._lock:
+            self._index.clear()
+        return cache_keys.bump_generation(cache_keys.CORPUS, self.cache)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._index),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+            }
+
+
+# Global cache instance
+_semantic_cache: Optional[SemanticAnswerCache] = None
+
+
+def get_semantic_cache() -> Optional[SemanticAnswerCache]:
+    """
+    Get the global semantic answer cache.
+
+    Returns:
+        SemanticAnswerCache instance, or None when disabled
+    """
+    global _semantic_cache
+
+    config = get_config()
+    if not config.rag_semantic_cache_enabled:
+        return None
+
+    if _semantic_cache is None:
+        _semantic_cache = SemanticAnswerCache(
+            threshold=config.rag_semantic_cache_threshold,
+            ttl_seconds=config.rag_semantic_cache_ttl_seconds,
+            max_entries=config.rag_semantic_cache_max_entries,
+        )
+
+    return _semantic_cache
+
+
+def invalidate_semantic_cache() -> None:
+    """
+    Invalidate corpus-dependent caches (RAG answers, vector search results)
+    after the document corpus changes (best-effort).
+    """
+    try:
+        if _semantic_cache is not None:
+            _semantic_cache.invalidate()
+        else:
+            cache_keys.bump_generation(cache_keys.CORPUS)
+    except Exception as e:
+        logger.warning(f"Semantic cache invalidation failed: {e}")
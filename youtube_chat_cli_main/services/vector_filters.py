@@ -0,0 +1,204 @@
+"""
+JAEGIS NexusSync - Vector Search Filters
+
+Search filters are written once, in the Chroma-style ``where`` syntax the CLI
+builds (``{'$and': [{'ingested_at': {'$gte': ts}}, {'tag_work': 1}]}``), and
+compiled for each backend:
+- Qdrant: a native ``Filter`` (must / should / must_not)
+- ChromaDB: a ``where`` dict in the strict form Chroma accepts
+- Local store: SQL over the JSON payload column
+
+Supported: field equality, $eq/$ne/$gt/$gte/$lt/$lte/$in/$nin, $and/$or.
+
+Hot fields are indexed where the backend allows it (Qdrant payload indexes,
+SQLite expression indexes); see INDEXED_FIELDS.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Payload fields filtered on by the CLI and workflows, with their index type
+INDEXED_FIELDS = {
+    'ingested_at': 'integer',
+    'source': 'keyword',
+    'file_type': 'keyword',
+    'file_id': 'keyword',
+    'tag_names': 'keyword',
+}
+
+# Lower-cased tags as a list, so one keyword index serves every tag_<name> filter
+TAG_FIELD = 'tag_names'
+
+_COMPARISONS = {
+    '$eq': '=',
+    '$ne': '!=',
+    '$gt': '>',
+    '$gte': '>=',
+    '$lt': '<',
+    '$lte': '<=',
+}
+_LIST_OPERATORS = ('$in', '$nin')
+
+
+class FilterError(Exception):
+    """Raised when a search filter cannot be compiled."""
+    pass
+
+
+def parse_filter(where: Optional[Dict[str, Any]]):
+    """
+    Parse a where dict into a tree of ``('$and' | '$or', [nodes])`` and
+    ``(field, operator, operand)`` nodes. Returns None for an empty filter.
+    """
+    if not where:
+        return None
+    if not isinstance(where, dict):
+        raise FilterError(f"Filter must be a dict, got {type(where).__name__}")
+
+    nodes = []
+    for key, value in where.items():
+        if key in ('$and', '$or'):
+            if not isinstance(value, list) or not value:
+                raise FilterError(f"{key} expects a non-empty list")
+            children = [child for child in map(parse_filter, value) if child is not None]
+            if children:
+                nodes.append(children[0] if len(children) == 1 else (key, children))
+            continue
+        if key.startswith('$'):
+            raise FilterError(f"Unsupported filter operator: {key}")
+        if not key or any(c in key for c in '"\'\\'):
+            raise FilterError(f"Invalid filter field: {key!r}")
+
+        conditions = value if isinstance(value, dict) else {'$eq': value}
+        for op, operand in conditions.items():
+            if op in _LIST_OPERATORS:
+                if not isinstance(operand, (list, tuple)) or not operand:
+                    raise FilterError(f"{op} expects a non-empty list")
+                operand = list(operand)
+            elif op not in _COMPARISONS:
+                raise FilterError(f"Unsupported filter operator: {op}")
+            nodes.append((key, op, operand))
+
+    if not nodes:
+        return None
+    return nodes[0] if len(nodes) == 1 else ('$and', nodes)
+
+
+def tag_names(tags: Any) -> List[str]:
+    """Normalized tag names, as matched by ``tag_<name>: 1`` filters."""
+    if not isinstance(tags, list):
+        return []
+    return [t.strip().lower() for t in tags if isinstance(t, str) and t.strip()]
+
+
+# ---------------------------------------------------------------------------
+# Qdrant
+# ---------------------------------------------------------------------------
+
+def to_qdrant_filter(where: Optional[Dict[str, Any]]):
+    """
+    Compile a where filter into a ``qdrant_client.models.Filter``.
+
+    ``tag_<name>: 1`` becomes a match on the indexed TAG_FIELD list.
+    Anything that is not a dict (e.g. a ready-made Filter) is passed through.
+    """
+    if where is None or not isinstance(where, dict):
+        return where
+    from qdrant_client.models import Filter
+
+    node = parse_filter(where)
+    if node is None:
+        return None
+    condition = _qdrant_condition(node)
+    return condition if isinstance(condition, Filter) else Filter(must=[condition])
+
+
+def _qdrant_condition(node):
+    from qdrant_client.models import FieldCondition, Filter, MatchAny, MatchValue, Range
+
+    if node[0] in ('$and', '$or'):
+        children = [_qdrant_condition(child) for child in node[1]]
+        return Filter(must=children) if node[0] == '$and' else Filter(should=children)
+
+    field, op, operand = node
+    if field.startswith('tag_') and op == '$eq' and operand in (1, True):
+        return FieldCondition(key=TAG_FIELD, match=MatchValue(value=field[len('tag_'):]))
+
+    if op in ('$eq', '$ne'):
+        if isinstance(operand, float):
+            # MatchValue only takes str / int / bool
+            condition = FieldCondition(key=field, range=Range(gte=operand, lte=operand))
+        else:
+            condition = FieldCondition(key=field, match=MatchValue(value=operand))
+        return condition if op == '$eq' else Filter(must_not=[condition])
+    if op in _LIST_OPERATORS:
+        condition = FieldCondition(key=field, match=MatchAny(any=operand))
+        return condition if op == '$in' else Filter(must_not=[condition])
+    return FieldCondition(key=field, range=Range(**{op[1:]: operand}))
+
+
+def ensure_qdrant_payload_indexes(client, collection_name: str) -> None:
+    """Create payload indexes for INDEXED_FIELDS (existing ones are kept)."""
+    from qdrant_client.models import PayloadSchemaType
+
+    for field, schema in INDEXED_FIELDS.items():
+        try:
+            client.create_payload_index(
+                collection_name=collection_name,
+                field_name=field,
+                field_schema=PayloadSchemaType(schema)
+            )
+        except Exception as e:
+            logger.warning(f"Could not index payload field {field}: {e}")
+
+
+# ---------------------------------------------------------------------------
+# ChromaDB
+# ---------------------------------------------------------------------------
+
+def to_chroma_where(where: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Compile a where filter into the form ChromaDB validates: one field or
+    operator per dict, $and/$or with at least two clauses.
+    """
+    node = parse_filter(where)
+    return _chroma_clause(node) if node is not None else None
+
+
+def _chroma_clause(node) -> Dict[str, Any]:
+    if node[0] in ('$and', '$or'):
+        return {node[0]: [_chroma_clause(child) for child in node[1]]}
+    field, op, operand = node
+    return {field: operand} if op == '$eq' else {field: {op: operand}}
+
+
+# ---------------------------------------------------------------------------
+# SQL (JSON payload column)
+# ---------------------------------------------------------------------------
+
+def json_field(field: str, column: str = 'payload') -> str:
+    """SQL expression for a payload field; indexes must use the same text."""
+    return f'json_extract({column}, \'$."{field}"\')'
+
+
+def to_sql_where(where: Optional[Dict[str, Any]], column: str = 'payload') -> Tuple[str, List[Any]]:
+    """Compile a where filter into an SQL condition and its parameters."""
+    node = parse_filter(where)
+    params: List[Any] = []
+    sql = _sql_clause(node, column, params) if node is not None else '1'
+    return sql, params
+
+
+def _sql_clause(node, column: str, params: List[Any]) -> str:
+    if node[0] in ('$and', '$or'):
+        joiner = ' AND ' if node[0] == '$and' else ' OR '
+        return '(' + joiner.join(_sql_clause(child, column, params) for child in node[1]) + ')'
+    field, op, operand = node
+    if op in _LIST_OPERATORS:
+        params.extend(operand)
+        placeholders = ','.join('?' * len(operand))
+        return f"{json_field(field, column)} {'IN' if op == '$in' else 'NOT IN'} ({placeholders})"
+    params.append(operand)
+    return f"{json_field(field, column)} {_COMPARISONS[op]} ?"
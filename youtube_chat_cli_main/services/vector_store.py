@@ -4,11 +4,15 @@ JAEGIS NexusSync - Vector Store Service
 This module provides a pluggable vector store interface supporting:
 - Qdrant (local Docker instance)
 - ChromaDB (local file-based storage)
+- Local (memory-mapped NumPy vectors + SQLite payloads, see local_vector_store)
 
-Both options are completely free and run locally.
+All options are completely free and run locally.
 """
 
+import json
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from abc import ABC, abstractmethod
 
@@ -22,21 +26,103 @@ from chromadb.config import Settings
 
 from ..core.config import get_config
 from ..core.database import get_database
+from ..core.embedding_cache import text_digest
+from .semantic_cache import invalidate_semantic_cache
+from .vector_filters import (
+    TAG_FIELD, ensure_qdrant_payload_indexes, tag_names, to_chroma_where, to_qdrant_filter
+)
 
 logger = logging.getLogger(__name__)
 
+SEARCH_MODES = ('vector', 'lexical', 'hybrid')
+
+# Stored-vector quantization: first pass on compressed vectors, then
+# full-precision rescoring of an oversampled candidate set
+QUANTIZATION_MODES = ('none', 'int8', 'binary')
+
+# Candidates fetched from each retriever per requested result in hybrid mode
+HYBRID_CANDIDATE_FACTOR = 3
+
+# Runs the BM25 leg of hybrid searches next to the embedding + vector leg.
+# Kept separate from the shared workload pools: search itself usually runs
+# on the "vector" pool and must not wait on a slot of its own pool.
+_lexical_pool: Optional[ThreadPoolExecutor] = None
+
 
 class VectorStoreError(Exception):
     """Raised when vector store operations fail."""
     pass
 
 
+def reciprocal_rank_fusion(result_lists: List[List[Dict[str, Any]]], k: int = 60) -> List[Dict[str, Any]]:
+    """
+    Merge ranked result lists with reciprocal rank fusion.
+
+    Each result scores sum(1 / (k + rank)) over the lists it appears in, so
+    documents ranked well by several retrievers rise to the top regardless
+    of how each retriever scales its scores.
+
+    Args:
+        result_lists: Ranked lists of results with 'id' keys
+        k: Fusion constant
+
+    Returns:
+        Fused results (first occurrence of each id) with 'score' set to the fused score
+    """
+    fused: Dict[str, Dict[str, Any]] = {}
+    scores: Dict[str, float] = {}
+    for results in result_lists:
+        for rank, result in enumerate(results, start=1):
+            key = str(result['id'])
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+            fused.setdefault(key, dict(result))
+    ranked = sorted(fused, key=lambda key: scores[key], reverse=True)
+    return [{**fused[key], 'score': scores[key]} for key in ranked]
+
+
+def dedupe_across_queries(result_lists: List[List[Dict[str, Any]]]) -> List[List[Dict[str, Any]]]:
+    """
+    Keep each document in only one of several per-query result lists.
+
+    A document found by several queries stays in the list of the query that
+    scored it highest (the earliest such query on ties), so the union of the
+    lists holds no duplicates.
+    """
+    best: Dict[str, Any] = {}
+    for q, results in enumerate(result_lists):
+        for result in results:
+            key = str(result['id'])
+            if key not in best or result['score'] > best[key][1]:
+                best[key] = (q, result['score'])
+    return [
+        [r for r in results if best[str(r['id'])][0] == q]
+        for q, results in enumerate(result_lists)
+    ]
+
+
+def point_ids(metadata: Optional[Dict[str, Any]], count: int) -> List[str]:
+    """Default point ids for the chunks of one file: ``{file_id}_{chunk}``."""
+    file_id = (metadata or {}).get('file_id', 'unknown')
+    return [f"{file_id}_{i}" for i in range(count)]
+
+
+def chunk_hash(doc: Dict[str, Any]) -> str:
+    """Content hash of a chunk: its text plus chunk-level metadata."""
+    chunk_metadata = json.dumps(doc.get('metadata') or {}, sort_keys=True, default=str)
+    return text_digest(f"{doc['content']}\0{chunk_metadata}")
+
+
+def pending_texts(prepared: Dict[str, Any]) -> List[str]:
+    """Texts of the chunks ``VectorStore.prepare_documents`` found new or changed."""
+    return [prepared['documents'][i]['content'] for i in prepared['changed']]
+
+
 class BaseVectorStore(ABC):
     """Abstract base class for vector stores."""
     
     @abstractmethod
-    def create_collection(self, collection_name: str, vector_size: int) -> None:
-        """Create a new collection."""
+    def create_collection(self, collection_name: str, vector_size: int, quantization: Optional[str] = None) -> None:
+        """Create a new collection (quantization: 'none', 'int8' or 'binary'; default VECTOR_QUANTIZATION)."""
         pass
     
     @abstractmethod
@@ -44,9 +130,14 @@ class BaseVectorStore(ABC):
         self,
         documents: List[Dict[str, Any]],
         embeddings: List[List[float]],
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        ids: Optional[List[str]] = None
     ) -> List[str]:
-        """Add documents with embeddings to the collection."""
+        """
+        Add (or overwrite) documents with embeddings in the collection.
+
+        Points are keyed by ``ids`` when given, else ``{file_id}_{i}``.
+        """
         pass
     
     @abstractmethod
@@ -59,6 +150,15 @@ class BaseVectorStore(ABC):
         """Search for similar documents."""
         pass
     
+    def search_many(
+        self,
+        query_embeddings: List[List[float]],
+        top_k: int = 5,
+        filter_dict: Optional[Dict[str, Any]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Search several query vectors at once (one result list per query)."""
+        return [self.search(embedding, top_k=top_k, filter_dict=filter_dict) for embedding in query_embeddings]
+
     @abstractmethod
     def delete_documents(self, document_ids: List[str]) -> None:
         """Delete documents by ID."""
@@ -81,6 +181,8 @@ class QdrantVectorStore(BaseVectorStore):
         """Initialize Qdrant client."""
         self.config = config
         self.collection_name = config.qdrant_collection_name
+        # Search params per collection, derived from its quantization config
+        self._search_params_cache: Dict[str, Any] = {}
         
         try:
             # Connect to local Qdrant instance
@@ -92,70 +194,147 @@ class QdrantVectorStore(BaseVectorStore):
         except Exception as e:
             raise VectorStoreError(f"Failed to connect to Qdrant: {e}")
     
-    def create_collection(self, collection_name: str, vector_size: int) -> None:
-        """Create a new Qdrant collection."""
+    def create_collection(self, collection_name: str, vector_size: int, quantization: Optional[str] = None) -> None:
+        """
+        Create a new Qdrant collection.
+
+        With quantization ('int8' or 'binary', default VECTOR_QUANTIZATION)
+        the quantized vectors stay in RAM and the originals move to disk,
+        where they are only read to rescore candidates.
+
+        Payload indexes on the commonly filtered fields are created for new
+        and existing collections, so filtered searches don't scan.
+        """
         try:
             # Check if collection exists
             collections = self.client.get_collections().collections
             exists = any(c.name == collection_name for c in collections)
             
             if not exists:
+                quantization = quantization or self.config.vector_quantization
                 self.client.create_collection(
                     collection_name=collection_name,
                     vectors_config=VectorParams(
                         size=vector_size,
-                        distance=Distance.COSINE
-                    )
+                        distance=Distance.COSINE,
+                        on_disk=quantization in ('int8', 'binary')
+                    ),
+                    quantization_config=self._quantization_config(quantization)
                 )
-                logger.info(f"✅ Created Qdrant collection: {collection_name}")
+                logger.info(f"✅ Created Qdrant collection: {collection_name} (quantization: {quantization})")
             else:
                 logger.info(f"Collection {collection_name} already exists")
-                
+
+            self._search_params_cache.pop(collection_name, None)
+            ensure_qdrant_payload_indexes(self.client, collection_name)
+
         except Exception as e:
             raise VectorStoreError(f"Failed to create collection: {e}")
     
+    @staticmethod
+    def _quantization_config(quantization: Optional[str]):
+        from qdrant_client.models import (
+            BinaryQuantization, BinaryQuantizationConfig,
+            ScalarQuantization, ScalarQuantizationConfig, ScalarType
+        )
+        if quantization == 'int8':
+            return ScalarQuantization(scalar=ScalarQuantizationConfig(type=ScalarType.INT8, always_ram=True))
+        if quantization == 'binary':
+            return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+        return None
+
+    def _search_params(self, collection_name: Optional[str] = None):
+        """
+        Rescore oversampled quantized candidates with the original vectors.
+
+        Whether a collection is quantized is fixed when it is created, so it
+        is read from the collection's own config (once per collection), not
+        from the current VECTOR_QUANTIZATION setting.
+        """
+        name = collection_name or self.collection_name
+        if name in self._search_params_cache:
+            return self._search_params_cache[name]
+        try:
+            config = self.client.get_collection(name).config
+            # A per-vector quantization config overrides the collection's
+            quantization = getattr(config.params.vectors, 'quantization_config', None) or config.quantization_config
+        except Exception as e:
+            # Not cached: the collection may not exist yet
+            logger.debug(f"Could not read quantization config of {name}: {e}")
+            return None
+
+        from qdrant_client.models import (
+            BinaryQuantization, ProductQuantization, QuantizationSearchParams,
+            ScalarQuantization, SearchParams
+        )
+        params = None
+        if isinstance(quantization, (ScalarQuantization, BinaryQuantization, ProductQuantization)):
+            params = SearchParams(quantization=QuantizationSearchParams(
+                rescore=True,
+                oversampling=self.config.vector_quantization_oversampling
+            ))
+        self._search_params_cache[name] = params
+        return params
+
     def add_documents(
         self,
         documents: List[Dict[str, Any]],
         embeddings: List[List[float]],
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        ids: Optional[List[str]] = None
     ) -> List[str]:
-        """Add documents to Qdrant."""
+        """
+        Add documents to Qdrant in batches.
+
+        Batches are sent with wait=False, up to VECTOR_UPSERT_PARALLELISM in
+        flight; the last batch is sent with wait=True once the others are
+        acknowledged. Qdrant applies updates in order, so that final wait is
+        a barrier for the whole file.
+        """
         try:
-            points = []
-            doc_ids = []
-            
-            for i, (doc, embedding) in enumerate(zip(documents, embeddings)):
-                # Generate unique ID
-                doc_id = f"{metadata.get('file_id', 'unknown')}_{i}"
-                doc_ids.append(doc_id)
-                
-                # Combine document metadata with global metadata
-                point_metadata = {
-                    **(metadata or {}),
-                    **doc.get('metadata', {}),
-                    'content': doc['content']
-                }
-                
-                # Create point
-                point = PointStruct(
-                    id=doc_id,
-                    vector=embedding,
-                    payload=point_metadata
-                )
-                points.append(point)
-            
-            # Upload points
-            self.client.upsert(
-                collection_name=self.collection_name,
-                points=points
-            )
-            
-            logger.info(f"✅ Added {len(points)} documents to Qdrant")
+            base_metadata = metadata or {}
+            doc_ids = ids or point_ids(metadata, len(documents))
+            if not doc_ids:
+                return []
+            batch_size = self.config.vector_upsert_batch_size
+            parallelism = self.config.vector_upsert_parallelism
+
+            def payload(doc: Dict[str, Any]) -> Dict[str, Any]:
+                payload = {**base_metadata, **doc.get('metadata', {}), 'content': doc['content']}
+                if 'tags' in payload:
+                    payload[TAG_FIELD] = tag_names(payload['tags'])
+                return payload
+
+            def points(start: int) -> List[PointStruct]:
+                return [
+                    PointStruct(id=doc_ids[i], vector=embeddings[i], payload=payload(documents[i]))
+                    for i in range(start, min(start + batch_size, len(documents)))
+                ]
+
+            starts = list(range(0, len(documents), batch_size))
+            if len(starts) > 1:
+                with ThreadPoolExecutor(max_workers=parallelism, thread_name_prefix="qdrant-upsert") as pool:
+                    in_flight = deque()
+                    for start in starts[:-1]:
+                        if len(in_flight) >= parallelism:
+                            in_flight.popleft().result()
+                        in_flight.append(pool.submit(self._upsert, points(start), False))
+                    for future in in_flight:
+                        future.result()
+            self._upsert(points(starts[-1]), True)
+
+            logger.info(f"✅ Added {len(doc_ids)} documents to Qdrant ({len(starts)} batches)")
             return doc_ids
             
         except Exception as e:
             raise VectorStoreError(f"Failed to add documents: {e}")
+
+    def _upsert(self, points: List[PointStruct], wait: bool) -> None:
+        self.client.upsert(
+            collection_name=self.collection_name,
+            points=points,
+            wait=wait
+        )
     
     def search(
         self,
@@ -165,27 +344,64 @@ class QdrantVectorStore(BaseVectorStore):
     ) -> List[Dict[str, Any]]:
         """Search Qdrant for similar documents."""
         try:
+            params = self._search_params()
             results = self.client.search(
                 collection_name=self.collection_name,
                 query_vector=query_embedding,
                 limit=top_k,
-                query_filter=filter_dict
+                query_filter=to_qdrant_filter(filter_dict),
+                **({'search_params': params} if params is not None else {})
             )
-            
-            # Format results
-            formatted_results = []
-            for result in results:
-                formatted_results.append({
-                    'id': result.id,
-                    'score': result.score,
-                    'content': result.payload.get('content', ''),
-                    'metadata': {k: v for k, v in result.payload.items() if k != 'content'}
-                })
-            
-            return formatted_results
+            return [self._format_point(result) for result in results]
             
         except Exception as e:
             raise VectorStoreError(f"Search failed: {e}")
+
+    def search_many(
+        self,
+        query_embeddings: List[List[float]],
+        top_k: int = 5,
+        filter_dict: Optional[Dict[str, Any]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Search several query vectors in one Qdrant batch request."""
+        if not query_embeddings:
+            return []
+        try:
+            params = self._search_params()
+            query_filter = to_qdrant_filter(filter_dict)
+            if hasattr(self.client, 'query_batch_points'):
+                # qdrant-client >= 1.10 (search_batch was removed later)
+                from qdrant_client.models import QueryRequest
+                responses = self.client.query_batch_points(
+                    collection_name=self.collection_name,
+                    requests=[
+                        QueryRequest(query=embedding, limit=top_k, filter=query_filter, params=params, with_payload=True)
+                        for embedding in query_embeddings
+                    ]
+                )
+                batches = [response.points for response in responses]
+            else:
+                from qdrant_client.models import SearchRequest
+                batches = self.client.search_batch(
+                    collection_name=self.collection_name,
+                    requests=[
+                        SearchRequest(vector=embedding, limit=top_k, filter=query_filter, params=params, with_payload=True)
+                        for embedding in query_embeddings
+                    ]
+                )
+            return [[self._format_point(result) for result in results] for results in batches]
+
+        except Exception as e:
+            raise VectorStoreError(f"Search failed: {e}")
+
+    @staticmethod
+    def _format_point(result) -> Dict[str, Any]:
+        return {
+            'id': result.id,
+            'score': result.score,
+            'content': result.payload.get('content', ''),
+            'metadata': {k: v for k, v in result.payload.items() if k not in ('content', TAG_FIELD)}
+        }
     
     def delete_documents(self, document_ids: List[str]) -> None:
         """Delete documents from Qdrant."""
@@ -245,8 +461,10 @@ class ChromaVectorStore(BaseVectorStore):
         except Exception as e:
             raise VectorStoreError(f"Failed to initialize ChromaDB: {e}")
     
-    def create_collection(self, collection_name: str, vector_size: int) -> None:
+    def create_collection(self, collection_name: str, vector_size: int, quantization: Optional[str] = None) -> None:
         """Create a new ChromaDB collection."""
+        if (quantization or self.config.vector_quantization) in ('int8', 'binary'):
+            logger.warning("ChromaDB does not support vector quantization; storing full-precision vectors")
         try:
             self.collection = self.client.get_or_create_collection(
                 name=collection_name,
@@ -260,63 +478,55 @@ class ChromaVectorStore(BaseVectorStore):
         self,
         documents: List[Dict[str, Any]],
         embeddings: List[List[float]],
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        ids: Optional[List[str]] = None
     ) -> List[str]:
-        """Add documents to ChromaDB."""
+        """Add documents to ChromaDB in batches."""
         try:
-            doc_ids = []
-            doc_contents = []
-            doc_embeddings = []
-            doc_metadatas = []
-            
-            for i, (doc, embedding) in enumerate(zip(documents, embeddings)):
-                # Generate unique ID
-                doc_id = f"{metadata.get('file_id', 'unknown')}_{i}"
-                doc_ids.append(doc_id)
-                
-                # Extract content
-                doc_contents.append(doc['content'])
-                doc_embeddings.append(embedding)
-                
-                # Combine metadata (ChromaDB requires all values to be strings, ints, or floats)
-                point_metadata = {
-                    **(metadata or {}),
-                    **doc.get('metadata', {})
-                }
-                
-                # Normalize metadata types for ChromaDB compatibility
-                # Keep ints/floats/str/bool as-is; convert other types to str
-                norm_meta = {}
-                for k, v in point_metadata.items():
-                    if isinstance(v, (int, float, str, bool)):
-                        norm_meta[k] = v
-                    elif v is None:
-                        continue
-                    else:
-                        norm_meta[k] = str(v)
-                # Expand tag list into filterable keys like tag_<name>=1
-                tags_val = point_metadata.get('tags')
-                if isinstance(tags_val, list):
-                    for t in tags_val:
-                        if isinstance(t, str) and t.strip():
-                            norm_meta[f"tag_{t.strip().lower()}"] = 1
-                    # also store human-readable comma string
-                    norm_meta['tags'] = ','.join([t for t in tags_val if isinstance(t, str)])
-                doc_metadatas.append(norm_meta)
-
-            # Add to collection
-            self.collection.add(
-                ids=doc_ids,
-                embeddings=doc_embeddings,
-                documents=doc_contents,
-                metadatas=doc_metadatas
-            )
+            # Global metadata is normalized once, not once per chunk
+            base_metadata = self._normalize_metadata(metadata or {})
+            doc_ids = ids or point_ids(metadata, len(documents))
+            batch_size = self.config.vector_upsert_batch_size
+
+            for start in range(0, len(documents), batch_size):
+                end = start + batch_size
+                batch = documents[start:end]
+                self.collection.upsert(
+                    ids=doc_ids[start:end],
+                    embeddings=embeddings[start:end],
+                    documents=[doc['content'] for doc in batch],
+                    metadatas=[
+                        {**base_metadata, **self._normalize_metadata(doc['metadata'])} if doc.get('metadata') else base_metadata
+                        for doc in batch
+                    ]
+                )
             
             logger.info(f"✅ Added {len(doc_ids)} documents to ChromaDB")
             return doc_ids
             
         except Exception as e:
             raise VectorStoreError(f"Failed to add documents: {e}")
+
+    @staticmethod
+    def _normalize_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Coerce metadata to ChromaDB's scalar types (str, int, float, bool)."""
+        norm_meta = {}
+        for k, v in metadata.items():
+            if isinstance(v, (int, float, str, bool)):
+                norm_meta[k] = v
+            elif v is None:
+                continue
+            else:
+                norm_meta[k] = str(v)
+        # Expand tag list into filterable keys like tag_<name>=1
+        tags_val = metadata.get('tags')
+        if isinstance(tags_val, list):
+            for t in tags_val:
+                if isinstance(t, str) and t.strip():
+                    norm_meta[f"tag_{t.strip().lower()}"] = 1
+            # also store human-readable comma string
+            norm_meta['tags'] = ','.join([t for t in tags_val if isinstance(t, str)])
+        return norm_meta
     
     def search(
         self,
@@ -325,24 +535,37 @@ class ChromaVectorStore(BaseVectorStore):
         filter_dict: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
         """Search ChromaDB for similar documents."""
+        return self.search_many([query_embedding], top_k=top_k, filter_dict=filter_dict)[0]
+
+    def search_many(
+        self,
+        query_embeddings: List[List[float]],
+        top_k: int = 5,
+        filter_dict: Optional[Dict[str, Any]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Search several query vectors in one ChromaDB query."""
+        if not query_embeddings:
+            return []
         try:
             results = self.collection.query(
-                query_embeddings=[query_embedding],
+                query_embeddings=list(query_embeddings),
                 n_results=top_k,
-                where=filter_dict
+                where=to_chroma_where(filter_dict)
             )
             
-            # Format results
-            formatted_results = []
-            for i in range(len(results['ids'][0])):
-                formatted_results.append({
-                    'id': results['ids'][0][i],
-                    'score': 1 - results['distances'][0][i],  # Convert distance to similarity
-                    'content': results['documents'][0][i],
-                    'metadata': results['metadatas'][0][i] if results['metadatas'] else {}
-                })
-            
-            return formatted_results
+            # Format results (one row per query embedding)
+            formatted = []
+            for q in range(len(results['ids'])):
+                formatted.append([
+                    {
+                        'id': results['ids'][q][i],
+                        'score': 1 - results['distances'][q][i],  # Convert distance to similarity
+                        'content': results['documents'][q][i],
+                        'metadata': results['metadatas'][q][i] if results['metadatas'] else {}
+                    }
+                    for i in range(len(results['ids'][q]))
+                ])
+            return formatted
             
         except Exception as e:
             raise VectorStoreError(f"Search failed: {e}")
@@ -388,6 +611,10 @@ class VectorStore:
         elif self.config.vector_store_type == 'chroma':
             self.backend = ChromaVectorStore(self.config)
             logger.info("Using ChromaDB vector store")
+        elif self.config.vector_store_type == 'local':
+            from .local_vector_store import LocalVectorStore
+            self.backend = LocalVectorStore(self.config)
+            logger.info("Using local vector store")
         else:
             raise VectorStoreError(
                 f"Unsupported vector store type: {self.config.vector_store_type}"
@@ -405,49 +632,129 @@ class VectorStore:
         """
         Add documents to vector store with automatic embedding generation.
 
+        When ``metadata`` carries a ``file_id`` the call re-indexes that file
+        incrementally: every chunk's content hash is compared with the one
+        stored in ``vector_metadata``, only new or changed chunks are
+        embedded and upserted, and chunks the file no longer has are deleted
+        in one batch.
+
         Args:
             documents: List of document dictionaries with 'content' key
             metadata: Optional metadata to attach to all documents
 
         Returns:
-            List of document IDs
+            List of document IDs (all chunks of the file, changed or not)
         """
         try:
-            # Extract content from documents
-            contents = [doc['content'] for doc in documents]
-
-            # Generate embeddings
-            logger.info(f"Generating embeddings for {len(contents)} documents...")
-            embeddings = self.embedding_service.embed_documents(contents)
-
-            # Add to vector store
-            doc_ids = self.backend.add_documents(documents, embeddings, metadata)
-
-            # Store metadata in database
-            for doc_id, doc in zip(doc_ids, documents):
-                self.db.add_vector_metadata(
-                    vector_id=doc_id,
-                    file_id=metadata.get('file_id') if metadata else None,
-                    chunk_index=doc.get('metadata', {}).get('chunk_index', 0),
-                    metadata={
-                        **(metadata or {}),
-                        **doc.get('metadata', {})
-                    }
-                )
-
-            logger.info(f"✅ Added {len(doc_ids)} documents to vector store")
+            prepared = self.prepare_documents(documents, metadata)
+            embeddings = []
+            if prepared['changed']:
+                logger.info(f"Generating embeddings for {len(prepared['changed'])} documents...")
+                embeddings = self.embedding_service.embed_documents(pending_texts(prepared))
+            self.write_documents([prepared], [embeddings])
+
+            doc_ids = prepared['doc_ids']
+            logger.info(
+                f"✅ Indexed {len(doc_ids)} documents "
+                f"({len(prepared['changed'])} embedded, {len(doc_ids) - len(prepared['changed'])} unchanged, "
+                f"{len(prepared['stale'])} removed)"
+            )
             return doc_ids
 
         except Exception as e:
             logger.error(f"Failed to add documents to vector store: {e}")
             raise VectorStoreError(f"Failed to add documents: {e}")
 
+    def prepare_documents(
+        self,
+        documents: List[Dict[str, Any]],
+        metadata: Optional[Dict[str, Any]] = None,
+        offset: int = 0,
+        final: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Diff a file's chunks against the index without writing anything.
+
+        A file streamed in parts is prepared part by part: ``offset`` is the
+        number of chunks in earlier parts, and only the ``final`` part looks
+        for stale chunks (the file's chunk count is known only then).
+
+        Returns:
+            Dictionary with the file's 'documents', 'metadata', 'doc_ids' and
+            'hashes', the positions of chunks that need embedding ('changed')
+            and the ids of chunks the file no longer has ('stale')
+        """
+        file_id = (metadata or {}).get('file_id')
+        doc_ids = point_ids(metadata, offset + len(documents))
+        hashes = [chunk_hash(doc) for doc in documents]
+
+        existing = self.db.get_chunk_hashes(file_id) if file_id else {}
+        current = set(doc_ids)
+        doc_ids = doc_ids[offset:]
+        return {
+            'documents': documents,
+            'metadata': metadata or {},
+            'file_id': file_id,
+            'doc_ids': doc_ids,
+            'hashes': hashes,
+            'changed': [i for i, (doc_id, digest) in enumerate(zip(doc_ids, hashes)) if existing.get(doc_id) != digest],
+            'stale': [doc_id for doc_id in existing if doc_id not in current] if final else [],
+        }
+
+    def write_documents(
+        self,
+        prepared: List[Dict[str, Any]],
+        embeddings: List[List[List[float]]]
+    ) -> None:
+        """
+        Write prepared files to the index in one batch.
+
+        Args:
+            prepared: Results of ``prepare_documents``
+            embeddings: Per prepared file, the vectors of its changed chunks
+        """
+        docs, vectors, ids, rows, stale = [], [], [], [], []
+        for item, item_embeddings in zip(prepared, embeddings):
+            documents, metadata = item['documents'], item['metadata']
+            for i, vector in zip(item['changed'], item_embeddings):
+                if len(prepared) == 1:
+                    docs.append(documents[i])
+                else:
+                    # Files differ in metadata, so it travels with each chunk
+                    docs.append({**documents[i], 'metadata': {**metadata, **documents[i].get('metadata', {})}})
+                vectors.append(vector)
+                ids.append(item['doc_ids'][i])
+                rows.append({
+                    'vector_id': item['doc_ids'][i],
+                    'file_id': item['file_id'],
+                    'chunk_index': documents[i].get('metadata', {}).get('chunk_index', 0),
+                    'metadata': {**metadata, **documents[i].get('metadata', {})},
+                    'chunk_text': documents[i]['content'],
+                    'content_hash': item['hashes'][i]
+                })
+            stale.extend(item['stale'])
+
+        if docs:
+            base_metadata = prepared[0]['metadata'] if len(prepared) == 1 else None
+            self.backend.add_documents(docs, vectors, base_metadata, ids=ids)
+            # Store metadata in one transaction (chunk text feeds the lexical index)
+            self.db.add_vector_metadata_many(rows)
+
+        if stale:
+            # Metadata goes last so a failed delete is retried next time
+            self.backend.delete_documents(stale)
+            self.db.delete_vector_metadata_many(stale)
+
+        if docs or stale:
+            invalidate_semantic_cache()
+
     def search(
         self,
         query: str,
         top_k: int = 5,
         filter_dict: Optional[Dict[str, Any]] = None,
-        min_score: Optional[float] = None
+        min_score: Optional[float] = None,
+        mode: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Search for similar documents using natural language query.
@@ -456,29 +763,179 @@ class VectorStore:
             query: Natural language search query
             top_k: Number of results to return
             filter_dict: Optional metadata filters
-            min_score: Minimum relevance score threshold
+            min_score: Minimum relevance score threshold (applies to vector
+                similarity; lexical matches are kept in hybrid mode)
+            mode: 'vector', 'lexical' (BM25 over chunk text) or 'hybrid'
+                (both, merged with reciprocal rank fusion). Defaults to
+                VECTOR_SEARCH_MODE.
 
         Returns:
             List of search results with content and metadata
         """
+        mode = (mode or self.config.vector_search_mode).lower()
+        if mode not in SEARCH_MODES:
+            raise VectorStoreError(f"Unsupported search mode: {mode}")
+
         try:
-            # Generate query embedding
-            query_embedding = self.embedding_service.embed_query(query)
-
-            # Search vector store
-            results = self.backend.search(
-                query_embedding=query_embedding,
-                top_k=top_k,
-                filter_dict=filter_dict
-            )
+            if mode == 'vector':
+                results = self._vector_search(query, top_k, filter_dict, min_score)
+            elif mode == 'lexical':
+                results = self._lexical_search(query, top_k, filter_dict)
+            else:
+                results = self._hybrid_search(query, top_k, filter_dict, min_score)
 
-            # Filter by minimum score if specified
-            if min_score is not None:
-                results = [r for r in results if r['score'] >= min_score]
+            logger.info(f"Found {len(results)} results for query ({mode})")
+            return results
 
-            logger.info(f"Found {len(results)} results for query")
+        except VectorStoreError:
+            raise
+        except Exception as e:
+            logger.error(f"Search failed: {e}")
+            raise VectorStoreError(f"Search failed: {e}")
+
+    def _vector_search(
+        self,
+        query: str,
+        top_k: int,
+        filter_dict: Optional[Dict[str, Any]],
+        min_score: Optional[float]
+    ) -> List[Dict[str, Any]]:
+        # Generate query embedding
+        query_embedding = self.embedding_service.embed_query(query)
+
+        # Search vector store
+        results = self.backend.search(
+            query_embedding=query_embedding,
+            top_k=top_k,
+            filter_dict=filter_dict
+        )
+
+        # Filter by minimum score if specified
+        if min_score is not None:
+            results = [r for r in results if r['score'] >= min_score]
+        return results
+
+    def _lexical_search(
+        self,
+        query: str,
+        top_k: int,
+        filter_dict: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        # The BM25 index understands plain equality filters only; backend
+        # specific filter objects are left to the vector leg.
+        if filter_dict and not all(isinstance(v, (str, int, float, bool)) for v in filter_dict.values()):
+            logger.debug("Skipping lexical search: filter is not a plain equality filter")
+            return []
+        return self.db.lexical_search(query, limit=top_k, filters=filter_dict)
+
+    def _hybrid_search(
+        self,
+        query: str,
+        top_k: int,
+        filter_dict: Optional[Dict[str, Any]],
+        min_score: Optional[float]
+    ) -> List[Dict[str, Any]]:
+        global _lexical_pool
+        if _lexical_pool is None:
+            _lexical_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="lexical-search")
+
+        candidates = top_k * HYBRID_CANDIDATE_FACTOR
+        # BM25 runs while the query is embedded and the vector backend searched
+        lexical_future = _lexical_pool.submit(self._lexical_search, query, candidates, filter_dict)
+        vector_results = self._vector_search(query, candidates, filter_dict, min_score)
+        try:
+            lexical_results = lexical_future.result()
+        except Exception as e:
+            logger.warning(f"Lexical search failed, using vector results only: {e}")
+            lexical_results = []
+
+        return self._fuse(vector_results, lexical_results, top_k)
+
+    def _fuse(
+        self,
+        vector_results: List[Dict[str, Any]],
+        lexical_results: List[Dict[str, Any]],
+        top_k: int
+    ) -> List[Dict[str, Any]]:
+        vector_scores = {str(r['id']): r['score'] for r in vector_results}
+        lexical_scores = {str(r['id']): r['score'] for r in lexical_results}
+        fused = reciprocal_rank_fusion([vector_results, lexical_results], k=self.config.hybrid_rrf_k)
+        for result in fused:
+            result['vector_score'] = vector_scores.get(str(result['id']))
+            result['lexical_score'] = lexical_scores.get(str(result['id']))
+        return fused[:top_k]
+
+    def search_many(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        min_score: Optional[float] = None,
+        mode: Optional[str] = None,
+        dedupe: bool = True
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search several natural language queries at once.
+
+        All queries are embedded in one batched embedding call and sent to
+        the backend as one batch search; in hybrid mode the BM25 legs run
+        alongside.
+
+        Args:
+            queries: Natural language queries
+            top_k: Number of results per query
+            filter_dict: Optional metadata filters (shared by all queries)
+            min_score: Minimum vector similarity (see search)
+            mode: 'vector', 'lexical' or 'hybrid' (defaults to VECTOR_SEARCH_MODE)
+            dedupe: Keep each document only under the query that scored it
+                highest
+
+        Returns:
+            One result list per query, in query order
+        """
+        mode = (mode or self.config.vector_search_mode).lower()
+        if mode not in SEARCH_MODES:
+            raise VectorStoreError(f"Unsupported search mode: {mode}")
+        if not queries:
+            return []
+
+        try:
+            if mode == 'lexical':
+                results = [self._lexical_search(query, top_k, filter_dict) for query in queries]
+            else:
+                candidates = top_k * HYBRID_CANDIDATE_FACTOR if mode == 'hybrid' else top_k
+                lexical_future = None
+                if mode == 'hybrid':
+                    global _lexical_pool
+                    if _lexical_pool is None:
+                        _lexical_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="lexical-search")
+                    lexical_future = _lexical_pool.submit(
+                        lambda: [self._lexical_search(query, candidates, filter_dict) for query in queries]
+                    )
+
+                embeddings = self.embedding_service.embed_documents(list(queries))
+                results = self.backend.search_many(embeddings, top_k=candidates, filter_dict=filter_dict)
+                if min_score is not None:
+                    results = [[r for r in hits if r['score'] >= min_score] for hits in results]
+
+                if lexical_future is not None:
+                    try:
+                        lexical_results = lexical_future.result()
+                    except Exception as e:
+                        logger.warning(f"Lexical search failed, using vector results only: {e}")
+                        lexical_results = [[] for _ in queries]
+                    results = [
+                        self._fuse(vector_hits, lexical_hits, top_k)
+                        for vector_hits, lexical_hits in zip(results, lexical_results)
+                    ]
+
+            if dedupe:
+                results = dedupe_across_queries(results)
+            logger.info(f"Found {sum(len(r) for r in results)} results for {len(queries)} queries ({mode})")
             return results
 
+        except VectorStoreError:
+            raise
         except Exception as e:
             logger.error(f"Search failed: {e}")
             raise VectorStoreError(f"Search failed: {e}")
@@ -487,17 +944,20 @@ class VectorStore:
         """Delete documents from vector store."""
         self.backend.delete_documents(document_ids)
 
-        # Remove from database
-        for doc_id in document_ids:
-            self.db.delete_vector_metadata(doc_id)
+        # Remove from database (triggers prune the lexical index)
+        self.db.delete_vector_metadata_many(document_ids)
+
+        invalidate_semantic_cache()
 
     def get_collection_info(self) -> Dict[str, Any]:
         """Get information about the vector store collection."""
         return self.backend.get_collection_info()
 
-    def create_collection(self, collection_name: str, vector_size: int = 768) -> None:
+    def create_collection(self, collection_name: str, vector_size: int = 768, quantization: Optional[str] = None) -> None:
         """Create a new collection in the vector store."""
-        self.backend.create_collection(collection_name, vector_size)
+        if quantization is not None and quantization not in QUANTIZATION_MODES:
+            raise VectorStoreError(f"Unsupported quantization: {quantization}")
+        self.backend.create_collection(collection_name, vector_size, quantization=quantization)
 
 
 # Global service instance
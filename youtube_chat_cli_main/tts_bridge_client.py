@@ -4,6 +4,16 @@ TTS Bridge Client - Python 3.13 Client for Python 3.11 TTS Bridge
 This module provides a client interface to communicate with the Python 3.11
 TTS bridge subprocess for MeloTTS and Chatterbox engines.
 
+By default the bridge runs as a pool of long-lived daemons
+(``tts_bridge.py --serve``) that load each model once and answer
+length-prefixed JSON requests over stdin/stdout, so only the first segment
+pays interpreter start-up and model load time. Idle workers are health
+checked before reuse and restarted automatically if they die.
+
+Environment:
+    TTS_BRIDGE_WORKERS: Number of daemon workers (default 1; each holds its own models)
+    TTS_BRIDGE_PERSISTENT: Set to "false" to spawn one subprocess per request
+
 Author: Augment Agent
 Date: September 30, 2025
 """
@@ -11,24 +21,275 @@ Date: September 30, 2025
 import os
 import sys
 import json
+import time
+import queue
+import struct
+import atexit
+import threading
 import subprocess
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Frame header shared with tts_bridge.py: 4-byte big-endian payload length
+FRAME_HEADER = struct.Struct(">I")
+
+# Seconds to wait for a freshly started daemon to answer its first ping
+STARTUP_TIMEOUT_S = 60
+# Idle workers older than this are pinged before being handed a request
+HEALTH_CHECK_INTERVAL_S = 30
+HEALTH_CHECK_TIMEOUT_S = 10
+
+
+class BridgeWorkerDied(RuntimeError):
+    """Raised when a bridge daemon exits or closes its pipe mid-request."""
+    pass
+
+
+def _bridge_env() -> Dict[str, str]:
+    env = os.environ.copy()
+    env.setdefault("PYTHONIOENCODING", "utf-8")
+    env.setdefault("PYTHONUTF8", "1")
+    return env
+
+
+class _BridgeWorker:
+    """One long-lived ``tts_bridge.py --serve`` process."""
+
+    def __init__(self, python_path: str, bridge_script: Path, index: int = 0):
+        self.python_path = python_path
+        self.bridge_script = bridge_script
+        self.index = index
+        self.process: Optional[subprocess.Popen] = None
+        self.requests = 0
+        self.restarts = 0
+        self.last_used = 0.0
+        self._responses: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._next_id = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid if self.process is not None else None
+
+    def start(self) -> None:
+        """Spawn the daemon and wait until it answers a ping."""
+        if self.process is not None:
+            self.stop()
+            self.restarts += 1
+
+        self._responses = queue.Queue()
+        self.process = subprocess.Popen(
+            [self.python_path, str(self.bridge_script), "--serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=_bridge_env(),
+        )
+        threading.Thread(
+            target=self._read_responses, args=(self.process, self._responses),
+            name=f"tts-bridge-{self.index}-out", daemon=True,
+        ).start()
+        threading.Thread(
+            target=self._drain_stderr, args=(self.process,),
+            name=f"tts-bridge-{self.index}-err", daemon=True,
+        ).start()
+
+        self.request({"op": "ping"}, timeout=STARTUP_TIMEOUT_S)
+        logger.info(f"✅ TTS bridge worker {self.index} started (pid {self.process.pid})")
+
+    @staticmethod
+    def _read_responses(process: subprocess.Popen, responses: "queue.Queue") -> None:
+        stream = process.stdout
+        try:
+            while True:
+                header = stream.read(FRAME_HEADER.size)
+                if len(header) < FRAME_HEADER.size:
+                    break
+                (length,) = FRAME_HEADER.unpack(header)
+                payload = stream.read(length)
+                if len(payload) < length:
+                    break
+                responses.put(json.loads(payload.decode("utf-8")))
+        except Exception as e:
+            logger.warning(f"TTS bridge response reader stopped: {e}")
+        responses.put(None)  # end of stream
+
+    def _drain_stderr(self, process: subprocess.Popen) -> None:
+        for line in iter(process.stderr.readline, b""):
+            logger.debug(f"[tts-bridge {self.index}] {line.decode('utf-8', errors='replace').rstrip()}")
+
+    def request(self, message: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """
+        Send one request and wait for its response.
+
+        Raises:
+            BridgeWorkerDied: The daemon exited or closed its pipe
+            RuntimeError: No response within ``timeout`` (the daemon is killed)
+        """
+        if not self.alive:
+            raise BridgeWorkerDied(f"TTS bridge worker {self.index} is not running")
+
+        self._next_id += 1
+        message = dict(message, id=self._next_id)
+        payload = json.dumps(message).encode("utf-8")
+        try:
+            self.process.stdin.write(FRAME_HEADER.pack(len(payload)) + payload)
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise BridgeWorkerDied(f"TTS bridge worker {self.index} pipe closed: {e}")
+
+        try:
+            response = self._responses.get(timeout=timeout)
+        except queue.Empty:
+            # The daemon is still busy with this request; its answer would
+            # arrive out of order, so replace the process.
+            self.stop(kill=True)
+            raise RuntimeError(f"TTS bridge timed out after {timeout} seconds")
+
+        if response is None:
+            raise BridgeWorkerDied(f"TTS bridge worker {self.index} exited (code {self.process.poll()})")
+        self.requests += 1
+        self.last_used = time.monotonic()
+        return response
+
+    def healthy(self) -> bool:
+        """Ping the daemon; False if it is dead or unresponsive."""
+        try:
+            return bool(self.request({"op": "ping"}, timeout=HEALTH_CHECK_TIMEOUT_S).get("success"))
+        except Exception:
+            return False
+
+    def stop(self, kill: bool = False) -> None:
+        """Stop the daemon (EOF on stdin, then kill if it lingers)."""
+        process = self.process
+        if process is None or process.poll() is not None:
+            return
+        if kill:
+            process.kill()
+            process.wait()
+            return
+        try:
+            process.stdin.close()
+        except Exception:
+            pass
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "index": self.index,
+            "pid": self.pid,
+            "alive": self.alive,
+            "requests": self.requests,
+            "restarts": self.restarts,
+        }
+
+
+class BridgeWorkerPool:
+    """
+    Fixed-size pool of bridge daemons.
+
+    Each request checks out an idle worker, so at most ``size`` segments are
+    synthesized at once. Workers start lazily and are restarted when found
+    dead or unhealthy; a request that loses its worker mid-flight is retried
+    once on a fresh daemon.
+    """
+
+    def __init__(self, python_path: str, bridge_script: Path, size: int = 1):
+        self.size = max(1, size)
+        self.workers: List[_BridgeWorker] = [
+            _BridgeWorker(python_path, bridge_script, index=i) for i in range(self.size)
+        ]
+        self._idle: "queue.Queue[_BridgeWorker]" = queue.Queue()
+        for worker in self.workers:
+            self._idle.put(worker)
+
+    def _ensure_ready(self, worker: _BridgeWorker) -> None:
+        if not worker.alive:
+            if worker.process is not None:
+                logger.warning(f"TTS bridge worker {worker.index} died; restarting")
+            worker.start()
+        elif time.monotonic() - worker.last_used > HEALTH_CHECK_INTERVAL_S and not worker.healthy():
+            logger.warning(f"TTS bridge worker {worker.index} failed health check; restarting")
+            worker.start()
+
+    def request(self, message: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Run a request on the next free worker."""
+        worker = self._idle.get()
+        try:
+            try:
+                self._ensure_ready(worker)
+                return worker.request(message, timeout)
+            except BridgeWorkerDied as e:
+                logger.warning(f"{e}; retrying on a restarted worker")
+                worker.start()
+                return worker.request(message, timeout)
+        finally:
+            self._idle.put(worker)
+
+    def status(self) -> List[Dict[str, Any]]:
+        return [worker.status() for worker in self.workers]
+
+    def shutdown(self) -> None:
+        for worker in self.workers:
+            worker.stop()
+
+
+# Daemon pools shared by every client using the same interpreter and script,
+# so models stay warm across TTSBridgeClient instances.
+_pools: Dict[Tuple[str, str], BridgeWorkerPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_bridge_pool(python_path: str, bridge_script: Path, size: int = 1) -> BridgeWorkerPool:
+    """Get (or create) the shared daemon pool for an interpreter/script pair."""
+    key = (python_path, str(bridge_script))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = BridgeWorkerPool(python_path, bridge_script, size=size)
+            _pools[key] = pool
+        return pool
+
+
+def shutdown_bridge_pools() -> None:
+    """Stop every bridge daemon started by this process."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
+atexit.register(shutdown_bridge_pools)
+
 
 class TTSBridgeClient:
     """Client for communicating with Python 3.11 TTS bridge subprocess."""
     
-    def __init__(self, python311_path: Optional[str] = None):
+    def __init__(
+        self,
+        python311_path: Optional[str] = None,
+        workers: Optional[int] = None,
+        persistent: Optional[bool] = None
+    ):
         """
         Initialize TTS Bridge Client.
         
         Args:
             python311_path: Path to Python 3.11 executable. If None, will try to
                           auto-detect from .python311_path file or environment.
+            workers: Number of bridge daemons (default: TTS_BRIDGE_WORKERS or 1)
+            persistent: Keep daemons warm between requests (default: TTS_BRIDGE_PERSISTENT or True)
         """
         self.python311_path = self._find_python311_path(python311_path)
         self.bridge_script = self._find_bridge_script()
@@ -36,6 +297,17 @@ class TTSBridgeClient:
         # Verify Python 3.11 is available
         self._verify_python311()
         
+        if persistent is None:
+            persistent = os.environ.get("TTS_BRIDGE_PERSISTENT", "true").lower() == "true"
+        self.persistent = persistent
+        if workers is None:
+            try:
+                workers = int(os.environ.get("TTS_BRIDGE_WORKERS", "1"))
+            except ValueError:
+                workers = 1
+        self.workers = max(1, workers)
+        self._pool: Optional[BridgeWorkerPool] = None
+        
         logger.info(f"✅ TTS Bridge initialized with Python 3.11: {self.python311_path}")
     
     def _find_python311_path(self, provided_path: Optional[str]) -> str:
@@ -144,9 +416,7 @@ class TTSBridgeClient:
         logger.info(f"Running TTS bridge: {' '.join(args[:4])}...")
         
         try:
-            env = os.environ.copy()
-            env.setdefault("PYTHONIOENCODING", "utf-8")
-            env.setdefault("PYTHONUTF8", "1")
+            env = _bridge_env()
             result = subprocess.run(
                 cmd,
                 capture_output=True,
@@ -187,6 +457,54 @@ class TTSBridgeClient:
         except subprocess.TimeoutExpired:
             raise RuntimeError(f"TTS bridge timed out after {timeout} seconds")
     
+    @staticmethod
+    def _to_args(request: Dict[str, Any]) -> list:
+        """Convert a daemon request into single-shot command line arguments."""
+        args = []
+        for key, value in request.items():
+            if key == "op" or value is None:
+                continue
+            args.extend([f"--{key.replace('_', '-')}", str(value)])
+        return args
+    
+    def _request(self, request: Dict[str, Any], timeout: int = 120) -> Dict[str, Any]:
+        """
+        Run a generation request on a warm bridge daemon.
+        
+        Falls back to a single-shot subprocess when persistence is disabled
+        or the daemon cannot be kept alive.
+        
+        Args:
+            request: Request fields (engine, text, output, ...)
+            timeout: Timeout in seconds
+        
+        Returns:
+            Response dictionary from bridge
+        """
+        if not self.persistent:
+            return self._run_bridge(self._to_args(request), timeout=timeout)
+        
+        if self._pool is None:
+            self._pool = get_bridge_pool(self.python311_path, self.bridge_script, size=self.workers)
+        
+        logger.info(f"Sending TTS bridge request: {request.get('engine')} ({len(request.get('text', ''))} chars)")
+        try:
+            response = self._pool.request(dict(request, op="generate"), timeout=timeout)
+        except BridgeWorkerDied as e:
+            logger.warning(f"TTS bridge daemon unavailable ({e}); falling back to single-shot subprocess")
+            return self._run_bridge(self._to_args(request), timeout=timeout)
+        
+        if not response.get("success"):
+            raise RuntimeError(f"TTS generation failed: {response.get('error')}")
+        return response
+    
+    def status(self) -> Dict[str, Any]:
+        """Bridge mode and per-worker state (pid, alive, requests, restarts)."""
+        return {
+            "persistent": self.persistent,
+            "workers": self._pool.status() if self._pool is not None else [],
+        }
+    
     def generate_melotts(
         self,
         text: str,
@@ -208,16 +526,16 @@ class TTSBridgeClient:
         Returns:
             Path to generated audio file
         """
-        args = [
-            "--engine", "melotts",
-            "--text", text,
-            "--output", output_file,
-            "--language", language,
-            "--speed", str(speed),
-            "--voice-index", str(voice_index)
-        ]
+        request = {
+            "engine": "melotts",
+            "text": text,
+            "output": output_file,
+            "language": language,
+            "speed": speed,
+            "voice_index": voice_index
+        }
         
-        response = self._run_bridge(args)
+        response = self._request(request)
         logger.info(f"✅ MeloTTS audio generated: {response['output']}")
         
         return response["output"]
@@ -245,22 +563,18 @@ class TTSBridgeClient:
         Returns:
             Path to generated audio file
         """
-        args = [
-            "--engine", "chatterbox",
-            "--text", text,
-            "--output", output_file,
-            "--exaggeration", str(exaggeration),
-            "--cfg-weight", str(cfg_weight)
-        ]
-        
-        if audio_prompt:
-            args.extend(["--audio-prompt", audio_prompt])
-        
-        if language_id:
-            args.extend(["--language-id", language_id])
+        request = {
+            "engine": "chatterbox",
+            "text": text,
+            "output": output_file,
+            "exaggeration": exaggeration,
+            "cfg_weight": cfg_weight,
+            "audio_prompt": audio_prompt or None,
+            "language_id": language_id or None
+        }
 
         # Allow longer time for model load and inference on first calls
-        response = self._run_bridge(args, timeout=600)
+        response = self._request(request, timeout=600)
         logger.info(f"✅ Chatterbox audio generated: {response['output']}")
 
         return response["output"]
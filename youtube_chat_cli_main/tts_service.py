@@ -3,7 +3,7 @@ TTS service module for generating audio from text using gTTS (Google Text-to-Spe
 """
 
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 import logging
 logger = logging.getLogger(__name__)
@@ -58,6 +58,16 @@ try:
 except Exception as e:
     logger.info(f"TTS Bridge not available: {e}")
 
+# Streaming podcast assembly (stdlib wave; pydub only for non-PCM segments)
+try:
+    from youtube_chat_cli_main.audio_assembly import AudioAssemblyError, assemble_wav
+except Exception:
+    from audio_assembly import AudioAssemblyError, assemble_wav  # type: ignore
+
+# Default concurrent segments per engine (override with TTS_SEGMENT_CONCURRENCY_<ENGINE>)
+SEGMENT_CONCURRENCY_DEFAULTS = {'edge': '4', 'default': '2'}
+
+
 class APIError(Exception):
     """Error related to external API calls."""
     pass
@@ -432,7 +442,8 @@ class TTSService:
             raise APIError(f"Chatterbox bridge generation failed: {e}")
 
     def generate_audio(self, text: str, output_file: str = "overview.wav",
-                      voice: str = "en-US-AriaNeural", audio_format: str = "wav", slow: bool = False) -> str:
+                      voice: str = "en-US-AriaNeural", audio_format: str = "wav", slow: bool = False,
+                      allow_bridge: bool = True) -> str:
         """Generate audio from text using Edge TTS (preferred) or gTTS (fallback).
 
         Args:
@@ -441,6 +452,8 @@ class TTSService:
             voice: Edge TTS voice name or language code for fallback
             audio_format: Output audio format (wav recommended for Edge TTS)
             slow: Whether to use slow speech for different voice articulation (gTTS only)
+            allow_bridge: Set to False to skip the Python 3.11 bridge engines
+                (used when retrying a segment the bridge already failed)
 
         Returns:
             Path to the generated audio file
@@ -451,7 +464,7 @@ class TTSService:
         logger.info(f"Generating audio for text ({len(text)} characters)")
 
         # FORCE: Chatterbox when requested (default ON for podcast path)
-        if os.getenv("TTS_FORCE_CHATTERBOX", "1") == "1":
+        if allow_bridge and os.getenv("TTS_FORCE_CHATTERBOX", "1") == "1":
             try:
                 logger.info("🎯 Forcing Chatterbox via Python 3.11 bridge...")
                 return self.generate_audio_chatterbox_bridge(text, output_file, exaggeration=0.5)
@@ -460,7 +473,7 @@ class TTSService:
                 raise
 
         # PRIORITY 1: Try Chatterbox via Python 3.11 bridge (HIGHEST QUALITY: 4.5/5)
-        if self.tts_bridge_available:
+        if allow_bridge and self.tts_bridge_available:
             try:
                 logger.info("🎯 Attempting Chatterbox (4.5/5 quality) via Python 3.11 bridge...")
                 return self.generate_audio_chatterbox_bridge(text, output_file, exaggeration=0.5)
@@ -468,7 +481,7 @@ class TTSService:
                 logger.warning(f"Chatterbox bridge failed, falling back to MeloTTS: {e}")
 
         # PRIORITY 2: Try MeloTTS via Python 3.11 bridge (HIGH QUALITY: 4/5)
-        if self.tts_bridge_available:
+        if allow_bridge and self.tts_bridge_available:
             try:
                 logger.info("🎯 Attempting MeloTTS (4/5 quality) via Python 3.11 bridge...")
                 return self.generate_audio_melotts_bridge(text, output_file, language="EN-US", speed=1.0)
@@ -616,7 +629,8 @@ class TTSService:
             podcast_script: The full podcast script text
 
         Returns:
-            List of tuples (speaker_name, voice_code, text_segment, audio_file_path)
+            List of tuples (speaker_name, voice_code, text_segment, audio), where audio
+            is the segment file path or, for engines that stream, the encoded audio bytes
         """
         import re
         import tempfile
@@ -657,181 +671,230 @@ class TTSService:
         seg_dir = Path('outputs') / f"podcast_segments_{int(_time.time())}"
         seg_dir.mkdir(parents=True, exist_ok=True)
 
-        temp_files = []
-
-        try:
-            for idx, (speaker_info, text) in enumerate(matches, start=1):
-                speaker_clean = speaker_info.lower().strip()
-
-                # Determine voice based on speaker name - use Edge TTS voice names directly
-                selected_voice = "en-US-AriaNeural"  # default American voice
-                for key, voice_name in voice_map.items():
-                    if key in speaker_clean:
-                        selected_voice = voice_name
-                        break
-
-                # Stable per-segment output path under outputs/
-                temp_wav_file = str(seg_dir / f"seg_{idx:02d}.wav")
-                # Ensure clean target
-                if os.path.exists(temp_wav_file):
-                    try:
-                        os.remove(temp_wav_file)
-                    except Exception:
-                        pass
-                temp_files.append(temp_wav_file)
-
-                # Generate audio for this segment sequentially to avoid file locking
+        # Plan one job per speaker turn: (index, speaker, voice, text, wav path)
+        jobs = []
+        for idx, (speaker_info, text) in enumerate(matches, start=1):
+            speaker_clean = speaker_info.lower().strip()
+
+            # Determine voice based on speaker name - use Edge TTS voice names directly
+            selected_voice = "en-US-AriaNeural"  # default American voice
+            for key, voice_name in voice_map.items():
+                if key in speaker_clean:
+                    selected_voice = voice_name
+                    break
+
+            # Stable per-segment output path under outputs/
+            temp_wav_file = str(seg_dir / f"seg_{idx:02d}.wav")
+            # Ensure clean target
+            if os.path.exists(temp_wav_file):
                 try:
+                    os.remove(temp_wav_file)
+                except Exception:
+                    pass
+            jobs.append((idx, speaker_info, selected_voice, text.strip(), temp_wav_file))
 
-                    # Prefer Chatterbox via bridge when forced (default: ON)
-                    force_chatterbox = os.getenv("TTS_FORCE_CHATTERBOX", "1") == "1"
-                    if force_chatterbox and self.tts_bridge_available:
-                        try:
-                            logger.info("Forcing Chatterbox bridge for segment...")
-                            self.generate_audio_chatterbox_bridge(text.strip(), temp_wav_file, exaggeration=0.5)
-                            segments.append((speaker_info, selected_voice, text.strip(), temp_wav_file))
-                            continue
-                        except Exception as ce:
-                            logger.warning(f"Chatterbox forced segment failed, falling back: {ce}")
-
-                    # Default path (will attempt Chatterbox first inside generate_audio)
-                    self.generate_audio(text.strip(), temp_wav_file, voice=selected_voice)
-                    segments.append((speaker_info, selected_voice, text.strip(), temp_wav_file))
-                except Exception as e:
-                    logger.warning(f"Failed to generate audio for speaker {speaker_info}: {e}")
-                    # Clean up failed temp file
-                    try:
-                        if os.path.exists(temp_wav_file):
-                            os.remove(temp_wav_file)
-                    except Exception:
-                        pass
-                    # Skip this segment but continue
-                    continue
-
+        try:
+            # Every segment writes its own seg_NN.wav, so segments are
+            # synthesized concurrently and assembled back in script order.
+            buffers, errors = self._synthesize_segments(jobs)
         except Exception as e:
             logger.error(f"Error generating podcast segments: {e}")
             # Clean up temp files
-            for temp_file in temp_files:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
+            for job in jobs:
+                if os.path.exists(job[4]):
+                    os.remove(job[4])
             raise e
 
+        for idx, speaker_info, selected_voice, text, temp_wav_file in jobs:
+            if idx in errors:
+                logger.warning(f"Failed to generate audio for speaker {speaker_info}: {errors[idx]}")
+                # Clean up failed temp file and skip this segment
+                try:
+                    if os.path.exists(temp_wav_file):
+                        os.remove(temp_wav_file)
+                except Exception:
+                    pass
+                continue
+            segments.append((speaker_info, selected_voice, text, buffers.get(idx, temp_wav_file)))
+
         logger.info(f"Generated {len(segments)} audio segments")
         return segments
 
-    def _combine_audio_segments(self, segments: list, output_file: str) -> str:
-        """Combine multiple audio segments into a single podcast file.
+    def _segment_engine(self) -> str:
+        """Primary engine for podcast segments: 'bridge', 'edge' or 'default'."""
+        if self.tts_bridge_available:
+            return "bridge"
+        if self.edge_tts_available:
+            return "edge"
+        return "default"
+
+    def _segment_concurrency(self, engine: str) -> int:
+        """Concurrent segments for an engine (TTS_SEGMENT_CONCURRENCY_<ENGINE>).
+
+        The bridge defaults to one segment per bridge daemon (TTS_BRIDGE_WORKERS);
+        more would only queue behind the daemons.
+        """
+        if engine == "bridge":
+            default = os.getenv("TTS_BRIDGE_WORKERS", "1")
+        else:
+            default = SEGMENT_CONCURRENCY_DEFAULTS.get(engine, "2")
+        try:
+            return max(1, int(os.getenv(f"TTS_SEGMENT_CONCURRENCY_{engine.upper()}", default)))
+        except ValueError:
+            return max(1, int(SEGMENT_CONCURRENCY_DEFAULTS.get(engine, "2")))
+
+    def _synthesize_segments(self, jobs: list) -> Tuple[Dict[int, bytes], Dict[int, Exception]]:
+        """Synthesize segment jobs concurrently, retrying failures on the fallback engine.
 
         Args:
-            segments: List of tuples (speaker_name, voice_code, text, audio_file_path)
-            output_file: Final output file path
+            jobs: List of tuples (index, speaker_name, voice, text, audio_file_path)
 
         Returns:
-            Path to the combined audio file
+            Tuple of (in-memory audio by segment index, errors by segment index).
+            Segments in neither mapping were written to their audio_file_path.
         """
-        if not segments:
-            raise APIError("No audio segments to combine")
+        buffers: Dict[int, bytes] = {}
+        engine = self._segment_engine()
+        concurrency = self._segment_concurrency(engine)
+        logger.info(f"Synthesizing {len(jobs)} segments with {engine} engine (concurrency {concurrency})")
+
+        if engine == "edge":
+            errors = self._run_edge_segments(jobs, concurrency, buffers)
+        elif engine == "bridge":
+            errors = self._run_threaded_segments(jobs, self._bridge_segment, concurrency)
+        else:
+            errors = self._run_threaded_segments(jobs, self._fallback_segment, concurrency)
 
-        logger.info(f"Combining {len(segments)} audio segments")
+        if errors and engine != "default":
+            retry = [job for job in jobs if job[0] in errors]
+            fallback = "edge" if engine == "bridge" and self.edge_tts_available else "default"
+            logger.warning(f"Retrying {len(retry)} failed segments on fallback engines")
+            errors = self._run_threaded_segments(retry, self._fallback_segment, self._segment_concurrency(fallback))
+
+        return buffers, errors
+
+    def _bridge_segment(self, job: tuple) -> None:
+        _, _, voice, text, output_file = job
+        # Prefer Chatterbox via bridge when forced (default: ON)
+        if os.getenv("TTS_FORCE_CHATTERBOX", "1") == "1":
+            self.generate_audio_chatterbox_bridge(text, output_file, exaggeration=0.5)
+        else:
+            self.generate_audio(text, output_file, voice=voice)
+
+    def _fallback_segment(self, job: tuple) -> None:
+        _, _, voice, text, output_file = job
+        self.generate_audio(text, output_file, voice=voice, allow_bridge=False)
+
+    def _run_threaded_segments(self, jobs: list, synthesize, concurrency: int) -> Dict[int, Exception]:
+        """Run ``synthesize(job)`` for each job on a bounded thread pool."""
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        errors: Dict[int, Exception] = {}
+        if not jobs:
+            return errors
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(jobs)), thread_name_prefix="tts-segment") as pool:
+            futures = {pool.submit(synthesize, job): job[0] for job in jobs}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    errors[futures[future]] = e
+        return errors
 
+    def _run_edge_segments(self, jobs: list, concurrency: int, buffers: Dict[int, bytes]) -> Dict[int, Exception]:
+        """Run Edge TTS segments concurrently on a single event loop.
+
+        Audio is collected into ``buffers`` (segment index -> encoded audio)
+        instead of being written to the segment files.
+        """
         try:
-            from pydub import AudioSegment
-            pydub_available = True
-        except ImportError:
-            pydub_available = False
-            logger.warning("pydub not available, using simple file concatenation")
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Already inside an event loop (asyncio.run would fail): use threads
+            return self._run_threaded_segments(
+                jobs, lambda job: self.generate_audio_edge(job[3], job[4], job[2]), concurrency
+            )
 
-        if pydub_available:
-            # Use pydub for proper audio concatenation with pauses
-            combined_audio = None
+        async def run_all():
+            semaphore = asyncio.Semaphore(concurrency)
 
-            for segment in segments:
-                _, _, _, audio_file = segment
+            async def synthesize(job):
+                _, _, voice, text, _ = job
+                async with semaphore:
+                    # Keep the audio in memory; the assembler reads buffers directly
+                    chunks = []
+                    async for chunk in Communicate(text, voice).stream():
+                        if chunk.get("type") == "audio":
+                            chunks.append(chunk["data"])
+                    if not chunks:
+                        raise APIError("Edge TTS returned no audio")
+                    buffers[job[0]] = b"".join(chunks)
 
-                if not os.path.exists(audio_file):
-                    logger.warning(f"Audio file missing: {audio_file}")
-                    continue
+            return await asyncio.gather(*(synthesize(job) for job in jobs), return_exceptions=True)
 
-                try:
-                    segment_audio = AudioSegment.from_wav(audio_file)
+        results = asyncio.run(run_all())
+        return {job[0]: result for job, result in zip(jobs, results) if isinstance(result, Exception)}
 
-                    if combined_audio is None:
-                        combined_audio = segment_audio
-                    else:
-                        # Add a 300ms pause between speakers to make conversation natural
-                        pause = AudioSegment.silent(duration=300)
-                        combined_audio = combined_audio + pause + segment_audio
+    def _combine_audio_segments(self, segments: list, output_file: str) -> str:
+        """Combine multiple audio segments into a single podcast file.
 
-                except Exception as e:
-                    logger.warning(f"Failed to load segment {audio_file}: {e}")
-                    continue
+        Segments are streamed into the output WAV (see audio_assembly), so
+        assembly is linear in podcast length with memory bounded by one segment.
+        PODCAST_PAUSE_MS (default 300) sets the pause between speakers and
+        PODCAST_CROSSFADE_MS (default 0) overlaps speakers instead.
 
-            if combined_audio is None:
-                logger.warning("pydub failed to assemble; falling back to wave-based concatenation")
-                # Wave-based fallback (no crossfades, adds 300ms silence between clips)
-                try:
-                    import wave
-                    valid_files = [seg[3] for seg in segments if os.path.exists(seg[3])]
-                    if not valid_files:
-                        raise APIError("No audio segments found for wave fallback")
-                    with wave.open(output_file, 'wb') as out_wav:
-                        first_params = None
-                        for i, fp in enumerate(valid_files):
-                            with wave.open(fp, 'rb') as w:
-                                params = w.getparams()
-                                if first_params is None:
-                                    first_params = params
-                                    out_wav.setparams(params)
-                                # Write frames
-                                frames = w.readframes(w.getnframes())
-                                out_wav.writeframes(frames)
-                                # Insert ~300ms of silence between segments
-                                if i < len(valid_files) - 1:
-                                    # 300ms of silence: n_samples = rate * 0.3
-                                    n_channels = first_params.nchannels
-                                    sampwidth = first_params.sampwidth
-                                    framerate = first_params.framerate
-                                    n_samples = int(framerate * 0.3)
-                                    out_wav.writeframes(b"\x00" * n_samples * n_channels * sampwidth)
-                except Exception as fe:
-                    raise APIError(f"Failed to combine any audio segments (wave fallback): {fe}")
-            else:
-                # Export the combined audio
-                combined_audio.export(output_file, format="wav")
+        Args:
+            segments: List of tuples (speaker_name, voice_code, text, audio_file_path_or_bytes)
+            output_file: Final output file path
 
-        else:
-            # Fallback: simple file concatenation of MP3 files
-            logger.info("Using simple MP3 concatenation (pauses not added)")
+        Returns:
+            Path to the combined audio file
+        """
+        if not segments:
+            raise APIError("No audio segments to combine")
 
-            with open(output_file, 'wb') as outfile:
-                for segment in segments:
-                    _, _, _, audio_file = segment
+        logger.info(f"Combining {len(segments)} audio segments")
 
-                    if not os.path.exists(audio_file):
-                        logger.warning(f"Audio file missing: {audio_file}")
-                        continue
+        sources = []
+        for segment in segments:
+            audio = segment[3]
+            if isinstance(audio, str) and not os.path.exists(audio):
+                logger.warning(f"Audio file missing: {audio}")
+                continue
+            sources.append(audio)
+
+        try:
+            pause_ms = max(0, int(os.getenv("PODCAST_PAUSE_MS", "300")))
+            crossfade_ms = max(0, int(os.getenv("PODCAST_CROSSFADE_MS", "0")))
+        except ValueError:
+            pause_ms, crossfade_ms = 300, 0
 
+        try:
+            assemble_wav(sources, output_file, pause_ms=pause_ms, crossfade_ms=crossfade_ms)
+        except AudioAssemblyError as e:
+            # Nothing was decodable (e.g. MP3 segments without pydub/ffmpeg):
+            # concatenate the raw files so the user still gets audio.
+            logger.warning(f"{e}; using simple file concatenation (pauses not added)")
+            with open(output_file, 'wb') as outfile:
+                for audio in sources:
                     try:
-                        # Read MP3 file as binary
-                        if audio_file.endswith('.wav'):
-                            # Skip .wav files if pydub wasn't available, look for .mp3
-                            mp3_file = audio_file.replace('.wav', '.mp3')
-                            if os.path.exists(mp3_file):
-                                with open(mp3_file, 'rb') as infile:
-                                    outfile.write(infile.read())
-                            else:
-                                with open(audio_file, 'rb') as infile:
-                                    outfile.write(infile.read())
-                        else:
-                            with open(audio_file, 'rb') as infile:
+                        if isinstance(audio, str):
+                            mp3_file = audio.replace('.wav', '.mp3')
+                            with open(mp3_file if os.path.exists(mp3_file) else audio, 'rb') as infile:
                                 outfile.write(infile.read())
-                    except Exception as e:
-                        logger.warning(f"Failed to read segment {audio_file}: {e}")
+                        else:
+                            outfile.write(audio)
+                    except Exception as fe:
+                        logger.warning(f"Failed to read segment {audio}: {fe}")
                         continue
 
         # Clean up temp files
         for segment in segments:
-            _, _, _, audio_file = segment
+            audio_file = segment[3]
+            if not isinstance(audio_file, str):
+                continue
             if os.path.exists(audio_file):
                 os.remove(audio_file)
             # Also clean up any .mp3 files left behind
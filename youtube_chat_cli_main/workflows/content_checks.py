@@ -15,11 +15,14 @@ from typing import Any, Dict, Optional, List
 from datetime import datetime, timezone
 import logging
 
+from ..core import cache_keys
 from ..core.config import get_config
 from . import deep_research
 
 logger = logging.getLogger(__name__)
 
+_GDRIVE_FILTER = {"source": "gdrive"}
+
 
 def _safe_llm_generate(prompt: str, system_prompt: Optional[str] = None, temperature: float = 0.3) -> str:
     # Circuit breaker for LLM
@@ -46,11 +49,9 @@ def _safe_llm_generate(prompt: str, system_prompt: Optional[str] = None, tempera
 
 def _vector_search(query: str, top_k: int = 5) -> List[Dict[str, Any]]:
     """Vector search with Redis cache and graceful fallback."""
-    cache_key = f"vector:{top_k}:{hash(query)}"
+    cache_key = cache_keys.cache_key("vector", cache_keys.normalize_text(query), top_k, _GDRIVE_FILTER)
     try:
-        from ..core.redis_cache import get_cache
-        cache = get_cache()
-        cached = cache.get_json(cache_key)
+        cached = cache_keys.get_json(cache_key)
         if isinstance(cached, list):
             return cached
     except Exception:
@@ -58,7 +59,7 @@ def _vector_search(query: str, top_k: int = 5) -> List[Dict[str, Any]]:
     try:
         from ..services.vector_store import get_vector_store  # lazy import
         vs = get_vector_store()
-        hits = vs.search(query=query, top_k=top_k, filter_dict={"source": "gdrive"}) or []
+        hits = vs.search(query=query, top_k=top_k, filter_dict=_GDRIVE_FILTER) or []
         try:
             from ..core.redis_cache import get_cache
             get_cache().set_json(cache_key, hits)
@@ -70,6 +71,40 @@ def _vector_search(query: str, top_k: int = 5) -> List[Dict[str, Any]]:
         # Default NOVEL by returning no hits
         return []
 
+def _vector_search_many(queries: List[str], top_k: int = 5) -> List[Dict[str, Any]]:
+    """Batched vector search over several queries; hits are deduplicated."""
+    if len(queries) == 1:
+        return _vector_search(queries[0], top_k=top_k)
+    cache_key = cache_keys.cache_key(
+        "vector", "many", [cache_keys.normalize_text(q) for q in queries], top_k, _GDRIVE_FILTER
+    )
+    try:
+        cached = cache_keys.get_json(cache_key)
+        if isinstance(cached, list):
+            return cached
+    except Exception:
+        cached = None
+    try:
+        from ..services.vector_store import get_vector_store  # lazy import
+        vs = get_vector_store()
+        per_query = vs.search_many(queries, top_k=top_k, filter_dict=_GDRIVE_FILTER) or []
+        hits = [h for query_hits in per_query for h in query_hits]
+        try:
+            from ..core.redis_cache import get_cache
+            get_cache().set_json(cache_key, hits)
+        except Exception:
+            pass
+        return hits
+    except Exception as e:
+        logger.warning("Vector store unavailable for duplicate check: %s", e)
+        return []
+
+
+def _insight_queries(insights: str, max_queries: int = 8) -> List[str]:
+    """Split research insights into per-turn passages for multi-query search."""
+    passages = [p.strip() for p in insights.split("\n\n") if p.strip()]
+    return passages[:max_queries] or [insights]
+
 # Optional LangGraph integration (lightweight wrapper)
 try:
     from langgraph.graph import StateGraph, END  # type: ignore
@@ -112,7 +147,9 @@ try:
     def _compute_duplicate_score(insights: str) -> tuple[float, list]:
         cfg = get_config()
         try:
-            hits = _vector_search(insights, top_k=5)
+            # Each transcript turn is its own query: a duplicate of any one
+            # passage shows up instead of being averaged away
+            hits = _vector_search_many(_insight_queries(insights), top_k=5)
         except Exception:
             hits = []
         half_life = getattr(cfg, 'duplicate_time_decay_half_life_days', 180)